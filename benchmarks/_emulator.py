@@ -0,0 +1,138 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Shared helpers for running benchmarks against a local Azure Storage emulator.
+
+Benchmarks default to the well-known development account exposed by Azurite. Start
+Azurite before running any benchmark, for example::
+
+    azurite-blob --skipApiVersionCheck --loose
+"""
+
+import argparse
+import datetime
+import os
+import statistics
+import time
+import uuid
+from typing import Callable, List
+
+from azure.storage.blob import (
+    BlobSasPermissions,
+    BlobServiceClient,
+    ContainerClient,
+    ContainerSasPermissions,
+    generate_blob_sas,
+    generate_container_sas,
+)
+
+# Well-known credentials for the Azurite development storage account:
+# https://learn.microsoft.com/azure/storage/common/storage-use-azurite#well-known-storage-account-and-key
+EMULATOR_ACCOUNT_NAME = "devstoreaccount1"
+EMULATOR_ACCOUNT_KEY = (
+    "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/"
+    "K1SZFPTOtr/KBHBeksoGMGw=="
+)
+EMULATOR_ACCOUNT_URL = f"http://127.0.0.1:10000/{EMULATOR_ACCOUNT_NAME}"
+
+MB = 1024 * 1024
+
+
+def add_emulator_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--account-url",
+        default=os.environ.get(
+            "AZSTORAGETORCH_BENCHMARK_ACCOUNT_URL", EMULATOR_ACCOUNT_URL
+        ),
+        help="Blob endpoint to benchmark against. Defaults to a local Azurite emulator.",
+    )
+    parser.add_argument(
+        "--account-name",
+        default=os.environ.get(
+            "AZSTORAGETORCH_BENCHMARK_ACCOUNT_NAME", EMULATOR_ACCOUNT_NAME
+        ),
+    )
+    parser.add_argument(
+        "--account-key",
+        default=os.environ.get(
+            "AZSTORAGETORCH_BENCHMARK_ACCOUNT_KEY", EMULATOR_ACCOUNT_KEY
+        ),
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=5, help="Number of timed iterations."
+    )
+
+
+class BenchmarkContainer:
+    def __init__(self, account_url: str, account_name: str, account_key: str):
+        self._account_name = account_name
+        self._account_key = account_key
+        self._service_client = BlobServiceClient(
+            account_url,
+            credential={"account_name": account_name, "account_key": account_key},
+        )
+        self.container_client: ContainerClient = self._service_client.create_container(
+            f"bench-{uuid.uuid4().hex[:12]}"
+        )
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "BenchmarkContainer":
+        return cls(args.account_url, args.account_name, args.account_key)
+
+    def upload_blob(self, size: int, blob_name: str = "") -> str:
+        blob_name = blob_name or uuid.uuid4().hex
+        blob_client = self.container_client.get_blob_client(blob_name)
+        blob_client.upload_blob(os.urandom(size), overwrite=True, max_concurrency=8)
+        return self.get_blob_url(blob_name)
+
+    def get_blob_url(self, blob_name: str) -> str:
+        sas = generate_blob_sas(
+            self._account_name,
+            self.container_client.container_name,
+            blob_name,
+            account_key=self._account_key,
+            permission=BlobSasPermissions(read=True, write=True, create=True, add=True),
+            expiry=datetime.datetime.now(datetime.timezone.utc)
+            + datetime.timedelta(hours=1),
+        )
+        return f"{self.container_client.url}/{blob_name}?{sas}"
+
+    def get_container_url(self) -> str:
+        sas = generate_container_sas(
+            self._account_name,
+            self.container_client.container_name,
+            account_key=self._account_key,
+            permission=ContainerSasPermissions(read=True, list=True),
+            expiry=datetime.datetime.now(datetime.timezone.utc)
+            + datetime.timedelta(hours=1),
+        )
+        return f"{self.container_client.url}?{sas}"
+
+    def delete(self) -> None:
+        self.container_client.delete_container()
+
+    def __enter__(self) -> "BenchmarkContainer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.delete()
+
+
+def time_iterations(fn: Callable[[], object], iterations: int) -> List[float]:
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def format_result(label: str, durations: List[float], num_bytes: int = 0) -> str:
+    median = statistics.median(durations)
+    result = f"{label:<40} median={median * 1000:9.1f} ms  min={min(durations) * 1000:9.1f} ms"
+    if num_bytes:
+        result += f"  throughput={num_bytes / median / MB:9.1f} MiB/s"
+    return result
@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare HTTP connection pool sizes for partitioned blob downloads.
+
+The benchmark repeatedly downloads a blob through a single client factory, first
+with the default requests pool of 10 connections per host and then with the pool
+sized to the factory's in-flight request limit. After each run, it prints how many
+connections were newly opened versus reused from the pool.
+"""
+
+import argparse
+from unittest import mock
+
+from azstoragetorch import _client
+
+from _emulator import (
+    MB,
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+DEFAULT_REQUESTS_POOL_SIZE = 10
+
+
+def benchmark_factory(
+    label: str,
+    blob_url: str,
+    size: int,
+    args: argparse.Namespace,
+) -> None:
+    factory = _client.AzStorageTorchBlobClientFactory(
+        credential=False, max_in_flight_requests=args.max_in_flight_requests
+    )
+    durations = time_iterations(
+        lambda: factory.get_blob_client_from_url(blob_url).download(),
+        args.iterations,
+    )
+    print(format_result(label, durations, size))
+    stats = factory.get_connection_stats()
+    print(
+        f"{'':<40} new_connections={stats['new_connections']}"
+        f"  reused_connections={stats['reused_connections']}"
+    )
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        size = args.size_mib * MB
+        blob_url = container.upload_blob(size)
+        with mock.patch.object(
+            _client.AzStorageTorchBlobClientFactory,
+            "_get_connection_pool_size",
+            lambda self: DEFAULT_REQUESTS_POOL_SIZE,
+        ):
+            benchmark_factory(f"{args.size_mib} MiB default pool", blob_url, size, args)
+        benchmark_factory(f"{args.size_mib} MiB sized pool", blob_url, size, args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--size-mib",
+        type=int,
+        default=1024,
+        help="Blob size, in MiB, to benchmark.",
+    )
+    parser.add_argument(
+        "--max-in-flight-requests",
+        type=int,
+        default=32,
+        help="In-flight request limit used for both the downloads and pool size.",
+    )
+    run(parser.parse_args())
@@ -0,0 +1,61 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare copying a blob through the client with a server-side copy.
+
+The client-side copy reads the source blob with BlobIO and writes it back to the
+destination, so the blob's content crosses the network twice. The server-side copy
+uses parallel Put Block From URL requests, so no blob content is transferred
+through the client.
+"""
+
+import argparse
+
+from azstoragetorch import _client
+from azstoragetorch.io import BlobIO
+
+from _emulator import (
+    MB,
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def copy_through_client(src_url: str, dst_url: str) -> None:
+    with BlobIO(src_url, "rb", credential=False) as src:
+        with BlobIO(dst_url, "wb", credential=False) as dst:
+            dst.write(src.read())
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        size = args.size_mib * MB
+        src_url = container.upload_blob(size, "latest.pt")
+        dst_url = container.get_blob_url("best.pt")
+        factory = _client.AzStorageTorchBlobClientFactory(credential=False)
+        label = f"{args.size_mib} MiB"
+        client_side = time_iterations(
+            lambda: copy_through_client(src_url, dst_url), args.iterations
+        )
+        print(format_result(f"{label} read + write", client_side, size))
+        server_side = time_iterations(
+            lambda: factory.copy_blob(src_url, dst_url), args.iterations
+        )
+        print(format_result(f"{label} copy_blob", server_side, size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--size-mib",
+        type=int,
+        default=1024,
+        help="Size, in MiB, of the blob to copy.",
+    )
+    run(parser.parse_args())
@@ -0,0 +1,111 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Measure the overhead of CRC64 validation on blob uploads and downloads.
+
+The benchmark first reports the raw throughput of the CRC64 implementations
+available in this environment. It then uploads and downloads a blob with and
+without CRC64 validation enabled so the overhead can be compared against wire
+throughput. Downloads with validation are split into 4 MiB ranges, which is the
+largest range the service returns a checksum for.
+"""
+
+import argparse
+import os
+from unittest import mock
+
+from azstoragetorch import _client, _crc64
+
+from _emulator import (
+    MB,
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def benchmark_checksums(size: int, iterations: int) -> None:
+    data = os.urandom(size)
+    if _crc64.is_native():
+        native = time_iterations(lambda: _crc64.compute(data), iterations)
+        print(format_result("crc64 native", native, size))
+    else:
+        print("crc64 native: azure-storage-extensions is not installed")
+    with mock.patch.object(_crc64, "_NATIVE_COMPUTE", None):
+        fallback = time_iterations(lambda: _crc64.compute(data), 1)
+    print(format_result("crc64 slice-by-8 (pure Python)", fallback, size))
+
+
+def get_client(
+    factory: _client.AzStorageTorchBlobClientFactory,
+    blob_url: str,
+    validate_crc64: bool,
+) -> _client.AzStorageTorchBlobClient:
+    return _client.AzStorageTorchBlobClient(
+        factory._get_sdk_blob_client_from_url(blob_url),
+        validate_crc64=validate_crc64,
+    )
+
+
+def upload(
+    factory: _client.AzStorageTorchBlobClientFactory,
+    blob_url: str,
+    data: bytes,
+    validate_crc64: bool,
+) -> None:
+    client = get_client(factory, blob_url, validate_crc64)
+    futures = client.stage_blocks(data)
+    client.commit_block_list([future.result() for future in futures])
+
+
+def download(
+    factory: _client.AzStorageTorchBlobClientFactory,
+    blob_url: str,
+    validate_crc64: bool,
+) -> None:
+    get_client(factory, blob_url, validate_crc64).download()
+
+
+def run(args: argparse.Namespace) -> None:
+    benchmark_checksums(args.checksum_size_mib * MB, args.iterations)
+    with BenchmarkContainer.from_args(args) as container:
+        size = args.size_mib * MB
+        data = os.urandom(size)
+        blob_url = container.get_blob_url("crc64-benchmark")
+        factory = _client.AzStorageTorchBlobClientFactory(credential=False)
+        for validate_crc64 in (False, True):
+            label = "with crc64" if validate_crc64 else "without crc64"
+            uploads = time_iterations(
+                lambda: upload(factory, blob_url, data, validate_crc64),
+                args.iterations,
+            )
+            downloads = time_iterations(
+                lambda: download(factory, blob_url, validate_crc64),
+                args.iterations,
+            )
+            print(format_result(f"{args.size_mib} MiB upload {label}", uploads, size))
+            print(
+                format_result(f"{args.size_mib} MiB download {label}", downloads, size)
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--size-mib",
+        type=int,
+        default=256,
+        help="Blob size, in MiB, to upload and download.",
+    )
+    parser.add_argument(
+        "--checksum-size-mib",
+        type=int,
+        default=64,
+        help="Amount of data, in MiB, to checksum when measuring raw CRC64 throughput.",
+    )
+    run(parser.parse_args())
@@ -0,0 +1,113 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Measure time to first batch of a DataLoader over a BlobDataset.
+
+With the spawn (or forkserver) start method, every DataLoader worker receives its own
+pickled copy of the dataset. This benchmark reports the pickled size of a dataset over
+many blobs and the time from creating a DataLoader iterator to receiving its first batch
+for each number of workers.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import pickle
+import time
+
+import torch.utils.data
+
+from azstoragetorch.datasets import Blob, BlobDataset
+
+from _emulator import MB, BenchmarkContainer, add_emulator_arguments
+
+
+def to_bytes(blob: Blob) -> bytes:
+    with blob.reader() as f:
+        return f.read()
+
+
+def create_blobs(container: BenchmarkContainer, args: argparse.Namespace) -> None:
+    data = os.urandom(args.blob_size)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
+        list(
+            executor.map(
+                lambda i: container.container_client.upload_blob(
+                    f"samples/sample-{i:08}", data, overwrite=True
+                ),
+                range(args.num_blobs),
+            )
+        )
+
+
+def time_to_first_batch(dataset: BlobDataset, num_workers: int, args) -> float:
+    loader = torch.utils.data.DataLoader(
+        dataset,
+        batch_size=args.batch_size,
+        num_workers=num_workers,
+        multiprocessing_context=args.start_method,
+        collate_fn=list,
+    )
+    start = time.perf_counter()
+    loader_iter = iter(loader)
+    next(loader_iter)
+    duration = time.perf_counter() - start
+    del loader_iter
+    return duration
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        create_blobs(container, args)
+        dataset = BlobDataset.from_container_url(
+            container.get_container_url(), credential=False, transform=to_bytes
+        )
+        pickled_size = len(pickle.dumps(dataset))
+        print(
+            f"{len(dataset)} blobs pickled dataset size={pickled_size / MB:.2f} MiB "
+            f"({pickled_size / len(dataset):.1f} bytes per blob)"
+        )
+        for num_workers in args.num_workers:
+            durations = [
+                time_to_first_batch(dataset, num_workers, args)
+                for _ in range(args.iterations)
+            ]
+            print(
+                f"{num_workers:>3} workers ({args.start_method}) time to first batch "
+                f"median={sorted(durations)[len(durations) // 2]:.2f} s  "
+                f"min={min(durations):.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--num-blobs",
+        type=int,
+        default=100_000,
+        help="Number of blobs in the dataset.",
+    )
+    parser.add_argument(
+        "--blob-size", type=int, default=1024, help="Size of each blob in bytes."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=32, help="DataLoader batch size."
+    )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        nargs="+",
+        default=[16, 64],
+        help="Numbers of DataLoader workers to measure.",
+    )
+    parser.add_argument(
+        "--start-method",
+        choices=["spawn", "forkserver", "fork"],
+        default="spawn",
+        help="Multiprocessing start method for DataLoader workers.",
+    )
+    run(parser.parse_args())
@@ -0,0 +1,86 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare repeated blob downloads with and without a local disk cache.
+
+Multi-epoch training jobs read the same blobs every epoch. The benchmark uploads
+several blobs and then downloads all of them once per epoch, each time with a new
+client as a new DataLoader worker would. With the disk cache, the first epoch
+populates the cache and later epochs only make a conditional request per blob to
+confirm it has not changed.
+"""
+
+import argparse
+import tempfile
+from typing import List
+
+from azstoragetorch import _client
+from azstoragetorch.cache import DiskCache
+
+from _emulator import (
+    MB,
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def download_all(
+    factory: _client.AzStorageTorchBlobClientFactory, blob_urls: List[str]
+) -> None:
+    for blob_url in blob_urls:
+        client = factory.get_blob_client_from_url(blob_url)
+        client.download()
+        client.close()
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        size = args.size_mib * MB
+        blob_urls = [
+            container.upload_blob(size, f"disk-cache-{i}")
+            for i in range(args.num_blobs)
+        ]
+        total_size = size * args.num_blobs
+        factory = _client.AzStorageTorchBlobClientFactory(credential=False)
+        label = f"{args.num_blobs} x {args.size_mib} MiB"
+        no_cache = time_iterations(
+            lambda: download_all(factory, blob_urls), args.iterations
+        )
+        print(format_result(f"{label} no cache", no_cache, total_size))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            disk_cache = DiskCache(cache_dir, max_size=2 * total_size)
+            cached_factory = _client.AzStorageTorchBlobClientFactory(
+                credential=False, disk_cache=disk_cache
+            )
+            first_epoch = time_iterations(
+                lambda: download_all(cached_factory, blob_urls), 1
+            )
+            print(format_result(f"{label} cold disk cache", first_epoch, total_size))
+            later_epochs = time_iterations(
+                lambda: download_all(cached_factory, blob_urls), args.iterations
+            )
+            print(format_result(f"{label} warm disk cache", later_epochs, total_size))
+            print(f"cached bytes: {disk_cache.get_size()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--size-mib",
+        type=int,
+        default=64,
+        help="Size, in MiB, of each blob to download.",
+    )
+    parser.add_argument(
+        "--num-blobs",
+        type=int,
+        default=8,
+        help="Number of blobs downloaded per epoch.",
+    )
+    run(parser.parse_args())
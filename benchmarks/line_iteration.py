@@ -0,0 +1,71 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare iterating over the lines of a JSON Lines blob with BlobIO.
+
+Lines are read one at a time by iterating over the BlobIO object and in batches
+with BlobIO.iter_lines(). The blob consists of many short lines, which is where the
+per-line cost of line parsing dominates.
+"""
+
+import argparse
+import json
+
+from azstoragetorch.io import BlobIO
+
+from _emulator import (
+    MB,
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def iterate_lines(blob_url: str) -> None:
+    with BlobIO(blob_url, "rb", credential=False) as f:
+        for _ in f:
+            pass
+
+
+def iterate_line_batches(blob_url: str, batch_size: int) -> None:
+    with BlobIO(blob_url, "rb", credential=False) as f:
+        for _ in f.iter_lines(batch_size):
+            pass
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        line = (json.dumps({"id": 0, "text": "x" * 40}) + "\n").encode("utf-8")
+        content = line * (args.size_mib * MB // len(line))
+        blob_name = "lines.jsonl"
+        container.container_client.upload_blob(blob_name, content, overwrite=True)
+        blob_url = container.get_blob_url(blob_name)
+        label = f"{args.size_mib} MiB of {len(line)} byte lines"
+        by_line = time_iterations(lambda: iterate_lines(blob_url), args.iterations)
+        print(format_result(f"{label} for line in f", by_line, len(content)))
+        batched = time_iterations(
+            lambda: iterate_line_batches(blob_url, args.batch_size), args.iterations
+        )
+        print(format_result(f"{label} iter_lines()", batched, len(content)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--size-mib",
+        type=int,
+        default=256,
+        help="Size, in MiB, of the JSON Lines blob.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=4096,
+        help="Number of lines in each batch from iter_lines().",
+    )
+    run(parser.parse_args())
@@ -0,0 +1,74 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare serial container listing with parallel prefix-partitioned listing.
+
+The benchmark creates empty blobs spread across a number of virtual directories and
+then lists the container twice. The first listing pages through list_blobs() serially.
+The second uses the client factory, which lists each virtual directory concurrently and
+merges the results in sorted order.
+"""
+
+import argparse
+import concurrent.futures
+
+from azure.storage.blob import ContainerClient
+
+from azstoragetorch import _client
+
+from _emulator import (
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def create_blobs(container_client: ContainerClient, args: argparse.Namespace) -> None:
+    blob_names = [
+        f"shard-{i % args.num_prefixes:05}/sample-{i:08}" for i in range(args.num_blobs)
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
+        list(
+            executor.map(
+                lambda name: container_client.upload_blob(name, b"", overwrite=True),
+                blob_names,
+            )
+        )
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        create_blobs(container.container_client, args)
+        container_url = container.get_container_url()
+        factory = _client.AzStorageTorchBlobClientFactory(credential=False)
+        serial = time_iterations(
+            lambda: list(container.container_client.list_blobs()), args.iterations
+        )
+        print(format_result(f"{args.num_blobs} blobs serial", serial))
+        parallel = time_iterations(
+            lambda: list(factory.yield_blob_clients_from_container_url(container_url)),
+            args.iterations,
+        )
+        print(format_result(f"{args.num_blobs} blobs parallel", parallel))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--num-blobs",
+        type=int,
+        default=50_000,
+        help="Number of blobs to create and list.",
+    )
+    parser.add_argument(
+        "--num-prefixes",
+        type=int,
+        default=64,
+        help="Number of virtual directories the blobs are spread across.",
+    )
+    run(parser.parse_args())
@@ -0,0 +1,63 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare fixed and adaptive partition sizing for partitioned blob downloads.
+
+The benchmark uploads blobs of several sizes and downloads each of them with
+partition sizes fixed at 16 MiB and with partition sizes chosen by the adaptive
+planner. Before the adaptive runs, download statistics are warmed up so the planner
+has latency and throughput measurements to work with.
+"""
+
+import argparse
+from unittest import mock
+
+from azstoragetorch import _client
+from azstoragetorch.io import BlobIO
+
+from _emulator import (
+    MB,
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def download(blob_url: str) -> None:
+    with BlobIO(blob_url, "rb", credential=False) as f:
+        f.read()
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        for size_mib in args.sizes_mib:
+            blob_url = container.upload_blob(size_mib * MB)
+            size = size_mib * MB
+            with mock.patch.object(
+                _client.AzStorageTorchBlobClient,
+                "_get_download_partition_size",
+                lambda self, length: self._PARTITION_SIZE,
+            ):
+                fixed = time_iterations(lambda: download(blob_url), args.iterations)
+            # Warm up download statistics so the planner has measurements to use.
+            time_iterations(lambda: download(blob_url), 2)
+            adaptive = time_iterations(lambda: download(blob_url), args.iterations)
+            print(format_result(f"{size_mib} MiB fixed 16 MiB partitions", fixed, size))
+            print(format_result(f"{size_mib} MiB adaptive partitions", adaptive, size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--sizes-mib",
+        type=int,
+        nargs="+",
+        default=[40, 256, 1024],
+        help="Blob sizes, in MiB, to benchmark.",
+    )
+    run(parser.parse_args())
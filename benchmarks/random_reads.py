@@ -0,0 +1,86 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare random reads with BlobIO with and without its block cache.
+
+Readers of formats such as zip archives and Parquet files seek back and forth
+between an index at the end of the file and the data regions it points to. This
+benchmark repeatedly reads a small footer and then a few records at random offsets
+from a fixed set, so that regions are read more than once.
+"""
+
+import argparse
+import random
+
+from azstoragetorch.io import BlobIO
+
+from _emulator import (
+    MB,
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def read_randomly(
+    blob_url: str, offsets: list, num_reads: int, read_size: int, cache_size: int
+) -> None:
+    rng = random.Random(0)
+    with BlobIO(blob_url, "rb", credential=False, cache_size=cache_size) as f:
+        for _ in range(num_reads):
+            f.seek(-read_size, 2)
+            f.read(read_size)
+            f.seek(rng.choice(offsets))
+            f.read(read_size)
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        size = args.size_mib * MB
+        blob_url = container.upload_blob(size)
+        read_size = args.read_size_kib * 1024
+        rng = random.Random(0)
+        offsets = [rng.randrange(size - read_size) for _ in range(args.num_regions)]
+        label = f"{args.num_reads} x 2 reads of {args.read_size_kib} KiB"
+        for cache_size, cache_label in [(0, "no cache"), (32 * MB, "32 MiB cache")]:
+            durations = time_iterations(
+                lambda: read_randomly(
+                    blob_url, offsets, args.num_reads, read_size, cache_size
+                ),
+                args.iterations,
+            )
+            print(format_result(f"{label} {cache_label}", durations))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--size-mib",
+        type=int,
+        default=256,
+        help="Size, in MiB, of the blob to read.",
+    )
+    parser.add_argument(
+        "--num-regions",
+        type=int,
+        default=16,
+        help="Number of distinct regions that records are read from.",
+    )
+    parser.add_argument(
+        "--num-reads",
+        type=int,
+        default=200,
+        help="Number of footer and record read pairs per iteration.",
+    )
+    parser.add_argument(
+        "--read-size-kib",
+        type=int,
+        default=16,
+        help="Size, in KiB, of each read.",
+    )
+    run(parser.parse_args())
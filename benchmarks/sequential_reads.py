@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare many small sequential reads with BlobIO with and without read-ahead.
+
+Parsers such as torch.load() read blobs sequentially in small pieces. Without
+read-ahead, every read is a separate, serial range request. With read-ahead, ranges
+past the current position are downloaded in the background and small reads are
+served from memory.
+"""
+
+import argparse
+from unittest import mock
+
+from azstoragetorch import io
+from azstoragetorch.io import BlobIO
+
+from _emulator import (
+    MB,
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def read_sequentially(blob_url: str, read_size: int, cache_size: int) -> None:
+    with BlobIO(blob_url, "rb", credential=False, cache_size=cache_size) as f:
+        while f.read(read_size):
+            pass
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        size = args.size_mib * MB
+        blob_url = container.upload_blob(size)
+        read_size = args.read_size_kib * 1024
+        label = f"{args.size_mib} MiB in {args.read_size_kib} KiB reads"
+        # Disable the block cache as well so that every read makes its own request.
+        with mock.patch.object(
+            io._SequentialReadAhead, "is_sequential", lambda self, position: False
+        ):
+            without_read_ahead = time_iterations(
+                lambda: read_sequentially(blob_url, read_size, cache_size=0),
+                args.iterations,
+            )
+        print(format_result(f"{label} no read-ahead", without_read_ahead, size))
+        with_read_ahead = time_iterations(
+            lambda: read_sequentially(blob_url, read_size, cache_size=0),
+            args.iterations,
+        )
+        print(format_result(f"{label} read-ahead", with_read_ahead, size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--size-mib",
+        type=int,
+        default=64,
+        help="Size, in MiB, of the blob to read.",
+    )
+    parser.add_argument(
+        "--read-size-kib",
+        type=int,
+        default=4,
+        help="Size, in KiB, of each read.",
+    )
+    run(parser.parse_args())
@@ -0,0 +1,68 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Compare uploading many small blobs with BlobIO.
+
+Blobs are written with a single Put Blob request when all written data is still
+buffered at close, and with Put Block followed by Put Block List otherwise. This
+benchmark writes a batch of small blobs, similar to per-rank checkpoint shards or
+metrics files, using each path.
+"""
+
+import argparse
+import os
+from unittest import mock
+
+from azstoragetorch.io import BlobIO
+
+from _emulator import (
+    BenchmarkContainer,
+    add_emulator_arguments,
+    format_result,
+    time_iterations,
+)
+
+
+def write_blobs(blob_urls, data: bytes) -> None:
+    for blob_url in blob_urls:
+        with BlobIO(blob_url, "wb", credential=False) as f:
+            f.write(data)
+
+
+def run(args: argparse.Namespace) -> None:
+    with BenchmarkContainer.from_args(args) as container:
+        data = os.urandom(args.size_kib * 1024)
+        blob_urls = [
+            container.get_blob_url(f"small-{i}") for i in range(args.num_blobs)
+        ]
+        label = f"{args.num_blobs} x {args.size_kib} KiB"
+        with mock.patch.object(BlobIO, "_MAX_SINGLE_PUT_SIZE", -1):
+            staged = time_iterations(
+                lambda: write_blobs(blob_urls, data), args.iterations
+            )
+        print(format_result(f"{label} stage + commit", staged))
+        single_put = time_iterations(
+            lambda: write_blobs(blob_urls, data), args.iterations
+        )
+        print(format_result(f"{label} single put", single_put))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_emulator_arguments(parser)
+    parser.add_argument(
+        "--num-blobs",
+        type=int,
+        default=200,
+        help="Number of blobs written per iteration.",
+    )
+    parser.add_argument(
+        "--size-kib",
+        type=int,
+        default=200,
+        help="Size, in KiB, of each blob.",
+    )
+    run(parser.parse_args())
@@ -4,12 +4,18 @@
 # license information.
 # --------------------------------------------------------------------------
 
+import bisect
+import collections
 import concurrent.futures
+import contextlib
+import ctypes
 import functools
 import io
+import itertools
 import logging
 import math
 import os
+import queue
 import random
 import sys
 import threading
@@ -17,14 +23,22 @@ import time
 import urllib.parse
 import uuid
 from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
     Optional,
     List,
+    Sequence,
     Tuple,
     Iterator,
     Union,
     Literal,
     TypedDict,
+    TypeVar,
     cast,
+    get_args,
 )
 
 from azure.core.credentials import (
@@ -39,9 +53,20 @@ from azure.storage.blob._shared.response_handlers import process_storage_error
 from azure.core.pipeline import Pipeline
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from azure.core.pipeline.transport import RequestsTransport
+from azure.core.pipeline.transport._bigger_block_size_http_adapters import (
+    BiggerBlockSizeHTTPAdapter,
+)
+import requests
+import requests.adapters
+import torch
 
+from azstoragetorch import _crc64
+from azstoragetorch.cache import DiskCache
 from azstoragetorch._version import __version__
-from azstoragetorch.exceptions import ClientRequestIdMismatchError
+from azstoragetorch.exceptions import (
+    ChecksumMismatchError,
+    ClientRequestIdMismatchError,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -54,7 +79,14 @@ SDK_CREDENTIAL_TYPE = Optional[
 ]
 AZSTORAGETORCH_CREDENTIAL_TYPE = Union[SDK_CREDENTIAL_TYPE, Literal[False]]
 SUPPORTED_WRITE_BYTES_LIKE_TYPE = Union[bytes, bytearray, memoryview]
+SUPPORTED_READINTO_BUFFER_TYPE = Union[bytearray, memoryview, torch.Tensor]
 STAGE_BLOCK_FUTURE_TYPE = concurrent.futures.Future[str]
+# Large downloads are returned as the bytearray their partitions were written into instead of
+# being copied into a bytes object.
+DOWNLOAD_CONTENT_TYPE = Union[bytes, bytearray]
+DOWNLOAD_FUTURE_TYPE = concurrent.futures.Future[DOWNLOAD_CONTENT_TYPE]
+DOWNLOAD_RANGE_TYPE = Tuple[int, int]
+_READ_STREAM_RETURN_TYPE = TypeVar("_READ_STREAM_RETURN_TYPE", bytes, int)
 
 
 class SDKKwargsType(TypedDict, total=False):
@@ -68,6 +100,7 @@ class SDKKwargsType(TypedDict, total=False):
 
 class DownloadKwargsType(TypedDict, total=False):
     range: str
+    range_get_content_crc64: bool
     modified_access_conditions: (
         azure.storage.blob._generated.models.ModifiedAccessConditions
     )
@@ -105,23 +138,129 @@ class EchoClientRequestIdPolicy(SansIOHTTPPolicy):
             )
 
 
+class AdaptiveConcurrencyPolicy(SansIOHTTPPolicy):
+    # Feeds the outcome of every request attempt, including attempts retried by the SDK's
+    # retry policy, to the adaptive concurrency limit of the targeted storage account.
+    _EPOCH_CONTEXT_KEY = "azstoragetorch_concurrency_epoch"
+    _THROTTLING_ERRORS = {
+        (503, "ServerBusy"),
+        (500, "OperationTimedOut"),
+    }
+
+    def on_request(self, request):
+        concurrency_limit = self._get_concurrency_limit(request)
+        request.context[self._EPOCH_CONTEXT_KEY] = concurrency_limit.epoch
+
+    def on_response(self, request, response):
+        concurrency_limit = self._get_concurrency_limit(request)
+        epoch = request.context[self._EPOCH_CONTEXT_KEY]
+        http_response = response.http_response
+        error_code = http_response.headers.get("x-ms-error-code")
+        if (http_response.status_code, error_code) in self._THROTTLING_ERRORS:
+            concurrency_limit.record_throttled(epoch)
+        elif http_response.status_code < 400:
+            concurrency_limit.record_success()
+
+    def _get_concurrency_limit(self, request) -> "_AdaptiveConcurrencyLimit":
+        return _get_concurrency_limit(
+            urllib.parse.urlparse(request.http_request.url).netloc
+        )
+
+
 class AzStorageTorchBlobClientFactory:
     # Socket timeouts set to match the default timeouts in Python SDK
     _SOCKET_CONNECTION_TIMEOUT = 20
     _SOCKET_READ_TIMEOUT = 60
     _CONNECTION_DATA_BLOCK_SIZE = 256 * 1024
+    _STORAGE_OAUTH_SCOPE = "https://storage.azure.com/.default"
 
     def __init__(
         self,
         credential: AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        max_in_flight_requests: Optional[int] = None,
+        hedge_downloads: bool = False,
+        speculative_download_partitions: int = 1,
+        max_download_attempts: Optional[int] = None,
+        validate_crc64: bool = False,
+        disk_cache: Optional[DiskCache] = None,
     ):
-        self._sdk_credential = self._get_sdk_credential(credential)
-        self._transport = self._get_transport()
+        self._validate_credential(credential)
+        self._credential = credential
+        if max_in_flight_requests is None:
+            max_in_flight_requests = _get_default_max_in_flight_requests()
+        self._max_in_flight_requests = max_in_flight_requests
+        self._hedge_downloads = hedge_downloads
+        self._speculative_download_partitions = speculative_download_partitions
+        self._max_download_attempts = max_download_attempts
+        self._validate_crc64 = validate_crc64
+        self._disk_cache = disk_cache
         self._pipeline: Optional[Pipeline] = None
+        self._pid = os.getpid()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Factories are pickled along with datasets to each DataLoader worker. Only keep what is
+        # needed to recreate the factory so that the credential, transport, and pipeline are
+        # lazily created again in the worker instead of being copied from the parent process.
+        return {
+            "_credential": self._credential,
+            "_max_in_flight_requests": self._max_in_flight_requests,
+            "_hedge_downloads": self._hedge_downloads,
+            "_speculative_download_partitions": self._speculative_download_partitions,
+            "_max_download_attempts": self._max_download_attempts,
+            "_validate_crc64": self._validate_crc64,
+            "_disk_cache": self._disk_cache,
+            "_pipeline": None,
+            "_pid": self._pid,
+        }
 
-    def get_blob_client_from_url(self, blob_url: str) -> "AzStorageTorchBlobClient":
+    def get_blob_client_from_url(
+        self,
+        blob_url: str,
+        blob_properties: Optional[azure.storage.blob.BlobProperties] = None,
+    ) -> "AzStorageTorchBlobClient":
         blob_sdk_client = self._get_sdk_blob_client_from_url(blob_url)
-        return AzStorageTorchBlobClient(blob_sdk_client)
+        return AzStorageTorchBlobClient(
+            blob_sdk_client,
+            max_in_flight_requests=self._max_in_flight_requests,
+            hedge_downloads=self._hedge_downloads,
+            speculative_download_partitions=self._speculative_download_partitions,
+            max_download_attempts=self._max_download_attempts,
+            validate_crc64=self._validate_crc64,
+            disk_cache=self._disk_cache,
+            blob_properties=blob_properties,
+        )
+
+    def get_blob_client_from_container_url(
+        self,
+        container_url: str,
+        blob_name: str,
+        listed_blob_properties: Optional[azure.storage.blob.BlobProperties] = None,
+    ) -> "AzStorageTorchBlobClient":
+        blob_properties = None
+        if listed_blob_properties is not None:
+            blob_properties = _get_blob_properties_from_listing(listed_blob_properties)
+        return self.get_blob_client_from_url(
+            _get_blob_url(container_url, blob_name), blob_properties
+        )
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        self._reinitialize_if_forked()
+        return self._transport.get_connection_stats()
+
+    def copy_blob(self, src_url: str, dst_url: str) -> None:
+        source_client = self.get_blob_client_from_url(src_url)
+        destination_client = self.get_blob_client_from_url(dst_url)
+        try:
+            source_properties = source_client._get_blob_properties()
+            destination_client.copy_from_url(
+                self._get_copy_source_url(src_url),
+                source_properties.size,
+                source_etag=source_properties.etag,
+                source_authorization=self._get_copy_source_authorization(src_url),
+            )
+        finally:
+            destination_client.close()
+            source_client.close()
 
     def yield_blob_clients_from_container_url(
         self, container_url: str, prefix: Optional[str] = None
@@ -129,14 +268,89 @@ class AzStorageTorchBlobClientFactory:
         container_sdk_client = self._get_sdk_container_client_from_container_url(
             container_url
         )
-        blob_names = container_sdk_client.list_blob_names(name_starts_with=prefix)
-        for blob_name in blob_names:
-            blob_client = container_sdk_client.get_blob_client(blob_name)
+        yield from self._yield_blob_clients_from_listing(
+            container_sdk_client,
+            self._list_blobs(container_sdk_client, prefix),
+        )
+
+    def yield_blob_clients_from_listing(
+        self,
+        container_url: str,
+        listed_blobs: Iterable[azure.storage.blob.BlobProperties],
+    ) -> Iterator["AzStorageTorchBlobClient"]:
+        # Used for blobs from a previous listing of the container, such as ones recorded
+        # in a manifest. The container client is only needed to build each blob's URL.
+        container_sdk_client = self._get_sdk_container_client_from_container_url(
+            container_url
+        )
+        yield from self._yield_blob_clients_from_listing(
+            container_sdk_client, listed_blobs
+        )
+
+    def list_blobs(
+        self, container_url: str, prefix: Optional[str] = None
+    ) -> Iterator[azure.storage.blob.BlobProperties]:
+        container_sdk_client = self._get_sdk_container_client_from_container_url(
+            container_url
+        )
+        return self._list_blobs(container_sdk_client, prefix)
+
+    def _list_blobs(
+        self,
+        container_sdk_client: azure.storage.blob.ContainerClient,
+        prefix: Optional[str],
+    ) -> Iterator[azure.storage.blob.BlobProperties]:
+        lister = _ParallelBlobLister(
+            container_sdk_client, _ScheduledExecutor(self._max_in_flight_requests)
+        )
+        try:
+            yield from lister.list_blobs(prefix)
+        finally:
+            # Each container client is created with its own transport. Close it once the
+            # listing is done (or abandoned) so that its pooled connections are released.
+            container_sdk_client.close()
+
+    def _yield_blob_clients_from_listing(
+        self,
+        container_sdk_client: azure.storage.blob.ContainerClient,
+        listed_blobs: Iterable[azure.storage.blob.BlobProperties],
+    ) -> Iterator["AzStorageTorchBlobClient"]:
+        # Listing already returns each blob's size and ETag. Seeding clients with them avoids
+        # a Get Blob Properties request, or a size-discovery download, on each blob's first read.
+        for listed_blob in listed_blobs:
+            blob_client = container_sdk_client.get_blob_client(listed_blob.name)
             # Throwaway the blob client for it's URL to ensure we are **not**
-            # sharing transports as list_blob_names() may happen in the parent
+            # sharing transports as listing may happen in the parent
             # process and calling fork() after can lead to unintentional resource
             # sharing in child processes.
-            yield self.get_blob_client_from_url(blob_client.url)
+            yield self.get_blob_client_from_url(
+                blob_client.url, _get_blob_properties_from_listing(listed_blob)
+            )
+
+    @functools.cached_property
+    def _sdk_credential(self) -> SDK_CREDENTIAL_TYPE:
+        return self._get_sdk_credential(self._credential)
+
+    @functools.cached_property
+    def _transport(self) -> "_PooledRequestsTransport":
+        return self._get_transport()
+
+    def _reinitialize_if_forked(self) -> None:
+        # A factory used in a parent process (e.g., to list blobs for a dataset) may be used
+        # again in a forked child process such as a DataLoader worker. Its transport's
+        # connection pool, and the cached pipeline using it, would then share sockets with
+        # the parent. Drop both so the child lazily creates its own private connection pool.
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self.__dict__.pop("_transport", None)
+        self._pipeline = None
+
+    def _validate_credential(self, credential: AZSTORAGETORCH_CREDENTIAL_TYPE) -> None:
+        if credential is None or credential is False:
+            return
+        if not isinstance(credential, (AzureSasCredential, TokenCredential)):
+            raise TypeError(f"Unsupported credential: {type(credential)}")
 
     def _get_sdk_credential(
         self, credential: AZSTORAGETORCH_CREDENTIAL_TYPE
@@ -145,17 +359,23 @@ class AzStorageTorchBlobClientFactory:
             return None
         if credential is None:
             return DefaultAzureCredential()
-        if isinstance(credential, (AzureSasCredential, TokenCredential)):
-            return credential
-        raise TypeError(f"Unsupported credential: {type(credential)}")
+        return credential
 
-    def _get_transport(self) -> RequestsTransport:
-        return RequestsTransport(
+    def _get_transport(self) -> "_PooledRequestsTransport":
+        return _PooledRequestsTransport(
+            connection_pool_size=self._get_connection_pool_size(),
             connection_timeout=self._SOCKET_CONNECTION_TIMEOUT,
             read_timeout=self._SOCKET_READ_TIMEOUT,
             connection_data_block_size=self._CONNECTION_DATA_BLOCK_SIZE,
         )
 
+    def _get_connection_pool_size(self) -> int:
+        # Each in-flight request holds onto a connection for the duration of the request.
+        # If the pool is smaller than the number of concurrent requests, connections
+        # beyond the pool size get discarded once their request completes and a new
+        # connection (and TLS handshake) is needed for the next request.
+        return self._max_in_flight_requests
+
     def _get_sdk_blob_client_from_url(
         self, blob_url: str
     ) -> azure.storage.blob.BlobClient:
@@ -169,19 +389,25 @@ class AzStorageTorchBlobClientFactory:
     def _get_sdk_container_client_from_container_url(
         self, container_url: str
     ) -> azure.storage.blob.ContainerClient:
+        kwargs = self._get_sdk_client_kwargs(container_url, share_transport=False)
+        # Prefix ranges are listed concurrently. Use a dedicated transport with a pool sized like
+        # the shared one so that concurrent listing requests can reuse their connections.
+        kwargs["transport"] = self._get_transport()
         client = azure.storage.blob.ContainerClient.from_container_url(
             container_url,
-            **self._get_sdk_client_kwargs(container_url, share_transport=False),
+            **kwargs,
         )
         return client
 
     def _get_sdk_client_kwargs(
         self, resource_url: str, share_transport: bool = True
     ) -> SDKKwargsType:
+        self._reinitialize_if_forked()
         kwargs: SDKKwargsType = {
             "user_agent": f"azstoragetorch/{__version__}",
             "_additional_pipeline_policies": [
                 EchoClientRequestIdPolicy(),
+                AdaptiveConcurrencyPolicy(),
             ],
         }
         if share_transport:
@@ -206,6 +432,27 @@ class AzStorageTorchBlobClientFactory:
         kwargs["credential"] = credential
         return kwargs
 
+    def _get_copy_source_url(self, src_url: str) -> str:
+        # The service reads the source of a Put Block From URL request itself. A SAS
+        # credential is not part of the URL, so it needs to be added for the service to
+        # be able to read the source.
+        if isinstance(self._sdk_credential, AzureSasCredential) and (
+            not self._url_has_sas_token(src_url)
+        ):
+            separator = "&" if urllib.parse.urlparse(src_url).query else "?"
+            return f"{src_url}{separator}{self._sdk_credential.signature.lstrip('?')}"
+        return src_url
+
+    def _get_copy_source_authorization(self, src_url: str) -> Optional[str]:
+        # OAuth credentials are forwarded to the service for reading the source with the
+        # x-ms-copy-source-authorization header.
+        if isinstance(self._sdk_credential, TokenCredential) and (
+            not self._url_has_sas_token(src_url)
+        ):
+            token = self._sdk_credential.get_token(self._STORAGE_OAUTH_SCOPE).token
+            return f"Bearer {token}"
+        return None
+
     def _url_has_sas_token(self, resource_url: str) -> bool:
         parsed_url = urllib.parse.urlparse(resource_url)
         if parsed_url.query is None:
@@ -228,15 +475,989 @@ class AzStorageTorchBlobClientFactory:
             self._pipeline = client._pipeline
 
 
+class _PooledRequestsTransport(RequestsTransport):
+    def __init__(self, connection_pool_size: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._connection_pool_size = connection_pool_size
+        self._pid = os.getpid()
+
+    def open(self) -> None:
+        # Clients created before a fork keep using this transport in the child process. Start
+        # a new session in the child instead of sending requests over pooled connections that
+        # the parent process may also be using. The inherited session is dropped rather than
+        # closed so that nothing is done to the connections the parent still owns.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self.session = None
+            self._has_been_opened = False
+        super().open()
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        new_connections = 0
+        requests_sent = 0
+        if self.session is not None:
+            for adapter in self.session.adapters.values():
+                pools = cast(requests.adapters.HTTPAdapter, adapter).poolmanager.pools
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    new_connections += pool.num_connections
+                    requests_sent += pool.num_requests
+        return {
+            "new_connections": new_connections,
+            "reused_connections": max(requests_sent - new_connections, 0),
+        }
+
+    def _init_session(self, session: requests.Session) -> None:
+        super()._init_session(session)
+        # The base transport mounts adapters using the default requests pool size of 10
+        # connections per host. Remount them with a pool large enough to hold a connection
+        # for every in-flight request while keeping the transport's retry configuration.
+        for prefix, adapter in list(session.adapters.items()):
+            session.mount(
+                prefix,
+                BiggerBlockSizeHTTPAdapter(
+                    pool_maxsize=self._connection_pool_size,
+                    max_retries=cast(
+                        requests.adapters.HTTPAdapter, adapter
+                    ).max_retries,
+                ),
+            )
+
+
+def _get_blob_properties_from_listing(
+    listed_blob: azure.storage.blob.BlobProperties,
+) -> azure.storage.blob.BlobProperties:
+    # Only keep the properties needed for downloads so that clients for large listings stay
+    # small. List Blobs returns ETags without the surrounding quotes included in the ETag
+    # header of other operations, so add them to match ETags later read from responses.
+    etag = listed_blob.etag
+    if etag and not etag.startswith('"'):
+        etag = f'"{etag}"'
+    return azure.storage.blob.BlobProperties(
+        **{
+            "Content-Length": listed_blob.size,
+            "ETag": etag,
+            "Last-Modified": listed_blob.last_modified,
+        }
+    )
+
+
+def _get_blob_url(container_url: str, blob_name: str) -> str:
+    # Matches how the SDK builds blob URLs from a container URL, including keeping any
+    # SAS token from the container URL's query string.
+    parsed_url = urllib.parse.urlsplit(container_url)
+    blob_path = (
+        f"{parsed_url.path.rstrip('/')}/{urllib.parse.quote(blob_name, safe='~/')}"
+    )
+    return parsed_url._replace(path=blob_path).geturl()
+
+
+def _get_url_without_query_string(parsed_url: urllib.parse.ParseResult) -> str:
+    # Only include scheme, network location, and path for a blob URL. More specifically, we do
+    # not want to return any SAS tokens in the URL as it can accidentally result in leaking
+    # credentials as part of interfaces that expose the URL (e.g., azstoragetorch.datasets.Blob)
+    # so we just remove all URL components past the path.
+    return urllib.parse.urlunparse(
+        (
+            parsed_url.scheme,
+            parsed_url.netloc,
+            parsed_url.path,
+            None,
+            None,
+            None,
+        )
+    )
+
+
+def _get_partitions(
+    offset: int, length: int, partition_size: int
+) -> List[Tuple[int, int]]:
+    end = offset + length
+    num_partitions = math.ceil(length / partition_size)
+    partitions = []
+    for i in range(num_partitions):
+        start = offset + i * partition_size
+        if start >= end:
+            break
+        size = min(partition_size, end - start)
+        partitions.append((start, size))
+    return partitions
+
+
+def _get_size_from_range(range_header: str) -> int:
+    return int(range_header.split(" ", 1)[1].split("/", 1)[1])
+
+
+def _is_invalid_range_from_empty_blob_error(
+    error: azure.core.exceptions.HttpResponseError,
+) -> bool:
+    return _is_invalid_range_past_blob_end_error(error, 0)
+
+
+def _is_invalid_range_past_blob_end_error(
+    error: azure.core.exceptions.HttpResponseError, pos: int
+) -> bool:
+    return (
+        error.response is not None
+        and error.status_code == 416
+        and hasattr(error.response, "headers")
+        and "Content-Range" in error.response.headers
+        and _get_size_from_range(error.response.headers["Content-Range"]) <= pos
+    )
+
+
+def _get_backoff_time(attempt_number: int) -> float:
+    # Backoff time uses exponential backoff with full jitter as a starting point to have at least
+    # some delay before retrying. For exceptions that we get while streaming data, it will likely be
+    # because of environment's network (e.g. high network load) so the approach will give some amount
+    # of backoff and randomness before attempting to stream again. In the future, we should
+    # consider other approaches such as adapting/throttling stream reading speeds to reduce occurrences
+    # of connection errors due to an overwhelmed network.
+    return min(random.uniform(0, 2**attempt_number), 20)
+
+
+class _DownloadAttempts:
+    # Tracks the attempts made to download a range. Used by both the synchronous and asyncio
+    # clients so that they retry streaming errors the same way.
+    def __init__(self, max_attempts: int) -> None:
+        self._max_attempts = max_attempts
+        self._attempt = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(self._max_attempts - self._attempt, 0)
+
+    def record_failure(self) -> Optional[float]:
+        # Returns how long to back off before the next attempt or None if no attempts remain.
+        backoff_time = _get_backoff_time(self._attempt)
+        self._attempt += 1
+        if not self.remaining:
+            return None
+        return backoff_time
+
+
+def _get_default_max_in_flight_requests() -> int:
+    # Ideally we would just match this value to the max workers of the executor. However
+    # the executor class does not publicly expose its max worker count. So, instead we copy
+    # the max worker calculation from the executor class and inject it into both the executor
+    # and semaphore
+    #
+    # In Python 3.13, os.process_cpu_count() was added and the ThreadPoolExecutor updated to
+    # use os.process_cpu_count() instead of os.cpu_count() when calculating default max workers.
+    # To match ThreadPoolExecutor defaults across Python versions, we use process_cpu_count
+    # if available, otherwise fall back to os.cpu_count().
+    cpu_count_fn = getattr(os, "process_cpu_count", os.cpu_count)
+    return min(32, (cpu_count_fn() or 1) + 4)
+
+
+class _ScheduledWorkItem:
+    def __init__(
+        self,
+        future: concurrent.futures.Future,
+        fn: Callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> None:
+        self.future = future
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+
+class _ScheduledQueue:
+    # Per-executor state tracked by the I/O scheduler.
+    def __init__(self, executor: "_ScheduledExecutor") -> None:
+        self.executor = executor
+        self.max_in_flight = executor.max_in_flight
+        self.concurrency_limit = executor.concurrency_limit
+        self.pending: Deque[_ScheduledWorkItem] = collections.deque()
+        self.in_flight = 0
+        # Whether the queue is currently in the scheduler's ready rotation.
+        self.ready = False
+        # Whether the queue is set aside until its concurrency limit allows another request.
+        self.waiting_for_concurrency_limit = False
+
+    def is_idle(self) -> bool:
+        return not self.pending and not self.in_flight
+
+
+class _IOScheduler:
+    # Runs work submitted from all blob clients in a process on a single, bounded set of
+    # worker threads. Each submitting executor has its own queue and work is taken from
+    # queues in round-robin order so that one client with many queued partitions cannot
+    # starve other clients. An executor never has more than its own in-flight limit of
+    # work running at once, even if there are idle workers.
+    #
+    # Executors may also have the adaptive concurrency limit of the storage account they send
+    # requests to. Work is only handed to a worker once the account's limit allows another
+    # request, so that workers shared by every account are never blocked waiting on a
+    # throttled account while work for other accounts is ready to run.
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._condition = threading.Condition()
+        self._queues: Dict["_ScheduledExecutor", _ScheduledQueue] = {}
+        self._ready: Deque[_ScheduledQueue] = collections.deque()
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(
+        self, executor: "_ScheduledExecutor", work_item: _ScheduledWorkItem
+    ) -> None:
+        with self._condition:
+            queue = self._queues.get(executor)
+            if queue is None:
+                queue = _ScheduledQueue(executor)
+                self._queues[executor] = queue
+            queue.pending.append(work_item)
+            self._add_to_ready_if_runnable(queue)
+            if self._idle_workers:
+                self._condition.notify()
+            elif len(self._workers) < self._max_workers:
+                self._start_worker()
+
+    def cancel_pending(self, executor: "_ScheduledExecutor") -> None:
+        with self._condition:
+            queue = self._queues.get(executor)
+            if queue is None:
+                return
+            while queue.pending:
+                queue.pending.popleft().future.cancel()
+            self._remove_if_idle(queue)
+
+    def wait_until_idle(self, executor: "_ScheduledExecutor") -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: executor not in self._queues)
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(
+            target=self._run_worker,
+            name=f"azstoragetorch-io-{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._condition:
+                self._idle_workers += 1
+                queue, work_item = self._wait_for_next_work_item()
+                self._idle_workers -= 1
+            if queue.concurrency_limit is None:
+                work_item.run()
+            else:
+                with queue.concurrency_limit.hold():
+                    work_item.run()
+            # Drop the reference so the work item's arguments (e.g., buffers) can be
+            # freed while the worker waits for more work.
+            del work_item
+            with self._condition:
+                queue.in_flight -= 1
+                self._add_to_ready_if_runnable(queue)
+                self._remove_if_idle(queue)
+
+    def _wait_for_next_work_item(self) -> Tuple[_ScheduledQueue, _ScheduledWorkItem]:
+        while True:
+            self._condition.wait_for(lambda: bool(self._ready))
+            next_work_item = self._get_next_work_item()
+            if next_work_item is not None:
+                return next_work_item
+
+    def _get_next_work_item(
+        self,
+    ) -> Optional[Tuple[_ScheduledQueue, _ScheduledWorkItem]]:
+        while self._ready:
+            queue = self._ready.popleft()
+            queue.ready = False
+            if queue.concurrency_limit is not None and not (
+                queue.concurrency_limit.try_acquire(
+                    functools.partial(self._on_concurrency_limit_available, queue)
+                )
+            ):
+                queue.waiting_for_concurrency_limit = True
+                continue
+            work_item = queue.pending.popleft()
+            queue.in_flight += 1
+            # Move the queue to the back of the rotation so other queues get the next turn.
+            self._add_to_ready_if_runnable(queue)
+            return queue, work_item
+        return None
+
+    def _on_concurrency_limit_available(self, queue: _ScheduledQueue) -> None:
+        with self._condition:
+            queue.waiting_for_concurrency_limit = False
+            self._add_to_ready_if_runnable(queue)
+
+    def _add_to_ready_if_runnable(self, queue: _ScheduledQueue) -> None:
+        if queue.ready or queue.waiting_for_concurrency_limit or not queue.pending:
+            return
+        if queue.in_flight >= queue.max_in_flight:
+            return
+        queue.ready = True
+        self._ready.append(queue)
+        self._condition.notify()
+
+    def _remove_if_idle(self, queue: _ScheduledQueue) -> None:
+        if queue.is_idle() and self._queues.get(queue.executor) is queue:
+            del self._queues[queue.executor]
+            self._condition.notify_all()
+
+
+class _ScheduledExecutor(concurrent.futures.Executor):
+    # Executor handed out to each blob client. It holds no threads of its own and instead
+    # submits work to the process-wide I/O scheduler, which runs at most ``max_in_flight``
+    # of this executor's work items at a time. The scheduler is looked up on every submit
+    # so that executors created before a fork use the child process's scheduler.
+    def __init__(
+        self,
+        max_in_flight: int,
+        concurrency_limit: Optional["_AdaptiveConcurrencyLimit"] = None,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.concurrency_limit = concurrency_limit
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs):
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        _get_io_scheduler().submit(self, _ScheduledWorkItem(future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._shutdown = True
+        scheduler = _get_io_scheduler()
+        if cancel_futures:
+            scheduler.cancel_pending(self)
+        if wait:
+            scheduler.wait_until_idle(self)
+
+
+_IO_SCHEDULER: Optional[_IOScheduler] = None
+_IO_SCHEDULER_LOCK = threading.Lock()
+
+
+def _get_io_scheduler() -> _IOScheduler:
+    global _IO_SCHEDULER
+    with _IO_SCHEDULER_LOCK:
+        if _IO_SCHEDULER is None:
+            _IO_SCHEDULER = _IOScheduler(_get_default_max_in_flight_requests())
+        return _IO_SCHEDULER
+
+
+def _reset_io_scheduler_after_fork() -> None:
+    # Worker threads do not survive a fork and locks may have been held by them at the
+    # time of the fork. Start the child process (e.g., a DataLoader worker) with a fresh
+    # scheduler that lazily creates its own workers.
+    global _IO_SCHEDULER, _IO_SCHEDULER_LOCK
+    _IO_SCHEDULER = None
+    _IO_SCHEDULER_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_io_scheduler_after_fork)
+
+
+class _PrefixListing:
+    # Lists all blobs under a single prefix. Pages are fetched one after another on the
+    # executor and queued until the consumer reaches this prefix, so listings of many
+    # prefixes progress concurrently while still being consumed in order. Fetching pauses
+    # once enough pages are queued ahead of the consumer and resumes as they are consumed,
+    # which bounds the memory used by listings that are far ahead of the consumer.
+    _DONE = object()
+    _MAX_QUEUED_PAGES = 2
+
+    def __init__(
+        self,
+        pages: Iterator[Iterable[azure.storage.blob.BlobProperties]],
+        executor: concurrent.futures.Executor,
+        stop_event: threading.Event,
+    ):
+        self._pages = pages
+        self._executor = executor
+        self._stop_event = stop_event
+        self._results: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._num_queued_pages = 0
+        self._paused = False
+        self._submit_next_page()
+
+    def __iter__(self) -> Iterator[azure.storage.blob.BlobProperties]:
+        while True:
+            result = self._results.get()
+            if result is self._DONE:
+                return
+            if isinstance(result, BaseException):
+                raise result
+            self._resume_if_paused()
+            yield from result
+
+    def _submit_next_page(self) -> None:
+        if not self._stop_event.is_set():
+            self._executor.submit(self._fetch_next_page)
+
+    def _fetch_next_page(self) -> None:
+        if self._stop_event.is_set():
+            return
+        try:
+            page = next(self._pages, None)
+            if page is None:
+                self._results.put(self._DONE)
+                return
+            self._results.put(list(page))
+        except BaseException as e:
+            self._results.put(e)
+            return
+        with self._lock:
+            self._num_queued_pages += 1
+            if self._num_queued_pages >= self._MAX_QUEUED_PAGES:
+                # Rather than blocking a worker of the executor until the consumer catches up,
+                # the next page is submitted once a queued page is consumed.
+                self._paused = True
+                return
+        self._submit_next_page()
+
+    def _resume_if_paused(self) -> None:
+        with self._lock:
+            self._num_queued_pages -= 1
+            if not self._paused:
+                return
+            self._paused = False
+        self._submit_next_page()
+
+
+class _ParallelBlobLister:
+    # Splits the namespace under a prefix into disjoint prefix ranges using a delimiter-based
+    # listing of the blob hierarchy and pages each range concurrently. Because every range is
+    # contiguous in the sorted key space, yielding ranges and top-level blobs in name order
+    # produces the same sorted order as a serial listing.
+    _DELIMITER = "/"
+    # Bounds how many levels of single-prefix hierarchy (e.g., "data/train/") are descended
+    # through looking for a level that can be split into multiple ranges.
+    _MAX_DISCOVERY_DEPTH = 16
+    # Bounds how many prefix ranges are listed ahead of the consumer at once. Listings of the
+    # remaining prefixes start as the consumer finishes earlier ones.
+    _MAX_CONCURRENT_PREFIX_LISTINGS = 16
+
+    def __init__(
+        self,
+        container_sdk_client: azure.storage.blob.ContainerClient,
+        executor: concurrent.futures.Executor,
+    ):
+        self._container_sdk_client = container_sdk_client
+        self._executor = executor
+
+    def list_blobs(
+        self, prefix: Optional[str] = None
+    ) -> Iterator[azure.storage.blob.BlobProperties]:
+        stop_event = threading.Event()
+        try:
+            yield from self._list_level(prefix, stop_event, depth=0)
+        finally:
+            # Stop fetching pages for ranges that will no longer be consumed (e.g., if
+            # iteration stopped early or a listing request failed).
+            stop_event.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _list_level(
+        self, prefix: Optional[str], stop_event: threading.Event, depth: int
+    ) -> Iterator[azure.storage.blob.BlobProperties]:
+        pages = iter(
+            self._container_sdk_client.walk_blobs(
+                name_starts_with=prefix, delimiter=self._DELIMITER
+            ).by_page()
+        )
+        first_page = list(next(pages, []))
+        second_page = next(pages, None)
+        if (
+            second_page is None
+            and depth < self._MAX_DISCOVERY_DEPTH
+            and len(first_page) == 1
+            and isinstance(first_page[0], azure.storage.blob.BlobPrefix)
+        ):
+            # A level with only a single prefix cannot be split, so split the next level instead.
+            yield from self._list_level(first_page[0].name, stop_event, depth + 1)
+            return
+        yield from self._list_page_items(first_page, stop_event)
+        if second_page is not None:
+            for page in itertools.chain([second_page], pages):
+                yield from self._list_page_items(list(page), stop_event)
+
+    def _list_page_items(
+        self,
+        items: Sequence[
+            Union[azure.storage.blob.BlobProperties, azure.storage.blob.BlobPrefix]
+        ],
+        stop_event: threading.Event,
+    ) -> Iterator[azure.storage.blob.BlobProperties]:
+        # The service returns all prefixes of a page ahead of its blobs. No top-level blob
+        # can sort within a prefix's range because it would then contain the delimiter, so
+        # sorting by name interleaves blobs and prefix ranges in key order.
+        items = sorted(items, key=lambda item: item.name)
+        pending_prefixes = collections.deque(
+            item.name
+            for item in items
+            if isinstance(item, azure.storage.blob.BlobPrefix)
+        )
+        prefix_listings: Dict[str, _PrefixListing] = {}
+        self._start_prefix_listings(pending_prefixes, prefix_listings, stop_event)
+        for item in items:
+            if isinstance(item, azure.storage.blob.BlobPrefix):
+                yield from prefix_listings.pop(item.name)
+                self._start_prefix_listings(
+                    pending_prefixes, prefix_listings, stop_event
+                )
+            else:
+                yield item
+
+    def _start_prefix_listings(
+        self,
+        pending_prefixes: Deque[str],
+        prefix_listings: Dict[str, _PrefixListing],
+        stop_event: threading.Event,
+    ) -> None:
+        while (
+            pending_prefixes
+            and len(prefix_listings) < self._MAX_CONCURRENT_PREFIX_LISTINGS
+        ):
+            prefix = pending_prefixes.popleft()
+            prefix_listings[prefix] = self._start_prefix_listing(prefix, stop_event)
+
+    def _start_prefix_listing(
+        self, prefix: str, stop_event: threading.Event
+    ) -> _PrefixListing:
+        pages = iter(
+            self._container_sdk_client.list_blobs(name_starts_with=prefix).by_page()
+        )
+        return _PrefixListing(pages, self._executor, stop_event)
+
+
+class _DownloadStats:
+    # Smoothing factor for the exponentially weighted moving averages. Higher values weigh
+    # recent requests more heavily.
+    _SMOOTHING_FACTOR = 0.2
+    # Minimum number of samples needed before estimates are considered representative
+    # enough to be used for planning downloads.
+    _MIN_SAMPLES = 8
+    # Requests smaller than this mostly measure latency, so they are excluded from
+    # throughput estimates.
+    _MIN_THROUGHPUT_SAMPLE_SIZE = 1024 * 1024
+
+    # Number of recent partition durations to keep for computing percentiles.
+    _PARTITION_DURATION_WINDOW_SIZE = 128
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: Optional[float] = None
+        self._throughput: Optional[float] = None
+        self._num_throughput_samples = 0
+        # Durations are normalized to seconds per byte so that partitions of different
+        # sizes can be compared against each other.
+        self._partition_durations: Deque[float] = collections.deque(
+            maxlen=self._PARTITION_DURATION_WINDOW_SIZE
+        )
+
+    def record(self, latency: float, num_bytes: int, transfer_time: float) -> None:
+        with self._lock:
+            self._latency = self._smooth(self._latency, latency)
+            if num_bytes >= self._MIN_THROUGHPUT_SAMPLE_SIZE and transfer_time > 0:
+                self._throughput = self._smooth(
+                    self._throughput, num_bytes / transfer_time
+                )
+                self._num_throughput_samples += 1
+
+    def get_estimates(self) -> Optional[Tuple[float, float]]:
+        # Returns the estimated per-request latency in seconds and per-request throughput
+        # in bytes per second, if enough requests have been measured.
+        with self._lock:
+            if self._num_throughput_samples < self._MIN_SAMPLES:
+                return None
+            return cast(float, self._latency), cast(float, self._throughput)
+
+    def record_partition_duration(self, duration: float, num_bytes: int) -> None:
+        if num_bytes <= 0:
+            return
+        with self._lock:
+            self._partition_durations.append(duration / num_bytes)
+
+    def get_partition_duration_percentile(
+        self, percentile: float, num_bytes: int
+    ) -> Optional[float]:
+        # Returns the expected duration, in seconds, of a partition of size ``num_bytes``
+        # at the given percentile of recently downloaded partitions.
+        with self._lock:
+            if len(self._partition_durations) < self._MIN_SAMPLES:
+                return None
+            durations = sorted(self._partition_durations)
+        index = min(int(percentile * len(durations)), len(durations) - 1)
+        return durations[index] * num_bytes
+
+    def reset_lock(self) -> None:
+        self._lock = threading.Lock()
+
+    def _smooth(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return self._SMOOTHING_FACTOR * sample + (1 - self._SMOOTHING_FACTOR) * current
+
+
+# Download statistics are shared across all clients in a process that target the same
+# storage account. Clients are often short-lived (e.g., one per blob in a dataset), so
+# sharing lets new clients plan downloads from what previous clients already measured.
+_DOWNLOAD_STATS_BY_ACCOUNT: Dict[str, _DownloadStats] = {}
+_DOWNLOAD_STATS_LOCK = threading.Lock()
+
+
+def _get_download_stats(account_netloc: str) -> _DownloadStats:
+    with _DOWNLOAD_STATS_LOCK:
+        if account_netloc not in _DOWNLOAD_STATS_BY_ACCOUNT:
+            _DOWNLOAD_STATS_BY_ACCOUNT[account_netloc] = _DownloadStats()
+        return _DOWNLOAD_STATS_BY_ACCOUNT[account_netloc]
+
+
+def _reset_download_stats_locks_after_fork() -> None:
+    # Unlike concurrency limits, measurements from the parent still describe the account, so
+    # they are kept to plan the child's downloads. Only the locks, which may have been held
+    # by the parent's threads at the time of the fork, are recreated.
+    global _DOWNLOAD_STATS_LOCK
+    _DOWNLOAD_STATS_LOCK = threading.Lock()
+    for download_stats in _DOWNLOAD_STATS_BY_ACCOUNT.values():
+        download_stats.reset_lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_download_stats_locks_after_fork)
+
+
+class _AdaptiveConcurrencyLimit:
+    # Additive-increase/multiplicative-decrease (AIMD) limit on the number of concurrent
+    # transfer requests to a storage account. The limit starts at the maximum and is cut
+    # whenever the account responds with a throttling error. It then grows back by roughly
+    # one request for every limit's worth of successful requests while the limit is
+    # actually constraining concurrency.
+    _DECREASE_FACTOR = 0.5
+    _MIN_LIMIT = 1
+
+    def __init__(self, max_limit: int) -> None:
+        self._condition = threading.Condition()
+        self._max_limit = max_limit
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        # Incremented on every decrease. Throttling responses to requests sent before the
+        # most recent decrease are ignored so that a single burst of throttling, which
+        # affects all outstanding requests at once, only cuts the limit once.
+        self._epoch = 0
+        # Callbacks waiting, without blocking a thread, for another request to be allowed.
+        self._waiters: List[Callable[[], None]] = []
+        # Tracks whether the current thread holds a permit acquired on its behalf.
+        self._thread_local = threading.local()
+
+    @property
+    def limit(self) -> int:
+        with self._condition:
+            return self._get_current_limit()
+
+    @property
+    def epoch(self) -> int:
+        with self._condition:
+            return self._epoch
+
+    def ensure_max_limit(self, max_limit: int) -> None:
+        with self._condition:
+            if max_limit <= self._max_limit:
+                return
+            # Only jump straight to the new maximum if the limit has not been cut by
+            # throttling. Otherwise, let it grow back additively up to the new maximum.
+            waiters = []
+            if self._limit >= self._max_limit:
+                self._limit = float(max_limit)
+                self._condition.notify_all()
+                waiters = self._pop_waiters()
+            self._max_limit = max_limit
+        self._notify_waiters(waiters)
+
+    def acquire(self) -> None:
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._in_flight < self._get_current_limit()
+            )
+            self._in_flight += 1
+
+    def try_acquire(self, on_available: Callable[[], None]) -> bool:
+        # Acquires without blocking if another request is allowed. Otherwise, on_available is
+        # called once the limit next allows another request, after which acquiring should be
+        # tried again.
+        with self._condition:
+            if self._in_flight < self._get_current_limit():
+                self._in_flight += 1
+                return True
+            self._waiters.append(on_available)
+            return False
+
+    def release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+            waiters = self._pop_waiters()
+        self._notify_waiters(waiters)
+
+    @contextlib.contextmanager
+    def hold(self) -> Iterator[None]:
+        # Used by whoever acquired a permit with try_acquire() to run work with it on the current
+        # thread. Requests made by the work use the held permit instead of acquiring another, and
+        # the permit is released once the work is done.
+        self._thread_local.holding = True
+        try:
+            yield
+        finally:
+            self._thread_local.holding = False
+            self.release()
+
+    @contextlib.contextmanager
+    def suspend(self) -> Iterator[None]:
+        # Gives up a permit held by the current thread for the duration of the context (e.g.,
+        # while backing off between attempts) so that it does not sit idle. The permit is
+        # reacquired before returning to the held work.
+        if not self._is_held_by_current_thread():
+            yield
+            return
+        self._thread_local.holding = False
+        self.release()
+        try:
+            yield
+        finally:
+            self.acquire()
+            self._thread_local.holding = True
+
+    def record_success(self) -> None:
+        with self._condition:
+            if self._in_flight < self._get_current_limit():
+                return
+            previous_limit = self._get_current_limit()
+            self._limit = min(self._limit + 1 / self._limit, self._max_limit)
+            if self._get_current_limit() <= previous_limit:
+                return
+            self._condition.notify_all()
+            waiters = self._pop_waiters()
+        self._notify_waiters(waiters)
+
+    def record_throttled(self, epoch: int) -> None:
+        with self._condition:
+            if epoch != self._epoch:
+                return
+            self._limit = max(self._limit * self._DECREASE_FACTOR, self._MIN_LIMIT)
+            self._epoch += 1
+            _LOGGER.debug(
+                "Storage account throttled requests. Reduced concurrency limit to %s.",
+                self._get_current_limit(),
+            )
+
+    def __enter__(self) -> "_AdaptiveConcurrencyLimit":
+        if not self._is_held_by_current_thread():
+            self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        if not self._is_held_by_current_thread():
+            self.release()
+
+    def _is_held_by_current_thread(self) -> bool:
+        return getattr(self._thread_local, "holding", False)
+
+    def _pop_waiters(self) -> List[Callable[[], None]]:
+        waiters = self._waiters
+        self._waiters = []
+        return waiters
+
+    def _notify_waiters(self, waiters: List[Callable[[], None]]) -> None:
+        # Waiters are notified without holding the limit's lock because they may acquire
+        # locks of their own (e.g., the I/O scheduler's).
+        for waiter in waiters:
+            waiter()
+
+    def _get_current_limit(self) -> int:
+        return int(self._limit)
+
+
+_CONCURRENCY_LIMITS_BY_ACCOUNT: Dict[str, _AdaptiveConcurrencyLimit] = {}
+_CONCURRENCY_LIMITS_LOCK = threading.Lock()
+
+
+def _get_concurrency_limit(account_netloc: str) -> _AdaptiveConcurrencyLimit:
+    with _CONCURRENCY_LIMITS_LOCK:
+        if account_netloc not in _CONCURRENCY_LIMITS_BY_ACCOUNT:
+            _CONCURRENCY_LIMITS_BY_ACCOUNT[account_netloc] = _AdaptiveConcurrencyLimit(
+                _get_default_max_in_flight_requests()
+            )
+        return _CONCURRENCY_LIMITS_BY_ACCOUNT[account_netloc]
+
+
+def _reset_concurrency_limits_after_fork() -> None:
+    # Limits count the requests in flight in the process that acquired them. Requests
+    # in flight in the parent at the time of the fork never complete in the child, so
+    # start the child with fresh limits.
+    global _CONCURRENCY_LIMITS_LOCK
+    _CONCURRENCY_LIMITS_BY_ACCOUNT.clear()
+    _CONCURRENCY_LIMITS_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_concurrency_limits_after_fork)
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = collections.Counter()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += value
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+class _HedgeLostError(Exception):
+    # Raised from within a download attempt to stop it once another attempt
+    # for the same range has already completed.
+    pass
+
+
+class _CountingStream:
+    # Wraps a download stream to track how many bytes have been consumed from it. A chunk is
+    # only counted once the consumer requests the next chunk, which means it has been fully
+    # processed (e.g., written to its destination).
+    #
+    # If requested, a CRC64 checksum of the consumed content is also computed as it is
+    # streamed so that checksums are calculated on the thread reading the response.
+    def __init__(self, stream: Iterator[bytes], compute_crc64: bool = False):
+        self._stream = stream
+        self._compute_crc64 = compute_crc64
+        self.num_bytes = 0
+        self.crc64 = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            yield chunk
+            self.num_bytes += len(chunk)
+            if self._compute_crc64:
+                self.crc64 = _crc64.compute(chunk, self.crc64)
+
+
+class _HedgedRange:
+    # Tracks the primary request and, if issued, the hedged request for a single range. The
+    # primary request writes directly into the range's slice of the destination buffer while
+    # the hedged request writes into its own buffer which is only copied into the destination
+    # if the hedge wins. All writes happen under a lock and stop once a winner is chosen
+    # so that a losing request never writes to the destination after the download returns.
+    def __init__(self, buffer: memoryview, pos: int):
+        self.buffer = buffer
+        self.pos = pos
+        self.start_time = 0.0
+        self.duration = 0.0
+        self.primary_future: Optional[concurrent.futures.Future[None]] = None
+        self.hedge_future: Optional[concurrent.futures.Future[None]] = None
+        self.hedge_won = False
+        self._completed = False
+        self._lock = threading.Lock()
+
+    @property
+    def completed(self) -> bool:
+        return self._completed
+
+    def get_attempt_futures(self) -> List[concurrent.futures.Future[None]]:
+        return [f for f in (self.primary_future, self.hedge_future) if f is not None]
+
+    def all_attempts_failed(self) -> bool:
+        futures = self.get_attempt_futures()
+        return all(f.done() and f.exception() is not None for f in futures)
+
+    def get_writer(self, target: memoryview) -> "_HedgedRangeWriter":
+        return _HedgedRangeWriter(self, target)
+
+    def complete(self, hedge_content: Optional[memoryview] = None) -> None:
+        with self._lock:
+            if self._completed:
+                raise _HedgeLostError()
+            if hedge_content is not None:
+                self.buffer[:] = hedge_content
+                self.hedge_won = True
+            self.duration = time.perf_counter() - self.start_time
+            self._completed = True
+
+    def write(self, target: memoryview, key: slice, value: bytes) -> None:
+        with self._lock:
+            if self._completed:
+                raise _HedgeLostError()
+            target[key] = value
+
+
+class _HedgedRangeWriter:
+    def __init__(self, hedged_range: _HedgedRange, target: memoryview):
+        self._hedged_range = hedged_range
+        self._target = target
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+    def __setitem__(self, key: slice, value: bytes) -> None:
+        self._hedged_range.write(self._target, key, value)
+
+
 class AzStorageTorchBlobClient:
     _PARTITIONED_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
     _PARTITION_SIZE = 16 * 1024 * 1024
+    _MIN_PARTITION_SIZE = 4 * 1024 * 1024
+    _MAX_PARTITION_SIZE = 128 * 1024 * 1024
+    _PARTITION_SIZE_ALIGNMENT = 1024 * 1024
+    # Partitions are sized so that request latency is at most roughly 1 / (1 + factor)
+    # of the total time spent on a single range request.
+    _LATENCY_AMORTIZATION_FACTOR = 4
+    # When hedging is enabled, a duplicate request is issued for a range once its elapsed
+    # time exceeds this percentile of recent partition durations.
+    _HEDGE_PERCENTILE = 0.95
+    # Ranges requested through download_ranges() are merged into a single request when the gap
+    # between them is at most this many bytes. Downloading a small gap is typically cheaper than
+    # paying the latency of an additional request.
+    _DOWNLOAD_RANGES_MAX_GAP = 1024 * 1024
     _NUM_DOWNLOAD_ATTEMPTS = 3
+    # The service only returns a CRC64 checksum for ranged downloads of up to 4 MiB.
+    _MAX_CRC64_RANGE_SIZE = 4 * 1024 * 1024
     _STAGE_BLOCK_SIZE = 32 * 1024 * 1024
+    # Cached attributes that hold locks or process-specific state and are recreated after a fork.
+    _PER_PROCESS_ATTRIBUTES = (
+        "_max_in_flight_semaphore",
+        "_counters",
+        "_blob_properties_lock",
+        "_download_stats",
+        "_concurrency_limit",
+    )
+    # A block blob can have at most 50,000 committed blocks. Blocks copied from a source
+    # blob are grown past the stage block size if needed to stay within this limit.
+    _MAX_BLOCKS_PER_BLOB = 50_000
     _RETRYABLE_READ_EXCEPTIONS = (
         azure.core.exceptions.IncompleteReadError,
         azure.core.exceptions.HttpResponseError,
         azure.core.exceptions.DecodeError,
+        ChecksumMismatchError,
     )
     _QS_PARAMETERS_TO_INCLUDE = [
         "snapshot",
@@ -248,15 +1469,50 @@ class AzStorageTorchBlobClient:
         sdk_blob_client: azure.storage.blob.BlobClient,
         executor: Optional[concurrent.futures.Executor] = None,
         max_in_flight_requests: Optional[int] = None,
+        hedge_downloads: bool = False,
+        speculative_download_partitions: int = 1,
+        max_download_attempts: Optional[int] = None,
+        validate_crc64: bool = False,
+        blob_properties: Optional[azure.storage.blob.BlobProperties] = None,
+        disk_cache: Optional[DiskCache] = None,
     ):
         self._sdk_blob_client = sdk_blob_client
         self._generated_sdk_storage_client = self._sdk_blob_client._client
 
         if max_in_flight_requests is None:
-            max_in_flight_requests = self._get_max_in_flight_requests()
+            max_in_flight_requests = _get_default_max_in_flight_requests()
         self._max_in_flight_requests = max_in_flight_requests
         self._executor = executor
-        self._blob_properties: Optional[azure.storage.blob.BlobProperties] = None
+        # Executors provided by the caller are owned, and managed across forks, by the caller.
+        self._owns_executor = executor is None
+        self._pid = os.getpid()
+        self._hedge_downloads = hedge_downloads
+        if speculative_download_partitions < 1:
+            raise ValueError(
+                "speculative_download_partitions must be greater than or equal to 1"
+            )
+        self._speculative_download_partitions = speculative_download_partitions
+        if max_download_attempts is None:
+            max_download_attempts = self._NUM_DOWNLOAD_ATTEMPTS
+        if max_download_attempts < 1:
+            raise ValueError("max_download_attempts must be greater than or equal to 1")
+        self._max_download_attempts = max_download_attempts
+        self._validate_crc64 = validate_crc64
+        if validate_crc64 and not _crc64.is_native():
+            _LOGGER.warning(
+                "CRC64 validation is enabled but the azure-storage-extensions package is not "
+                "installed. Falling back to a pure-Python CRC64 implementation, which is "
+                "significantly slower. Install azstoragetorch[crc64] for a native implementation."
+            )
+        # Properties may be known ahead of time (e.g., from listing a container), in which
+        # case no request is needed to learn the blob's size and ETag.
+        self._blob_properties: Optional[azure.storage.blob.BlobProperties] = (
+            blob_properties
+        )
+        self._disk_cache = disk_cache
+        # Cached content is only used once a conditional request has confirmed that the
+        # blob has not changed since it was cached.
+        self._disk_cache_validated = False
 
     @property
     def url(self) -> str:
@@ -264,7 +1520,7 @@ class AzStorageTorchBlobClient:
         parsed_url = urllib.parse.urlparse(blob_sdk_url)
         if parsed_url.query is None:
             return blob_sdk_url
-        return self._get_url_without_query_string(parsed_url)
+        return _get_url_without_query_string(parsed_url)
 
     @property
     def blob_name(self) -> str:
@@ -274,31 +1530,160 @@ class AzStorageTorchBlobClient:
     def container_name(self) -> str:
         return self._sdk_blob_client.container_name
 
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return self._counters.snapshot()
+
     def get_blob_size(self) -> int:
+        self._reinitialize_if_forked()
         return self._get_blob_properties().size
 
-    def download(self, offset: int = 0, length: Optional[int] = None) -> bytes:
-        initial_content = b""
+    def download(
+        self, offset: int = 0, length: Optional[int] = None
+    ) -> DOWNLOAD_CONTENT_TYPE:
+        self._reinitialize_if_forked()
+        if self._disk_cache is not None:
+            return self._download_with_disk_cache(
+                self._disk_cache, offset, length, self._download_into
+            )
+        initial_chunks: List[bytes] = []
+        initial_length = 0
         if self._blob_properties is None:
-            initial_content = self._download_from_unknown_blob_size(offset, length)
-            offset = len(initial_content) + offset
+            initial_chunks = self._download_from_unknown_blob_size(offset, length)
+            initial_length = sum(len(chunk) for chunk in initial_chunks)
+            offset = initial_length + offset
             if length is not None:
-                length = length - len(initial_content)
+                length = length - initial_length
             if not self._more_to_download(offset, length):
-                return initial_content
+                return b"".join(initial_chunks)
         length = self._update_download_length_from_blob_size(offset, length)
-        if length < self._PARTITIONED_DOWNLOAD_THRESHOLD:
-            return b"".join(
-                [initial_content, self._download_with_retries(offset, length)]
+        if not initial_length and length < self._get_partitioned_download_threshold():
+            return self._download_with_retries(offset, length)
+        # Allocate the full content once and have each partition write directly into its slice
+        # of it. This avoids holding both the individual partitions and the joined result in
+        # memory at the same time.
+        content = bytearray(initial_length + length)
+        content_view = memoryview(content)
+        pos = 0
+        for chunk in initial_chunks:
+            content_view[pos : pos + len(chunk)] = chunk
+            pos += len(chunk)
+        self._download_into(content_view[initial_length:], offset)
+        return content
+
+    def download_into(
+        self,
+        buffer: SUPPORTED_READINTO_BUFFER_TYPE,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> int:
+        self._reinitialize_if_forked()
+        # Views of the buffer are released as soon as the download returns or raises, so
+        # the caller can resize the buffer even while a raised exception's traceback still
+        # references them.
+        with get_writable_memoryview(buffer) as view:
+            if length is None:
+                length = len(view)
+            if length > len(view):
+                raise ValueError(
+                    f"length ({length}) must not be greater than size of buffer ({len(view)})"
+                )
+            if length == 0:
+                return 0
+            written = 0
+            if self._blob_properties is None:
+                with view[:length] as target:
+                    written = self._download_into_from_unknown_blob_size(target, offset)
+                offset += written
+                length -= written
+                if not self._more_to_download(offset, length):
+                    return written
+            length = max(self._update_download_length_from_blob_size(offset, length), 0)
+            with view[written : written + length] as target:
+                self._download_into(target, offset)
+            return written + length
+
+    def iter_chunks(
+        self,
+        offset: int = 0,
+        length: Optional[int] = None,
+        window: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        self._reinitialize_if_forked()
+        if window is None:
+            window = self._max_in_flight_requests
+        if window < 1:
+            raise ValueError("window must be greater than or equal to 1")
+        return self._iter_chunks(offset, length, window)
+
+    def download_ranges(
+        self, ranges: Sequence[DOWNLOAD_RANGE_TYPE], max_gap: Optional[int] = None
+    ) -> List[memoryview]:
+        self._reinitialize_if_forked()
+        if max_gap is None:
+            max_gap = self._DOWNLOAD_RANGES_MAX_GAP
+        if max_gap < 0:
+            raise ValueError("max_gap must be greater than or equal to 0")
+        for offset, length in ranges:
+            if offset < 0 or length < 0:
+                raise ValueError(
+                    f"Range offset and length must be greater than or equal to 0: {(offset, length)}"
+                )
+        blob_size = self.get_blob_size()
+        ranges = [
+            (min(offset, blob_size), max(min(length, blob_size - offset), 0))
+            for offset, length in ranges
+        ]
+        merged_ranges = self._coalesce_ranges(ranges, max_gap)
+        # All merged ranges are downloaded into a single buffer and each requested range is
+        # returned as a read-only slice of it so that no content is copied after download.
+        buffer = bytearray(sum(length for _, length in merged_ranges))
+        buffer_positions = list(
+            itertools.accumulate(
+                (length for _, length in merged_ranges[:-1]), initial=0
             )
-        else:
-            return b"".join(
-                [initial_content, self._partitioned_download(offset, length)]
+        )
+        self._download_merged_ranges_into(
+            memoryview(buffer), merged_ranges, buffer_positions
+        )
+        content = memoryview(buffer).toreadonly()
+        merged_offsets = [offset for offset, _ in merged_ranges]
+        views = []
+        for offset, length in ranges:
+            if length == 0:
+                views.append(content[0:0])
+                continue
+            i = bisect.bisect_right(merged_offsets, offset) - 1
+            start = buffer_positions[i] + offset - merged_offsets[i]
+            views.append(content[start : start + length])
+        return views
+
+    def submit_download(self, offset: int, length: int) -> DOWNLOAD_FUTURE_TYPE:
+        self._reinitialize_if_forked()
+        if offset < 0 or length < 1:
+            raise ValueError(
+                f"Range offset must be greater than or equal to 0 and length must be "
+                f"greater than or equal to 1: {(offset, length)}"
             )
+        # Downloads the range in the background with a single request. This is for callers that
+        # schedule their own ranges ahead of when they are needed (e.g., sequential read-ahead)
+        # and need each range as soon as it completes, instead of waiting on a full download.
+        if self._disk_cache is not None:
+            # Ranges missing from the disk cache are downloaded one partition at a time because
+            # partitioned downloads would wait on work submitted to the same executor.
+            return self._get_executor().submit(
+                self._download_with_disk_cache,
+                self._disk_cache,
+                offset,
+                length,
+                self._download_into_serially,
+            )
+        return self._get_executor().submit(self._download_with_retries, offset, length)
 
     def stage_blocks(
         self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE
     ) -> List[STAGE_BLOCK_FUTURE_TYPE]:
+        self._reinitialize_if_forked()
         if not data:
             raise ValueError("Data must not be empty.")
         if (
@@ -318,35 +1703,87 @@ class AzStorageTorchBlobClient:
         return futures
 
     def commit_block_list(self, block_ids: List[str]) -> None:
+        self._reinitialize_if_forked()
         blob_blocks = [azure.storage.blob.BlobBlock(block_id) for block_id in block_ids]
         self._sdk_blob_client.commit_block_list(blob_blocks)
 
+    def copy_from_url(
+        self,
+        source_url: str,
+        source_size: int,
+        source_etag: Optional[str] = None,
+        source_authorization: Optional[str] = None,
+    ) -> None:
+        self._reinitialize_if_forked()
+        # Copies the source blob into this blob entirely server-side. Partitions of the source are
+        # staged with parallel Put Block From URL requests and then committed as a block list, so
+        # no blob data is transferred through the client.
+        futures = []
+        for pos, length in self._get_copy_partitions(source_size):
+            self._max_in_flight_semaphore.acquire()
+            future = self._get_executor().submit(
+                self._stage_block_from_url,
+                source_url,
+                pos,
+                length,
+                source_etag,
+                source_authorization,
+            )
+            future.add_done_callback(self._release_in_flight_semaphore)
+            futures.append(future)
+        self._raise_if_any_future_failed(futures)
+        self.commit_block_list([future.result() for future in futures])
+
+    def upload_blob(self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> None:
+        self._reinitialize_if_forked()
+        # Uploads the blob with a single Put Blob request. The SDK only sends data in a single
+        # request when it is given a bytes object, so other bytes-like objects are copied.
+        upload_blob_kwargs: Dict[str, Any] = {}
+        if self._validate_crc64:
+            upload_blob_kwargs["transactional_content_crc64"] = _crc64.to_bytes(
+                _crc64.compute(data)
+            )
+        with self._concurrency_limit:
+            self._sdk_blob_client.upload_blob(
+                bytes(data),
+                length=len(data),
+                overwrite=True,
+                **upload_blob_kwargs,
+            )
+
     def close(self) -> None:
+        self._reinitialize_if_forked()
         if self._executor is not None:
             self._executor.shutdown()
+            # A client may be closed by more than one user of it, such as each BlobIO opened
+            # with a dataset Blob's reader(). Executors owned by the client only hand work to
+            # the process-wide scheduler, so a new one is created if the client is used again.
+            if self._owns_executor:
+                self._executor = None
 
-    def _get_max_in_flight_requests(self) -> int:
-        # Ideally we would just match this value to the max workers of the executor. However
-        # the executor class does not publicly expose its max worker count. So, instead we copy
-        # the max worker calculation from the executor class and inject it into both the executor
-        # and semaphore
-        #
-        # In Python 3.13, os.process_cpu_count() was added and the ThreadPoolExecutor updated to
-        # use os.process_cpu_count() instead of os.cpu_count() when calculating default max workers.
-        # To match ThreadPoolExecutor defaults across Python versions, we use process_cpu_count
-        # if available, otherwise fall back to os.cpu_count().
-        cpu_count_fn = getattr(os, "process_cpu_count", os.cpu_count)
-        return min(32, (cpu_count_fn() or 1) + 4)
+    def _reinitialize_if_forked(self) -> None:
+        # Clients created in a parent process can be used again in a forked child process
+        # (e.g., a DataLoader worker). Locks and semaphores may have been held by the parent's
+        # threads at the time of the fork and never be released in the child, so recreate
+        # them, along with the client's executor, lazily in the child.
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        if self._owns_executor:
+            self._executor = None
+        for name in self._PER_PROCESS_ATTRIBUTES:
+            self.__dict__.pop(name, None)
 
     def _get_executor(self) -> concurrent.futures.Executor:
-        # We want executor creation to be lazy instead of instantiating immediately in
-        # the constructor because the executor itself is not pickleable. This is an issue
-        # when workers are used by PyTorch's DataLoader as workers are spawned as processes.
-        # So we delay executor creation until it is needed for reading/writing data which will
-        # happen after processes are spawned.
+        # Executor creation is kept lazy so that clients created and pickled before
+        # DataLoader workers are spawned do not carry any executor state with them.
+        # Work is run on the process-wide I/O scheduler, which bounds the total number of
+        # threads and concurrent requests across all clients instead of each client
+        # spawning its own pool of threads. The scheduler also only runs the client's work
+        # once the storage account's concurrency limit allows another request.
         if self._executor is None:
-            self._executor = concurrent.futures.ThreadPoolExecutor(
-                self._max_in_flight_requests
+            self._executor = _ScheduledExecutor(
+                self._max_in_flight_requests, self._concurrency_limit
             )
         return self._executor
 
@@ -359,6 +1796,44 @@ class AzStorageTorchBlobClient:
         # submitted to the executor when there are no workers available to upload it.
         return threading.Semaphore(self._max_in_flight_requests)
 
+    @functools.cached_property
+    def _counters(self) -> _Counters:
+        return _Counters()
+
+    @functools.cached_property
+    def _blob_properties_lock(self) -> threading.Lock:
+        return threading.Lock()
+
+    @functools.cached_property
+    def _download_stats(self) -> _DownloadStats:
+        return _get_download_stats(
+            urllib.parse.urlparse(self._sdk_blob_client.url).netloc
+        )
+
+    @functools.cached_property
+    def _concurrency_limit(self) -> _AdaptiveConcurrencyLimit:
+        concurrency_limit = _get_concurrency_limit(
+            urllib.parse.urlparse(self._sdk_blob_client.url).netloc
+        )
+        concurrency_limit.ensure_max_limit(self._max_in_flight_requests)
+        return concurrency_limit
+
+    @functools.cached_property
+    def _disk_cache_url(self) -> str:
+        # Snapshots and versions of a blob share its URL path, so keep their query string
+        # parameters to cache each of them separately. Any SAS token is left out.
+        parsed_url = urllib.parse.urlparse(self._sdk_blob_client.url)
+        query = urllib.parse.parse_qs(parsed_url.query)
+        version_parameters = [
+            (name, query[name][0])
+            for name in self._QS_PARAMETERS_TO_INCLUDE
+            if name in query
+        ]
+        url = _get_url_without_query_string(parsed_url)
+        if version_parameters:
+            url += "?" + urllib.parse.urlencode(version_parameters)
+        return url
+
     def _get_blob_properties(self) -> azure.storage.blob.BlobProperties:
         if self._blob_properties is None:
             self._blob_properties = self._sdk_blob_client.get_blob_properties()
@@ -372,31 +1847,481 @@ class AzStorageTorchBlobClient:
             return min(length, length_from_offset)
         return length_from_offset
 
-    def _partitioned_download(self, offset: int, length: int) -> bytes:
-        futures = []
-        for read_partition in self._get_partitions(
-            offset, length, self._PARTITION_SIZE
-        ):
-            futures.append(
-                self._get_executor().submit(
-                    self._download_with_retries, *read_partition
+    def _download_into(self, buffer: memoryview, offset: int) -> None:
+        if len(buffer) < self._get_partitioned_download_threshold():
+            self._download_into_with_retries(buffer, offset)
+        else:
+            self._partitioned_download_into(buffer, offset)
+
+    def _download_with_disk_cache(
+        self,
+        disk_cache: DiskCache,
+        offset: int,
+        length: Optional[int],
+        download_into: Callable[[memoryview, int], Any],
+    ) -> DOWNLOAD_CONTENT_TYPE:
+        block_size = disk_cache.block_size
+        blocks: Dict[int, bytes] = {}
+        if not self._disk_cache_validated:
+            blocks.update(self._validate_disk_cache(disk_cache, offset // block_size))
+        length = self._update_download_length_from_blob_size(offset, length)
+        if length <= 0:
+            return b""
+        etag = self._get_blob_properties().etag
+        first_index = offset // block_size
+        last_index = (offset + length - 1) // block_size
+        missing_indexes = []
+        for index in range(first_index, last_index + 1):
+            if index in blocks:
+                continue
+            block = disk_cache.get_block(
+                self._disk_cache_url,
+                etag,
+                index,
+                self._get_disk_cache_block_length(disk_cache, index),
+            )
+            if block is None:
+                missing_indexes.append(index)
+            else:
+                blocks[index] = block
+        self._counters.increment(
+            "disk_cache_hits", last_index - first_index + 1 - len(missing_indexes)
+        )
+        self._counters.increment("disk_cache_misses", len(missing_indexes))
+        # Consecutive missing blocks are downloaded together so that large uncached ranges
+        # are still downloaded with as few requests as possible.
+        for start_index, end_index in self._get_consecutive_runs(missing_indexes):
+            run_pos = start_index * block_size
+            run = bytearray(min(end_index * block_size, self.get_blob_size()) - run_pos)
+            download_into(memoryview(run), run_pos)
+            for index in range(start_index, end_index):
+                block_pos = index * block_size - run_pos
+                blocks[index] = bytes(run[block_pos : block_pos + block_size])
+                self._put_in_disk_cache(disk_cache, etag, index, blocks[index])
+        content = bytearray(length)
+        for index in range(first_index, last_index + 1):
+            block_pos = index * block_size
+            start = max(offset, block_pos)
+            end = min(offset + length, block_pos + len(blocks[index]))
+            content[start - offset : end - offset] = blocks[index][
+                start - block_pos : end - block_pos
+            ]
+        return content
+
+    def _validate_disk_cache(
+        self, disk_cache: DiskCache, index: int
+    ) -> Dict[int, bytes]:
+        # When the blob has been cached before, the first download through the disk cache
+        # requests the first needed block on the condition that the blob does not match the
+        # last ETag known for it, either from the client's properties or from what was recorded
+        # in the cache. If the blob has not changed, the service responds with no content and
+        # cached blocks can be used. Otherwise, the block's content and the blob's new ETag are
+        # returned in the same response, and blocks cached for the previous ETag are removed.
+        block_size = disk_cache.block_size
+        pos = index * block_size
+        # Blocks may be larger than a single range request is allowed to be (e.g., 4 MiB when
+        # validating CRC64 checksums), in which case only the start of the block is requested.
+        probe_length = min(block_size, self._get_partitioned_download_threshold())
+        etag: Optional[str] = None
+        cached_size: Optional[int] = None
+        blob_info = disk_cache.get_blob_info(self._disk_cache_url)
+        if blob_info is not None:
+            etag, cached_size = blob_info
+            if self._blob_properties is not None:
+                etag = self._blob_properties.etag
+        block: Optional[bytes]
+        if blob_info is None and self._blob_properties is not None:
+            # Nothing is cached for the blob, so there is nothing to revalidate and its blocks
+            # can be downloaded like any other content.
+            block = None
+        elif etag is None:
+            block = self._download_with_retries(pos, probe_length)
+        else:
+            block = self._download_if_none_match(pos, probe_length, etag)
+            if block is None and self._blob_properties is None:
+                self._blob_properties = azure.storage.blob.BlobProperties(
+                    **{"Content-Length": cached_size, "ETag": etag}
+                )
+        properties = self._get_blob_properties()
+        disk_cache.record_blob_info(
+            self._disk_cache_url, properties.etag, properties.size
+        )
+        self._disk_cache_validated = True
+        if block is None:
+            if blob_info is not None:
+                self._counters.increment("disk_cache_revalidations")
+            return {}
+        if etag is not None:
+            self._counters.increment("disk_cache_stale_blobs")
+        block_length = self._get_disk_cache_block_length(disk_cache, index)
+        if len(block) < block_length:
+            remainder = bytearray(block_length - len(block))
+            self._download_into_serially(memoryview(remainder), pos + len(block))
+            block += remainder
+        if not block or len(block) != block_length:
+            return {}
+        self._put_in_disk_cache(disk_cache, properties.etag, index, block)
+        return {index: block}
+
+    def _download_if_none_match(
+        self, pos: int, length: int, etag: str
+    ) -> Optional[bytes]:
+        download_kwargs: DownloadKwargsType = {
+            "range": f"bytes={pos}-{pos + length - 1}",
+            "modified_access_conditions": azure.storage.blob._generated.models.ModifiedAccessConditions(
+                if_none_match=etag
+            ),
+        }
+        if self._validate_crc64:
+            download_kwargs["range_get_content_crc64"] = True
+        with self._concurrency_limit:
+            try:
+                response = self._generated_sdk_storage_client.blob.download(
+                    **download_kwargs
+                )
+            except azure.core.exceptions.ResourceNotModifiedError:
+                return None
+            except azure.core.exceptions.HttpResponseError as e:
+                if _is_invalid_range_from_empty_blob_error(e):
+                    headers = getattr(e.response, "headers", {})
+                    self._blob_properties = azure.storage.blob.BlobProperties(
+                        **{"Content-Length": 0, "ETag": headers.get("ETag")}
+                    )
+                    return b""
+                process_storage_error(e)
+            self._set_blob_properties_from_download(response)
+            stream = _CountingStream(response, compute_crc64=self._validate_crc64)
+            try:
+                content = b"".join(stream)
+                if self._validate_crc64:
+                    self._validate_download_crc64(response, stream)
+                return content
+            except self._RETRYABLE_READ_EXCEPTIONS:
+                _LOGGER.debug(
+                    "Retrying download of modified blob content from caught streaming exception.",
+                    exc_info=True,
                 )
+        # Now that the blob's new ETag is known, the range can be retried, and resumed,
+        # like any other download.
+        return self._download_with_retries(pos, length)
+
+    def _put_in_disk_cache(
+        self,
+        disk_cache: DiskCache,
+        etag: str,
+        index: int,
+        block: bytes,
+    ) -> None:
+        # Failing to cache content (e.g., because the disk is full) should not fail the
+        # download that the content was needed for.
+        try:
+            disk_cache.put_block(self._disk_cache_url, etag, index, block)
+        except OSError:
+            _LOGGER.warning(
+                "Failed to write block %s of blob %s to the disk cache.",
+                index,
+                self.url,
+                exc_info=True,
             )
-        return b"".join(f.result() for f in futures)
 
-    def _get_partitions(
-        self, offset: int, length: int, partition_size: int
-    ) -> List[Tuple[int, int]]:
-        end = offset + length
-        num_partitions = math.ceil(length / partition_size)
-        partitions = []
-        for i in range(num_partitions):
-            start = offset + i * partition_size
-            if start >= end:
-                break
-            size = min(partition_size, end - start)
-            partitions.append((start, size))
-        return partitions
+    def _get_disk_cache_block_length(self, disk_cache: DiskCache, index: int) -> int:
+        pos = index * disk_cache.block_size
+        return max(min(disk_cache.block_size, self.get_blob_size() - pos), 0)
+
+    def _get_consecutive_runs(self, indexes: List[int]) -> List[Tuple[int, int]]:
+        # Returns the start and (exclusive) end of each run of consecutive indexes.
+        runs: List[Tuple[int, int]] = []
+        for index in indexes:
+            if runs and runs[-1][1] == index:
+                runs[-1] = (runs[-1][0], index + 1)
+            else:
+                runs.append((index, index + 1))
+        return runs
+
+    def _partitioned_download_into(self, buffer: memoryview, offset: int) -> None:
+        partition_size = self._get_download_partition_size(len(buffer))
+        partitions = _get_partitions(offset, len(buffer), partition_size)
+        if self._hedge_downloads:
+            self._hedged_partitioned_download_into(buffer, offset, partitions)
+            return
+        views = [
+            buffer[pos - offset : pos - offset + length] for pos, length in partitions
+        ]
+        futures = [
+            self._get_executor().submit(self._download_into_with_retries, view, pos)
+            for view, (pos, _) in zip(views, partitions)
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            self._cancel_and_wait(futures)
+            raise
+        finally:
+            for view in views:
+                view.release()
+
+    def _cancel_and_wait(self, futures: List[concurrent.futures.Future]) -> None:
+        # Partitions are written directly into slices of the caller's buffer. Before raising
+        # the error of a failed partition, make sure that no other partition is still writing
+        # into the buffer.
+        for future in futures:
+            future.cancel()
+        concurrent.futures.wait(futures)
+
+    def _hedged_partitioned_download_into(
+        self, buffer: memoryview, offset: int, partitions: List[Tuple[int, int]]
+    ) -> None:
+        hedged_ranges = [
+            _HedgedRange(buffer[pos - offset : pos - offset + length], pos)
+            for pos, length in partitions
+        ]
+        try:
+            self._download_hedged_ranges(hedged_ranges)
+        except BaseException:
+            self._cancel_and_wait(
+                [f for r in hedged_ranges for f in r.get_attempt_futures()]
+            )
+            raise
+        finally:
+            # Requests that lost to a hedge may still be running, but they stop without
+            # writing to a range's buffer once the range has been completed.
+            for hedged_range in hedged_ranges:
+                hedged_range.buffer.release()
+
+    def _download_hedged_ranges(self, hedged_ranges: List[_HedgedRange]) -> None:
+        not_started = collections.deque(hedged_ranges)
+        in_progress: List[_HedgedRange] = []
+        while not_started or in_progress:
+            # Both primary and hedged requests count against the in-flight request limit. If
+            # no requests for this download are in progress, block until a slot frees up.
+            while not_started and self._max_in_flight_semaphore.acquire(
+                blocking=not in_progress
+            ):
+                hedged_range = not_started.popleft()
+                self._start_primary_range_download(hedged_range)
+                in_progress.append(hedged_range)
+            pending = [
+                f for r in in_progress for f in r.get_attempt_futures() if not f.done()
+            ]
+            # A range may have completed, e.g. from its hedged request winning, since it was last
+            # checked and before its futures were filtered out above. Waiting only on the range's
+            # remaining request could then block until a straggling request finishes.
+            if not any(r.completed for r in in_progress):
+                concurrent.futures.wait(
+                    pending,
+                    timeout=self._get_time_until_next_hedge(in_progress),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+            still_in_progress = []
+            for hedged_range in in_progress:
+                if hedged_range.completed:
+                    self._record_range_download(hedged_range)
+                elif hedged_range.all_attempts_failed():
+                    cast(
+                        concurrent.futures.Future, hedged_range.primary_future
+                    ).result()
+                else:
+                    self._hedge_range_download_if_needed(hedged_range)
+                    still_in_progress.append(hedged_range)
+            in_progress = still_in_progress
+
+    def _start_primary_range_download(self, hedged_range: _HedgedRange) -> None:
+        hedged_range.start_time = time.perf_counter()
+        hedged_range.primary_future = self._get_executor().submit(
+            self._download_range_attempt, hedged_range, False
+        )
+        hedged_range.primary_future.add_done_callback(self._release_in_flight_semaphore)
+
+    def _hedge_range_download_if_needed(self, hedged_range: _HedgedRange) -> None:
+        if hedged_range.hedge_future is not None:
+            return
+        hedge_delay = self._get_hedge_delay(hedged_range)
+        if hedge_delay is None:
+            return
+        if time.perf_counter() - hedged_range.start_time < hedge_delay:
+            return
+        if not self._max_in_flight_semaphore.acquire(blocking=False):
+            return
+        # The slot may have been freed by this range's own primary request finishing after
+        # it was last checked, in which case there is nothing left to hedge.
+        if hedged_range.completed:
+            self._max_in_flight_semaphore.release()
+            return
+        self._counters.increment("hedged_requests")
+        hedged_range.hedge_future = self._get_executor().submit(
+            self._download_range_attempt, hedged_range, True
+        )
+        hedged_range.hedge_future.add_done_callback(self._release_in_flight_semaphore)
+
+    def _download_range_attempt(
+        self, hedged_range: _HedgedRange, is_hedge: bool
+    ) -> None:
+        if is_hedge:
+            hedge_content = memoryview(bytearray(len(hedged_range.buffer)))
+            self._retry_download(
+                hedged_range.pos,
+                len(hedge_content),
+                functools.partial(
+                    self._read_stream_into, hedged_range.get_writer(hedge_content)
+                ),
+            )
+            hedged_range.complete(hedge_content)
+        else:
+            self._retry_download(
+                hedged_range.pos,
+                len(hedged_range.buffer),
+                functools.partial(
+                    self._read_stream_into,
+                    hedged_range.get_writer(hedged_range.buffer),
+                ),
+            )
+            hedged_range.complete()
+
+    def _get_hedge_delay(self, hedged_range: _HedgedRange) -> Optional[float]:
+        return self._download_stats.get_partition_duration_percentile(
+            self._HEDGE_PERCENTILE, len(hedged_range.buffer)
+        )
+
+    def _get_time_until_next_hedge(
+        self, in_progress: List[_HedgedRange]
+    ) -> Optional[float]:
+        now = time.perf_counter()
+        wait_times = []
+        for hedged_range in in_progress:
+            if hedged_range.hedge_future is not None:
+                continue
+            hedge_delay = self._get_hedge_delay(hedged_range)
+            if hedge_delay is not None:
+                wait_times.append(max(hedged_range.start_time + hedge_delay - now, 0))
+        return min(wait_times, default=None)
+
+    def _record_range_download(self, hedged_range: _HedgedRange) -> None:
+        if hedged_range.hedge_won:
+            self._counters.increment("hedged_requests_won")
+        self._download_stats.record_partition_duration(
+            hedged_range.duration, len(hedged_range.buffer)
+        )
+
+    def _iter_chunks(
+        self, offset: int, length: Optional[int], window: int
+    ) -> Iterator[bytes]:
+        if self._blob_properties is None:
+            initial_chunks = self._download_from_unknown_blob_size(
+                offset, length, max_partitions=window
+            )
+            for chunk in initial_chunks:
+                yield chunk
+                offset += len(chunk)
+                if length is not None:
+                    length -= len(chunk)
+            if not self._more_to_download(offset, length):
+                return
+        length = self._update_download_length_from_blob_size(offset, length)
+        if length <= 0:
+            return
+        partitions = iter(
+            _get_partitions(offset, length, self._get_download_partition_size(length))
+        )
+        # Keep up to ``window`` partitions downloading at a time and yield them in order as
+        # soon as the partition at the head of the line completes. This bounds the amount of
+        # content held in memory while letting consumers start processing before the rest of
+        # the range has been downloaded.
+        pending: Deque[concurrent.futures.Future[bytes]] = collections.deque(
+            self._get_executor().submit(self._download_with_retries, *partition)
+            for partition in itertools.islice(partitions, window)
+        )
+        try:
+            while pending:
+                content = pending.popleft().result()
+                next_partition = next(partitions, None)
+                if next_partition is not None:
+                    pending.append(
+                        self._get_executor().submit(
+                            self._download_with_retries, *next_partition
+                        )
+                    )
+                yield content
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _coalesce_ranges(
+        self, ranges: List[DOWNLOAD_RANGE_TYPE], max_gap: int
+    ) -> List[DOWNLOAD_RANGE_TYPE]:
+        merged: List[List[int]] = []
+        for offset, length in sorted(r for r in ranges if r[1] > 0):
+            if merged and offset - merged[-1][1] <= max_gap:
+                merged[-1][1] = max(merged[-1][1], offset + length)
+            else:
+                merged.append([offset, offset + length])
+        return [(start, end - start) for start, end in merged]
+
+    def _download_merged_ranges_into(
+        self,
+        buffer: memoryview,
+        merged_ranges: List[DOWNLOAD_RANGE_TYPE],
+        buffer_positions: List[int],
+    ) -> None:
+        partition_size = self._get_download_partition_size(len(buffer))
+        views = []
+        futures: List[concurrent.futures.Future] = []
+        try:
+            for (offset, length), buffer_pos in zip(merged_ranges, buffer_positions):
+                for pos, partition_length in _get_partitions(
+                    offset, length, partition_size
+                ):
+                    start = buffer_pos + pos - offset
+                    views.append(buffer[start : start + partition_length])
+                    # Many small ranges may be merged into far more partitions than there are
+                    # in-flight request slots. Only submit partitions as slots free up.
+                    self._max_in_flight_semaphore.acquire()
+                    future = self._get_executor().submit(
+                        self._download_into_with_retries, views[-1], pos
+                    )
+                    future.add_done_callback(self._release_in_flight_semaphore)
+                    futures.append(future)
+            for future in futures:
+                future.result()
+        except BaseException:
+            self._cancel_and_wait(futures)
+            raise
+        finally:
+            for view in views:
+                view.release()
+
+    def _get_partitioned_download_threshold(self) -> int:
+        if self._validate_crc64:
+            return self._MAX_CRC64_RANGE_SIZE
+        return self._PARTITIONED_DOWNLOAD_THRESHOLD
+
+    def _get_download_partition_size(self, length: int) -> int:
+        partition_size = self._get_planned_download_partition_size(length)
+        if self._validate_crc64:
+            return min(partition_size, self._MAX_CRC64_RANGE_SIZE)
+        return partition_size
+
+    def _get_planned_download_partition_size(self, length: int) -> int:
+        estimates = self._download_stats.get_estimates()
+        if estimates is None:
+            return self._PARTITION_SIZE
+        latency, throughput = estimates
+        # Smallest range that keeps per-request latency a small fraction of the time spent
+        # transferring the range. Faster links result in fewer, larger ranges.
+        latency_amortized_size = (
+            self._LATENCY_AMORTIZATION_FACTOR * latency * throughput
+        )
+        # Range size that would spread the download evenly across all in-flight request
+        # slots. Ranges are not made larger than this unless needed to amortize latency.
+        parallelized_size = length / self._max_in_flight_requests
+        partition_size = max(latency_amortized_size, parallelized_size)
+        partition_size = min(
+            max(partition_size, self._MIN_PARTITION_SIZE), self._MAX_PARTITION_SIZE
+        )
+        return (
+            math.ceil(partition_size / self._PARTITION_SIZE_ALIGNMENT)
+            * self._PARTITION_SIZE_ALIGNMENT
+        )
 
     def _more_to_download(
         self, updated_offset, remaining_length: Optional[int] = None
@@ -408,44 +2333,223 @@ class AzStorageTorchBlobClient:
         return True
 
     def _download_from_unknown_blob_size(
-        self, offset: int, length: Optional[int] = None
-    ) -> bytes:
-        if length is None or length > self._PARTITIONED_DOWNLOAD_THRESHOLD:
-            length = self._PARTITIONED_DOWNLOAD_THRESHOLD
-        return self._download_with_retries(offset, length)
+        self,
+        offset: int,
+        length: Optional[int] = None,
+        max_partitions: Optional[int] = None,
+    ) -> List[bytes]:
+        chunks = self._download_partitions_from_unknown_blob_size(
+            offset, length, self._download_with_retries, max_partitions
+        )
+        return [chunk for chunk in chunks if chunk]
+
+    def _download_into_from_unknown_blob_size(
+        self, buffer: memoryview, offset: int
+    ) -> int:
+        return sum(
+            self._download_partitions_from_unknown_blob_size(
+                offset,
+                len(buffer),
+                lambda pos, length: self._download_slice_into(
+                    buffer, pos - offset, pos, length
+                ),
+            )
+        )
+
+    def _download_into_serially(self, buffer: memoryview, offset: int) -> None:
+        # Downloads one partition at a time for work that is already running on the executor.
+        # Each request is still no larger than a partition so that it stays within the range
+        # size that CRC64 checksums can be validated for.
+        partition_size = self._get_download_partition_size(len(buffer))
+        for pos, length in _get_partitions(offset, len(buffer), partition_size):
+            self._download_slice_into(buffer, pos - offset, pos, length)
+
+    def _download_slice_into(
+        self, buffer: memoryview, start: int, pos: int, length: int
+    ) -> int:
+        with buffer[start : start + length] as target:
+            return self._download_into_with_retries(target, pos)
+
+    def _download_partitions_from_unknown_blob_size(
+        self,
+        offset: int,
+        length: Optional[int],
+        download_partition: Callable[[int, int], _READ_STREAM_RETURN_TYPE],
+        max_partitions: Optional[int] = None,
+    ) -> List[_READ_STREAM_RETURN_TYPE]:
+        num_partitions = self._speculative_download_partitions
+        if max_partitions is not None:
+            num_partitions = min(num_partitions, max_partitions)
+        partitioned_download_threshold = self._get_partitioned_download_threshold()
+        max_length = num_partitions * partitioned_download_threshold
+        if length is None or length > max_length:
+            length = max_length
+        partitions = _get_partitions(offset, length, partitioned_download_threshold)
+        if len(partitions) == 1:
+            return [download_partition(*partitions[0])]
+        # Without knowing the blob size, speculatively request the first several partitions
+        # concurrently instead of waiting on a single request to learn the size before fanning out.
+        # Once any response reveals the size, requests that have not started and fall entirely
+        # past the end of the blob are cancelled. Requests already in flight past the end return
+        # no content, and the request straddling the end returns only the remaining bytes.
+        futures = [
+            self._get_executor().submit(
+                self._download_speculative_partition,
+                download_partition,
+                pos,
+                partition_length,
+                is_first_partition=(i == 0),
+            )
+            for i, (pos, partition_length) in enumerate(partitions)
+        ]
+        try:
+            concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            if self._blob_properties is not None:
+                blob_size = self._blob_properties.size
+                for (pos, _), future in zip(partitions, futures):
+                    if pos >= blob_size:
+                        future.cancel()
+            results = [f.result() for f in futures if not f.cancelled()]
+        finally:
+            for future in futures:
+                future.cancel()
+            # Partitions may be downloading into the caller's buffer, so do not return,
+            # or raise, until none of them are still running.
+            concurrent.futures.wait(futures)
+        self._counters.increment("speculative_requests", len(partitions) - 1)
+        return [result for result in results if result is not None]
+
+    def _download_speculative_partition(
+        self,
+        download_partition: Callable[[int, int], _READ_STREAM_RETURN_TYPE],
+        pos: int,
+        length: int,
+        is_first_partition: bool,
+    ) -> Optional[_READ_STREAM_RETURN_TYPE]:
+        try:
+            return download_partition(pos, length)
+        except azure.core.exceptions.HttpResponseError as e:
+            # The first partition keeps the same error behavior as a non-speculative download
+            # (e.g. when the offset itself is past the end of the blob).
+            if not is_first_partition and _is_invalid_range_past_blob_end_error(e, pos):
+                return None
+            raise
 
     def _download_with_retries(self, pos: int, length: int) -> bytes:
-        attempt = 0
-        while self._attempts_remaining(attempt):
-            stream = self._get_download_stream(pos, length)
-            try:
-                return self._read_stream(stream)
-            except self._RETRYABLE_READ_EXCEPTIONS:
-                backoff_time = self._get_backoff_time(attempt)
-                attempt += 1
-                if not self._attempts_remaining(attempt):
-                    raise
-                _LOGGER.debug(
-                    "Sleeping %s seconds and retrying download from caught streaming exception (attempts remaining: %s).",
-                    backoff_time,
-                    self._attempts_remaining(attempt),
-                    exc_info=True,
-                )
-                time.sleep(backoff_time)
+        content = io.BytesIO()
+        self._retry_download(pos, length, functools.partial(self._read_stream, content))
+        return content.getvalue()
+
+    def _download_into_with_retries(self, buffer: memoryview, pos: int) -> int:
+        return self._retry_download(
+            pos, len(buffer), functools.partial(self._read_stream_into, buffer)
+        )
+
+    def _retry_download(
+        self,
+        pos: int,
+        length: int,
+        read_stream: Callable[[Iterator[bytes], int], int],
+    ) -> int:
+        # The read_stream callable is provided the response stream along with the offset into the
+        # requested range that the stream starts at. If streaming fails partway through a range,
+        # the next attempt resumes from the last byte received instead of requesting the entire
+        # range again. Because the blob's ETag is known after the first response, resumed requests
+        # are conditional on the blob not changing in between.
+        attempts = _DownloadAttempts(self._max_download_attempts)
+        received = 0
+        while attempts.remaining:
+            backoff_time: Optional[float] = None
+            # Only hold a concurrency slot while the request is outstanding and not while
+            # backing off between attempts.
+            with self._concurrency_limit:
+                start_time = time.perf_counter()
+                response = self._get_download_stream(pos + received, length - received)
+                stream = _CountingStream(response, compute_crc64=self._validate_crc64)
+                response_time = time.perf_counter()
+                try:
+                    read_stream(iter(stream), received)
+                    if self._validate_crc64:
+                        self._validate_download_crc64(response, stream)
+                except self._RETRYABLE_READ_EXCEPTIONS:
+                    backoff_time = attempts.record_failure()
+                    if backoff_time is None:
+                        raise
+                    # The service only provides the checksum of the entire requested range.
+                    # So when validating checksums, content from an interrupted response
+                    # cannot be verified and the range is requested again in full.
+                    if not self._validate_crc64:
+                        received += stream.num_bytes
+                    length = self._get_resumable_download_length(pos, length)
+                    _LOGGER.debug(
+                        "Sleeping %s seconds and retrying download from caught streaming exception (bytes received: %s, attempts remaining: %s).",
+                        backoff_time,
+                        received,
+                        attempts.remaining,
+                        exc_info=True,
+                    )
+            if backoff_time is not None:
+                if received >= length:
+                    return received
+                if received:
+                    self._counters.increment("resumed_requests")
+                    self._counters.increment("resumed_bytes_saved", received)
+                with self._concurrency_limit.suspend():
+                    time.sleep(backoff_time)
+                continue
+            self._download_stats.record(
+                latency=response_time - start_time,
+                num_bytes=stream.num_bytes,
+                transfer_time=time.perf_counter() - response_time,
+            )
+            return received + stream.num_bytes
         raise RuntimeError("Exhausted all retry attempts to read blob content.")
 
+    def _validate_download_crc64(
+        self, response: Iterator[bytes], stream: _CountingStream
+    ) -> None:
+        # Downloads of empty blobs are not backed by a response, so there is no checksum
+        # to validate against.
+        if not hasattr(response, "response"):
+            return
+        expected = _crc64.from_header(
+            response.response.headers["x-ms-content-crc64"]  # type: ignore[attr-defined]
+        )
+        if expected != stream.crc64:
+            raise ChecksumMismatchError(expected=expected, actual=stream.crc64)
+
+    def _get_resumable_download_length(self, pos: int, length: int) -> int:
+        # Requests for blobs of unknown size may have asked for more content than the blob has.
+        # Once the size is known, only the content that actually exists can be resumed.
+        if self._blob_properties is None:
+            return length
+        return min(length, max(self._blob_properties.size - pos, 0))
+
     def _set_blob_properties_from_download(self, response) -> None:
         headers = response.response.headers
-        blob_size = self._get_size_from_range(headers["Content-Range"])
-        self._blob_properties = azure.storage.blob.BlobProperties(
-            **{"Content-Length": blob_size, "ETag": headers.get("ETag")}
-        )
+        blob_size = _get_size_from_range(headers["Content-Range"])
+        with self._blob_properties_lock:
+            if self._blob_properties is None:
+                self._blob_properties = azure.storage.blob.BlobProperties(
+                    **{"Content-Length": blob_size, "ETag": headers.get("ETag")}
+                )
+            elif self._blob_properties.etag != headers.get("ETag"):
+                # Speculative requests are issued concurrently before an ETag is known so they
+                # cannot be made conditional. Instead, make sure they all observed the same
+                # version of the blob.
+                raise azure.core.exceptions.ResourceModifiedError(
+                    "Blob was modified while its initial partitions were being downloaded."
+                )
 
     def _get_download_stream(self, pos: int, length: int) -> Iterator[bytes]:
         try:
             download_kwargs: DownloadKwargsType = {
                 "range": f"bytes={pos}-{pos + length - 1}",
             }
+            if self._validate_crc64:
+                download_kwargs["range_get_content_crc64"] = True
             if self._blob_properties is not None:
                 download_kwargs["modified_access_conditions"] = (
                     azure.storage.blob._generated.models.ModifiedAccessConditions(
@@ -455,11 +2559,11 @@ class AzStorageTorchBlobClient:
             response = self._generated_sdk_storage_client.blob.download(
                 **download_kwargs
             )
-            if self._blob_properties is None:
+            if "modified_access_conditions" not in download_kwargs:
                 self._set_blob_properties_from_download(response)
             return response
         except azure.core.exceptions.HttpResponseError as e:
-            if self._is_invalid_range_from_empty_blob_error(e):
+            if _is_invalid_range_from_empty_blob_error(e):
                 self._blob_properties = azure.storage.blob.BlobProperties(
                     **{"Content-Length": 0}
                 )
@@ -470,69 +2574,94 @@ class AzStorageTorchBlobClient:
             # exceptions from this library (i.e. instead of raising our own exception classes).
             process_storage_error(e)
 
-    def _get_size_from_range(self, range_header: str) -> int:
-        return int(range_header.split(" ", 1)[1].split("/", 1)[1])
-
-    def _is_invalid_range_from_empty_blob_error(
-        self, error: azure.core.exceptions.HttpResponseError
-    ) -> bool:
-        return (
-            error.response is not None
-            and error.status_code == 416
-            and hasattr(error.response, "headers")
-            and "Content-Range" in error.response.headers
-            and self._get_size_from_range(error.response.headers["Content-Range"]) == 0
-        )
-
-    def _attempts_remaining(self, attempt_number: int) -> int:
-        return max(self._NUM_DOWNLOAD_ATTEMPTS - attempt_number, 0)
-
-    def _get_backoff_time(self, attempt_number: int) -> float:
-        # Backoff time uses exponential backoff with full jitter as a starting point to have at least
-        # some delay before retrying. For exceptions that we get while streaming data, it will likely be
-        # because of environment's network (e.g. high network load) so the approach will give some amount
-        # of backoff and randomness before attempting to stream again. In the future, we should
-        # consider other approaches such as adapting/throttling stream reading speeds to reduce occurrences
-        # of connection errors due to an overwhelmed network.
-        return min(random.uniform(0, 2**attempt_number), 20)
-
-    def _read_stream(self, stream: Iterator[bytes]) -> bytes:
-        content = io.BytesIO()
+    def _read_stream(
+        self, content: io.BytesIO, stream: Iterator[bytes], offset: int = 0
+    ) -> int:
+        content.seek(offset)
+        content.truncate()
         for chunk in stream:
             content.write(chunk)
-        return content.getvalue()
+        return content.tell()
+
+    def _read_stream_into(
+        self,
+        buffer: Union[memoryview, _HedgedRangeWriter],
+        stream: Iterator[bytes],
+        offset: int = 0,
+    ) -> int:
+        pos = offset
+        for chunk in stream:
+            end = pos + len(chunk)
+            buffer[pos:end] = chunk
+            pos = end
+        return pos
 
     def _get_stage_block_partitions(
         self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE
     ) -> List[Tuple[int, int]]:
-        return self._get_partitions(0, len(data), self._STAGE_BLOCK_SIZE)
+        return _get_partitions(0, len(data), self._STAGE_BLOCK_SIZE)
 
     def _stage_block(self, data: SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> str:
         block_id = str(uuid.uuid4())
-        self._sdk_blob_client.stage_block(block_id, data)
+        stage_block_kwargs: Dict[str, Any] = {}
+        if self._validate_crc64:
+            stage_block_kwargs["transactional_content_crc64"] = _crc64.to_bytes(
+                _crc64.compute(data)
+            )
+        with self._concurrency_limit:
+            self._sdk_blob_client.stage_block(block_id, data, **stage_block_kwargs)
         return block_id
 
-    def _release_in_flight_semaphore(self, _: STAGE_BLOCK_FUTURE_TYPE) -> None:
-        self._max_in_flight_semaphore.release()
+    def _get_copy_partitions(self, source_size: int) -> List[Tuple[int, int]]:
+        block_size = max(
+            self._STAGE_BLOCK_SIZE, math.ceil(source_size / self._MAX_BLOCKS_PER_BLOB)
+        )
+        return _get_partitions(0, source_size, block_size)
 
-    def _get_url_without_query_string(
-        self, parsed_url: urllib.parse.ParseResult
+    def _stage_block_from_url(
+        self,
+        source_url: str,
+        pos: int,
+        length: int,
+        source_etag: Optional[str],
+        source_authorization: Optional[str],
     ) -> str:
-        # Helper method to only include scheme, network location, and path for a blob URL.
-        # More specifically, we do not want to return any SAS tokens in the URL as it can
-        # accidentally result in leaking credentials as part of interfaces that expose the
-        # URL (e.g., azstoragetorch.datasets.Blob) so we just remove all URL components past
-        # the path.
-        return urllib.parse.urlunparse(
-            (
-                parsed_url.scheme,
-                parsed_url.netloc,
-                parsed_url.path,
-                None,
-                None,
-                None,
+        block_id = str(uuid.uuid4())
+        stage_block_kwargs: Dict[str, Any] = {}
+        if source_etag is not None:
+            # Condition every partition on the source ETag so that the copy fails instead of
+            # committing blocks from different versions of the source if it changes mid-copy.
+            stage_block_kwargs["source_modified_access_conditions"] = (
+                azure.storage.blob._generated.models.SourceModifiedAccessConditions(
+                    source_if_match=source_etag
+                )
             )
+        if source_authorization is not None:
+            stage_block_kwargs["source_authorization"] = source_authorization
+        with self._concurrency_limit:
+            self._sdk_blob_client.stage_block_from_url(
+                block_id,
+                source_url,
+                source_offset=pos,
+                source_length=length,
+                **stage_block_kwargs,
+            )
+        return block_id
+
+    def _raise_if_any_future_failed(
+        self, futures: List[concurrent.futures.Future]
+    ) -> None:
+        done, not_done = concurrent.futures.wait(
+            futures, return_when=concurrent.futures.FIRST_EXCEPTION
         )
+        failed = [future for future in done if future.exception() is not None]
+        if failed:
+            for future in not_done:
+                future.cancel()
+            raise failed[0].exception()  # type: ignore[misc]
+
+    def _release_in_flight_semaphore(self, _: concurrent.futures.Future) -> None:
+        self._max_in_flight_semaphore.release()
 
     def _sdk_supports_memoryview_for_writes(self) -> bool:
         # The SDK validates iterable bytes objects passed to its HTTP request layer
@@ -542,3 +2671,38 @@ class AzStorageTorchBlobClient:
         # We still want to leverage memorviews when we can to avoid unnecessary copies. So
         # we check the Python version to determine if we can use memoryviews for writes.
         return sys.version_info >= (3, 10)
+
+
+def get_writable_memoryview(buffer: SUPPORTED_READINTO_BUFFER_TYPE) -> memoryview:
+    if isinstance(buffer, torch.Tensor):
+        return _get_writable_memoryview_from_tensor(buffer)
+    try:
+        view = memoryview(buffer)
+    except TypeError:
+        raise TypeError(
+            f"Unsupported type for buffer: {type(buffer)}. Supported types: {get_args(SUPPORTED_READINTO_BUFFER_TYPE)}"
+        )
+    if view.readonly:
+        raise TypeError("buffer must be writable")
+    if not view.c_contiguous:
+        raise ValueError("buffer must be C-contiguous")
+    return view.cast("B")
+
+
+def _get_writable_memoryview_from_tensor(tensor: torch.Tensor) -> memoryview:
+    if tensor.dtype != torch.uint8:
+        raise TypeError(
+            f"Tensor buffer must have dtype torch.uint8, not: {tensor.dtype}"
+        )
+    if tensor.device.type != "cpu":
+        raise ValueError(f"Tensor buffer must be on cpu device, not: {tensor.device}")
+    if not tensor.is_contiguous():
+        raise ValueError("Tensor buffer must be contiguous")
+    if tensor.numel() == 0:
+        return memoryview(bytearray())
+    # Tensors do not implement the buffer protocol and converting through numpy would
+    # require an additional dependency. Instead, wrap the tensor's underlying memory directly
+    # so that downloaded content is written in place. The caller owns the tensor, which keeps
+    # the memory alive for the duration of the download.
+    c_array = (ctypes.c_ubyte * tensor.numel()).from_address(tensor.data_ptr())
+    return memoryview(c_array).cast("B")
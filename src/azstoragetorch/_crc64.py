@@ -0,0 +1,93 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+# CRC64 implementation matching the checksum used by Azure Storage for the
+# x-ms-content-crc64 and x-ms-range-get-content-crc64 headers. If the optional
+# azure-storage-extensions package is installed, its native implementation is used.
+# Otherwise, checksums fall back to a pure-Python, slice-by-8 table-driven implementation.
+
+import base64
+import struct
+from typing import Callable, List, Optional, Union
+
+# Reflected form of the polynomial used by Azure Storage.
+_POLY = 0x9A6C9329AC4BC9B5
+_MASK = 0xFFFFFFFFFFFFFFFF
+
+CRC64_SUPPORTED_DATA_TYPE = Union[bytes, bytearray, memoryview]
+
+
+def _make_tables() -> List[List[int]]:
+    table = []
+    for n in range(256):
+        crc = n
+        for _ in range(8):
+            crc = (crc >> 1) ^ (_POLY if crc & 1 else 0)
+        table.append(crc)
+    tables = [table]
+    # Table k holds the CRC contribution of a byte followed by k zero bytes, which lets
+    # eight bytes be folded into the CRC with eight independent table lookups.
+    for _ in range(7):
+        previous = tables[-1]
+        tables.append([(crc >> 8) ^ table[crc & 0xFF] for crc in previous])
+    return tables
+
+
+_TABLES = _make_tables()
+
+
+def _compute_slice_by_8(data: CRC64_SUPPORTED_DATA_TYPE, crc: int) -> int:
+    t0, t1, t2, t3, t4, t5, t6, t7 = _TABLES
+    view = memoryview(data).cast("B")
+    crc ^= _MASK
+    num_words = len(view) // 8
+    for (word,) in struct.iter_unpack("<Q", view[: num_words * 8]):
+        crc ^= word
+        crc = (
+            t7[crc & 0xFF]
+            ^ t6[(crc >> 8) & 0xFF]
+            ^ t5[(crc >> 16) & 0xFF]
+            ^ t4[(crc >> 24) & 0xFF]
+            ^ t3[(crc >> 32) & 0xFF]
+            ^ t2[(crc >> 40) & 0xFF]
+            ^ t1[(crc >> 48) & 0xFF]
+            ^ t0[crc >> 56]
+        )
+    for byte in view[num_words * 8 :]:
+        crc = (crc >> 8) ^ t0[(crc ^ byte) & 0xFF]
+    return crc ^ _MASK
+
+
+def _get_native_compute() -> Optional[Callable[[bytes, int], int]]:
+    try:
+        from azure.storage.extensions.checksums import crc64  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return crc64.compute
+
+
+_NATIVE_COMPUTE = _get_native_compute()
+
+
+def is_native() -> bool:
+    return _NATIVE_COMPUTE is not None
+
+
+def compute(data: CRC64_SUPPORTED_DATA_TYPE, crc: int = 0) -> int:
+    if _NATIVE_COMPUTE is not None:
+        # The native implementation only accepts bytes objects.
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        return _NATIVE_COMPUTE(data, crc)
+    return _compute_slice_by_8(data, crc)
+
+
+def to_bytes(crc: int) -> bytes:
+    return crc.to_bytes(8, "little")
+
+
+def from_header(value: str) -> int:
+    return int.from_bytes(base64.b64decode(value), "little")
@@ -0,0 +1,222 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+# Listing manifests record the blobs returned from listing a container so that datasets
+# can be created again without re-listing the container. A manifest is stored as
+# gzip-compressed JSON, with one array per recorded blob property, in either a local
+# file or a blob.
+
+import datetime
+import gzip
+import json
+import os
+import urllib.parse
+import uuid
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import azure.core.exceptions
+import azure.storage.blob
+
+from azstoragetorch import _client
+from azstoragetorch.io import BlobIO, _SUPPORTED_MODES
+
+MANIFEST_LOCATION_TYPE = Union[str, os.PathLike]
+
+_MANIFEST_VERSION = 1
+
+
+class BlobManifest:
+    def __init__(
+        self,
+        container_url: str,
+        prefix: Optional[str],
+        names: List[str],
+        sizes: List[int],
+        etags: List[str],
+        last_modified: List[int],
+    ):
+        self.container_url = _strip_query(container_url)
+        self.prefix = prefix
+        self._names = names
+        self._sizes = sizes
+        self._etags = etags
+        # Last-Modified only has a resolution of seconds, so store it as a POSIX timestamp.
+        self._last_modified = last_modified
+
+    @classmethod
+    def from_listing(
+        cls,
+        container_url: str,
+        prefix: Optional[str],
+        listed_blobs: Iterable[azure.storage.blob.BlobProperties],
+    ) -> "BlobManifest":
+        manifest = cls(container_url, prefix, [], [], [], [])
+        for listed_blob in listed_blobs:
+            manifest._names.append(listed_blob.name)
+            manifest._sizes.append(listed_blob.size)
+            manifest._etags.append(listed_blob.etag)
+            manifest._last_modified.append(int(listed_blob.last_modified.timestamp()))
+        return manifest
+
+    @classmethod
+    def from_bytes(cls, data: _client.DOWNLOAD_CONTENT_TYPE) -> "BlobManifest":
+        content = json.loads(gzip.decompress(data))
+        if content.get("version") != _MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported manifest version: {content.get('version')}. "
+                f"Expected version: {_MANIFEST_VERSION}."
+            )
+        return cls(
+            content["container_url"],
+            content["prefix"],
+            content["names"],
+            content["sizes"],
+            content["etags"],
+            content["last_modified"],
+        )
+
+    def to_bytes(self) -> bytes:
+        content = {
+            "version": _MANIFEST_VERSION,
+            "container_url": self.container_url,
+            "prefix": self.prefix,
+            "names": self._names,
+            "sizes": self._sizes,
+            "etags": self._etags,
+            "last_modified": self._last_modified,
+        }
+        return gzip.compress(json.dumps(content, separators=(",", ":")).encode("utf-8"))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def is_for_listing(self, container_url: str, prefix: Optional[str]) -> bool:
+        return self.container_url == _strip_query(container_url) and (
+            self.prefix == prefix
+        )
+
+    def has_same_blobs(self, other: "BlobManifest") -> bool:
+        # ETags change on every write to a blob, so comparing names and ETags is enough to
+        # know whether any blob was added, removed, or modified.
+        return self._names == other._names and self._etags == other._etags
+
+    def iter_entries(self) -> Iterator[Tuple[str, int, str, int]]:
+        # Yields the name, size, ETag, and Last-Modified timestamp of each recorded blob.
+        return zip(self._names, self._sizes, self._etags, self._last_modified)
+
+    def iter_blob_properties(self) -> Iterator[azure.storage.blob.BlobProperties]:
+        for name, size, etag, last_modified in self.iter_entries():
+            yield azure.storage.blob.BlobProperties(
+                name=name,
+                **{
+                    "Content-Length": size,
+                    "ETag": etag,
+                    "Last-Modified": datetime.datetime.fromtimestamp(
+                        last_modified, tz=datetime.timezone.utc
+                    ),
+                },
+            )
+
+
+class _LocalManifestStore:
+    def __init__(self, path: MANIFEST_LOCATION_TYPE):
+        self._path = os.fspath(path)
+
+    def load(self) -> Optional[bytes]:
+        try:
+            with open(self._path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def save(self, data: bytes) -> None:
+        # Many processes, such as each rank of a distributed job, may create the same manifest
+        # at once. Write to a temporary file first and then replace the manifest so that
+        # readers never see a partially written manifest.
+        tmp_path = f"{self._path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class _BlobManifestStore:
+    def __init__(
+        self,
+        blob_url: str,
+        blob_client_factory: _client.AzStorageTorchBlobClientFactory,
+    ):
+        self._blob_url = blob_url
+        self._blob_client_factory = blob_client_factory
+
+    def load(self) -> Optional[_client.DOWNLOAD_CONTENT_TYPE]:
+        try:
+            with self._open("rb") as f:
+                return f.read()
+        except azure.core.exceptions.ResourceNotFoundError:
+            return None
+
+    def save(self, data: bytes) -> None:
+        with self._open("wb") as f:
+            f.write(data)
+
+    def _open(self, mode: _SUPPORTED_MODES) -> BlobIO:
+        return BlobIO(
+            self._blob_url,
+            mode,
+            _azstoragetorch_blob_client=self._blob_client_factory.get_blob_client_from_url(
+                self._blob_url
+            ),
+        )
+
+
+def load_or_create_manifest(
+    location: MANIFEST_LOCATION_TYPE,
+    blob_client_factory: _client.AzStorageTorchBlobClientFactory,
+    container_url: str,
+    prefix: Optional[str] = None,
+    refresh: bool = False,
+) -> BlobManifest:
+    store = get_manifest_store(location, blob_client_factory)
+    existing_manifest = None
+    data = store.load()
+    if data is not None:
+        existing_manifest = BlobManifest.from_bytes(data)
+        if not existing_manifest.is_for_listing(container_url, prefix):
+            raise ValueError(
+                f"Manifest: {os.fspath(location)} was created from listing container: "
+                f"{existing_manifest.container_url} with prefix: {existing_manifest.prefix}. "
+                f"It cannot be used for container: {_strip_query(container_url)} with "
+                f"prefix: {prefix}."
+            )
+        if not refresh:
+            return existing_manifest
+    manifest = BlobManifest.from_listing(
+        container_url,
+        prefix,
+        blob_client_factory.list_blobs(container_url, prefix=prefix),
+    )
+    if existing_manifest is None or not existing_manifest.has_same_blobs(manifest):
+        store.save(manifest.to_bytes())
+    return manifest
+
+
+def get_manifest_store(
+    location: MANIFEST_LOCATION_TYPE,
+    blob_client_factory: _client.AzStorageTorchBlobClientFactory,
+) -> Union[_LocalManifestStore, _BlobManifestStore]:
+    if isinstance(location, str) and location.startswith(("https://", "http://")):
+        return _BlobManifestStore(location, blob_client_factory)
+    return _LocalManifestStore(location)
+
+
+def _strip_query(url: str) -> str:
+    # Manifests are shareable, so never record SAS tokens from the container URL.
+    stripped_url = urllib.parse.urlsplit(url)._replace(query="", fragment="").geturl()
+    return stripped_url.rstrip("/")
@@ -0,0 +1,427 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import functools
+import io
+import logging
+import sys
+import urllib.parse
+import uuid
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+    Union,
+    cast,
+)
+
+from azure.core.credentials import AzureSasCredential
+from azure.core.credentials_async import AsyncTokenCredential
+import azure.core.exceptions
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+from azure.core.pipeline.transport import AsyncHttpTransport
+import azure.identity.aio
+import azure.storage.blob
+import azure.storage.blob.aio
+import azure.storage.blob._generated.models
+from azure.storage.blob._shared.response_handlers import process_storage_error
+
+from azstoragetorch import _client
+from azstoragetorch._version import __version__
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SDK_ASYNC_CREDENTIAL_TYPE = Optional[
+    Union[
+        AzureSasCredential,
+        AsyncTokenCredential,
+    ]
+]
+AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = Union[SDK_ASYNC_CREDENTIAL_TYPE, Literal[False]]
+
+
+class AsyncSDKKwargsType(TypedDict, total=False):
+    connection_data_block_size: int
+    transport: AsyncHttpTransport
+    user_agent: str
+    credential: SDK_ASYNC_CREDENTIAL_TYPE
+    _additional_pipeline_policies: List[SansIOHTTPPolicy]
+
+
+class AsyncAzStorageTorchBlobClientFactory:
+    # Socket timeouts set to match the default timeouts in Python SDK
+    _SOCKET_CONNECTION_TIMEOUT = 20
+    _SOCKET_READ_TIMEOUT = 60
+    _CONNECTION_DATA_BLOCK_SIZE = 256 * 1024
+
+    def __init__(
+        self,
+        credential: AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+    ):
+        self._sdk_credential = self._get_sdk_credential(credential)
+        # Only credentials created by the factory are closed by the factory. Credentials
+        # provided by the caller are owned, and closed, by the caller.
+        self._owns_credential = credential is None
+        # Unlike the synchronous factory, the transport is created lazily. aiohttp sessions are
+        # bound to the event loop they are created in, so the transport must be created from
+        # within the event loop that will be used to make requests.
+        self._transport: Optional[AsyncHttpTransport] = None
+
+    def get_blob_client_from_url(
+        self,
+        blob_url: str,
+        blob_properties: Optional[azure.storage.blob.BlobProperties] = None,
+    ) -> "AsyncAzStorageTorchBlobClient":
+        blob_sdk_client = azure.storage.blob.aio.BlobClient.from_blob_url(
+            blob_url, **self._get_sdk_client_kwargs(blob_url)
+        )
+        return AsyncAzStorageTorchBlobClient(
+            blob_sdk_client, blob_properties=blob_properties
+        )
+
+    async def yield_blob_clients_from_container_url(
+        self, container_url: str, prefix: Optional[str] = None
+    ) -> AsyncIterator["AsyncAzStorageTorchBlobClient"]:
+        container_sdk_client = (
+            azure.storage.blob.aio.ContainerClient.from_container_url(
+                container_url,
+                **self._get_sdk_client_kwargs(container_url, share_transport=False),
+            )
+        )
+        async with container_sdk_client:
+            # See AzStorageTorchBlobClientFactory.yield_blob_clients_from_container_url()
+            async for listed_blob in container_sdk_client.list_blobs(
+                name_starts_with=prefix
+            ):
+                blob_client = container_sdk_client.get_blob_client(listed_blob.name)
+                yield self.get_blob_client_from_url(
+                    blob_client.url,
+                    _client._get_blob_properties_from_listing(listed_blob),
+                )
+
+    async def close(self) -> None:
+        if self._transport is not None:
+            await self._transport.close()
+            self._transport = None
+        if self._owns_credential and self._sdk_credential is not None:
+            await cast(AsyncTokenCredential, self._sdk_credential).close()
+
+    def _get_sdk_credential(
+        self, credential: AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE
+    ) -> SDK_ASYNC_CREDENTIAL_TYPE:
+        if credential is False:
+            return None
+        if credential is None:
+            return azure.identity.aio.DefaultAzureCredential()
+        if isinstance(credential, (AzureSasCredential, AsyncTokenCredential)):
+            return credential
+        raise TypeError(f"Unsupported credential: {type(credential)}")
+
+    def _get_transport(self) -> AsyncHttpTransport:
+        if self._transport is None:
+            self._transport = self._create_transport()
+        return self._transport
+
+    def _create_transport(self) -> AsyncHttpTransport:
+        try:
+            from azure.core.pipeline.transport import AioHttpTransport
+        except ImportError as e:
+            raise ImportError(
+                "The aiohttp package is required to use azstoragetorch.aio. "
+                'Install it with: pip install "azstoragetorch[aio]"'
+            ) from e
+        return AioHttpTransport(
+            connection_timeout=self._SOCKET_CONNECTION_TIMEOUT,
+            read_timeout=self._SOCKET_READ_TIMEOUT,
+            connection_data_block_size=self._CONNECTION_DATA_BLOCK_SIZE,
+        )
+
+    def _get_sdk_client_kwargs(
+        self, resource_url: str, share_transport: bool = True
+    ) -> AsyncSDKKwargsType:
+        kwargs: AsyncSDKKwargsType = {
+            "user_agent": f"azstoragetorch/{__version__}",
+            "_additional_pipeline_policies": [
+                _client.EchoClientRequestIdPolicy(),
+            ],
+        }
+        if share_transport:
+            kwargs["transport"] = self._get_transport()
+        credential = self._sdk_credential
+        if self._url_has_sas_token(resource_url):
+            # The SDK prefers the explict credential over the one in the URL. So if a SAS token is
+            # in the URL, we do not want the factory to automatically inject its credential.
+            credential = None
+        kwargs["credential"] = credential
+        return kwargs
+
+    def _url_has_sas_token(self, resource_url: str) -> bool:
+        parsed_url = urllib.parse.urlparse(resource_url)
+        if parsed_url.query is None:
+            return False
+        parsed_qs = urllib.parse.parse_qs(parsed_url.query)
+        return "sig" in parsed_qs
+
+
+class AsyncAzStorageTorchBlobClient:
+    _PARTITIONED_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+    _PARTITION_SIZE = 16 * 1024 * 1024
+    _NUM_DOWNLOAD_ATTEMPTS = 3
+    _STAGE_BLOCK_SIZE = 32 * 1024 * 1024
+    # Requests on an event loop do not each tie up a thread so the default in-flight limit is
+    # higher than the synchronous client's, which is bound by the size of its thread pool.
+    _DEFAULT_MAX_IN_FLIGHT_REQUESTS = 64
+    _RETRYABLE_READ_EXCEPTIONS = (
+        azure.core.exceptions.IncompleteReadError,
+        azure.core.exceptions.HttpResponseError,
+        azure.core.exceptions.DecodeError,
+    )
+
+    def __init__(
+        self,
+        sdk_blob_client: azure.storage.blob.aio.BlobClient,
+        max_in_flight_requests: Optional[int] = None,
+        blob_properties: Optional[azure.storage.blob.BlobProperties] = None,
+    ):
+        self._sdk_blob_client = sdk_blob_client
+        self._generated_sdk_storage_client = self._sdk_blob_client._client
+        if max_in_flight_requests is None:
+            max_in_flight_requests = self._DEFAULT_MAX_IN_FLIGHT_REQUESTS
+        self._max_in_flight_requests = max_in_flight_requests
+        self._blob_properties: Optional[azure.storage.blob.BlobProperties] = (
+            blob_properties
+        )
+
+    @property
+    def url(self) -> str:
+        return _client._get_url_without_query_string(
+            urllib.parse.urlparse(self._sdk_blob_client.url)
+        )
+
+    @property
+    def blob_name(self) -> str:
+        return self._sdk_blob_client.blob_name
+
+    @property
+    def container_name(self) -> str:
+        return self._sdk_blob_client.container_name
+
+    async def get_blob_size(self) -> int:
+        return (await self._get_blob_properties()).size
+
+    async def download(
+        self, offset: int = 0, length: Optional[int] = None
+    ) -> _client.DOWNLOAD_CONTENT_TYPE:
+        initial_content = b""
+        if self._blob_properties is None:
+            initial_content = await self._download_from_unknown_blob_size(
+                offset, length
+            )
+            offset = len(initial_content) + offset
+            if length is not None:
+                length = length - len(initial_content)
+            if not self._more_to_download(offset, length):
+                return initial_content
+        length = await self._update_download_length_from_blob_size(offset, length)
+        if length <= 0:
+            return initial_content
+        if not initial_content and length < self._PARTITIONED_DOWNLOAD_THRESHOLD:
+            return await self._download_with_retries(offset, length)
+        content = bytearray(len(initial_content) + length)
+        content_view = memoryview(content)
+        content_view[: len(initial_content)] = initial_content
+        await self._partitioned_download_into(
+            content_view[len(initial_content) :], offset
+        )
+        return content
+
+    async def stage_blocks(
+        self, data: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE
+    ) -> List["asyncio.Task[str]"]:
+        if not data:
+            raise ValueError("Data must not be empty.")
+        if isinstance(data, memoryview) and sys.version_info < (3, 10):
+            # See AzStorageTorchBlobClient._sdk_supports_memoryview_for_writes()
+            data = cast(Union[bytes, bytearray], data.obj)
+        tasks = []
+        for pos, length in _client._get_partitions(
+            0, len(data), self._STAGE_BLOCK_SIZE
+        ):
+            # Acquiring the semaphore before creating the task bounds the amount of data
+            # waiting to be uploaded, similar to the synchronous client.
+            await self._max_in_flight_semaphore.acquire()
+            task = asyncio.ensure_future(self._stage_block(data[pos : pos + length]))
+            task.add_done_callback(self._release_in_flight_semaphore)
+            tasks.append(task)
+        return tasks
+
+    async def commit_block_list(self, block_ids: List[str]) -> None:
+        blob_blocks = [azure.storage.blob.BlobBlock(block_id) for block_id in block_ids]
+        await self._sdk_blob_client.commit_block_list(blob_blocks)
+
+    async def upload_blob(self, data: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> None:
+        # See AzStorageTorchBlobClient.upload_blob()
+        await self._sdk_blob_client.upload_blob(
+            bytes(data), length=len(data), overwrite=True
+        )
+
+    @functools.cached_property
+    def _max_in_flight_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so that it is always created from within the running event loop.
+        return asyncio.Semaphore(self._max_in_flight_requests)
+
+    async def _get_blob_properties(self) -> azure.storage.blob.BlobProperties:
+        if self._blob_properties is None:
+            self._blob_properties = await self._sdk_blob_client.get_blob_properties()
+        return self._blob_properties
+
+    async def _update_download_length_from_blob_size(
+        self, offset: int, length: Optional[int] = None
+    ) -> int:
+        length_from_offset = await self.get_blob_size() - offset
+        if length is not None:
+            return min(length, length_from_offset)
+        return length_from_offset
+
+    async def _partitioned_download_into(self, buffer: memoryview, offset: int) -> None:
+        tasks = []
+        for pos, length in _client._get_partitions(
+            offset, len(buffer), self._PARTITION_SIZE
+        ):
+            start = pos - offset
+            tasks.append(
+                asyncio.ensure_future(
+                    self._download_into_with_retries(
+                        buffer[start : start + length], pos
+                    )
+                )
+            )
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # If any partition fails, stop the remaining partitions instead of leaving them
+            # running in the background writing into the buffer. Wait for them to finish
+            # cancelling so that none are still writing once the buffer is released.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _more_to_download(
+        self, updated_offset: int, remaining_length: Optional[int] = None
+    ) -> bool:
+        if self._blob_properties and self._blob_properties.size <= updated_offset:
+            return False
+        if remaining_length is not None and remaining_length == 0:
+            return False
+        return True
+
+    async def _download_from_unknown_blob_size(
+        self, offset: int, length: Optional[int] = None
+    ) -> bytes:
+        if length is None or length > self._PARTITIONED_DOWNLOAD_THRESHOLD:
+            length = self._PARTITIONED_DOWNLOAD_THRESHOLD
+        return await self._download_with_retries(offset, length)
+
+    async def _download_with_retries(self, pos: int, length: int) -> bytes:
+        return await self._retry_download(pos, length, self._read_stream)
+
+    async def _download_into_with_retries(self, buffer: memoryview, pos: int) -> int:
+        return await self._retry_download(
+            pos, len(buffer), functools.partial(self._read_stream_into, buffer)
+        )
+
+    async def _retry_download(
+        self,
+        pos: int,
+        length: int,
+        read_stream: Callable[
+            [AsyncIterator[bytes]], Awaitable[_client._READ_STREAM_RETURN_TYPE]
+        ],
+    ) -> _client._READ_STREAM_RETURN_TYPE:
+        attempts = _client._DownloadAttempts(self._NUM_DOWNLOAD_ATTEMPTS)
+        while attempts.remaining:
+            async with self._max_in_flight_semaphore:
+                stream = await self._get_download_stream(pos, length)
+                try:
+                    return await read_stream(stream)
+                except self._RETRYABLE_READ_EXCEPTIONS:
+                    backoff_time = attempts.record_failure()
+                    if backoff_time is None:
+                        raise
+                    _LOGGER.debug(
+                        "Sleeping %s seconds and retrying download from caught streaming exception (attempts remaining: %s).",
+                        backoff_time,
+                        attempts.remaining,
+                        exc_info=True,
+                    )
+            await asyncio.sleep(backoff_time)
+        raise RuntimeError("Exhausted all retry attempts to read blob content.")
+
+    async def _get_download_stream(self, pos: int, length: int) -> AsyncIterator[bytes]:
+        try:
+            download_kwargs: _client.DownloadKwargsType = {
+                "range": f"bytes={pos}-{pos + length - 1}",
+            }
+            if self._blob_properties is not None:
+                download_kwargs["modified_access_conditions"] = (
+                    azure.storage.blob._generated.models.ModifiedAccessConditions(
+                        if_match=self._blob_properties.etag
+                    )
+                )
+            response = await self._generated_sdk_storage_client.blob.download(
+                **download_kwargs
+            )
+            if self._blob_properties is None:
+                self._set_blob_properties_from_download(response)
+            return response
+        except azure.core.exceptions.HttpResponseError as e:
+            if _client._is_invalid_range_from_empty_blob_error(e):
+                self._blob_properties = azure.storage.blob.BlobProperties(
+                    **{"Content-Length": 0}
+                )
+                return self._empty_stream()
+            process_storage_error(e)
+
+    async def _empty_stream(self) -> AsyncIterator[bytes]:
+        yield b""
+
+    def _set_blob_properties_from_download(self, response) -> None:
+        headers = response.response.headers
+        blob_size = _client._get_size_from_range(headers["Content-Range"])
+        self._blob_properties = azure.storage.blob.BlobProperties(
+            **{"Content-Length": blob_size, "ETag": headers.get("ETag")}
+        )
+
+    async def _read_stream(self, stream: AsyncIterator[bytes]) -> bytes:
+        content = io.BytesIO()
+        async for chunk in stream:
+            content.write(chunk)
+        return content.getvalue()
+
+    async def _read_stream_into(
+        self, buffer: memoryview, stream: AsyncIterator[bytes]
+    ) -> int:
+        pos = 0
+        async for chunk in stream:
+            end = pos + len(chunk)
+            buffer[pos:end] = chunk
+            pos = end
+        return pos
+
+    async def _stage_block(self, data: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> str:
+        block_id = str(uuid.uuid4())
+        # The SDK sends any bytes-like object as is, but its annotations only allow bytes.
+        await self._sdk_blob_client.stage_block(block_id, cast(bytes, data))
+        return block_id
+
+    def _release_in_flight_semaphore(self, _: "asyncio.Future[str]") -> None:
+        self._max_in_flight_semaphore.release()
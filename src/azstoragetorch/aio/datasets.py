@@ -0,0 +1,352 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import collections
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from typing import Deque, Optional, Union, cast
+from typing_extensions import Self, TypeVar
+
+import torch.utils.data
+
+from azstoragetorch.aio import _client as _aio_client
+from azstoragetorch.aio.io import AsyncBlobIO
+from azstoragetorch.datasets import _DefaultTransformOutput
+
+
+_TransformOutputType_co = TypeVar(
+    "_TransformOutputType_co", covariant=True, default=_DefaultTransformOutput
+)
+
+
+async def _default_transform(blob: "AsyncBlob") -> _DefaultTransformOutput:
+    async with blob.reader() as f:
+        content = await f.read()
+    ret: _DefaultTransformOutput = {
+        "url": blob.url,
+        "data": content,
+    }
+    return ret
+
+
+class AsyncBlob:
+    """Object representing a single blob in an asynchronous dataset.
+
+    This is the :py:mod:`asyncio` counterpart to :py:class:`azstoragetorch.datasets.Blob`.
+    Datasets instantiate :py:class:`AsyncBlob` objects and pass them directly to a dataset's
+    ``transform`` coroutine function. For example::
+
+        from azstoragetorch.aio.datasets import AsyncBlob, AsyncIterableBlobDataset
+
+        async def to_bytes(blob: AsyncBlob) -> bytes:
+            async with blob.reader() as f:
+                return await f.read()
+
+        dataset = AsyncIterableBlobDataset.from_blob_urls(
+            "https://<storage-account-name>.blob.core.windows.net/<container-name>/<blob-name>",
+            transform=to_bytes
+        )
+
+    Instantiating class directly using ``__init__()`` is **not** supported.
+    """
+
+    def __init__(self, blob_client: _aio_client.AsyncAzStorageTorchBlobClient):
+        self._blob_client = blob_client
+
+    @property
+    def url(self) -> str:
+        """The full endpoint URL of the blob.
+
+        The query string is **not** included in the returned URL.
+        """
+        return self._blob_client.url
+
+    @property
+    def blob_name(self) -> str:
+        """The name of the blob."""
+        return self._blob_client.blob_name
+
+    @property
+    def container_name(self) -> str:
+        """The name of the blob's container."""
+        return self._blob_client.container_name
+
+    def reader(self) -> AsyncBlobIO:
+        """Open asynchronous file-like object for reading the blob's content.
+
+        :returns: An asynchronous file-like object for reading the blob's content.
+        """
+        return AsyncBlobIO(
+            self._blob_client.url, "rb", _azstoragetorch_blob_client=self._blob_client
+        )
+
+
+class AsyncIterableBlobDataset(
+    torch.utils.data.IterableDataset[_TransformOutputType_co]
+):
+    """Iterable-style dataset for blobs in Azure Blob Storage that reads blobs using :py:mod:`asyncio`.
+
+    Use :py:meth:`from_blob_urls` or :py:meth:`from_container_url` to create an instance of
+    this dataset. Iterate over it asynchronously with ``async for``::
+
+        from azstoragetorch.aio.datasets import AsyncIterableBlobDataset
+
+        dataset = AsyncIterableBlobDataset.from_container_url(
+            "https://<storage-account-name>.blob.core.windows.net/<container-name>"
+        )
+        async for sample in dataset:
+            print(sample)
+
+    Up to ``max_concurrency`` blobs are transformed concurrently on the event loop while
+    samples are still returned in order. This makes the dataset well suited for reading
+    many small blobs, which are typically bound by request latency rather than throughput.
+
+    Using this class requires the ``aio`` extra (i.e., ``pip install azstoragetorch[aio]``).
+
+    Instantiating dataset class directly using ``__init__()`` is **not** supported.
+
+    **Usage with PyTorch DataLoader**
+
+    The dataset can be provided directly to a PyTorch :py:class:`~torch.utils.data.DataLoader`::
+
+        import torch.utils.data
+
+        loader = torch.utils.data.DataLoader(dataset)
+
+    When iterated synchronously, such as from a :py:class:`~torch.utils.data.DataLoader`, the
+    dataset runs its own event loop in the iterating thread, which results in a single event loop
+    per ``DataLoader`` worker. Like :py:class:`~azstoragetorch.datasets.IterableBlobDataset`,
+    data samples are automatically sharded across workers.
+
+    **Dataset output**
+
+    The default output format of the dataset is the same as
+    :py:class:`~azstoragetorch.datasets.IterableBlobDataset`. To override the output format,
+    provide a ``transform`` coroutine function to either :py:meth:`from_blob_urls` or
+    :py:meth:`from_container_url` when creating the dataset.
+    """
+
+    _DEFAULT_MAX_CONCURRENCY = 64
+
+    def __init__(
+        self,
+        blobs: "_AsyncBaseBlobIterable",
+        transform: Optional[
+            Callable[[AsyncBlob], Awaitable[_TransformOutputType_co]]
+        ] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        self._blobs = blobs
+        if transform is None:
+            transform = cast(
+                Callable[[AsyncBlob], Awaitable[_TransformOutputType_co]],
+                _default_transform,
+            )
+        self._transform = transform
+        if max_concurrency is None:
+            max_concurrency = self._DEFAULT_MAX_CONCURRENCY
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than or equal to 1")
+        self._max_concurrency = max_concurrency
+
+    @classmethod
+    def from_blob_urls(
+        cls,
+        blob_urls: Union[str, Iterable[str]],
+        *,
+        credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+        transform: Optional[
+            Callable[[AsyncBlob], Awaitable[_TransformOutputType_co]]
+        ] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Self:
+        """Instantiate dataset from provided blob URLs.
+
+        **Sample usage**::
+
+            container_url = "https://<storage-account-name>.blob.core.windows.net/<container-name>"
+            dataset = AsyncIterableBlobDataset.from_blob_urls([
+                f"{container_url}/<blob-name-1>",
+                f"{container_url}/<blob-name-2>",
+                f"{container_url}/<blob-name-3>",
+            ])
+
+        :param blob_urls: The full endpoint URLs to the blobs to be used for dataset.
+            Can be a single URL or an iterable of URLs. URLs respect SAS tokens,
+            snapshots, and version IDs in their query strings.
+        :param credential: The credential to use for authentication. If not specified,
+            :py:class:`azure.identity.aio.DefaultAzureCredential` will be used. When set to
+            ``False``, anonymous requests will be made. If a URL contains a SAS token,
+            this parameter is ignored for that URL.
+        :param transform: A coroutine function that accepts a :py:class:`AsyncBlob` object
+            representing a blob in the dataset and returns a transformed output to be used as
+            output from the dataset.
+        :param max_concurrency: The maximum number of blobs to transform concurrently.
+            If not specified, defaults to 64.
+
+        :returns: Dataset formed from the provided blob URLs.
+        """
+        blobs = _AsyncBlobUrlsBlobIterable(blob_urls, credential=credential)
+        return cls(blobs, transform=transform, max_concurrency=max_concurrency)
+
+    @classmethod
+    def from_container_url(
+        cls,
+        container_url: str,
+        *,
+        prefix: Optional[str] = None,
+        credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+        transform: Optional[
+            Callable[[AsyncBlob], Awaitable[_TransformOutputType_co]]
+        ] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Self:
+        """Instantiate dataset by listing blobs from provided container URL.
+
+        **Sample usage**::
+
+            dataset = AsyncIterableBlobDataset.from_container_url(
+                "https://<storage-account-name>.blob.core.windows.net/<container-name>",
+            )
+
+        :param container_url: The full endpoint URL to the container to be used for dataset.
+            The URL respects SAS tokens in its query string.
+        :param prefix: The prefix to filter blobs by. Only blobs whose names begin with
+            ``prefix`` will be included in the dataset. If not specified, all blobs
+            in the container will be included in the dataset.
+        :param credential: The credential to use for authentication. If not specified,
+            :py:class:`azure.identity.aio.DefaultAzureCredential` will be used. When set to
+            ``False``, anonymous requests will be made. If a URL contains a SAS token,
+            this parameter is ignored for that URL.
+        :param transform: A coroutine function that accepts a :py:class:`AsyncBlob` object
+            representing a blob in the dataset and returns a transformed output to be used as
+            output from the dataset.
+        :param max_concurrency: The maximum number of blobs to transform concurrently.
+            If not specified, defaults to 64.
+
+        :returns: Dataset formed from the blobs in the provided container URL.
+        """
+        blobs = _AsyncContainerUrlBlobIterable(
+            container_url, prefix=prefix, credential=credential
+        )
+        return cls(blobs, transform=transform, max_concurrency=max_concurrency)
+
+    async def __aiter__(self) -> AsyncGenerator[_TransformOutputType_co, None]:
+        """Asynchronously iterate over the blobs in the dataset.
+
+        :returns: An asynchronous iterator over the blobs, with ``transform`` applied, in the
+            dataset.
+        """
+        worker_info = torch.utils.data.get_worker_info()
+        blob_client_factory = self._blobs.get_blob_client_factory()
+        pending: Deque[asyncio.Future[_TransformOutputType_co]] = collections.deque()
+        try:
+            i = 0
+            async for blob in self._blobs.iter_blobs(blob_client_factory):
+                if self._should_yield_from_worker_shard(worker_info, i):
+                    pending.append(asyncio.ensure_future(self._transform(blob)))
+                    if len(pending) >= self._max_concurrency:
+                        yield await pending.popleft()
+                i += 1
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+            await blob_client_factory.close()
+
+    def __iter__(self) -> Iterator[_TransformOutputType_co]:
+        """Iterate over the blobs in the dataset.
+
+        A new event loop is created, and run in the calling thread, to drive the
+        dataset's asynchronous iteration.
+
+        :returns: An iterator over the blobs, with ``transform`` applied, in the dataset.
+        """
+        loop = asyncio.new_event_loop()
+        async_iterator = self.__aiter__()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(async_iterator.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(async_iterator.aclose())
+            loop.close()
+
+    def _should_yield_from_worker_shard(self, worker_info, blob_index: int) -> bool:
+        if worker_info is None:
+            return True
+        return blob_index % worker_info.num_workers == worker_info.id
+
+
+class _AsyncBaseBlobIterable:
+    # Unlike the synchronous blob iterables, a client factory is created per iteration
+    # instead of once per iterable because its transport is bound to the event loop
+    # used for iteration.
+    def __init__(
+        self, credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None
+    ):
+        self._credential = credential
+
+    def get_blob_client_factory(
+        self,
+    ) -> _aio_client.AsyncAzStorageTorchBlobClientFactory:
+        return _aio_client.AsyncAzStorageTorchBlobClientFactory(
+            credential=self._credential
+        )
+
+    def iter_blobs(
+        self, blob_client_factory: _aio_client.AsyncAzStorageTorchBlobClientFactory
+    ) -> AsyncIterator[AsyncBlob]:
+        raise NotImplementedError("iter_blobs")
+
+
+class _AsyncContainerUrlBlobIterable(_AsyncBaseBlobIterable):
+    def __init__(
+        self,
+        container_url: str,
+        prefix: Optional[str] = None,
+        credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+    ):
+        super().__init__(credential)
+        self._container_url = container_url
+        self._prefix = prefix
+
+    async def iter_blobs(
+        self, blob_client_factory: _aio_client.AsyncAzStorageTorchBlobClientFactory
+    ) -> AsyncIterator[AsyncBlob]:
+        blob_clients = blob_client_factory.yield_blob_clients_from_container_url(
+            self._container_url, prefix=self._prefix
+        )
+        async for blob_client in blob_clients:
+            yield AsyncBlob(blob_client)
+
+
+class _AsyncBlobUrlsBlobIterable(_AsyncBaseBlobIterable):
+    def __init__(
+        self,
+        blob_urls: Union[str, Iterable[str]],
+        credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+    ):
+        super().__init__(credential)
+        if isinstance(blob_urls, str):
+            blob_urls = [blob_urls]
+        self._blob_urls = blob_urls
+
+    async def iter_blobs(
+        self, blob_client_factory: _aio_client.AsyncAzStorageTorchBlobClientFactory
+    ) -> AsyncIterator[AsyncBlob]:
+        for blob_url in self._blob_urls:
+            yield AsyncBlob(blob_client_factory.get_blob_client_from_url(blob_url))
@@ -0,0 +1,392 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import io
+import os
+from types import TracebackType
+from typing import get_args, List, Literal, Optional, Type
+
+from typing_extensions import Self
+
+from azstoragetorch import _client
+from azstoragetorch.aio import _client as _aio_client
+from azstoragetorch.exceptions import FatalBlobIOWriteError
+
+
+_SUPPORTED_MODES = Literal["rb", "wb"]
+
+
+class AsyncBlobIO:
+    """Asynchronous file-like object for reading and writing blobs in Azure Blob Storage.
+
+    This is the :py:mod:`asyncio` counterpart to :py:class:`azstoragetorch.io.BlobIO`. Requests
+    are made on the running event loop instead of a thread pool, which allows many concurrent
+    reads and writes without a thread per in-flight request. Use it as an asynchronous context
+    manager::
+
+        from azstoragetorch.aio.io import AsyncBlobIO
+
+        async with AsyncBlobIO(
+            "https://<storage-account-name>.blob.core.windows.net/<container-name>/<blob-name>",
+            "rb",
+        ) as f:
+            content = await f.read()
+
+    Using this class requires the ``aio`` extra (i.e., ``pip install azstoragetorch[aio]``).
+
+    :param blob_url: The full endpoint URL to the blob. The URL respects
+        SAS tokens, snapshots, and version IDs in its query string.
+    :param mode: The mode in which to open the blob. Supported modes are:
+
+        * ``rb`` - Opens blob for reading
+        * ``wb`` - Opens blob for writing
+
+    :param credential: The credential to use for authentication. If not specified,
+        :py:class:`azure.identity.aio.DefaultAzureCredential` will be used. When set to
+        ``False``, anonymous requests will be made. If the ``blob_url`` contains a SAS token,
+        this parameter is ignored.
+    """
+
+    _WRITE_BUFFER_SIZE = 32 * 1024 * 1024
+    _MAX_SINGLE_PUT_SIZE = 32 * 1024 * 1024
+
+    def __init__(
+        self,
+        blob_url: str,
+        mode: _SUPPORTED_MODES,
+        *,
+        credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE = None,
+        **_internal_only_kwargs,
+    ):
+        self._blob_url = blob_url
+        self._validate_mode(mode)
+        self._mode = mode
+        self._client_factory: Optional[
+            _aio_client.AsyncAzStorageTorchBlobClientFactory
+        ] = None
+        self._client = self._get_azstoragetorch_blob_client(
+            blob_url,
+            credential,
+            _internal_only_kwargs.get("_azstoragetorch_blob_client"),
+        )
+
+        self._position = 0
+        self._closed = False
+        self._write_buffer = bytearray()
+        self._all_stage_block_tasks: List["asyncio.Task[str]"] = []
+        self._in_progress_stage_block_tasks: List["asyncio.Task[str]"] = []
+        self._stage_block_exception: Optional[BaseException] = None
+        self._blob_size: Optional[int] = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the file-like object.
+
+        In write mode, this will :py:meth:`flush` and commit the blob.
+
+        :raises FatalBlobIOWriteError: if a fatal error occurs when writing to blob. If
+            raised, no data written, nor uploaded, using this :py:class:`AsyncBlobIO` instance
+            will be committed to the blob. It is recommended to create a new
+            :py:class:`AsyncBlobIO` instance and retry all writes when attempting retries.
+        """
+        if self.closed:
+            return
+        try:
+            if self.writable():
+                await self._commit_blob()
+        finally:
+            await self._close_client_factory()
+            self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        """Whether the file-like object is closed.
+
+        Is ``True`` if the file-like is closed, ``False`` otherwise.
+        """
+        return self._closed
+
+    async def flush(self) -> None:
+        """Flush all written data to the blob.
+
+        When awaited, any unstaged data will be uploaded and the coroutine will
+        wait until all uploads complete. In read mode, this method has no effect.
+
+        :raises FatalBlobIOWriteError: if a fatal error occurs when writing to blob. If
+            raised, no data written, nor uploaded, using this :py:class:`AsyncBlobIO` instance
+            will be committed to the blob. It is recommended to create a new
+            :py:class:`AsyncBlobIO` instance and retry all writes when attempting retries.
+        """
+        self._validate_not_closed()
+        await self._flush()
+
+    async def read(self, size: Optional[int] = -1, /) -> _client.DOWNLOAD_CONTENT_TYPE:
+        """Read bytes from the blob.
+
+        :param size: The maximum number of bytes to read. If not specified, all bytes will be read.
+
+        :return: The bytes read from the blob. Reads large enough to be downloaded in parallel
+            return a :py:class:`bytearray` that the content was downloaded directly into,
+            instead of copying it into :py:class:`bytes`.
+        """
+        if size is not None:
+            self._validate_is_integer("size", size)
+            self._validate_min("size", size, -1)
+        self._validate_readable()
+        self._validate_not_closed()
+        return await self._read(size)
+
+    def readable(self) -> bool:
+        """Return whether file-like object is readable.
+
+        :returns: ``True`` if opened in read mode, ``False`` otherwise.
+        """
+        if self._is_read_mode():
+            self._validate_not_closed()
+            return True
+        return False
+
+    async def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Change the file-like position to a given byte offset.
+
+        :param offset: The offset to seek to
+        :param whence: The reference point for the offset. Accepted values are:
+
+            * :py:data:`os.SEEK_SET` - The start of the file-like object (the default)
+            * :py:data:`os.SEEK_CUR` - The current position in the file-like object
+            * :py:data:`os.SEEK_END` - The end of the file-like object
+
+        :returns: The new absolute position in the file-like object.
+        """
+        self._validate_is_integer("offset", offset)
+        self._validate_is_integer("whence", whence)
+        self._validate_seekable()
+        self._validate_not_closed()
+        return await self._seek(offset, whence)
+
+    def seekable(self) -> bool:
+        """Return whether file-like object supports random access.
+
+        :returns: ``True`` if can seek, ``False`` otherwise. Seeking is only supported in read mode.
+        """
+        return self.readable()
+
+    def tell(self) -> int:
+        """Return the current position in the file-like object.
+
+        :returns: The current position in the file-like object.
+        """
+        self._validate_not_closed()
+        return self._position
+
+    async def write(self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE, /) -> int:
+        """Write a bytes-like object to the blob.
+
+        Data written may not be immediately uploaded. Instead, data may be uploaded via
+        background tasks on the event loop. Calls to :py:meth:`flush` or :py:meth:`close`
+        will upload all pending data, wait until all data is uploaded, and propagate
+        any errors.
+
+        :param b: The bytes-like object to write to the blob.
+
+        :returns: The number of bytes written
+
+        :raises FatalBlobIOWriteError: if a fatal error occurs when writing to blob. If
+            raised, no data written, nor uploaded, using this :py:class:`AsyncBlobIO` instance
+            will be committed to the blob. It is recommended to create a new
+            :py:class:`AsyncBlobIO` instance and retry all writes when attempting retries.
+        """
+        self._validate_supported_write_type(b)
+        self._validate_writable()
+        self._validate_not_closed()
+        return await self._write(b)
+
+    def writable(self) -> bool:
+        """Return whether file-like object is writeable.
+
+        :returns: ``True`` if opened in write mode, ``False`` otherwise.
+        """
+        if self._is_write_mode():
+            self._validate_not_closed()
+            return True
+        return False
+
+    def _validate_mode(self, mode: str) -> None:
+        if mode not in get_args(_SUPPORTED_MODES):
+            raise ValueError(f"Unsupported mode: {mode}")
+
+    def _validate_is_integer(self, param_name: str, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError(f"{param_name} must be an integer, not: {type(value)}")
+
+    def _validate_min(self, param_name: str, value: int, min_value: int) -> None:
+        if value < min_value:
+            raise ValueError(
+                f"{param_name} must be greater than or equal to {min_value}"
+            )
+
+    def _validate_supported_write_type(
+        self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE
+    ) -> None:
+        if not isinstance(b, get_args(_client.SUPPORTED_WRITE_BYTES_LIKE_TYPE)):
+            raise TypeError(
+                f"Unsupported type for write: {type(b)}. Supported types: {get_args(_client.SUPPORTED_WRITE_BYTES_LIKE_TYPE)}"
+            )
+
+    def _validate_readable(self) -> None:
+        if not self._is_read_mode():
+            raise io.UnsupportedOperation("read")
+
+    def _validate_seekable(self) -> None:
+        if not self._is_read_mode():
+            raise io.UnsupportedOperation("seek")
+
+    def _validate_writable(self) -> None:
+        if not self._is_write_mode():
+            raise io.UnsupportedOperation("write")
+
+    def _is_read_mode(self) -> bool:
+        return self._mode == "rb"
+
+    def _is_write_mode(self) -> bool:
+        return self._mode == "wb"
+
+    def _validate_not_closed(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+
+    def _get_azstoragetorch_blob_client(
+        self,
+        blob_url: str,
+        credential: _aio_client.AZSTORAGETORCH_ASYNC_CREDENTIAL_TYPE,
+        azstoragetorch_blob_client: Optional[
+            _aio_client.AsyncAzStorageTorchBlobClient
+        ] = None,
+    ) -> _aio_client.AsyncAzStorageTorchBlobClient:
+        if azstoragetorch_blob_client is not None:
+            return azstoragetorch_blob_client
+        # The factory owns the transport (and possibly the credential), so keep a reference
+        # to it in order to release those resources when closed.
+        self._client_factory = _aio_client.AsyncAzStorageTorchBlobClientFactory(
+            credential=credential
+        )
+        return self._client_factory.get_blob_client_from_url(blob_url)
+
+    async def _get_blob_size(self) -> int:
+        if self._blob_size is None:
+            self._blob_size = await self._client.get_blob_size()
+        return self._blob_size
+
+    async def _read(self, size: Optional[int]) -> _client.DOWNLOAD_CONTENT_TYPE:
+        if size == 0 or self._is_at_end_of_blob():
+            return b""
+        download_length = size
+        if size is not None and size < 0:
+            download_length = None
+        content = await self._client.download(
+            offset=self._position, length=download_length
+        )
+        self._position += len(content)
+        self._blob_size = await self._get_blob_size()
+        return content
+
+    async def _seek(self, offset: int, whence: int) -> int:
+        if whence == os.SEEK_SET:
+            new_position = offset
+        elif whence == os.SEEK_CUR:
+            new_position = self._position + offset
+        elif whence == os.SEEK_END:
+            new_position = await self._get_blob_size() + offset
+        else:
+            raise ValueError(f"Unsupported whence: {whence}")
+        if new_position < 0:
+            raise ValueError("Cannot seek to negative position")
+        self._position = new_position
+        return self._position
+
+    async def _flush(self) -> None:
+        await self._check_for_stage_block_exceptions(wait=False)
+        await self._flush_write_buffer()
+        await self._check_for_stage_block_exceptions(wait=True)
+
+    async def _flush_write_buffer(self) -> None:
+        if self._write_buffer:
+            tasks = await self._client.stage_blocks(memoryview(self._write_buffer))
+            self._all_stage_block_tasks.extend(tasks)
+            self._in_progress_stage_block_tasks.extend(tasks)
+            self._write_buffer = bytearray()
+
+    async def _write(self, b: _client.SUPPORTED_WRITE_BYTES_LIKE_TYPE) -> int:
+        await self._check_for_stage_block_exceptions(wait=False)
+        write_length = len(b)
+        self._write_buffer.extend(b)
+        if len(self._write_buffer) >= self._WRITE_BUFFER_SIZE:
+            await self._flush_write_buffer()
+        self._position += write_length
+        return write_length
+
+    async def _commit_blob(self) -> None:
+        if (
+            not self._all_stage_block_tasks
+            and len(self._write_buffer) <= self._MAX_SINGLE_PUT_SIZE
+        ):
+            # See BlobIO._can_upload_in_single_request()
+            await self._upload_write_buffer()
+            return
+        await self._flush()
+        block_ids = [task.result() for task in self._all_stage_block_tasks]
+        if len(block_ids) != len(set(block_ids)):
+            raise RuntimeError(
+                "Unexpected duplicate block IDs detected. Not committing blob."
+            )
+        await self._client.commit_block_list(block_ids)
+
+    async def _upload_write_buffer(self) -> None:
+        try:
+            await self._client.upload_blob(memoryview(self._write_buffer))
+        except Exception as e:
+            self._stage_block_exception = e
+            self._raise_if_fatal_write_error()
+        self._write_buffer = bytearray()
+
+    async def _check_for_stage_block_exceptions(self, wait: bool = True) -> None:
+        self._raise_if_fatal_write_error()
+        if wait and self._in_progress_stage_block_tasks:
+            await asyncio.wait(
+                self._in_progress_stage_block_tasks,
+                return_when=asyncio.FIRST_EXCEPTION,
+            )
+        tasks_still_in_progress = []
+        for task in self._in_progress_stage_block_tasks:
+            if task.done():
+                if self._stage_block_exception is None and task.exception() is not None:
+                    self._stage_block_exception = task.exception()
+            else:
+                tasks_still_in_progress.append(task)
+        self._in_progress_stage_block_tasks = tasks_still_in_progress
+        self._raise_if_fatal_write_error()
+
+    def _raise_if_fatal_write_error(self) -> None:
+        if self._stage_block_exception is not None:
+            raise FatalBlobIOWriteError(self._stage_block_exception)
+
+    async def _close_client_factory(self) -> None:
+        if self._client_factory is not None:
+            await self._client_factory.close()
+
+    def _is_at_end_of_blob(self) -> bool:
+        return self._blob_size is not None and self._position >= self._blob_size
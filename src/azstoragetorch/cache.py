@@ -0,0 +1,294 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+# A read-through cache of blob content on local disk. Content is stored in aligned blocks,
+# one file per block, under a directory named after the blob's URL (including any snapshot or
+# version ID) and ETag. Because any write to a blob changes its ETag, cached blocks never need
+# to be invalidated in place: a modified blob is cached under a new directory and blocks of the
+# previous version are removed once the new ETag is recorded.
+#
+# The cache is meant to be shared by all processes on a node, such as DataLoader workers.
+# Blocks are written to temporary files and then moved into place, so readers never see a
+# partially written block and can read without holding any lock. Updates to the recorded
+# ETags and the cache's size, along with eviction, are done while holding an exclusive lock
+# on a file in the cache directory.
+
+import collections
+import contextlib
+import hashlib
+import json
+import os
+import uuid
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+class DiskCache:
+    """Read-through cache of blob content on local disk.
+
+    Pass an instance to :py:class:`~azstoragetorch.io.BlobIO` or to the dataset constructors
+    to serve repeated reads of the same blobs, such as every epoch after the first, from local
+    disk instead of Azure Blob Storage. Cached content is keyed by the blob's URL and ETag, so
+    modified blobs are always downloaded again.
+
+    A cache directory can be shared by all processes on a node, such as
+    :py:class:`torch.utils.data.DataLoader` workers, and instances can be pickled.
+
+    :param directory: The local directory to store cached content in. It is created if it does
+        not exist.
+    :param max_size: The maximum number of bytes of blob content to keep in the cache. Least
+        recently used content is evicted first once the cache grows past this size.
+    :param block_size: The size, in bytes, of each cached block. Blobs are downloaded and
+        cached in aligned blocks of this size. Defaults to 4 MiB.
+    """
+
+    _DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+    # When the cache grows past its maximum size, least recently used blocks are evicted until
+    # it is under this fraction of the maximum size. Leaving some headroom means eviction only
+    # happens once for every several blocks added.
+    _EVICTION_TARGET_RATIO = 0.9
+    _LOCK_FILENAME = ".lock"
+    _SIZE_FILENAME = ".size"
+    _BLOBS_DIRNAME = "blobs"
+    _BLOCKS_DIRNAME = "blocks"
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int,
+        block_size: int = _DEFAULT_BLOCK_SIZE,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than or equal to 1")
+        if block_size < 1:
+            raise ValueError("block_size must be greater than or equal to 1")
+        self._directory = os.fspath(directory)
+        self._max_size = max_size
+        self._block_size = block_size
+        # Least recently used first, the modification time, size, and path of cached blocks
+        # found the last time the cache directory was walked that have not been evicted yet.
+        self._eviction_candidates: Deque[Tuple[float, int, str]] = collections.deque()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Candidates are specific to the process that walked the cache directory. Other
+        # processes gather their own once they need to evict.
+        state = self.__dict__.copy()
+        state["_eviction_candidates"] = collections.deque()
+        return state
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def get_blob_info(self, url: str) -> Optional[Tuple[str, int]]:
+        # Returns the ETag and size most recently recorded for the blob.
+        try:
+            with open(self._get_blob_info_path(url), "rb") as f:
+                info = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        return info["etag"], info["size"]
+
+    def record_blob_info(self, url: str, etag: str, size: int) -> None:
+        with self._lock():
+            previous = self.get_blob_info(url)
+            if previous == (etag, size):
+                return
+            self._write_file(
+                self._get_blob_info_path(url),
+                json.dumps({"url": url, "etag": etag, "size": size}).encode("utf-8"),
+            )
+            if previous is not None and previous[0] != etag:
+                removed = self._remove_blocks(self._get_blocks_dir(url, previous[0]))
+                self._write_size(max(self._read_size() - removed, 0))
+
+    def get_block(
+        self, url: str, etag: str, index: int, length: int
+    ) -> Optional[bytes]:
+        path = self._get_block_path(url, etag, index)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if len(data) != length:
+            return None
+        # Modification times are used to track recency instead of access times, which are
+        # often not updated (e.g., file systems mounted with noatime or relatime).
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return data
+
+    def put_block(self, url: str, etag: str, index: int, data: bytes) -> None:
+        path = self._get_block_path(url, etag, index)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write outside of the lock so that processes only wait on each other for
+        # bookkeeping and not for each other's block writes.
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            with self._lock():
+                # Another process may have cached the same block in the meantime.
+                if os.path.exists(path):
+                    return
+                os.replace(tmp_path, path)
+                size = self._read_size() + len(data)
+                if size > self._max_size:
+                    size = self._evict(
+                        size, int(self._max_size * self._EVICTION_TARGET_RATIO)
+                    )
+                self._write_size(size)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get_size(self) -> int:
+        """Return the number of bytes of blob content currently in the cache."""
+        return self._read_size()
+
+    def _evict(self, size: int, target_size: int) -> int:
+        # Walking the cache directory stats every cached block, so only walk it once the
+        # candidates from the previous walk are used up. This way the cost of a walk is spread
+        # over all of the evictions it provides candidates for instead of being paid every time
+        # the cache is over its maximum size.
+        walked = False
+        while size > target_size:
+            if not self._eviction_candidates:
+                if walked:
+                    break
+                # The size recorded for the cache is only updated by processes that complete
+                # writes, so recompute it from the blocks on disk whenever walking.
+                blocks = sorted(self._iter_blocks())
+                size = sum(block_size for _, block_size, _ in blocks)
+                self._eviction_candidates = collections.deque(blocks)
+                walked = True
+                continue
+            mtime, _, path = self._eviction_candidates.popleft()
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # Already evicted or removed by this or another process.
+                continue
+            # A block used since the walk is no longer among the least recently used. It is
+            # considered again with its new modification time the next time the cache is walked.
+            if stat.st_mtime != mtime:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+                size -= stat.st_size
+        return size
+
+    def _iter_blocks(self) -> Iterator[Tuple[float, int, str]]:
+        # Yields the modification time, size, and path of each cached block.
+        for dirpath, _, filenames in os.walk(
+            os.path.join(self._directory, self._BLOCKS_DIRNAME)
+        ):
+            for filename in filenames:
+                if filename.endswith(".tmp"):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    def _remove_blocks(self, blocks_dir: str) -> int:
+        removed = 0
+        try:
+            filenames: List[str] = os.listdir(blocks_dir)
+        except FileNotFoundError:
+            return 0
+        for filename in filenames:
+            # Leave blocks that are still being written by other processes.
+            if filename.endswith(".tmp"):
+                continue
+            path = os.path.join(blocks_dir, filename)
+            with contextlib.suppress(FileNotFoundError):
+                size = os.stat(path).st_size
+                os.remove(path)
+                removed += size
+        with contextlib.suppress(OSError):
+            os.rmdir(blocks_dir)
+        return removed
+
+    def _read_size(self) -> int:
+        try:
+            with open(self._get_path(self._SIZE_FILENAME), "rb") as f:
+                return int(f.read())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _write_size(self, size: int) -> None:
+        self._write_file(self._get_path(self._SIZE_FILENAME), str(size).encode("ascii"))
+
+    def _write_file(self, path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @contextlib.contextmanager
+    def _lock(self) -> Iterator[None]:
+        os.makedirs(self._directory, exist_ok=True)
+        with open(self._get_path(self._LOCK_FILENAME), "a+b") as f:
+            _lock_file(f.fileno())
+            try:
+                yield
+            finally:
+                _unlock_file(f.fileno())
+
+    def _get_blob_info_path(self, url: str) -> str:
+        return self._get_path(self._BLOBS_DIRNAME, f"{_hash(url)}.json")
+
+    def _get_blocks_dir(self, url: str, etag: str) -> str:
+        blob_hash = _hash(f"{url}\n{etag}")
+        return self._get_path(self._BLOCKS_DIRNAME, blob_hash[:2], blob_hash)
+
+    def _get_block_path(self, url: str, etag: str, index: int) -> str:
+        return os.path.join(self._get_blocks_dir(url, etag), str(index))
+
+    def _get_path(self, *parts: str) -> str:
+        return os.path.join(self._directory, *parts)
+
+
+def _lock_file(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    # msvcrt.locking() locks a region starting at the current file position and only retries
+    # for about 10 seconds before raising, so keep retrying until the lock is acquired to
+    # match the blocking behavior of flock().
+    os.lseek(fd, 0, os.SEEK_SET)
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_file(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
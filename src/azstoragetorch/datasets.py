@@ -4,14 +4,19 @@
 # license information.
 # --------------------------------------------------------------------------
 
+import array
+import datetime
+import operator
 from collections.abc import Callable, Iterable, Iterator
-from typing import Optional, Union, TypedDict, cast
+from typing import List, Optional, Union, TypedDict, cast
 from typing_extensions import Self, TypeVar
 
+import azure.storage.blob
 import torch.utils.data
 
-from azstoragetorch.io import BlobIO
-from azstoragetorch import _client
+from azstoragetorch.cache import DiskCache
+from azstoragetorch.io import BlobIO, DownloadOptions
+from azstoragetorch import _client, _manifest
 
 
 _TransformOutputType_co = TypeVar(
@@ -21,7 +26,7 @@ _TransformOutputType_co = TypeVar(
 
 class _DefaultTransformOutput(TypedDict):
     url: str
-    data: bytes
+    data: _client.DOWNLOAD_CONTENT_TYPE
 
 
 def _default_transform(blob: "Blob") -> _DefaultTransformOutput:
@@ -135,7 +140,14 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
         blobs: Iterable[Blob],
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
     ):
-        self._blobs = list(blobs)
+        self._blobs: Union[List[Blob], _BlobIndex]
+        if isinstance(blobs, _BaseBlobIterable):
+            # Only index the names and properties of blobs. Blob objects, and their clients, are
+            # created on access so that memory usage, and the size of the dataset pickled to each
+            # DataLoader worker, stays small for datasets with many blobs.
+            self._blobs = blobs.build_index()
+        else:
+            self._blobs = list(blobs)
         if transform is None:
             transform = cast(
                 Callable[[Blob], _TransformOutputType_co], _default_transform
@@ -149,6 +161,9 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
         *,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        disk_cache: Optional[DiskCache] = None,
+        validate_crc64: bool = False,
+        download_options: Optional[DownloadOptions] = None,
     ) -> Self:
         """Instantiate dataset from provided blob URLs.
 
@@ -172,10 +187,29 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
             in the dataset and returns a transformed output to be used as output from the dataset.
             See :py:class:`Blob` class for more information on writing a ``transform`` callable to
             override the default dataset output format.
+        :param disk_cache: A :py:class:`~azstoragetorch.cache.DiskCache` to read blob content
+            through. Content already in the cache is read from local disk, so every epoch after
+            the first can be served without downloading blobs again. If not specified, content
+            is always downloaded.
+        :param validate_crc64: Whether to validate downloaded content with CRC64 checksums
+            returned by the service. Ranges that do not match their checksum are retried, and
+            :py:class:`~azstoragetorch.exceptions.ChecksumMismatchError` is raised once retries
+            are exhausted. Downloads use ranges of at most 4 MiB when enabled. Install the
+            ``crc64`` extra (``azstoragetorch[crc64]``) to compute checksums with a native
+            implementation. Defaults to ``False``.
+        :param download_options: A :py:class:`~azstoragetorch.io.DownloadOptions` for tuning
+            how blob content is downloaded. If not specified, the defaults of
+            :py:class:`~azstoragetorch.io.DownloadOptions` are used.
 
         :returns: Dataset formed from the provided blob URLs.
         """
-        blobs = _BlobUrlsBlobIterable(blob_urls, credential=credential)
+        blobs = _BlobUrlsBlobIterable(
+            blob_urls,
+            credential=credential,
+            disk_cache=disk_cache,
+            validate_crc64=validate_crc64,
+            download_options=download_options,
+        )
         return cls(blobs, transform=transform)
 
     @classmethod
@@ -186,6 +220,11 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
         prefix: Optional[str] = None,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        manifest: Optional[_manifest.MANIFEST_LOCATION_TYPE] = None,
+        refresh_manifest: bool = False,
+        disk_cache: Optional[DiskCache] = None,
+        validate_crc64: bool = False,
+        download_options: Optional[DownloadOptions] = None,
     ) -> Self:
         """Instantiate dataset by listing blobs from provided container URL.
 
@@ -208,11 +247,39 @@ class BlobDataset(torch.utils.data.Dataset[_TransformOutputType_co]):
             in the dataset and returns a transformed output to be used as output from the dataset.
             See :py:class:`Blob` class for more information on writing a ``transform`` callable to
             override the default dataset output format.
+        :param manifest: A local file path or blob URL of a listing manifest for the dataset.
+            If the manifest exists, the dataset is formed from the blobs recorded in it instead
+            of listing the container. Otherwise, the container is listed and the listed blobs'
+            names, sizes, ETags, and last-modified times are saved to the manifest. A blob URL
+            respects SAS tokens in its query string and otherwise uses ``credential``.
+        :param refresh_manifest: Whether to list the container again when ``manifest`` already
+            exists. The manifest is only rewritten if blobs were added, removed, or modified
+            since it was saved.
+        :param disk_cache: A :py:class:`~azstoragetorch.cache.DiskCache` to read blob content
+            through. Content already in the cache is read from local disk, so every epoch after
+            the first can be served without downloading blobs again. If not specified, content
+            is always downloaded.
+        :param validate_crc64: Whether to validate downloaded content with CRC64 checksums
+            returned by the service. Ranges that do not match their checksum are retried, and
+            :py:class:`~azstoragetorch.exceptions.ChecksumMismatchError` is raised once retries
+            are exhausted. Downloads use ranges of at most 4 MiB when enabled. Install the
+            ``crc64`` extra (``azstoragetorch[crc64]``) to compute checksums with a native
+            implementation. Defaults to ``False``.
+        :param download_options: A :py:class:`~azstoragetorch.io.DownloadOptions` for tuning
+            how blob content is downloaded. If not specified, the defaults of
+            :py:class:`~azstoragetorch.io.DownloadOptions` are used.
 
         :returns: Dataset formed from the blobs in the provided container URL.
         """
         blobs = _ContainerUrlBlobIterable(
-            container_url, prefix=prefix, credential=credential
+            container_url,
+            prefix=prefix,
+            credential=credential,
+            manifest=manifest,
+            refresh_manifest=refresh_manifest,
+            disk_cache=disk_cache,
+            validate_crc64=validate_crc64,
+            download_options=download_options,
         )
         return cls(blobs, transform=transform)
 
@@ -298,6 +365,9 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
         *,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        disk_cache: Optional[DiskCache] = None,
+        validate_crc64: bool = False,
+        download_options: Optional[DownloadOptions] = None,
     ) -> Self:
         """Instantiate dataset from provided blob URLs.
 
@@ -321,10 +391,29 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
             in the dataset and returns a transformed output to be used as output from the dataset.
             See :py:class:`Blob` class for more information on writing a ``transform`` callable to
             override the default dataset output format.
+        :param disk_cache: A :py:class:`~azstoragetorch.cache.DiskCache` to read blob content
+            through. Content already in the cache is read from local disk, so every epoch after
+            the first can be served without downloading blobs again. If not specified, content
+            is always downloaded.
+        :param validate_crc64: Whether to validate downloaded content with CRC64 checksums
+            returned by the service. Ranges that do not match their checksum are retried, and
+            :py:class:`~azstoragetorch.exceptions.ChecksumMismatchError` is raised once retries
+            are exhausted. Downloads use ranges of at most 4 MiB when enabled. Install the
+            ``crc64`` extra (``azstoragetorch[crc64]``) to compute checksums with a native
+            implementation. Defaults to ``False``.
+        :param download_options: A :py:class:`~azstoragetorch.io.DownloadOptions` for tuning
+            how blob content is downloaded. If not specified, the defaults of
+            :py:class:`~azstoragetorch.io.DownloadOptions` are used.
 
         :returns: Dataset formed from the provided blob URLs.
         """
-        blobs = _BlobUrlsBlobIterable(blob_urls, credential=credential)
+        blobs = _BlobUrlsBlobIterable(
+            blob_urls,
+            credential=credential,
+            disk_cache=disk_cache,
+            validate_crc64=validate_crc64,
+            download_options=download_options,
+        )
         return cls(blobs, transform=transform)
 
     @classmethod
@@ -335,6 +424,11 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
         prefix: Optional[str] = None,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
         transform: Optional[Callable[[Blob], _TransformOutputType_co]] = None,
+        manifest: Optional[_manifest.MANIFEST_LOCATION_TYPE] = None,
+        refresh_manifest: bool = False,
+        disk_cache: Optional[DiskCache] = None,
+        validate_crc64: bool = False,
+        download_options: Optional[DownloadOptions] = None,
     ) -> Self:
         """Instantiate dataset by listing blobs from provided container URL.
 
@@ -357,11 +451,39 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
             in the dataset and returns a transformed output to be used as output from the dataset.
             See :py:class:`Blob` class for more information on writing a ``transform`` callable to
             override the default dataset output format.
+        :param manifest: A local file path or blob URL of a listing manifest for the dataset.
+            If the manifest exists, the dataset is formed from the blobs recorded in it instead
+            of listing the container. Otherwise, the container is listed and the listed blobs'
+            names, sizes, ETags, and last-modified times are saved to the manifest. A blob URL
+            respects SAS tokens in its query string and otherwise uses ``credential``.
+        :param refresh_manifest: Whether to list the container again when ``manifest`` already
+            exists. The manifest is only rewritten if blobs were added, removed, or modified
+            since it was saved.
+        :param disk_cache: A :py:class:`~azstoragetorch.cache.DiskCache` to read blob content
+            through. Content already in the cache is read from local disk, so every epoch after
+            the first can be served without downloading blobs again. If not specified, content
+            is always downloaded.
+        :param validate_crc64: Whether to validate downloaded content with CRC64 checksums
+            returned by the service. Ranges that do not match their checksum are retried, and
+            :py:class:`~azstoragetorch.exceptions.ChecksumMismatchError` is raised once retries
+            are exhausted. Downloads use ranges of at most 4 MiB when enabled. Install the
+            ``crc64`` extra (``azstoragetorch[crc64]``) to compute checksums with a native
+            implementation. Defaults to ``False``.
+        :param download_options: A :py:class:`~azstoragetorch.io.DownloadOptions` for tuning
+            how blob content is downloaded. If not specified, the defaults of
+            :py:class:`~azstoragetorch.io.DownloadOptions` are used.
 
         :returns: Dataset formed from the blobs in the provided container URL.
         """
         blobs = _ContainerUrlBlobIterable(
-            container_url, prefix=prefix, credential=credential
+            container_url,
+            prefix=prefix,
+            credential=credential,
+            manifest=manifest,
+            refresh_manifest=refresh_manifest,
+            disk_cache=disk_cache,
+            validate_crc64=validate_crc64,
+            download_options=download_options,
         )
         return cls(blobs, transform=transform)
 
@@ -383,15 +505,31 @@ class IterableBlobDataset(torch.utils.data.IterableDataset[_TransformOutputType_
 
 
 class _BaseBlobIterable(Iterable[Blob]):
-    def __init__(self, credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None):
+    def __init__(
+        self,
+        credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        disk_cache: Optional[DiskCache] = None,
+        validate_crc64: bool = False,
+        download_options: Optional[DownloadOptions] = None,
+    ):
         self._credential = credential
+        if download_options is None:
+            download_options = DownloadOptions()
         self._blob_client_factory = _client.AzStorageTorchBlobClientFactory(
-            credential=self._credential
+            credential=self._credential,
+            disk_cache=disk_cache,
+            validate_crc64=validate_crc64,
+            hedge_downloads=download_options.hedge_downloads,
+            speculative_download_partitions=download_options.speculative_download_partitions,
+            max_download_attempts=download_options.max_download_attempts,
         )
 
     def __iter__(self) -> Iterator[Blob]:
         raise NotImplementedError("__iter__")
 
+    def build_index(self) -> "_BlobIndex":
+        raise NotImplementedError("build_index")
+
 
 class _ContainerUrlBlobIterable(_BaseBlobIterable):
     def __init__(
@@ -399,26 +537,79 @@ class _ContainerUrlBlobIterable(_BaseBlobIterable):
         container_url: str,
         prefix: Optional[str] = None,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        manifest: Optional[_manifest.MANIFEST_LOCATION_TYPE] = None,
+        refresh_manifest: bool = False,
+        disk_cache: Optional[DiskCache] = None,
+        validate_crc64: bool = False,
+        download_options: Optional[DownloadOptions] = None,
     ):
-        super().__init__(credential)
+        super().__init__(credential, disk_cache, validate_crc64, download_options)
         self._container_url = container_url
         self._prefix = prefix
+        self._manifest_location = manifest
+        self._refresh_manifest = refresh_manifest
+        self._manifest: Optional[_manifest.BlobManifest] = None
 
     def __iter__(self) -> Iterator[Blob]:
-        blob_clients = self._blob_client_factory.yield_blob_clients_from_container_url(
-            self._container_url, prefix=self._prefix
-        )
+        if self._manifest_location is None:
+            blob_clients = (
+                self._blob_client_factory.yield_blob_clients_from_container_url(
+                    self._container_url, prefix=self._prefix
+                )
+            )
+        else:
+            blob_clients = self._blob_client_factory.yield_blob_clients_from_listing(
+                self._container_url,
+                self._get_manifest(self._manifest_location).iter_blob_properties(),
+            )
         for blob_client in blob_clients:
             yield Blob(blob_client)
 
+    def build_index(self) -> "_ContainerBlobIndex":
+        index = _ContainerBlobIndex(self._container_url, self._blob_client_factory)
+        if self._manifest_location is None:
+            listed_blobs = self._blob_client_factory.list_blobs(
+                self._container_url, prefix=self._prefix
+            )
+            for listed_blob in listed_blobs:
+                index.append(
+                    listed_blob.name,
+                    listed_blob.size,
+                    listed_blob.etag,
+                    int(listed_blob.last_modified.timestamp()),
+                )
+        else:
+            manifest = self._get_manifest(self._manifest_location)
+            for name, size, etag, last_modified in manifest.iter_entries():
+                index.append(name, size, etag, last_modified)
+        return index
+
+    def _get_manifest(
+        self, location: _manifest.MANIFEST_LOCATION_TYPE
+    ) -> _manifest.BlobManifest:
+        # Iterable datasets iterate over their blobs once per epoch. Only load (or refresh)
+        # the manifest once so that every epoch iterates over the same blobs.
+        if self._manifest is None:
+            self._manifest = _manifest.load_or_create_manifest(
+                location,
+                self._blob_client_factory,
+                self._container_url,
+                prefix=self._prefix,
+                refresh=self._refresh_manifest,
+            )
+        return self._manifest
+
 
 class _BlobUrlsBlobIterable(_BaseBlobIterable):
     def __init__(
         self,
         blob_urls: Union[str, Iterable[str]],
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        disk_cache: Optional[DiskCache] = None,
+        validate_crc64: bool = False,
+        download_options: Optional[DownloadOptions] = None,
     ):
-        super().__init__(credential)
+        super().__init__(credential, disk_cache, validate_crc64, download_options)
         if isinstance(blob_urls, str):
             blob_urls = [blob_urls]
         self._blob_urls = blob_urls
@@ -426,3 +617,103 @@ class _BlobUrlsBlobIterable(_BaseBlobIterable):
     def __iter__(self) -> Iterator[Blob]:
         for blob_url in self._blob_urls:
             yield Blob(self._blob_client_factory.get_blob_client_from_url(blob_url))
+
+    def build_index(self) -> "_BlobUrlsIndex":
+        index = _BlobUrlsIndex(self._blob_client_factory)
+        for blob_url in self._blob_urls:
+            index.append(blob_url)
+        return index
+
+
+class _StringColumn:
+    # Stores strings back to back in a single UTF-8 encoded buffer along with the offset at
+    # which each string ends. This avoids the overhead of a Python object for every string.
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._end_offsets = array.array("q")
+
+    def __len__(self) -> int:
+        return len(self._end_offsets)
+
+    def __getitem__(self, index: int) -> str:
+        start = self._end_offsets[index - 1] if index > 0 else 0
+        return self._buffer[start : self._end_offsets[index]].decode("utf-8")
+
+    def append(self, value: str) -> None:
+        self._buffer += value.encode("utf-8")
+        self._end_offsets.append(len(self._buffer))
+
+
+class _BlobIndex:
+    def __init__(self, blob_client_factory: _client.AzStorageTorchBlobClientFactory):
+        self._blob_client_factory = blob_client_factory
+
+    def __len__(self) -> int:
+        raise NotImplementedError("__len__")
+
+    def __getitem__(self, index: int) -> Blob:
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("blob index out of range")
+        return Blob(self._get_blob_client(index))
+
+    def _get_blob_client(self, index: int) -> _client.AzStorageTorchBlobClient:
+        raise NotImplementedError("_get_blob_client")
+
+
+class _ContainerBlobIndex(_BlobIndex):
+    def __init__(
+        self,
+        container_url: str,
+        blob_client_factory: _client.AzStorageTorchBlobClientFactory,
+    ):
+        super().__init__(blob_client_factory)
+        self._container_url = container_url
+        self._names = _StringColumn()
+        self._etags = _StringColumn()
+        self._sizes = array.array("q")
+        self._last_modified = array.array("q")
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def append(self, name: str, size: int, etag: str, last_modified: int) -> None:
+        self._names.append(name)
+        self._sizes.append(size)
+        self._etags.append(etag)
+        self._last_modified.append(last_modified)
+
+    def _get_blob_client(self, index: int) -> _client.AzStorageTorchBlobClient:
+        name = self._names[index]
+        listed_blob_properties = azure.storage.blob.BlobProperties(
+            name=name,
+            **{
+                "Content-Length": self._sizes[index],
+                "ETag": self._etags[index],
+                "Last-Modified": datetime.datetime.fromtimestamp(
+                    self._last_modified[index], tz=datetime.timezone.utc
+                ),
+            },
+        )
+        return self._blob_client_factory.get_blob_client_from_container_url(
+            self._container_url, name, listed_blob_properties
+        )
+
+
+class _BlobUrlsIndex(_BlobIndex):
+    def __init__(self, blob_client_factory: _client.AzStorageTorchBlobClientFactory):
+        super().__init__(blob_client_factory)
+        self._blob_urls = _StringColumn()
+
+    def __len__(self) -> int:
+        return len(self._blob_urls)
+
+    def append(self, blob_url: str) -> None:
+        self._blob_urls.append(blob_url)
+
+    def _get_blob_client(self, index: int) -> _client.AzStorageTorchBlobClient:
+        return self._blob_client_factory.get_blob_client_from_url(
+            self._blob_urls[index]
+        )
@@ -31,6 +31,22 @@ class FatalBlobIOWriteError(AZStorageTorchError):
         )
 
 
+class ChecksumMismatchError(AZStorageTorchError):
+    """Raised when the CRC64 checksum of downloaded content does not match the checksum returned by the service.
+
+    This indicates the content was corrupted in transit. Downloads that fail checksum
+    validation are retried before this exception is raised.
+    """
+
+    _MSG_FORMAT = (
+        "CRC64 checksum of downloaded content: {actual:#018x} does not match the "
+        "checksum returned by the service: {expected:#018x}."
+    )
+
+    def __init__(self, expected: int, actual: int):
+        super().__init__(self._MSG_FORMAT.format(expected=expected, actual=actual))
+
+
 class ClientRequestIdMismatchError(AZStorageTorchError):
     """Raised when a client request ID in a response does not match the ID in it's originating request.
 
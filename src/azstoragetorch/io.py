@@ -4,18 +4,79 @@
 # license information.
 # --------------------------------------------------------------------------
 
+import collections
 import concurrent.futures
+import functools
 import io
 import os
-from typing import get_args, Optional, Literal, List
+import sys
+import threading
+from typing import (
+    get_args,
+    Deque,
+    Dict,
+    Iterator,
+    Optional,
+    Literal,
+    List,
+    Sequence,
+    Tuple,
+)
 
 from azstoragetorch import _client
+from azstoragetorch.cache import DiskCache
 from azstoragetorch.exceptions import FatalBlobIOWriteError
 
 
 _SUPPORTED_MODES = Literal["rb", "wb"]
 
 
+class DownloadOptions:
+    """Options for tuning how blob content is downloaded.
+
+    Pass an instance as ``download_options`` to :py:class:`BlobIO` or to the
+    ``from_blob_urls()`` and ``from_container_url()`` constructors of
+    :py:class:`~azstoragetorch.datasets.BlobDataset` and
+    :py:class:`~azstoragetorch.datasets.IterableBlobDataset`.
+
+    **Sample usage**::
+
+        options = DownloadOptions(hedge_downloads=True)
+        with BlobIO(blob_url, "rb", download_options=options) as f:
+            content = f.read()
+
+    :param hedge_downloads: Whether to hedge range requests of parallel downloads. When a
+        range request takes longer than the 95th percentile of recent range request durations,
+        a duplicate request is issued and the content of whichever request finishes first is
+        used. Duplicate requests count against the in-flight request limit. Defaults to
+        ``False``.
+    :param speculative_download_partitions: The number of partitions to request concurrently
+        when first downloading a blob whose size is not known. Requests past the end of the
+        blob are cancelled or return no content. Defaults to ``1``, which downloads the first
+        partition on its own to learn the blob's size before downloading the rest in parallel.
+    :param max_download_attempts: The maximum number of attempts to download each range,
+        including the first. Interrupted downloads are retried from the last received byte.
+        Defaults to ``3``.
+    """
+
+    def __init__(
+        self,
+        *,
+        hedge_downloads: bool = False,
+        speculative_download_partitions: int = 1,
+        max_download_attempts: int = 3,
+    ):
+        if speculative_download_partitions < 1:
+            raise ValueError(
+                "speculative_download_partitions must be greater than or equal to 1"
+            )
+        if max_download_attempts < 1:
+            raise ValueError("max_download_attempts must be greater than or equal to 1")
+        self.hedge_downloads = hedge_downloads
+        self.speculative_download_partitions = speculative_download_partitions
+        self.max_download_attempts = max_download_attempts
+
+
 class BlobIO(io.IOBase):
     """File-like object for reading and writing blobs in Azure Blob Storage.
 
@@ -43,11 +104,38 @@ class BlobIO(io.IOBase):
         :py:class:`azure.identity.DefaultAzureCredential` will be used. When set to
         ``False``, anonymous requests will be made. If the ``blob_url`` contains a SAS token,
         this parameter is ignored.
+    :param cache_size: The maximum number of bytes of blob content to cache in memory for
+        reads that are not sequential (e.g., when seeking back and forth between a file's
+        footer and its data). Content is cached in aligned blocks and the least recently
+        used blocks are evicted first. Defaults to ``0``, which disables caching, as the cache
+        holds up to this many bytes for as long as the object is open, and each missed block is
+        downloaded in full even if only part of it is read. Only used in read mode.
+    :param cache_block_size: The size, in bytes, of each cached block. Each block is
+        downloaded with a single request. Defaults to 1 MiB. Only used in read mode.
+    :param disk_cache: A :py:class:`~azstoragetorch.cache.DiskCache` to read blob content
+        through. Content already in the cache is read from local disk, and content downloaded
+        from the blob is added to the cache. If not specified, content is always downloaded.
+        Only used in read mode.
+    :param validate_crc64: Whether to validate the integrity of transferred content with CRC64
+        checksums. Downloaded ranges are checked against the checksum returned by the service
+        and retried if they do not match, raising
+        :py:class:`~azstoragetorch.exceptions.ChecksumMismatchError` once retries are exhausted.
+        Uploaded blocks are sent with a checksum for the service to check. Because the service
+        only returns checksums for ranges of 4 MiB or less, downloads use ranges of at most
+        4 MiB when enabled. Install the ``crc64`` extra (``azstoragetorch[crc64]``) to compute
+        checksums with a native implementation. Defaults to ``False``.
+    :param download_options: A :py:class:`DownloadOptions` for tuning how blob content is
+        downloaded. If not specified, the defaults of :py:class:`DownloadOptions` are used.
+        Only used in read mode.
     """
 
     _READLINE_PREFETCH_SIZE = 4 * 1024 * 1024
     _READLINE_TERMINATOR = b"\n"
+    _READ_AHEAD_MIN_WINDOW_SIZE = 256 * 1024
+    _READ_AHEAD_MAX_WINDOW_SIZE = 32 * 1024 * 1024
+    _READ_AHEAD_MAX_RANGE_SIZE = 4 * 1024 * 1024
     _WRITE_BUFFER_SIZE = 32 * 1024 * 1024
+    _MAX_SINGLE_PUT_SIZE = 32 * 1024 * 1024
 
     def __init__(
         self,
@@ -55,22 +143,38 @@ class BlobIO(io.IOBase):
         mode: _SUPPORTED_MODES,
         *,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE = None,
+        cache_size: int = 0,
+        cache_block_size: int = 1024 * 1024,
+        disk_cache: Optional[DiskCache] = None,
+        validate_crc64: bool = False,
+        download_options: Optional[DownloadOptions] = None,
         **_internal_only_kwargs,
     ):
         self._blob_url = blob_url
         self._validate_mode(mode)
         self._mode = mode
+        self._validate_is_integer("cache_size", cache_size)
+        self._validate_min("cache_size", cache_size, 0)
+        self._validate_is_integer("cache_block_size", cache_block_size)
+        self._validate_min("cache_block_size", cache_block_size, 1)
         self._client = self._get_azstoragetorch_blob_client(
             blob_url,
             credential,
+            disk_cache,
+            validate_crc64,
+            download_options,
             _internal_only_kwargs.get("_azstoragetorch_blob_client"),
         )
 
         self._position = 0
         self._closed = False
-        # TODO: Consider using a bytearray and/or memoryview for readline buffer. There may be performance
-        #  gains in regards to reducing the number of copies performed when consuming from buffer.
+        # Lines are consumed from the readline buffer by advancing an offset into it, instead of
+        # slicing off the consumed bytes, so that each line only costs a copy of itself.
         self._readline_buffer = b""
+        self._readline_buffer_pos = 0
+        self._readline_prefetch: Optional[Tuple[int, _client.DOWNLOAD_FUTURE_TYPE]] = (
+            None
+        )
         self._write_buffer = bytearray()
         self._all_stage_block_futures: List[_client.STAGE_BLOCK_FUTURE_TYPE] = []
         self._in_progress_stage_block_futures: List[
@@ -78,6 +182,15 @@ class BlobIO(io.IOBase):
         ] = []
         self._stage_block_exception: Optional[BaseException] = None
         self._blob_size: Optional[int] = None
+        self._read_ahead = _SequentialReadAhead(
+            self._client,
+            min_window_size=self._READ_AHEAD_MIN_WINDOW_SIZE,
+            max_window_size=self._READ_AHEAD_MAX_WINDOW_SIZE,
+            max_range_size=self._READ_AHEAD_MAX_RANGE_SIZE,
+        )
+        self._block_cache = _BlockCache(
+            self._client, block_size=cache_block_size, max_size=cache_size
+        )
 
     def close(self) -> None:
         """Close the file-like object.
@@ -127,12 +240,74 @@ class BlobIO(io.IOBase):
         self._validate_not_closed()
         self._flush()
 
-    def read(self, size: Optional[int] = -1, /) -> bytes:
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return statistics for the in-memory cache of blob content.
+
+        Only reads that are not sequential use the cache. Each block of a read is counted
+        once: as a hit if it was served from the cache or from a download already in
+        progress, or as a miss if it had to be downloaded.
+
+        :returns: A dictionary with the number of block ``hits`` and ``misses`` and the
+            number of bytes currently cached as ``cached_bytes``.
+        """
+        return self._block_cache.get_stats()
+
+    def iter_chunks(
+        self, size: Optional[int] = -1, /, *, window: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Iterate over the blob's content, from the current position, in ordered chunks.
+
+        Chunks are downloaded in parallel, with up to ``window`` chunks in flight at a time,
+        and yielded in order as soon as each next chunk completes. This allows processing
+        of a large blob to start before all of its content has been downloaded while keeping
+        memory usage bounded. The position advances as each chunk is yielded. Avoid
+        calling other read methods while iterating over chunks.
+
+        :param size: The maximum number of bytes to read. If not specified, all bytes
+            from the current position will be read.
+        :param window: The maximum number of chunks to download ahead of the consumer. If
+            not specified, it defaults to the maximum number of concurrent requests.
+
+        :returns: An iterator over the chunks read from the blob.
+        """
+        if size is not None:
+            self._validate_is_integer("size", size)
+            self._validate_min("size", size, -1)
+        if window is not None:
+            self._validate_is_integer("window", window)
+            self._validate_min("window", window, 1)
+        self._validate_readable()
+        self._validate_not_closed()
+        self._invalidate_readline_buffer()
+        return self._iter_chunks(size, window)
+
+    def iter_lines(self, batch_size: int = 1024, /) -> Iterator[List[bytes]]:
+        """Iterate over batches of lines from the current position.
+
+        Batching lines reduces the per-line overhead of iterating over blobs with many
+        short lines (e.g., JSON Lines files). The line terminator is always ``b'\\n'``.
+        The position advances as each batch is yielded. Avoid calling other read
+        methods while iterating over batches.
+
+        :param batch_size: The maximum number of lines in each batch.
+
+        :returns: An iterator over lists of lines read from the blob. Every batch other
+            than the last one contains exactly ``batch_size`` lines.
+        """
+        self._validate_is_integer("batch_size", batch_size)
+        self._validate_min("batch_size", batch_size, 1)
+        self._validate_readable()
+        self._validate_not_closed()
+        return self._iter_lines(batch_size)
+
+    def read(self, size: Optional[int] = -1, /) -> _client.DOWNLOAD_CONTENT_TYPE:
         """Read bytes from the blob.
 
         :param size: The maximum number of bytes to read. If not specified, all bytes will be read.
 
-        :return: The bytes read from the blob.
+        :return: The bytes read from the blob. Reads large enough to be downloaded in parallel
+            return a :py:class:`bytearray` that the content was downloaded directly into,
+            instead of copying it into :py:class:`bytes`.
         """
         if size is not None:
             self._validate_is_integer("size", size)
@@ -142,6 +317,72 @@ class BlobIO(io.IOBase):
         self._invalidate_readline_buffer()
         return self._read(size)
 
+    def read_ranges(
+        self, ranges: Sequence[Tuple[int, int]], /, *, max_gap: Optional[int] = None
+    ) -> List[memoryview]:
+        """Read multiple byte ranges from the blob.
+
+        Ranges that are close to each other are merged into a single request and all
+        requests are made in parallel. This is useful for formats that need many scattered
+        ranges from a single blob (e.g., zip archives or indexed record files). The current
+        position is not changed.
+
+        :param ranges: The ``(offset, length)`` pairs of the ranges to read. Ranges
+            that extend past the end of the blob are truncated.
+        :param max_gap: The maximum number of bytes between two ranges for them to be
+            merged into a single request. If not specified, a default of 1 MiB is used.
+
+        :returns: A read-only :py:class:`memoryview` for each requested range, in the same
+            order as ``ranges``. All views reference a single buffer of downloaded content.
+        """
+        for offset, length in ranges:
+            self._validate_is_integer("offset", offset)
+            self._validate_min("offset", offset, 0)
+            self._validate_is_integer("length", length)
+            self._validate_min("length", length, 0)
+        if max_gap is not None:
+            self._validate_is_integer("max_gap", max_gap)
+            self._validate_min("max_gap", max_gap, 0)
+        self._validate_readable()
+        self._validate_not_closed()
+        return self._read_ranges(ranges, max_gap)
+
+    def readinto(self, b: _client.SUPPORTED_READINTO_BUFFER_TYPE, /) -> int:
+        """Read bytes from the blob directly into a pre-allocated, writable buffer.
+
+        Content for large buffers is downloaded straight into ``b``, in parallel partitions,
+        without intermediate copies, which makes this method well suited for reading large
+        blobs into preallocated memory. Small buffers are filled from the same read-ahead
+        window and cache as :py:meth:`read`. This makes :py:class:`BlobIO` efficient to wrap
+        in an :py:class:`io.BufferedReader`.
+
+        :param b: The writable buffer to read into. Supported types are :py:class:`bytearray`,
+            writable :py:class:`memoryview` objects, and contiguous CPU :py:class:`torch.Tensor`
+            objects with a dtype of :py:data:`torch.uint8`.
+
+        :return: The number of bytes read into ``b``. Returns ``0`` once the end of the
+            blob has been reached.
+        """
+        self._validate_readable()
+        self._validate_not_closed()
+        self._invalidate_readline_buffer()
+        return self._readinto(b)
+
+    def readinto1(self, b: _client.SUPPORTED_READINTO_BUFFER_TYPE, /) -> int:
+        """Read bytes from the blob into a pre-allocated, writable buffer.
+
+        :py:class:`BlobIO` does not buffer reads on top of its downloads, so this method
+        behaves the same as :py:meth:`readinto`. It is provided for consumers that expect
+        the :py:class:`io.BufferedIOBase` interface.
+
+        :param b: The writable buffer to read into. Supported types are the same as for
+            :py:meth:`readinto`.
+
+        :return: The number of bytes read into ``b``. Returns ``0`` once the end of the
+            blob has been reached.
+        """
+        return self.readinto(b)
+
     def readable(self) -> bool:
         """Return whether file-like object is readable.
 
@@ -168,6 +409,23 @@ class BlobIO(io.IOBase):
         self._validate_not_closed()
         return self._readline(size)
 
+    def readlines(self, hint: Optional[int] = -1, /) -> List[bytes]:
+        """Read and return a list of lines from the file-like object.
+
+        The line terminator is always ``b'\\n'``.
+
+        :param hint: If specified, no more lines are read once the total size of the
+            lines read so far exceeds ``hint`` bytes. If not specified, all lines
+            are read.
+
+        :returns: The lines read from the blob.
+        """
+        if hint is not None:
+            self._validate_is_integer("hint", hint)
+        self._validate_readable()
+        self._validate_not_closed()
+        return self._readlines(hint)
+
     def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
         """Change the file-like position to a given byte offset.
 
@@ -287,16 +545,35 @@ class BlobIO(io.IOBase):
         # NOTE: We invalidate the readline buffer for any out-of-band read() or seek() in order to simplify
         # caching logic for readline(). In the future, we can consider reusing the buffer for read() calls.
         self._readline_buffer = b""
+        self._readline_buffer_pos = 0
+        self._cancel_readline_prefetch()
+
+    def _cancel_readline_prefetch(self) -> None:
+        if self._readline_prefetch is not None:
+            self._readline_prefetch[1].cancel()
+            self._readline_prefetch = None
 
     def _get_azstoragetorch_blob_client(
         self,
         blob_url: str,
         credential: _client.AZSTORAGETORCH_CREDENTIAL_TYPE,
+        disk_cache: Optional[DiskCache],
+        validate_crc64: bool,
+        download_options: Optional[DownloadOptions],
         azstoragetorch_blob_client: Optional[_client.AzStorageTorchBlobClient] = None,
     ) -> _client.AzStorageTorchBlobClient:
         if azstoragetorch_blob_client is not None:
             return azstoragetorch_blob_client
-        client_factory = _client.AzStorageTorchBlobClientFactory(credential=credential)
+        if download_options is None:
+            download_options = DownloadOptions()
+        client_factory = _client.AzStorageTorchBlobClientFactory(
+            credential=credential,
+            disk_cache=disk_cache,
+            validate_crc64=validate_crc64,
+            hedge_downloads=download_options.hedge_downloads,
+            speculative_download_partitions=download_options.speculative_download_partitions,
+            max_download_attempts=download_options.max_download_attempts,
+        )
         return client_factory.get_blob_client_from_url(blob_url)
 
     def _get_blob_size(self):
@@ -305,58 +582,206 @@ class BlobIO(io.IOBase):
         return self._blob_size
 
     def _readline(self, size: Optional[int]) -> bytes:
-        consumed = b""
         if size == 0 or self._is_at_end_of_blob(fetch_blob_size=False):
-            return consumed
-        limit = self._get_limit(size)
-        if self._readline_buffer:
-            consumed = self._consume_from_readline_buffer(consumed, limit)
-        while self._should_download_more_for_readline(consumed, limit):
-            self._readline_buffer = self._client.download(
-                offset=self._position, length=self._READLINE_PREFETCH_SIZE
-            )
-            consumed = self._consume_from_readline_buffer(consumed, limit)
-        return consumed
+            return b""
+        remaining = self._get_limit(size)
+        parts = []
+        while remaining > 0:
+            if self._readline_buffer_pos >= len(self._readline_buffer):
+                if self._is_at_end_of_blob():
+                    break
+                self._fill_readline_buffer()
+            part, found_terminator = self._consume_from_readline_buffer(remaining)
+            parts.append(part)
+            remaining -= len(part)
+            if found_terminator:
+                break
+        return b"".join(parts)
+
+    def _readlines(self, hint: Optional[int]) -> List[bytes]:
+        if hint is None or hint <= 0:
+            return self._read_lines(sys.maxsize)
+        lines = []
+        total_size = 0
+        while total_size < hint:
+            line = self._readline(-1)
+            if not line:
+                break
+            lines.append(line)
+            total_size += len(line)
+        return lines
+
+    def _iter_lines(self, batch_size: int) -> Iterator[List[bytes]]:
+        while True:
+            batch = self._read_lines(batch_size)
+            if not batch:
+                return
+            yield batch
+
+    def _read_lines(self, max_lines: int) -> List[bytes]:
+        lines: List[bytes] = []
+        while len(lines) < max_lines:
+            self._consume_lines_from_readline_buffer(lines, max_lines)
+            if len(lines) >= max_lines:
+                break
+            # Any content left in the buffer is a partial line that continues into the next
+            # buffer, or the buffer is empty. Either way, readline() handles downloading more.
+            line = self._readline(-1)
+            if not line:
+                break
+            lines.append(line)
+        return lines
+
+    def _consume_lines_from_readline_buffer(
+        self, lines: List[bytes], max_lines: int
+    ) -> None:
+        # Fast path for reading many lines that avoids the per-line overhead of readline().
+        # Only complete lines in the buffer are consumed.
+        buffer = self._readline_buffer
+        start = pos = self._readline_buffer_pos
+        while len(lines) < max_lines:
+            end = buffer.find(self._READLINE_TERMINATOR, pos) + 1
+            if not end:
+                break
+            lines.append(buffer[pos:end])
+            pos = end
+        self._readline_buffer_pos = pos
+        self._position += pos - start
+        self._prefetch_next_readline_buffer_if_needed()
 
     def _get_limit(self, size: Optional[int]) -> int:
         if size is None or size < 0:
             # If size is not provided, set the initial limit to the blob size as BlobIO
             # will never read more than the size of the blob in a single readline() call.
-            return self._client.get_blob_size()
+            return self._get_blob_size()
         return size
 
-    def _consume_from_readline_buffer(self, consumed: bytes, limit: int) -> bytes:
-        limit -= len(consumed)
-        find_pos = self._readline_buffer.find(self._READLINE_TERMINATOR, 0, limit)
-        end = find_pos + 1
-        if find_pos == -1:
-            buffer_length = len(self._readline_buffer)
-            end = min(buffer_length, limit)
-        consumed += self._readline_buffer[:end]
-        self._readline_buffer = self._readline_buffer[end:]
-        self._position += end
-        return consumed
-
-    def _should_download_more_for_readline(self, consumed: bytes, limit: int) -> bool:
-        if consumed.endswith(self._READLINE_TERMINATOR):
-            return False
-        if self._is_at_end_of_blob():
-            return False
-        if len(consumed) == limit:
-            return False
-        return True
-
-    def _read(self, size: Optional[int]) -> bytes:
+    def _fill_readline_buffer(self) -> None:
+        if self._readline_prefetch is not None and (
+            self._readline_prefetch[0] == self._position
+        ):
+            # Clear the prefetch before waiting on it so that a failed prefetch is not
+            # reused by later reads.
+            future = self._readline_prefetch[1]
+            self._readline_prefetch = None
+            content = future.result()
+        else:
+            self._cancel_readline_prefetch()
+            content = self._client.download(
+                offset=self._position, length=self._READLINE_PREFETCH_SIZE
+            )
+        # Lines are sliced from the buffer and must be returned as bytes.
+        self._readline_buffer = bytes(content)
+        self._readline_buffer_pos = 0
+
+    def _consume_from_readline_buffer(self, limit: int) -> Tuple[bytes, bool]:
+        start = self._readline_buffer_pos
+        end = min(len(self._readline_buffer), start + limit)
+        find_pos = self._readline_buffer.find(self._READLINE_TERMINATOR, start, end)
+        found_terminator = find_pos != -1
+        if found_terminator:
+            end = find_pos + 1
+        self._readline_buffer_pos = end
+        self._position += end - start
+        self._prefetch_next_readline_buffer_if_needed()
+        return self._readline_buffer[start:end], found_terminator
+
+    def _prefetch_next_readline_buffer_if_needed(self) -> None:
+        # Once half of the buffer has been consumed, start downloading the next buffer in the
+        # background so that it downloads while the rest of the buffer is being parsed. Waiting
+        # until half of the buffer is consumed avoids downloading a second buffer when only the
+        # first few lines of a blob are read.
+        if self._readline_prefetch is not None or not self._readline_buffer:
+            return
+        if self._readline_buffer_pos < len(self._readline_buffer) // 2:
+            return
+        next_offset = (
+            self._position + len(self._readline_buffer) - (self._readline_buffer_pos)
+        )
+        blob_size = self._get_blob_size()
+        if next_offset >= blob_size:
+            return
+        self._readline_prefetch = (
+            next_offset,
+            self._client.submit_download(
+                next_offset, min(self._READLINE_PREFETCH_SIZE, blob_size - next_offset)
+            ),
+        )
+
+    def _read(self, size: Optional[int]) -> _client.DOWNLOAD_CONTENT_TYPE:
         if size == 0 or self._is_at_end_of_blob(fetch_blob_size=False):
             return b""
-        download_length = size
-        if size is not None and size < 0:
-            download_length = None
-        content = self._client.download(offset=self._position, length=download_length)
+        content: _client.DOWNLOAD_CONTENT_TYPE
+        if size is not None and self._is_small_read(size):
+            content = self._read_small(size)
+        else:
+            download_length = size
+            if size is not None and size < 0:
+                download_length = None
+            content = self._client.download(
+                offset=self._position, length=download_length
+            )
         self._position += len(content)
         self._blob_size = self._get_blob_size()
         return content
 
+    def _is_small_read(self, size: int) -> bool:
+        # Only small reads are served from the read-ahead window or the block cache. Larger
+        # reads are already downloaded in parallel partitions and would gain little from
+        # either.
+        return 0 < size <= self._READ_AHEAD_MAX_RANGE_SIZE
+
+    def _read_small(self, size: int) -> _client.DOWNLOAD_CONTENT_TYPE:
+        if self._read_ahead.is_sequential(self._position):
+            return self._read_ahead.read(self._position, size)
+        content: _client.DOWNLOAD_CONTENT_TYPE
+        # Blocks can only be aligned once the blob size is known. Until then (i.e., for the
+        # first read), download only the requested range, which also retrieves the size.
+        if self._block_cache.enabled and self._blob_size is not None:
+            content = self._block_cache.read(self._position, size, self._blob_size)
+        else:
+            content = self._client.download(offset=self._position, length=size)
+        self._read_ahead.record_read(self._position, len(content))
+        return content
+
+    def _read_ranges(
+        self, ranges: Sequence[Tuple[int, int]], max_gap: Optional[int]
+    ) -> List[memoryview]:
+        views = self._client.download_ranges(ranges, max_gap=max_gap)
+        self._blob_size = self._get_blob_size()
+        return views
+
+    def _iter_chunks(
+        self, size: Optional[int], window: Optional[int]
+    ) -> Iterator[bytes]:
+        if size == 0 or self._is_at_end_of_blob(fetch_blob_size=False):
+            return
+        length = size
+        if size is not None and size < 0:
+            length = None
+        for chunk in self._client.iter_chunks(
+            offset=self._position, length=length, window=window
+        ):
+            self._position += len(chunk)
+            yield chunk
+        self._blob_size = self._get_blob_size()
+
+    def _readinto(self, b: _client.SUPPORTED_READINTO_BUFFER_TYPE) -> int:
+        if self._is_at_end_of_blob(fetch_blob_size=False):
+            return 0
+        view = _client.get_writable_memoryview(b)
+        if self._is_small_read(len(view)):
+            # Consumers such as io.BufferedReader fill small buffers one after another, so
+            # serve them like small reads instead of making a request for each buffer.
+            content = self._read_small(len(view))
+            read_length = len(content)
+            view[:read_length] = content
+        else:
+            read_length = self._client.download_into(b, offset=self._position)
+        self._position += read_length
+        self._blob_size = self._get_blob_size()
+        return read_length
+
     def _seek(self, offset: int, whence: int) -> int:
         if self._blob_size is None:
             self._blob_size = self._get_blob_size()
@@ -397,11 +822,35 @@ class BlobIO(io.IOBase):
         return write_length
 
     def _commit_blob(self) -> None:
+        if self._can_upload_in_single_request():
+            self._upload_write_buffer()
+            return
         self._flush()
         block_ids = [f.result() for f in self._all_stage_block_futures]
         self._raise_if_duplicate_block_ids(block_ids)
         self._client.commit_block_list(block_ids)
 
+    def _can_upload_in_single_request(self) -> bool:
+        # If no blocks have been staged, all written data is still in the write buffer.
+        # When it is small enough, it can be uploaded with a single Put Blob request
+        # instead of staging a block and then committing the block list in a second,
+        # serial request.
+        return (
+            not self._all_stage_block_futures
+            and len(self._write_buffer) <= self._MAX_SINGLE_PUT_SIZE
+        )
+
+    def _upload_write_buffer(self) -> None:
+        try:
+            self._client.upload_blob(memoryview(self._write_buffer))
+        except Exception as e:
+            # Treat a failed single-request upload the same as a failed stage block so
+            # that close() consistently raises a FatalBlobIOWriteError when no data was
+            # written to the blob.
+            self._stage_block_exception = e
+            self._raise_if_fatal_write_error()
+        self._write_buffer = bytearray()
+
     def _raise_if_duplicate_block_ids(self, block_ids: List[str]) -> None:
         # An additional safety measure to ensure we never reuse block IDs within a BlobIO instance. This
         # should not be an issue with UUID4 for block IDs, but that may not always be the case if
@@ -442,9 +891,221 @@ class BlobIO(io.IOBase):
             raise FatalBlobIOWriteError(self._stage_block_exception)
 
     def _close_client(self) -> None:
+        self._cancel_readline_prefetch()
+        self._read_ahead.reset()
+        self._block_cache.clear()
         self._client.close()
 
     def _is_at_end_of_blob(self, fetch_blob_size=True) -> bool:
         if fetch_blob_size:
             self._get_blob_size()
         return self._blob_size is not None and self._position >= self._blob_size
+
+
+class _SequentialReadAhead:
+    # Downloads ranges ahead of sequential reads so that many small reads (e.g., from
+    # torch.load() or other parsers reading a few KiB at a time) are served from memory
+    # instead of each making a serial request. Read-ahead starts on the second of two
+    # consecutive reads. The window of content downloaded ahead of the position starts small
+    # and doubles each time a downloaded range is consumed, up to a maximum window size. Any
+    # read outside of the window resets it.
+    def __init__(
+        self,
+        client: _client.AzStorageTorchBlobClient,
+        min_window_size: int,
+        max_window_size: int,
+        max_range_size: int,
+    ):
+        self._client = client
+        self._min_window_size = min_window_size
+        self._max_window_size = max_window_size
+        self._max_range_size = max_range_size
+        self._window_size = 0
+        self._next_read_position: Optional[int] = None
+        self._buffer = memoryview(b"")
+        self._buffer_offset = 0
+        self._scheduled_end = 0
+        self._pending_ranges: Deque[Tuple[int, int, _client.DOWNLOAD_FUTURE_TYPE]] = (
+            collections.deque()
+        )
+
+    def read(self, position: int, size: int) -> bytes:
+        try:
+            return self._read_from_window(position, size)
+        except BaseException:
+            self.reset()
+            raise
+
+    def reset(self) -> None:
+        for _, _, future in self._pending_ranges:
+            future.cancel()
+        self._pending_ranges.clear()
+        self._window_size = 0
+        self._next_read_position = None
+        self._buffer = memoryview(b"")
+
+    def record_read(self, position: int, length: int) -> None:
+        # Records a read that was not served from the window so that a following read
+        # starting where it ended is detected as sequential.
+        self.reset()
+        self._next_read_position = position + length
+
+    def is_sequential(self, position: int) -> bool:
+        if position == self._next_read_position:
+            return True
+        return bool(self._window_size) and (
+            self._buffer_offset <= position < self._scheduled_end
+        )
+
+    def _read_from_window(self, position: int, size: int) -> bytes:
+        blob_size = self._client.get_blob_size()
+        end = min(position + size, blob_size)
+        if not self._window_size:
+            self._window_size = self._min_window_size
+            self._buffer_offset = position
+            self._scheduled_end = position
+        self._schedule_ranges(max(end, position + self._window_size), blob_size)
+        chunks = []
+        while position < end:
+            if position >= self._buffer_offset + len(self._buffer):
+                self._load_next_range(position)
+            start = position - self._buffer_offset
+            chunk = self._buffer[start : start + end - position]
+            if not chunk:
+                break
+            chunks.append(chunk)
+            position += len(chunk)
+        # Keep the, possibly grown, window full from the new position so that the next ranges
+        # download while the caller processes what was just read.
+        self._schedule_ranges(position + self._window_size, blob_size)
+        self._next_read_position = position
+        return b"".join(chunks)
+
+    def _schedule_ranges(self, target_end: int, blob_size: int) -> None:
+        target_end = min(target_end, blob_size)
+        while self._scheduled_end < target_end:
+            length = min(
+                self._window_size,
+                self._max_range_size,
+                blob_size - self._scheduled_end,
+            )
+            self._pending_ranges.append(
+                (
+                    self._scheduled_end,
+                    length,
+                    self._client.submit_download(self._scheduled_end, length),
+                )
+            )
+            self._scheduled_end += length
+
+    def _load_next_range(self, position: int) -> None:
+        offset, length, future = self._pending_ranges.popleft()
+        # Skip over ranges that end before the position (e.g., after a seek forward
+        # within the window).
+        while offset + length <= position:
+            future.cancel()
+            offset, length, future = self._pending_ranges.popleft()
+        self._buffer = memoryview(future.result())
+        self._buffer_offset = offset
+        self._window_size = min(2 * self._window_size, self._max_window_size)
+
+
+class _BlockCache:
+    # Least recently used cache of aligned blocks of blob content for reads that are not
+    # sequential. Formats such as zip archives and Parquet files are read by seeking back
+    # and forth between an index (e.g., a footer or central directory) and data regions, so
+    # the same regions are often read more than once. Blocks of a read that are not cached are
+    # downloaded in parallel, and reads of a block that is already being downloaded wait on
+    # that download instead of starting another one.
+    def __init__(
+        self,
+        client: _client.AzStorageTorchBlobClient,
+        block_size: int,
+        max_size: int,
+    ):
+        self._client = client
+        self._block_size = block_size
+        self._max_size = max_size
+        self._blocks: collections.OrderedDict[int, _client.DOWNLOAD_CONTENT_TYPE] = (
+            collections.OrderedDict()
+        )
+        self._cached_size = 0
+        self._in_flight_blocks: Dict[int, _client.DOWNLOAD_FUTURE_TYPE] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def read(self, position: int, size: int, blob_size: int) -> bytes:
+        end = min(position + size, blob_size)
+        if position >= end:
+            return b""
+        block_indexes = range(
+            position // self._block_size, (end - 1) // self._block_size + 1
+        )
+        futures = [self._get_block_future(i, blob_size) for i in block_indexes]
+        chunks = []
+        for index, future in zip(block_indexes, futures):
+            block = memoryview(future.result())
+            block_offset = index * self._block_size
+            chunks.append(block[max(position - block_offset, 0) : end - block_offset])
+        return b"".join(chunks)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "cached_bytes": self._cached_size,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            for future in self._in_flight_blocks.values():
+                future.cancel()
+            self._in_flight_blocks.clear()
+            self._blocks.clear()
+            self._cached_size = 0
+
+    def _get_block_future(
+        self, index: int, blob_size: int
+    ) -> _client.DOWNLOAD_FUTURE_TYPE:
+        future: _client.DOWNLOAD_FUTURE_TYPE
+        with self._lock:
+            if index in self._blocks:
+                self._blocks.move_to_end(index)
+                self._hits += 1
+                future = concurrent.futures.Future()
+                future.set_result(self._blocks[index])
+                return future
+            if index in self._in_flight_blocks:
+                self._hits += 1
+                return self._in_flight_blocks[index]
+            self._misses += 1
+            offset = index * self._block_size
+            future = self._client.submit_download(
+                offset, min(self._block_size, blob_size - offset)
+            )
+            self._in_flight_blocks[index] = future
+        # Add the callback outside of the lock as it runs immediately, in this thread,
+        # if the download has already completed.
+        future.add_done_callback(functools.partial(self._add_block, index))
+        return future
+
+    def _add_block(self, index: int, future: _client.DOWNLOAD_FUTURE_TYPE) -> None:
+        with self._lock:
+            if self._in_flight_blocks.get(index) is future:
+                del self._in_flight_blocks[index]
+            if future.cancelled() or future.exception() is not None:
+                return
+            block = future.result()
+            if index in self._blocks or len(block) > self._max_size:
+                return
+            self._blocks[index] = block
+            self._cached_size += len(block)
+            while self._cached_size > self._max_size:
+                _, evicted = self._blocks.popitem(last=False)
+                self._cached_size -= len(evicted)
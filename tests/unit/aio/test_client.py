@@ -0,0 +1,336 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+from unittest import mock
+
+import pytest
+from azure.core.credentials import AzureSasCredential
+from azure.core.credentials_async import AsyncTokenCredential
+import azure.core.exceptions
+from azure.core.pipeline.transport import HttpResponse
+import azure.identity.aio
+from azure.storage.blob import BlobBlock, BlobProperties
+from azure.storage.blob.aio import BlobClient
+
+from azstoragetorch.aio._client import (
+    AsyncAzStorageTorchBlobClient,
+    AsyncAzStorageTorchBlobClientFactory,
+)
+from tests.unit.utils import random_bytes
+
+
+PARTITION_SIZE = 16 * 1024 * 1024
+STAGE_BLOCK_SIZE = 32 * 1024 * 1024
+
+
+class MockAsyncStream:
+    def __init__(self, content, blob_size, etag="etag", chunk_size=64 * 1024):
+        self._chunks = [
+            content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+        ]
+        self.response = mock.Mock()
+        self.response.headers = {
+            "Content-Range": f"bytes 0-{max(len(content) - 1, 0)}/{blob_size}",
+            "ETag": etag,
+        }
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class FailingAsyncStream(MockAsyncStream):
+    async def _iter(self):
+        raise azure.core.exceptions.IncompleteReadError()
+        yield
+
+
+@pytest.fixture
+def mock_sdk_blob_client(blob_url, container_name, blob_name):
+    client = mock.Mock(BlobClient)
+    client.url = blob_url
+    client.container_name = container_name
+    client.blob_name = blob_name
+    client._client = mock.Mock()
+    client._client.blob.download = mock.AsyncMock()
+    client.get_blob_properties = mock.AsyncMock()
+    client.stage_block = mock.AsyncMock()
+    client.commit_block_list = mock.AsyncMock()
+    client.upload_blob = mock.AsyncMock()
+    return client
+
+
+@pytest.fixture
+def async_blob_client(mock_sdk_blob_client):
+    return AsyncAzStorageTorchBlobClient(mock_sdk_blob_client)
+
+
+@pytest.fixture
+def mock_download(mock_sdk_blob_client):
+    return mock_sdk_blob_client._client.blob.download
+
+
+def set_download_content(mock_download, content):
+    def download_side_effect(range, **kwargs):
+        start, end = range.split("=", 1)[1].split("-", 1)
+        return MockAsyncStream(content[int(start) : int(end) + 1], len(content))
+
+    mock_download.side_effect = download_side_effect
+
+
+def get_requested_ranges(mock_download):
+    return sorted(
+        (call.kwargs["range"] for call in mock_download.call_args_list),
+        key=lambda r: int(r.split("=", 1)[1].split("-", 1)[0]),
+    )
+
+
+class TestAsyncAzStorageTorchBlobClientFactory:
+    @pytest.fixture(autouse=True)
+    def default_credential_patch(self):
+        with mock.patch(
+            "azure.identity.aio.DefaultAzureCredential", spec=True
+        ) as patched:
+            yield patched
+
+    def test_defaults_to_default_azure_credential(self, default_credential_patch):
+        factory = AsyncAzStorageTorchBlobClientFactory()
+        assert factory._sdk_credential is default_credential_patch.return_value
+
+    @pytest.mark.parametrize(
+        "credential",
+        [
+            AzureSasCredential("sig=sas"),
+            mock.Mock(AsyncTokenCredential),
+        ],
+    )
+    def test_respects_provided_credential(self, credential):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=credential)
+        assert factory._sdk_credential is credential
+
+    def test_anonymous_credential(self):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=False)
+        assert factory._sdk_credential is None
+
+    def test_raises_for_unsupported_credential(self):
+        with pytest.raises(TypeError, match="Unsupported credential"):
+            AsyncAzStorageTorchBlobClientFactory(
+                credential=azure.identity.DefaultAzureCredential()
+            )
+
+    def test_get_blob_client_from_url(self, blob_url):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=False)
+        transport = mock.Mock()
+        with mock.patch.object(factory, "_create_transport", return_value=transport):
+            client = factory.get_blob_client_from_url(blob_url)
+        assert isinstance(client, AsyncAzStorageTorchBlobClient)
+        assert client.url == blob_url
+        assert client._sdk_blob_client._config.transport is transport
+
+    def test_transport_is_shared_and_created_lazily(self, blob_url):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=False)
+        with mock.patch.object(factory, "_create_transport") as create_transport:
+            create_transport.assert_not_called()
+            factory.get_blob_client_from_url(blob_url)
+            factory.get_blob_client_from_url(blob_url)
+        create_transport.assert_called_once_with()
+
+    def test_close_closes_owned_resources(self, blob_url, default_credential_patch):
+        default_credential_patch.return_value.close = mock.AsyncMock()
+        factory = AsyncAzStorageTorchBlobClientFactory()
+        transport = mock.Mock()
+        transport.close = mock.AsyncMock()
+        with mock.patch.object(factory, "_create_transport", return_value=transport):
+            factory.get_blob_client_from_url(blob_url)
+        asyncio.run(factory.close())
+        transport.close.assert_awaited_once_with()
+        default_credential_patch.return_value.close.assert_awaited_once_with()
+
+    def test_close_does_not_close_provided_credential(self):
+        credential = mock.Mock(AsyncTokenCredential)
+        credential.close = mock.AsyncMock()
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=credential)
+        asyncio.run(factory.close())
+        credential.close.assert_not_awaited()
+
+    def test_create_transport_without_aiohttp(self):
+        factory = AsyncAzStorageTorchBlobClientFactory(credential=False)
+        with mock.patch.dict("sys.modules", {"aiohttp": None}):
+            with mock.patch(
+                "azure.core.pipeline.transport.__getattr__",
+                side_effect=ImportError("aiohttp package is not installed"),
+                create=True,
+            ):
+                with pytest.raises(ImportError, match="azstoragetorch\\[aio\\]"):
+                    factory._create_transport()
+
+
+class TestAsyncAzStorageTorchBlobClient:
+    def test_properties(self, async_blob_client, blob_url, blob_name, container_name):
+        assert async_blob_client.url == blob_url
+        assert async_blob_client.blob_name == blob_name
+        assert async_blob_client.container_name == container_name
+
+    def test_url_strips_query_string(self, mock_sdk_blob_client, blob_url):
+        mock_sdk_blob_client.url = f"{blob_url}?sig=sas"
+        client = AsyncAzStorageTorchBlobClient(mock_sdk_blob_client)
+        assert client.url == blob_url
+
+    def test_get_blob_size(self, async_blob_client, mock_sdk_blob_client):
+        mock_sdk_blob_client.get_blob_properties.return_value = BlobProperties(
+            **{"Content-Length": 10}
+        )
+        assert asyncio.run(async_blob_client.get_blob_size()) == 10
+        assert asyncio.run(async_blob_client.get_blob_size()) == 10
+        mock_sdk_blob_client.get_blob_properties.assert_awaited_once_with()
+
+    def test_get_blob_size_from_provided_blob_properties(self, mock_sdk_blob_client):
+        client = AsyncAzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            blob_properties=BlobProperties(**{"Content-Length": 10}),
+        )
+        assert asyncio.run(client.get_blob_size()) == 10
+        mock_sdk_blob_client.get_blob_properties.assert_not_awaited()
+
+    def test_download_small_blob(self, async_blob_client, mock_download):
+        content = random_bytes(10)
+        set_download_content(mock_download, content)
+        assert asyncio.run(async_blob_client.download()) == content
+        assert get_requested_ranges(mock_download) == [f"bytes=0-{PARTITION_SIZE - 1}"]
+
+    def test_download_with_offset_and_length(self, async_blob_client, mock_download):
+        content = random_bytes(10)
+        set_download_content(mock_download, content)
+        assert (
+            asyncio.run(async_blob_client.download(offset=2, length=4))
+            == (content[2:6])
+        )
+
+    def test_download_large_blob_in_partitions(self, async_blob_client, mock_download):
+        content = random_bytes(2 * PARTITION_SIZE + 10)
+        set_download_content(mock_download, content)
+        downloaded = asyncio.run(async_blob_client.download())
+        assert downloaded == content
+        # Partitions are downloaded into a single bytearray, which is returned as is.
+        assert isinstance(downloaded, bytearray)
+        assert get_requested_ranges(mock_download) == [
+            f"bytes=0-{PARTITION_SIZE - 1}",
+            f"bytes={PARTITION_SIZE}-{2 * PARTITION_SIZE - 1}",
+            f"bytes={2 * PARTITION_SIZE}-{2 * PARTITION_SIZE + 9}",
+        ]
+        # Requests after the first are conditioned on the ETag from the first response.
+        for call in mock_download.call_args_list[1:]:
+            assert call.kwargs["modified_access_conditions"].if_match == "etag"
+
+    def test_download_empty_blob(self, async_blob_client, mock_download):
+        mock_http_response = mock.Mock(HttpResponse)
+        mock_http_response.reason = "message"
+        mock_http_response.status_code = 416
+        mock_http_response.headers = {"Content-Range": "bytes */0"}
+        mock_http_response.content_type = "application/xml"
+        mock_http_response.text.return_value = ""
+        mock_download.side_effect = azure.core.exceptions.HttpResponseError(
+            response=mock_http_response
+        )
+        assert asyncio.run(async_blob_client.download()) == b""
+        assert asyncio.run(async_blob_client.get_blob_size()) == 0
+
+    def test_download_retries_streaming_errors(self, async_blob_client, mock_download):
+        content = random_bytes(10)
+        mock_download.side_effect = [
+            FailingAsyncStream(content, len(content)),
+            MockAsyncStream(content, len(content)),
+        ]
+        with mock.patch("asyncio.sleep", new=mock.AsyncMock()):
+            assert asyncio.run(async_blob_client.download()) == content
+        assert mock_download.await_count == 2
+
+    def test_download_bounded_by_max_in_flight_requests(self, mock_sdk_blob_client):
+        client = AsyncAzStorageTorchBlobClient(
+            mock_sdk_blob_client, max_in_flight_requests=2
+        )
+        content = random_bytes(6 * PARTITION_SIZE)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def download_side_effect(range, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            start, end = range.split("=", 1)[1].split("-", 1)
+            return MockAsyncStream(content[int(start) : int(end) + 1], len(content))
+
+        mock_sdk_blob_client._client.blob.download.side_effect = download_side_effect
+        assert asyncio.run(client.download()) == content
+        assert max_in_flight == 2
+
+    def test_download_waits_for_cancelled_partitions(self, mock_sdk_blob_client):
+        client = AsyncAzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            blob_properties=BlobProperties(
+                **{"Content-Length": 3 * PARTITION_SIZE, "ETag": "etag"}
+            ),
+        )
+        failing_start = 2 * PARTITION_SIZE
+        cancelled_starts = []
+
+        async def download_side_effect(range, **kwargs):
+            start = int(range.split("=", 1)[1].split("-", 1)[0])
+            await asyncio.sleep(0)
+            if start == failing_start:
+                raise ValueError("Partition failed")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled_starts.append(start)
+                raise
+
+        mock_sdk_blob_client._client.blob.download.side_effect = download_side_effect
+
+        async def download():
+            with pytest.raises(ValueError, match="Partition failed"):
+                await client.download()
+            # All other partitions are done by the time the download raises.
+            return sorted(cancelled_starts)
+
+        assert asyncio.run(download()) == [0, PARTITION_SIZE]
+
+    def test_stage_blocks(self, async_blob_client, mock_sdk_blob_client):
+        data = random_bytes(STAGE_BLOCK_SIZE + 10)
+
+        async def stage_blocks():
+            tasks = await async_blob_client.stage_blocks(data)
+            return await asyncio.gather(*tasks)
+
+        block_ids = asyncio.run(stage_blocks())
+        assert len(block_ids) == 2
+        assert mock_sdk_blob_client.stage_block.call_args_list == [
+            mock.call(block_ids[0], data[:STAGE_BLOCK_SIZE]),
+            mock.call(block_ids[1], data[STAGE_BLOCK_SIZE:]),
+        ]
+
+    def test_stage_blocks_raises_for_empty_data(self, async_blob_client):
+        with pytest.raises(ValueError, match="Data must not be empty"):
+            asyncio.run(async_blob_client.stage_blocks(b""))
+
+    def test_commit_block_list(self, async_blob_client, mock_sdk_blob_client):
+        asyncio.run(async_blob_client.commit_block_list(["id1", "id2"]))
+        mock_sdk_blob_client.commit_block_list.assert_awaited_once()
+        blocks = mock_sdk_blob_client.commit_block_list.call_args.args[0]
+        assert all(isinstance(block, BlobBlock) for block in blocks)
+        assert [block.id for block in blocks] == ["id1", "id2"]
+
+    def test_upload_blob(self, async_blob_client, mock_sdk_blob_client):
+        asyncio.run(async_blob_client.upload_blob(memoryview(b"content")))
+        mock_sdk_blob_client.upload_blob.assert_awaited_once_with(
+            b"content", length=7, overwrite=True
+        )
@@ -0,0 +1,194 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+from unittest import mock
+
+import pytest
+import torch.utils.data
+
+from azstoragetorch.aio.datasets import AsyncBlob, AsyncIterableBlobDataset
+from azstoragetorch.aio._client import (
+    AsyncAzStorageTorchBlobClient,
+    AsyncAzStorageTorchBlobClientFactory,
+)
+
+
+@pytest.fixture
+def data_samples(container_url):
+    return [
+        {"url": f"{container_url}/blob{i}", "data": f"sample data {i}".encode("utf-8")}
+        for i in range(10)
+    ]
+
+
+@pytest.fixture
+def data_sample_blob_urls(data_samples):
+    return [sample["url"] for sample in data_samples]
+
+
+def create_mock_async_blob_client(url, data):
+    mock_blob_client = mock.Mock(AsyncAzStorageTorchBlobClient)
+    mock_blob_client.url = url
+    mock_blob_client.get_blob_size = mock.AsyncMock(return_value=len(data))
+    mock_blob_client.download = mock.AsyncMock(return_value=data)
+    return mock_blob_client
+
+
+@pytest.fixture
+def mock_factory_cls(data_samples):
+    blob_clients = {
+        sample["url"]: create_mock_async_blob_client(**sample)
+        for sample in data_samples
+    }
+
+    async def yield_blob_clients_from_container_url(container_url, prefix=None):
+        for blob_client in blob_clients.values():
+            yield blob_client
+
+    with mock.patch(
+        "azstoragetorch.aio._client.AsyncAzStorageTorchBlobClientFactory", spec=True
+    ) as mock_factory_cls:
+        mock_factory = mock_factory_cls.return_value
+        mock_factory.get_blob_client_from_url.side_effect = blob_clients.get
+        mock_factory.yield_blob_clients_from_container_url.side_effect = (
+            yield_blob_clients_from_container_url
+        )
+        mock_factory.close = mock.AsyncMock()
+        yield mock_factory_cls
+
+
+async def collect(dataset):
+    return [sample async for sample in dataset]
+
+
+class TestAsyncBlob:
+    def test_properties(self, blob_url, blob_name, container_name):
+        mock_blob_client = mock.Mock(AsyncAzStorageTorchBlobClient)
+        mock_blob_client.url = blob_url
+        mock_blob_client.blob_name = blob_name
+        mock_blob_client.container_name = container_name
+        blob = AsyncBlob(mock_blob_client)
+        assert blob.url == blob_url
+        assert blob.blob_name == blob_name
+        assert blob.container_name == container_name
+
+    def test_reader(self, blob_url):
+        mock_blob_client = mock.Mock(AsyncAzStorageTorchBlobClient)
+        mock_blob_client.url = blob_url
+        with mock.patch(
+            "azstoragetorch.aio.datasets.AsyncBlobIO", spec=True
+        ) as mock_blob_io_cls:
+            reader = AsyncBlob(mock_blob_client).reader()
+            assert reader is mock_blob_io_cls.return_value
+            mock_blob_io_cls.assert_called_once_with(
+                blob_url, "rb", _azstoragetorch_blob_client=mock_blob_client
+            )
+
+
+class TestAsyncIterableBlobDataset:
+    def test_from_blob_urls(
+        self, mock_factory_cls, data_samples, data_sample_blob_urls
+    ):
+        dataset = AsyncIterableBlobDataset.from_blob_urls(data_sample_blob_urls)
+        assert isinstance(dataset, torch.utils.data.IterableDataset)
+        assert asyncio.run(collect(dataset)) == data_samples
+        mock_factory_cls.assert_called_once_with(credential=None)
+        mock_factory_cls.return_value.close.assert_awaited_once_with()
+
+    def test_from_single_blob_url(self, mock_factory_cls, data_samples):
+        dataset = AsyncIterableBlobDataset.from_blob_urls(data_samples[0]["url"])
+        assert asyncio.run(collect(dataset)) == data_samples[:1]
+
+    def test_from_container_url(self, mock_factory_cls, data_samples, container_url):
+        dataset = AsyncIterableBlobDataset.from_container_url(
+            container_url, prefix="prefix", credential=False
+        )
+        assert asyncio.run(collect(dataset)) == data_samples
+        mock_factory_cls.assert_called_once_with(credential=False)
+        mock_factory_cls.return_value.yield_blob_clients_from_container_url.assert_called_once_with(
+            container_url, prefix="prefix"
+        )
+
+    def test_transform(self, mock_factory_cls, data_sample_blob_urls):
+        async def transform(blob):
+            return blob.url
+
+        dataset = AsyncIterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, transform=transform
+        )
+        assert asyncio.run(collect(dataset)) == data_sample_blob_urls
+
+    def test_transforms_run_concurrently_and_preserve_order(
+        self, mock_factory_cls, data_sample_blob_urls
+    ):
+        running = 0
+        max_running = 0
+
+        async def transform(blob):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            # Make earlier blobs finish last to ensure order is still preserved.
+            await asyncio.sleep(0.001 * (len(data_sample_blob_urls) - running))
+            running -= 1
+            return blob.url
+
+        dataset = AsyncIterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, transform=transform, max_concurrency=4
+        )
+        assert asyncio.run(collect(dataset)) == data_sample_blob_urls
+        assert max_running == 4
+
+    def test_sync_iteration(
+        self, mock_factory_cls, data_samples, data_sample_blob_urls
+    ):
+        dataset = AsyncIterableBlobDataset.from_blob_urls(data_sample_blob_urls)
+        assert list(dataset) == data_samples
+        mock_factory_cls.return_value.close.assert_awaited_once_with()
+
+    def test_sync_iteration_closes_on_early_exit(
+        self, mock_factory_cls, data_samples, data_sample_blob_urls
+    ):
+        dataset = AsyncIterableBlobDataset.from_blob_urls(data_sample_blob_urls)
+        iterator = iter(dataset)
+        assert next(iterator) == data_samples[0]
+        iterator.close()
+        mock_factory_cls.return_value.close.assert_awaited_once_with()
+
+    @pytest.mark.parametrize(
+        "worker_id,expected_indexes",
+        [(0, [0, 3, 6, 9]), (1, [1, 4, 7]), (2, [2, 5, 8])],
+    )
+    def test_shards_across_workers(
+        self,
+        mock_factory_cls,
+        data_samples,
+        data_sample_blob_urls,
+        worker_id,
+        expected_indexes,
+    ):
+        dataset = AsyncIterableBlobDataset.from_blob_urls(data_sample_blob_urls)
+        worker_info = mock.Mock(num_workers=3, id=worker_id)
+        with mock.patch("torch.utils.data.get_worker_info", return_value=worker_info):
+            assert list(dataset) == [data_samples[i] for i in expected_indexes]
+
+    def test_raises_for_invalid_max_concurrency(self, data_sample_blob_urls):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncIterableBlobDataset.from_blob_urls(
+                data_sample_blob_urls, max_concurrency=0
+            )
+
+    def test_factory_created_per_iteration(
+        self, mock_factory_cls, data_sample_blob_urls
+    ):
+        dataset = AsyncIterableBlobDataset.from_blob_urls(data_sample_blob_urls)
+        list(dataset)
+        list(dataset)
+        assert mock_factory_cls.call_count == 2
+        assert isinstance(
+            mock_factory_cls.return_value, AsyncAzStorageTorchBlobClientFactory
+        )
@@ -0,0 +1,227 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import io
+import os
+from unittest import mock
+
+import pytest
+
+from azstoragetorch.aio.io import AsyncBlobIO
+from azstoragetorch.aio._client import AsyncAzStorageTorchBlobClient
+from azstoragetorch.exceptions import FatalBlobIOWriteError
+from tests.unit.utils import random_bytes
+
+
+EXPECTED_FLUSH_THRESHOLD = 32 * 1024 * 1024
+
+
+@pytest.fixture
+def mock_async_blob_client(blob_content, blob_length):
+    mock_blob_client = mock.Mock(AsyncAzStorageTorchBlobClient)
+    mock_blob_client.get_blob_size = mock.AsyncMock(return_value=blob_length)
+    mock_blob_client.download = mock.AsyncMock(return_value=blob_content)
+    mock_blob_client.commit_block_list = mock.AsyncMock()
+    mock_blob_client.upload_blob = mock.AsyncMock()
+
+    async def stage_blocks(data):
+        async def stage_block():
+            return f"block-{len(data)}-{bytes(data[:4]).hex()}"
+
+        return [asyncio.ensure_future(stage_block())]
+
+    mock_blob_client.stage_blocks = mock.AsyncMock(side_effect=stage_blocks)
+    return mock_blob_client
+
+
+@pytest.fixture
+def create_blob_io(blob_url, mock_async_blob_client):
+    def _create_blob_io(mode="rb"):
+        return AsyncBlobIO(
+            blob_url, mode, _azstoragetorch_blob_client=mock_async_blob_client
+        )
+
+    return _create_blob_io
+
+
+class TestAsyncBlobIO:
+    def test_raises_for_unsupported_mode(self, blob_url):
+        with pytest.raises(ValueError, match="Unsupported mode"):
+            AsyncBlobIO(blob_url, "r+")
+
+    def test_creates_client_from_factory(self, blob_url):
+        with mock.patch(
+            "azstoragetorch.aio._client.AsyncAzStorageTorchBlobClientFactory",
+            spec=True,
+        ) as mock_factory_cls:
+            mock_factory_cls.return_value.close = mock.AsyncMock()
+            blob_io = AsyncBlobIO(blob_url, "rb", credential=False)
+            mock_factory_cls.assert_called_once_with(credential=False)
+            mock_factory_cls.return_value.get_blob_client_from_url.assert_called_once_with(
+                blob_url
+            )
+            asyncio.run(blob_io.close())
+            mock_factory_cls.return_value.close.assert_awaited_once_with()
+
+    def test_read(self, create_blob_io, mock_async_blob_client, blob_content):
+        async def read():
+            async with create_blob_io() as blob_io:
+                content = await blob_io.read()
+                assert blob_io.tell() == len(blob_content)
+                assert await blob_io.read() == b""
+                return content
+
+        assert asyncio.run(read()) == blob_content
+        mock_async_blob_client.download.assert_awaited_once_with(offset=0, length=None)
+
+    def test_read_with_size_after_seek(
+        self, create_blob_io, mock_async_blob_client, blob_content
+    ):
+        mock_async_blob_client.download.return_value = blob_content[2:6]
+
+        async def read():
+            async with create_blob_io() as blob_io:
+                assert await blob_io.seek(2) == 2
+                return await blob_io.read(4)
+
+        assert asyncio.run(read()) == blob_content[2:6]
+        mock_async_blob_client.download.assert_awaited_once_with(offset=2, length=4)
+
+    @pytest.mark.parametrize(
+        "offset,whence,expected_position",
+        [
+            (2, os.SEEK_SET, 2),
+            (1, os.SEEK_CUR, 1),
+            (-2, os.SEEK_END, 10),
+        ],
+    )
+    def test_seek(self, create_blob_io, offset, whence, expected_position):
+        blob_io = create_blob_io()
+        assert asyncio.run(blob_io.seek(offset, whence)) == expected_position
+        assert blob_io.tell() == expected_position
+
+    def test_seek_raises_for_negative_position(self, create_blob_io):
+        with pytest.raises(ValueError, match="negative position"):
+            asyncio.run(create_blob_io().seek(-1))
+
+    def test_write(self, create_blob_io, mock_async_blob_client):
+        async def write():
+            async with create_blob_io(mode="wb") as blob_io:
+                assert await blob_io.write(b"abc") == 3
+                assert await blob_io.write(b"def") == 3
+                assert blob_io.tell() == 6
+                mock_async_blob_client.stage_blocks.assert_not_awaited()
+
+        asyncio.run(write())
+        mock_async_blob_client.upload_blob.assert_awaited_once_with(
+            memoryview(b"abcdef")
+        )
+        mock_async_blob_client.stage_blocks.assert_not_awaited()
+        mock_async_blob_client.commit_block_list.assert_not_awaited()
+
+    def test_write_commits_block_list_after_flush(
+        self, create_blob_io, mock_async_blob_client
+    ):
+        async def write():
+            async with create_blob_io(mode="wb") as blob_io:
+                await blob_io.write(b"abc")
+                await blob_io.flush()
+                await blob_io.write(b"def")
+
+        asyncio.run(write())
+        mock_async_blob_client.upload_blob.assert_not_awaited()
+        mock_async_blob_client.commit_block_list.assert_awaited_once_with(
+            ["block-3-616263", "block-3-646566"]
+        )
+
+    def test_write_stages_blocks_once_buffer_is_full(
+        self, create_blob_io, mock_async_blob_client
+    ):
+        data = random_bytes(EXPECTED_FLUSH_THRESHOLD)
+
+        async def write():
+            async with create_blob_io(mode="wb") as blob_io:
+                await blob_io.write(data)
+                mock_async_blob_client.stage_blocks.assert_awaited_once()
+
+        asyncio.run(write())
+        mock_async_blob_client.commit_block_list.assert_awaited_once()
+
+    def test_close_raises_fatal_error_for_failed_stage_block(
+        self, create_blob_io, mock_async_blob_client
+    ):
+        async def stage_blocks(data):
+            async def stage_block():
+                raise ValueError("stage block failed")
+
+            return [asyncio.ensure_future(stage_block())]
+
+        mock_async_blob_client.stage_blocks.side_effect = stage_blocks
+
+        async def write():
+            blob_io = create_blob_io(mode="wb")
+            await blob_io.write(random_bytes(EXPECTED_FLUSH_THRESHOLD))
+            await blob_io.close()
+
+        with pytest.raises(FatalBlobIOWriteError):
+            asyncio.run(write())
+        mock_async_blob_client.commit_block_list.assert_not_awaited()
+
+    def test_close_raises_fatal_error_for_failed_single_request_upload(
+        self, create_blob_io, mock_async_blob_client
+    ):
+        mock_async_blob_client.upload_blob.side_effect = ValueError("upload failed")
+
+        async def write():
+            blob_io = create_blob_io(mode="wb")
+            await blob_io.write(b"data")
+            await blob_io.close()
+
+        with pytest.raises(FatalBlobIOWriteError):
+            asyncio.run(write())
+        mock_async_blob_client.commit_block_list.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        "mode,method,args",
+        [
+            ("rb", "write", [b""]),
+            ("wb", "read", []),
+            ("wb", "seek", [0]),
+        ],
+    )
+    def test_methods_raise_for_unsupported_modes(
+        self, create_blob_io, mode, method, args
+    ):
+        blob_io = create_blob_io(mode=mode)
+        with pytest.raises(io.UnsupportedOperation):
+            asyncio.run(getattr(blob_io, method)(*args))
+
+    @pytest.mark.parametrize(
+        "method,args,mode",
+        [
+            ("read", [], "rb"),
+            ("seek", [0], "rb"),
+            ("write", [b""], "wb"),
+            ("flush", [], "wb"),
+        ],
+    )
+    def test_raises_after_close(self, create_blob_io, method, args, mode):
+        blob_io = create_blob_io(mode=mode)
+        asyncio.run(blob_io.close())
+        assert blob_io.closed
+        with pytest.raises(ValueError, match="I/O operation on closed file"):
+            asyncio.run(getattr(blob_io, method)(*args))
+
+    def test_mode_checks(self, create_blob_io):
+        read_blob_io = create_blob_io(mode="rb")
+        assert read_blob_io.readable()
+        assert read_blob_io.seekable()
+        assert not read_blob_io.writable()
+        write_blob_io = create_blob_io(mode="wb")
+        assert not write_blob_io.readable()
+        assert not write_blob_io.seekable()
+        assert write_blob_io.writable()
@@ -0,0 +1,198 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import concurrent.futures
+import os
+import pickle
+from unittest import mock
+
+import pytest
+
+from azstoragetorch.cache import DiskCache
+from tests.unit.utils import random_bytes
+
+BLOCK_SIZE = 10
+ETAG = "etag"
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def disk_cache(cache_dir):
+    return DiskCache(str(cache_dir), max_size=30, block_size=BLOCK_SIZE)
+
+
+def get_block_files(cache_dir):
+    return sorted(
+        os.path.join(dirpath, filename)
+        for dirpath, _, filenames in os.walk(cache_dir / "blocks")
+        for filename in filenames
+    )
+
+
+def set_mtime(disk_cache, blob_url, index, mtime):
+    os.utime(disk_cache._get_block_path(blob_url, ETAG, index), (mtime, mtime))
+
+
+class TestDiskCache:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_size": 0},
+            {"max_size": 1, "block_size": 0},
+        ],
+    )
+    def test_raises_for_invalid_sizes(self, cache_dir, kwargs):
+        with pytest.raises(ValueError):
+            DiskCache(str(cache_dir), **kwargs)
+
+    def test_put_and_get_block(self, disk_cache, blob_url):
+        block = random_bytes(BLOCK_SIZE)
+        assert disk_cache.get_block(blob_url, ETAG, 0, BLOCK_SIZE) is None
+        disk_cache.put_block(blob_url, ETAG, 0, block)
+        assert disk_cache.get_block(blob_url, ETAG, 0, BLOCK_SIZE) == block
+        assert disk_cache.get_size() == BLOCK_SIZE
+
+    def test_blocks_are_keyed_by_url_and_etag(self, disk_cache, blob_url):
+        disk_cache.put_block(blob_url, ETAG, 0, random_bytes(BLOCK_SIZE))
+        assert disk_cache.get_block(blob_url, "other-etag", 0, BLOCK_SIZE) is None
+        assert disk_cache.get_block(blob_url + "2", ETAG, 0, BLOCK_SIZE) is None
+        assert disk_cache.get_block(blob_url, ETAG, 1, BLOCK_SIZE) is None
+
+    def test_get_block_of_unexpected_length_is_miss(self, disk_cache, blob_url):
+        disk_cache.put_block(blob_url, ETAG, 0, random_bytes(BLOCK_SIZE - 1))
+        assert disk_cache.get_block(blob_url, ETAG, 0, BLOCK_SIZE) is None
+
+    def test_put_existing_block_is_not_counted_again(
+        self, disk_cache, cache_dir, blob_url
+    ):
+        block = random_bytes(BLOCK_SIZE)
+        disk_cache.put_block(blob_url, ETAG, 0, block)
+        disk_cache.put_block(blob_url, ETAG, 0, block)
+        assert disk_cache.get_size() == BLOCK_SIZE
+        assert len(get_block_files(cache_dir)) == 1
+
+    def test_does_not_leave_temporary_files(self, disk_cache, cache_dir, blob_url):
+        disk_cache.put_block(blob_url, ETAG, 0, random_bytes(BLOCK_SIZE))
+        disk_cache.record_blob_info(blob_url, ETAG, BLOCK_SIZE)
+        assert not [
+            filename
+            for _, _, filenames in os.walk(cache_dir)
+            for filename in filenames
+            if filename.endswith(".tmp")
+        ]
+
+    def test_evicts_least_recently_used_blocks(self, disk_cache, cache_dir, blob_url):
+        blocks = [random_bytes(BLOCK_SIZE) for _ in range(4)]
+        for index, block in enumerate(blocks[:3]):
+            disk_cache.put_block(blob_url, ETAG, index, block)
+            set_mtime(disk_cache, blob_url, index, 1000 + index)
+        # Reading the oldest block makes it the most recently used.
+        assert disk_cache.get_block(blob_url, ETAG, 0, BLOCK_SIZE) == blocks[0]
+        disk_cache.put_block(blob_url, ETAG, 3, blocks[3])
+        assert disk_cache.get_block(blob_url, ETAG, 1, BLOCK_SIZE) is None
+        assert disk_cache.get_block(blob_url, ETAG, 2, BLOCK_SIZE) is None
+        assert disk_cache.get_block(blob_url, ETAG, 0, BLOCK_SIZE) == blocks[0]
+        assert disk_cache.get_block(blob_url, ETAG, 3, BLOCK_SIZE) == blocks[3]
+        assert disk_cache.get_size() == 2 * BLOCK_SIZE
+        assert len(get_block_files(cache_dir)) == 2
+
+    def test_eviction_recomputes_size_from_disk(self, disk_cache, cache_dir, blob_url):
+        for index in range(3):
+            disk_cache.put_block(blob_url, ETAG, index, random_bytes(BLOCK_SIZE))
+            set_mtime(disk_cache, blob_url, index, 1000 + index)
+        # Simulate a process that stopped after caching a block but before recording
+        # the cache's new size.
+        disk_cache._write_size(2 * BLOCK_SIZE)
+        disk_cache.put_block(blob_url, ETAG, 3, random_bytes(2 * BLOCK_SIZE))
+        assert disk_cache.get_size() == 2 * BLOCK_SIZE
+        assert len(get_block_files(cache_dir)) == 1
+
+    def test_eviction_reuses_candidates_from_previous_walk(
+        self, disk_cache, cache_dir, blob_url
+    ):
+        for index in range(3):
+            disk_cache.put_block(blob_url, ETAG, index, random_bytes(BLOCK_SIZE))
+            set_mtime(disk_cache, blob_url, index, 1000 + index)
+        with mock.patch.object(
+            disk_cache, "_iter_blocks", wraps=disk_cache._iter_blocks
+        ) as iter_blocks_spy:
+            disk_cache.put_block(blob_url, ETAG, 3, random_bytes(BLOCK_SIZE))
+            disk_cache.put_block(blob_url, ETAG, 4, random_bytes(BLOCK_SIZE))
+            disk_cache.put_block(blob_url, ETAG, 5, random_bytes(BLOCK_SIZE))
+        assert iter_blocks_spy.call_count == 1
+        assert [
+            disk_cache.get_block(blob_url, ETAG, index, BLOCK_SIZE) is not None
+            for index in range(6)
+        ] == [False, False, False, False, True, True]
+        assert disk_cache.get_size() == 2 * BLOCK_SIZE
+        assert len(get_block_files(cache_dir)) == 2
+
+    def test_eviction_skips_candidates_used_since_walk(
+        self, disk_cache, cache_dir, blob_url
+    ):
+        for index in range(3):
+            disk_cache.put_block(blob_url, ETAG, index, random_bytes(BLOCK_SIZE))
+            set_mtime(disk_cache, blob_url, index, 1000 + index)
+        disk_cache.put_block(blob_url, ETAG, 3, random_bytes(BLOCK_SIZE))
+        # Block 2 is a candidate from the previous walk but is read before the next eviction.
+        assert disk_cache.get_block(blob_url, ETAG, 2, BLOCK_SIZE) is not None
+        disk_cache.put_block(blob_url, ETAG, 4, random_bytes(BLOCK_SIZE))
+        set_mtime(disk_cache, blob_url, 4, 1004)
+        disk_cache.put_block(blob_url, ETAG, 5, random_bytes(BLOCK_SIZE))
+        assert [
+            os.path.exists(disk_cache._get_block_path(blob_url, ETAG, index))
+            for index in range(6)
+        ] == [False, False, True, False, False, True]
+        assert disk_cache.get_size() == 2 * BLOCK_SIZE
+
+    def test_get_blob_info(self, disk_cache, blob_url):
+        assert disk_cache.get_blob_info(blob_url) is None
+        disk_cache.record_blob_info(blob_url, ETAG, 100)
+        assert disk_cache.get_blob_info(blob_url) == (ETAG, 100)
+
+    def test_record_new_etag_removes_previous_blocks(
+        self, disk_cache, cache_dir, blob_url
+    ):
+        disk_cache.record_blob_info(blob_url, ETAG, 2 * BLOCK_SIZE)
+        for index in range(2):
+            disk_cache.put_block(blob_url, ETAG, index, random_bytes(BLOCK_SIZE))
+        other_blob_block = random_bytes(BLOCK_SIZE)
+        disk_cache.put_block(blob_url + "2", ETAG, 0, other_blob_block)
+        disk_cache.record_blob_info(blob_url, "new-etag", BLOCK_SIZE)
+        assert disk_cache.get_blob_info(blob_url) == ("new-etag", BLOCK_SIZE)
+        assert disk_cache.get_block(blob_url, ETAG, 0, BLOCK_SIZE) is None
+        assert (
+            disk_cache.get_block(blob_url + "2", ETAG, 0, BLOCK_SIZE)
+            == other_blob_block
+        )
+        assert disk_cache.get_size() == BLOCK_SIZE
+        assert len(get_block_files(cache_dir)) == 1
+
+    def test_shared_by_multiple_writers(self, cache_dir, blob_url):
+        # Each writer uses its own cache instance, and therefore its own lock file
+        # descriptors, as separate DataLoader worker processes would.
+        blocks = [random_bytes(BLOCK_SIZE) for _ in range(20)]
+
+        def put_block(index):
+            disk_cache = DiskCache(str(cache_dir), max_size=1024, block_size=BLOCK_SIZE)
+            disk_cache.put_block(blob_url, ETAG, index, blocks[index])
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            list(executor.map(put_block, list(range(20)) * 2))
+        disk_cache = DiskCache(str(cache_dir), max_size=1024, block_size=BLOCK_SIZE)
+        assert disk_cache.get_size() == 20 * BLOCK_SIZE
+        for index, block in enumerate(blocks):
+            assert disk_cache.get_block(blob_url, ETAG, index, BLOCK_SIZE) == block
+
+    def test_pickle(self, disk_cache, blob_url):
+        block = random_bytes(BLOCK_SIZE)
+        disk_cache.put_block(blob_url, ETAG, 0, block)
+        unpickled = pickle.loads(pickle.dumps(disk_cache))
+        assert unpickled.block_size == BLOCK_SIZE
+        assert unpickled.get_block(blob_url, ETAG, 0, BLOCK_SIZE) == block
@@ -3,19 +3,29 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import base64
 import concurrent.futures
 import copy
+import datetime
 from unittest import mock
 import os
+import pickle
 import threading
+import time
 import urllib.parse
 import pytest
+import torch
 
-from azure.core.credentials import AzureSasCredential, AzureNamedKeyCredential
+from azure.core.credentials import (
+    AccessToken,
+    AzureSasCredential,
+    AzureNamedKeyCredential,
+)
 import azure.core.exceptions
 from azure.core.pipeline.transport import HttpRequest, HttpResponse
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import (
+    BlobPrefix,
     BlobClient,
     BlobProperties,
     StorageErrorCode,
@@ -24,17 +34,26 @@ from azure.storage.blob import (
 )
 from azure.storage.blob._generated._azure_blob_storage import AzureBlobStorage
 from azure.storage.blob._generated.operations import BlobOperations
-from azure.storage.blob._generated.models import ModifiedAccessConditions
+from azure.storage.blob._generated.models import (
+    ModifiedAccessConditions,
+    SourceModifiedAccessConditions,
+)
 from azure.core.pipeline import Pipeline
 from azure.core.pipeline import PipelineRequest, PipelineResponse
 from azure.core.pipeline.transport import RequestsTransport
 
+from azstoragetorch import _client, _crc64
+from azstoragetorch.cache import DiskCache
 from azstoragetorch._client import (
     AzStorageTorchBlobClient,
     AzStorageTorchBlobClientFactory,
+    AdaptiveConcurrencyPolicy,
     EchoClientRequestIdPolicy,
 )
-from azstoragetorch.exceptions import ClientRequestIdMismatchError
+from azstoragetorch.exceptions import (
+    ChecksumMismatchError,
+    ClientRequestIdMismatchError,
+)
 from tests.unit.utils import random_bytes
 from azstoragetorch._version import __version__
 from azure.core.pipeline.transport._requests_basic import StreamDownloadGenerator
@@ -52,6 +71,9 @@ PROCESS_CPU_COUNT_UNAVAILABLE = object()
 SAS_TOKEN = "sp=r&st=2024-10-28T20:22:30Z&se=2024-10-29T04:22:30Z&spr=https&sv=2022-11-02&sr=c&sig=signature"
 SNAPSHOT = "2024-10-28T20:34:36.1724588Z"
 VERSION_ID = SNAPSHOT
+LAST_MODIFIED = datetime.datetime(
+    2024, 10, 28, 20, 34, 36, tzinfo=datetime.timezone.utc
+)
 
 
 @pytest.fixture(autouse=True)
@@ -60,6 +82,18 @@ def sleep_patch():
         yield patched_sleep
 
 
+@pytest.fixture(autouse=True)
+def reset_download_stats():
+    with mock.patch.dict(_client._DOWNLOAD_STATS_BY_ACCOUNT, clear=True):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def reset_concurrency_limits():
+    with mock.patch.dict(_client._CONCURRENCY_LIMITS_BY_ACCOUNT, clear=True):
+        yield
+
+
 @pytest.fixture
 def sas_token():
     return SAS_TOKEN
@@ -104,12 +138,26 @@ def mock_sdk_blob_client(
     return mock_sdk_client
 
 
+@pytest.fixture
+def listed_blobs(blob_names):
+    listed_blobs = []
+    for i, blob_name in enumerate(blob_names):
+        listed_blob = BlobProperties(name=blob_name)
+        listed_blob.size = i + 1
+        listed_blob.etag = f"0x8D{i}"
+        listed_blob.last_modified = LAST_MODIFIED
+        listed_blobs.append(listed_blob)
+    return listed_blobs
+
+
 @pytest.fixture
 def mock_sdk_container_client(
-    blob_names, mock_sdk_blob_clients_from_blob_names, mock_pipeline
+    listed_blobs, mock_sdk_blob_clients_from_blob_names, mock_pipeline
 ):
     mock_container_client = mock.Mock(ContainerClient)
-    mock_container_client.list_blob_names.return_value = blob_names
+    fake_listing = FakeBlobListing(listed_blobs)
+    mock_container_client.walk_blobs.side_effect = fake_listing.walk_blobs
+    mock_container_client.list_blobs.side_effect = fake_listing.list_blobs
     mock_container_client.get_blob_client.side_effect = (
         mock_sdk_blob_clients_from_blob_names
     )
@@ -193,6 +241,11 @@ def to_bytes_iterator(content, chunk_size=64 * 1024, exception_to_raise=None):
             raise exception_to_raise
 
 
+def raise_on_iteration(exception_to_raise):
+    raise exception_to_raise
+    yield
+
+
 def mock_download_response(
     expected_range, blob_length, content, exception=None, etag=None
 ):
@@ -209,6 +262,16 @@ def mock_download_response(
     return response
 
 
+def assert_buffer_content(buffer, expected_content):
+    if isinstance(buffer, torch.Tensor):
+        expected_tensor = torch.frombuffer(
+            bytearray(expected_content), dtype=torch.uint8
+        )
+        assert torch.equal(buffer, expected_tensor)
+    else:
+        assert bytes(buffer) == expected_content
+
+
 def preset_blob_size_on_clients(
     azstoragetorch_blob_client,
     mock_sdk_blob_client,
@@ -218,6 +281,14 @@ def preset_blob_size_on_clients(
     azstoragetorch_blob_client.get_blob_size()
 
 
+def seed_download_stats(blob_url, latency, throughput, num_samples=8):
+    download_stats = _client._get_download_stats(urllib.parse.urlparse(blob_url).netloc)
+    for _ in range(num_samples):
+        download_stats.record(
+            latency=latency, num_bytes=int(throughput), transfer_time=1.0
+        )
+
+
 class NonRetryableException(Exception):
     pass
 
@@ -238,6 +309,59 @@ class AtomicCounter:
             return self.value
 
 
+class FakeBlobListing:
+    # Simulates the paging behavior of ContainerClient.walk_blobs() and list_blobs() for a
+    # fixed set of blobs. Like the service, walk_blobs() returns all prefixes of a page
+    # ahead of its blobs.
+    def __init__(self, listed_blobs, page_size=2):
+        self._listed_blobs = sorted(listed_blobs, key=lambda blob: blob.name)
+        self._page_size = page_size
+
+    def walk_blobs(self, name_starts_with=None, delimiter="/"):
+        prefix = name_starts_with or ""
+        items = []
+        for blob in self._listed_blobs:
+            if not blob.name.startswith(prefix):
+                continue
+            rest = blob.name[len(prefix) :]
+            if delimiter in rest:
+                blob_prefix_name = prefix + rest.split(delimiter, 1)[0] + delimiter
+                if not items or items[-1].name != blob_prefix_name:
+                    blob_prefix = mock.Mock(BlobPrefix)
+                    blob_prefix.name = blob_prefix_name
+                    items.append(blob_prefix)
+            else:
+                items.append(blob)
+        pages = [
+            sorted(page, key=lambda item: not isinstance(item, BlobPrefix))
+            for page in self._get_pages(items)
+        ]
+        return self._get_item_paged(pages)
+
+    def list_blobs(self, name_starts_with=None):
+        prefix = name_starts_with or ""
+        items = [blob for blob in self._listed_blobs if blob.name.startswith(prefix)]
+        return self._get_item_paged(self._get_pages(items))
+
+    def _get_pages(self, items):
+        return [
+            items[i : i + self._page_size]
+            for i in range(0, len(items), self._page_size)
+        ]
+
+    def _get_item_paged(self, pages):
+        item_paged = mock.Mock()
+        item_paged.by_page.side_effect = lambda: iter(pages)
+        return item_paged
+
+
+def get_listed_blob(name):
+    listed_blob = BlobProperties(name=name)
+    listed_blob.size = len(name)
+    listed_blob.etag = f"etag-{name}"
+    return listed_blob
+
+
 class SpySubmitExcecutor(concurrent.futures.ThreadPoolExecutor):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -248,6 +372,31 @@ class SpySubmitExcecutor(concurrent.futures.ThreadPoolExecutor):
         return super().submit(fn, *args, **kwargs)
 
 
+class RunningTracker:
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._released = False
+        self.running = 0
+        self.max_running = 0
+
+    def run(self):
+        with self._condition:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._released, timeout=10)
+            self.running -= 1
+
+    def wait_for_running(self, count):
+        with self._condition:
+            self._condition.wait_for(lambda: self.running >= count, timeout=10)
+
+    def release_all(self):
+        with self._condition:
+            self._released = True
+            self._condition.notify_all()
+
+
 class TestEchoClientRequestIdPolicy:
     def test_adds_client_request_id(
         self, echo_client_request_id_policy, mock_pipeline_request, mock_uuid4
@@ -297,6 +446,255 @@ class TestEchoClientRequestIdPolicy:
             pytest.fail(f"Client request ID should match but received: {e}")
 
 
+class TestAdaptiveConcurrencyPolicy:
+    @pytest.fixture
+    def policy(self):
+        return AdaptiveConcurrencyPolicy()
+
+    @pytest.fixture
+    def concurrency_limit(self):
+        return _client._get_concurrency_limit("myaccount.blob.core.windows.net")
+
+    @pytest.fixture
+    def pipeline_request(self, mock_pipeline_request, blob_url):
+        mock_pipeline_request.http_request.url = blob_url
+        mock_pipeline_request.context = {}
+        return mock_pipeline_request
+
+    def send(self, policy, pipeline_request, response, status_code, error_code=None):
+        policy.on_request(pipeline_request)
+        response.http_response.status_code = status_code
+        if error_code is not None:
+            response.http_response.headers["x-ms-error-code"] = error_code
+        policy.on_response(pipeline_request, response)
+
+    @pytest.mark.parametrize(
+        "status_code,error_code",
+        [
+            (503, "ServerBusy"),
+            (500, "OperationTimedOut"),
+        ],
+    )
+    def test_throttling_response_decreases_limit(
+        self,
+        policy,
+        concurrency_limit,
+        pipeline_request,
+        mock_pipeline_response,
+        status_code,
+        error_code,
+    ):
+        initial_limit = concurrency_limit.limit
+        self.send(
+            policy, pipeline_request, mock_pipeline_response, status_code, error_code
+        )
+        assert concurrency_limit.limit == initial_limit // 2
+
+    @pytest.mark.parametrize(
+        "status_code,error_code",
+        [
+            (500, "InternalError"),
+            (404, "BlobNotFound"),
+            (206, None),
+        ],
+    )
+    def test_other_responses_do_not_decrease_limit(
+        self,
+        policy,
+        concurrency_limit,
+        pipeline_request,
+        mock_pipeline_response,
+        status_code,
+        error_code,
+    ):
+        initial_limit = concurrency_limit.limit
+        self.send(
+            policy, pipeline_request, mock_pipeline_response, status_code, error_code
+        )
+        assert concurrency_limit.limit == initial_limit
+
+    def test_only_decreases_once_for_requests_sent_before_decrease(
+        self, policy, concurrency_limit, pipeline_request, mock_pipeline_response
+    ):
+        initial_limit = concurrency_limit.limit
+        other_request = mock.Mock(PipelineRequest)
+        other_request.http_request = pipeline_request.http_request
+        other_request.context = {}
+        policy.on_request(pipeline_request)
+        policy.on_request(other_request)
+        mock_pipeline_response.http_response.status_code = 503
+        mock_pipeline_response.http_response.headers["x-ms-error-code"] = "ServerBusy"
+        policy.on_response(pipeline_request, mock_pipeline_response)
+        policy.on_response(other_request, mock_pipeline_response)
+        assert concurrency_limit.limit == initial_limit // 2
+
+    def test_limits_shared_per_account(self):
+        assert _client._get_concurrency_limit(
+            "account.blob.core.windows.net"
+        ) is _client._get_concurrency_limit("account.blob.core.windows.net")
+        assert _client._get_concurrency_limit(
+            "account.blob.core.windows.net"
+        ) is not _client._get_concurrency_limit("other.blob.core.windows.net")
+
+
+class TestDownloadStats:
+    def test_reset_locks_after_fork(self):
+        download_stats = _client._get_download_stats("account")
+        download_stats.record(0.1, 1024, 0.1)
+        with mock.patch.object(_client, "_DOWNLOAD_STATS_LOCK", threading.Lock()):
+            # Simulates locks held by other threads of the parent at the time of the fork.
+            _client._DOWNLOAD_STATS_LOCK.acquire()
+            download_stats._lock.acquire()
+            _client._reset_download_stats_locks_after_fork()
+            assert _client._get_download_stats("account") is download_stats
+            download_stats.record(0.1, 1024, 0.1)
+
+
+class TestAdaptiveConcurrencyLimit:
+    def throttle(self, concurrency_limit):
+        concurrency_limit.record_throttled(concurrency_limit.epoch)
+
+    def fill(self, concurrency_limit):
+        for _ in range(concurrency_limit.limit):
+            concurrency_limit.acquire()
+
+    def test_starts_at_max_limit(self):
+        assert _client._AdaptiveConcurrencyLimit(8).limit == 8
+
+    def test_multiplicative_decrease(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(8)
+        self.throttle(concurrency_limit)
+        assert concurrency_limit.limit == 4
+        self.throttle(concurrency_limit)
+        assert concurrency_limit.limit == 2
+
+    def test_does_not_decrease_below_one(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(2)
+        for _ in range(5):
+            self.throttle(concurrency_limit)
+        assert concurrency_limit.limit == 1
+
+    def test_ignores_throttling_from_previous_epoch(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(8)
+        epoch = concurrency_limit.epoch
+        concurrency_limit.record_throttled(epoch)
+        concurrency_limit.record_throttled(epoch)
+        assert concurrency_limit.limit == 4
+
+    def test_additive_increase_when_limit_reached(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(8)
+        self.throttle(concurrency_limit)
+        self.fill(concurrency_limit)
+        # Roughly a limit's worth of successes is needed to grow by one request.
+        for _ in range(4):
+            concurrency_limit.record_success()
+        assert concurrency_limit.limit == 4
+        concurrency_limit.record_success()
+        assert concurrency_limit.limit == 5
+
+    def test_does_not_increase_when_limit_not_reached(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(8)
+        self.throttle(concurrency_limit)
+        for _ in range(100):
+            concurrency_limit.record_success()
+        assert concurrency_limit.limit == 4
+
+    def test_does_not_increase_past_max_limit(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(2)
+        self.fill(concurrency_limit)
+        for _ in range(100):
+            concurrency_limit.record_success()
+        assert concurrency_limit.limit == 2
+
+    def test_ensure_max_limit(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(8)
+        concurrency_limit.ensure_max_limit(4)
+        assert concurrency_limit.limit == 8
+        concurrency_limit.ensure_max_limit(16)
+        assert concurrency_limit.limit == 16
+
+    def test_ensure_max_limit_after_throttling(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(8)
+        self.throttle(concurrency_limit)
+        concurrency_limit.ensure_max_limit(16)
+        assert concurrency_limit.limit == 4
+        self.fill(concurrency_limit)
+        for _ in range(200):
+            previous_limit = concurrency_limit.limit
+            concurrency_limit.record_success()
+            if concurrency_limit.limit > previous_limit:
+                concurrency_limit.acquire()
+        assert concurrency_limit.limit == 16
+
+    def test_reset_after_fork(self):
+        concurrency_limit = _client._get_concurrency_limit("account")
+        with mock.patch.object(_client, "_CONCURRENCY_LIMITS_LOCK", threading.Lock()):
+            _client._reset_concurrency_limits_after_fork()
+            assert _client._get_concurrency_limit("account") is not concurrency_limit
+
+    def test_acquire_blocks_until_under_limit(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(2)
+        self.throttle(concurrency_limit)
+        concurrency_limit.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(
+            target=lambda: (concurrency_limit.acquire(), acquired.set())
+        )
+        thread.start()
+        assert not acquired.wait(timeout=0.05)
+        concurrency_limit.release()
+        assert acquired.wait(timeout=10)
+        thread.join()
+
+    def test_try_acquire_notifies_when_under_limit(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(1)
+        on_available = mock.Mock()
+        assert concurrency_limit.try_acquire(on_available)
+        assert not concurrency_limit.try_acquire(on_available)
+        on_available.assert_not_called()
+        concurrency_limit.release()
+        on_available.assert_called_once_with()
+        assert concurrency_limit.try_acquire(on_available)
+
+    def test_hold_releases_and_does_not_acquire_again(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(1)
+        assert concurrency_limit.try_acquire(mock.Mock())
+        with concurrency_limit.hold():
+            # Requests made while holding a permit use it instead of waiting on the limit.
+            with concurrency_limit:
+                pass
+        assert concurrency_limit.try_acquire(mock.Mock())
+
+    def test_suspend_releases_held_permit(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(1)
+        assert concurrency_limit.try_acquire(mock.Mock())
+        with concurrency_limit.hold():
+            with concurrency_limit.suspend():
+                assert concurrency_limit.try_acquire(mock.Mock())
+                concurrency_limit.release()
+            assert not concurrency_limit.try_acquire(mock.Mock())
+        assert concurrency_limit.try_acquire(mock.Mock())
+
+    def test_suspend_is_noop_when_not_held(self):
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(1)
+        with concurrency_limit.suspend():
+            assert concurrency_limit.try_acquire(mock.Mock())
+        assert not concurrency_limit.try_acquire(mock.Mock())
+
+
+class TestDownloadAttempts:
+    def test_record_failure_until_exhausted(self):
+        attempts = _client._DownloadAttempts(3)
+        assert attempts.remaining == 3
+        with mock.patch("random.uniform", side_effect=lambda a, b: b):
+            assert attempts.record_failure() == 1
+            assert attempts.remaining == 2
+            assert attempts.record_failure() == 2
+            assert attempts.remaining == 1
+            assert attempts.record_failure() is None
+        assert attempts.remaining == 0
+
+
 class TestAzStorageTorchBlobClientFactory:
     @pytest.fixture(autouse=True)
     def sdk_blob_client_patch(self, mock_sdk_blob_client):
@@ -329,7 +727,7 @@ class TestAzStorageTorchBlobClientFactory:
     ):
         self.assert_expected_from_url_call(
             mock_sdk_container_client.from_container_url,
-            expected_transport=None,
+            expected_transport=mock.ANY,
             **kwargs,
         )
 
@@ -364,8 +762,8 @@ class TestAzStorageTorchBlobClientFactory:
                 self.get_container_credential_used(mock_sdk_container_client),
                 expected_credentials_cls,
             )
-        mock_sdk_container_client.list_blob_names.assert_called_once_with(
-            name_starts_with=expected_prefix
+        mock_sdk_container_client.walk_blobs.assert_called_once_with(
+            name_starts_with=expected_prefix, delimiter="/"
         )
         assert mock_sdk_container_client.get_blob_client.call_args_list == [
             mock.call(blob_name) for blob_name in expected_blob_names_used
@@ -382,9 +780,24 @@ class TestAzStorageTorchBlobClientFactory:
         self,
         mock_azstorage_blob_client_cls,
         expected_blob_sdk_clients,
+        expected_blob_properties=None,
     ):
+        if expected_blob_properties is None:
+            expected_blob_properties = [mock.ANY] * len(expected_blob_sdk_clients)
         assert mock_azstorage_blob_client_cls.call_args_list == [
-            mock.call(sdk_blob_client) for sdk_blob_client in expected_blob_sdk_clients
+            mock.call(
+                sdk_blob_client,
+                max_in_flight_requests=mock.ANY,
+                hedge_downloads=False,
+                speculative_download_partitions=1,
+                max_download_attempts=None,
+                validate_crc64=False,
+                disk_cache=None,
+                blob_properties=blob_properties,
+            )
+            for sdk_blob_client, blob_properties in zip(
+                expected_blob_sdk_clients, expected_blob_properties
+            )
         ]
 
     def assert_expected_from_blob_url_calls(
@@ -432,6 +845,7 @@ class TestAzStorageTorchBlobClientFactory:
             "user_agent": f"azstoragetorch/{__version__}",
             "_additional_pipeline_policies": [
                 mock.ANY,
+                mock.ANY,
             ],
         }
         if expected_transport is not None:
@@ -474,12 +888,150 @@ class TestAzStorageTorchBlobClientFactory:
         returned_client = factory.get_blob_client_from_url(blob_url)
         assert returned_client is azstoragetorch_blob_client_cls_patch.return_value
         azstoragetorch_blob_client_cls_patch.assert_called_once_with(
-            mock_sdk_blob_client.from_blob_url.return_value
+            mock_sdk_blob_client.from_blob_url.return_value,
+            max_in_flight_requests=mock.ANY,
+            hedge_downloads=False,
+            speculative_download_partitions=1,
+            max_download_attempts=None,
+            validate_crc64=False,
+            disk_cache=None,
+            blob_properties=None,
         )
         self.assert_expected_from_blob_url_call(
             mock_sdk_blob_client, expected_url=blob_url
         )
 
+    def test_get_blob_client_from_url_with_max_in_flight_requests(
+        self, blob_url, mock_sdk_blob_client, azstoragetorch_blob_client_cls_patch
+    ):
+        factory = AzStorageTorchBlobClientFactory(max_in_flight_requests=4)
+        factory.get_blob_client_from_url(blob_url)
+        azstoragetorch_blob_client_cls_patch.assert_called_once_with(
+            mock_sdk_blob_client.from_blob_url.return_value,
+            max_in_flight_requests=4,
+            hedge_downloads=False,
+            speculative_download_partitions=1,
+            max_download_attempts=None,
+            validate_crc64=False,
+            disk_cache=None,
+            blob_properties=None,
+        )
+
+    def test_get_blob_client_from_url_with_hedge_downloads(
+        self, blob_url, mock_sdk_blob_client, azstoragetorch_blob_client_cls_patch
+    ):
+        factory = AzStorageTorchBlobClientFactory(hedge_downloads=True)
+        factory.get_blob_client_from_url(blob_url)
+        assert (
+            azstoragetorch_blob_client_cls_patch.call_args.kwargs["hedge_downloads"]
+            is True
+        )
+
+    def test_get_blob_client_from_url_with_speculative_download_partitions(
+        self, blob_url, mock_sdk_blob_client, azstoragetorch_blob_client_cls_patch
+    ):
+        factory = AzStorageTorchBlobClientFactory(speculative_download_partitions=4)
+        factory.get_blob_client_from_url(blob_url)
+        assert (
+            azstoragetorch_blob_client_cls_patch.call_args.kwargs[
+                "speculative_download_partitions"
+            ]
+            == 4
+        )
+
+    def test_get_blob_client_from_url_with_max_download_attempts(
+        self, blob_url, mock_sdk_blob_client, azstoragetorch_blob_client_cls_patch
+    ):
+        factory = AzStorageTorchBlobClientFactory(max_download_attempts=5)
+        factory.get_blob_client_from_url(blob_url)
+        assert (
+            azstoragetorch_blob_client_cls_patch.call_args.kwargs[
+                "max_download_attempts"
+            ]
+            == 5
+        )
+
+    def test_get_blob_client_from_url_with_validate_crc64(
+        self, blob_url, mock_sdk_blob_client, azstoragetorch_blob_client_cls_patch
+    ):
+        factory = AzStorageTorchBlobClientFactory(validate_crc64=True)
+        factory.get_blob_client_from_url(blob_url)
+        assert (
+            azstoragetorch_blob_client_cls_patch.call_args.kwargs["validate_crc64"]
+            is True
+        )
+
+    def test_get_blob_client_from_url_with_disk_cache(
+        self,
+        blob_url,
+        mock_sdk_blob_client,
+        azstoragetorch_blob_client_cls_patch,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB)
+        factory = AzStorageTorchBlobClientFactory(disk_cache=disk_cache)
+        factory.get_blob_client_from_url(blob_url)
+        assert (
+            azstoragetorch_blob_client_cls_patch.call_args.kwargs["disk_cache"]
+            is disk_cache
+        )
+
+    def test_get_blob_client_from_container_url(
+        self,
+        container_url,
+        mock_sdk_blob_client,
+        azstoragetorch_blob_client_cls_patch,
+        listed_blobs,
+    ):
+        factory = AzStorageTorchBlobClientFactory()
+        returned_client = factory.get_blob_client_from_container_url(
+            container_url, "dir/my blob#1", listed_blobs[0]
+        )
+        assert returned_client is azstoragetorch_blob_client_cls_patch.return_value
+        self.assert_expected_from_blob_url_call(
+            mock_sdk_blob_client, expected_url=f"{container_url}/dir/my%20blob%231"
+        )
+        self.assert_expected_underlying_sdk_blob_clients(
+            azstoragetorch_blob_client_cls_patch,
+            expected_blob_sdk_clients=[mock_sdk_blob_client.from_blob_url.return_value],
+            expected_blob_properties=[
+                BlobProperties(
+                    **{
+                        "Content-Length": 1,
+                        "ETag": '"0x8D0"',
+                        "Last-Modified": LAST_MODIFIED,
+                    }
+                )
+            ],
+        )
+
+    def test_get_blob_client_from_container_url_with_sas_in_url(
+        self,
+        container_url,
+        mock_sdk_blob_client,
+        azstoragetorch_blob_client_cls_patch,
+        sas_token,
+    ):
+        factory = AzStorageTorchBlobClientFactory()
+        factory.get_blob_client_from_container_url(
+            f"{container_url}?{sas_token}", "blob"
+        )
+        self.assert_expected_from_blob_url_call(
+            mock_sdk_blob_client,
+            expected_url=f"{container_url}/blob?{sas_token}",
+            expected_credential=None,
+        )
+        azstoragetorch_blob_client_cls_patch.assert_called_once_with(
+            mock_sdk_blob_client.from_blob_url.return_value,
+            max_in_flight_requests=mock.ANY,
+            hedge_downloads=False,
+            speculative_download_partitions=1,
+            max_download_attempts=None,
+            validate_crc64=False,
+            disk_cache=None,
+            blob_properties=None,
+        )
+
     def test_credential_defaults_to_azure_default_credential(
         self, blob_url, mock_sdk_blob_client
     ):
@@ -564,6 +1116,36 @@ class TestAzStorageTorchBlobClientFactory:
         with pytest.raises(TypeError, match="Unsupported credential"):
             AzStorageTorchBlobClientFactory(credential=credential)
 
+    def test_pickle_only_keeps_constructor_arguments(
+        self, blob_url, mock_sdk_blob_client
+    ):
+        factory = AzStorageTorchBlobClientFactory(max_in_flight_requests=4)
+        factory.get_blob_client_from_url(blob_url)
+        unpickled = pickle.loads(pickle.dumps(factory))
+        assert vars(unpickled) == {
+            "_credential": None,
+            "_max_in_flight_requests": 4,
+            "_hedge_downloads": False,
+            "_speculative_download_partitions": 1,
+            "_max_download_attempts": None,
+            "_validate_crc64": False,
+            "_disk_cache": None,
+            "_pipeline": None,
+            "_pid": os.getpid(),
+        }
+        assert isinstance(unpickled._sdk_credential, DefaultAzureCredential)
+        assert unpickled._sdk_credential is not factory._sdk_credential
+        assert unpickled._transport is not factory._transport
+
+    @pytest.mark.parametrize("credential", [False, AzureSasCredential("sas")])
+    def test_pickle_keeps_credential(self, credential):
+        factory = AzStorageTorchBlobClientFactory(credential=credential)
+        unpickled = pickle.loads(pickle.dumps(factory))
+        if credential is False:
+            assert unpickled._sdk_credential is None
+        else:
+            assert unpickled._sdk_credential.signature == credential.signature
+
     def test_reuses_credential(self, blob_url, mock_sdk_blob_client):
         factory = AzStorageTorchBlobClientFactory()
         factory.get_blob_client_from_url(blob_url)
@@ -575,9 +1157,10 @@ class TestAzStorageTorchBlobClientFactory:
         second_credential_used = self.get_credential_used(mock_sdk_blob_client)
         assert first_credential_used is second_credential_used
 
-    def test_transport_defaults(self, blob_url, mock_sdk_blob_client):
+    def test_transport_defaults(self, blob_url, mock_sdk_blob_client, monkeypatch):
+        monkeypatch.setattr(os, "process_cpu_count", lambda: 4, raising=False)
         with mock.patch(
-            "azstoragetorch._client.RequestsTransport", spec=True
+            "azstoragetorch._client._PooledRequestsTransport", spec=True
         ) as mock_requests_transport_cls:
             factory = AzStorageTorchBlobClientFactory()
             factory.get_blob_client_from_url(blob_url)
@@ -587,11 +1170,198 @@ class TestAzStorageTorchBlobClientFactory:
                 expected_transport=mock_requests_transport_cls.return_value,
             )
             mock_requests_transport_cls.assert_called_once_with(
+                connection_pool_size=8,
                 connection_timeout=20,
                 read_timeout=60,
                 connection_data_block_size=256 * 1024,
             )
 
+    def test_connection_pool_sized_from_max_in_flight_requests(self):
+        factory = AzStorageTorchBlobClientFactory(max_in_flight_requests=48)
+        transport = factory._transport
+        transport.open()
+        try:
+            for prefix in ("http://", "https://"):
+                adapter = transport.session.adapters[prefix]
+                assert adapter._pool_maxsize == 48
+                # The transport's disabled retries should be retained when remounting.
+                assert adapter.max_retries.total is False
+        finally:
+            transport.close()
+
+    def test_get_connection_stats(self):
+        factory = AzStorageTorchBlobClientFactory()
+        assert factory.get_connection_stats() == {
+            "new_connections": 0,
+            "reused_connections": 0,
+        }
+        transport = factory._transport
+        transport.open()
+        try:
+            pools = transport.session.adapters["https://"].poolmanager.pools
+            pools["account-pool"] = mock.Mock(num_connections=3, num_requests=10)
+            assert factory.get_connection_stats() == {
+                "new_connections": 3,
+                "reused_connections": 7,
+            }
+        finally:
+            transport.close()
+
+    def test_recreates_transport_and_pipeline_after_fork(
+        self, blob_url, mock_sdk_blob_client
+    ):
+        factory = AzStorageTorchBlobClientFactory()
+        factory.get_blob_client_from_url(blob_url)
+        parent_transport = factory._transport
+        with mock.patch("os.getpid", return_value=os.getpid() + 1):
+            factory.get_blob_client_from_url(blob_url)
+        assert factory._transport is not parent_transport
+        assert mock_sdk_blob_client.from_blob_url.call_args_list == [
+            mock.call(
+                blob_url,
+                **self.get_expected_from_url_kwargs(
+                    expected_transport=parent_transport
+                ),
+            ),
+            mock.call(
+                blob_url,
+                **self.get_expected_from_url_kwargs(
+                    expected_transport=factory._transport
+                ),
+            ),
+        ]
+
+    def test_transport_opens_new_session_after_fork(self):
+        transport = AzStorageTorchBlobClientFactory()._transport
+        transport.open()
+        parent_session = transport.session
+        try:
+            with mock.patch("os.getpid", return_value=os.getpid() + 1):
+                transport.open()
+                child_session = transport.session
+                assert child_session is not parent_session
+                # The inherited session may still be in use by the parent process.
+                assert parent_session.adapters["https://"].poolmanager.pools is not None
+                transport.open()
+                assert transport.session is child_session
+        finally:
+            transport.close()
+            parent_session.close()
+
+    def get_copy_blob_clients(self, mock_azstorage_blob_client_cls, blob_properties):
+        source_client = mock.Mock(AzStorageTorchBlobClient)
+        source_client._get_blob_properties.return_value = blob_properties
+        destination_client = mock.Mock(AzStorageTorchBlobClient)
+        mock_azstorage_blob_client_cls.side_effect = [source_client, destination_client]
+        return source_client, destination_client
+
+    def test_copy_blob(
+        self,
+        blob_url,
+        blob_length,
+        blob_etag,
+        blob_properties,
+        azstoragetorch_blob_client_cls_patch,
+    ):
+        credential = mock.Mock(DefaultAzureCredential)
+        credential.get_token.return_value = AccessToken("token", 0)
+        source_client, destination_client = self.get_copy_blob_clients(
+            azstoragetorch_blob_client_cls_patch, blob_properties
+        )
+        dst_url = blob_url + "-copy"
+        factory = AzStorageTorchBlobClientFactory(credential=credential)
+        factory.copy_blob(blob_url, dst_url)
+        destination_client.copy_from_url.assert_called_once_with(
+            blob_url,
+            blob_length,
+            source_etag=blob_etag,
+            source_authorization="Bearer token",
+        )
+        credential.get_token.assert_called_once_with(
+            "https://storage.azure.com/.default"
+        )
+        source_client.close.assert_called_once()
+        destination_client.close.assert_called_once()
+
+    def test_copy_blob_with_sas_in_source_url(
+        self,
+        blob_url,
+        blob_length,
+        blob_properties,
+        azstoragetorch_blob_client_cls_patch,
+    ):
+        credential = mock.Mock(DefaultAzureCredential)
+        _, destination_client = self.get_copy_blob_clients(
+            azstoragetorch_blob_client_cls_patch, blob_properties
+        )
+        src_url = f"{blob_url}?{SAS_TOKEN}"
+        factory = AzStorageTorchBlobClientFactory(credential=credential)
+        factory.copy_blob(src_url, blob_url + "-copy")
+        destination_client.copy_from_url.assert_called_once_with(
+            src_url,
+            blob_length,
+            source_etag=mock.ANY,
+            source_authorization=None,
+        )
+        credential.get_token.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "src_url_suffix,expected_separator",
+        [
+            ("", "?"),
+            (f"?snapshot={SNAPSHOT}", "&"),
+        ],
+    )
+    def test_copy_blob_with_sas_credential(
+        self,
+        blob_url,
+        blob_properties,
+        azstoragetorch_blob_client_cls_patch,
+        src_url_suffix,
+        expected_separator,
+    ):
+        _, destination_client = self.get_copy_blob_clients(
+            azstoragetorch_blob_client_cls_patch, blob_properties
+        )
+        src_url = blob_url + src_url_suffix
+        factory = AzStorageTorchBlobClientFactory(
+            credential=AzureSasCredential(SAS_TOKEN)
+        )
+        factory.copy_blob(src_url, blob_url + "-copy")
+        destination_client.copy_from_url.assert_called_once_with(
+            f"{src_url}{expected_separator}{SAS_TOKEN}",
+            mock.ANY,
+            source_etag=mock.ANY,
+            source_authorization=None,
+        )
+
+    def test_copy_blob_with_anonymous_credential(
+        self, blob_url, blob_properties, azstoragetorch_blob_client_cls_patch
+    ):
+        _, destination_client = self.get_copy_blob_clients(
+            azstoragetorch_blob_client_cls_patch, blob_properties
+        )
+        factory = AzStorageTorchBlobClientFactory(credential=False)
+        factory.copy_blob(blob_url, blob_url + "-copy")
+        destination_client.copy_from_url.assert_called_once_with(
+            blob_url, mock.ANY, source_etag=mock.ANY, source_authorization=None
+        )
+
+    def test_copy_blob_closes_clients_on_error(
+        self, blob_url, blob_properties, azstoragetorch_blob_client_cls_patch
+    ):
+        source_client, destination_client = self.get_copy_blob_clients(
+            azstoragetorch_blob_client_cls_patch, blob_properties
+        )
+        destination_client.copy_from_url.side_effect = azure.core.exceptions.AzureError(
+            "copy failed"
+        )
+        factory = AzStorageTorchBlobClientFactory(credential=False)
+        with pytest.raises(azure.core.exceptions.AzureError, match="copy failed"):
+            factory.copy_blob(blob_url, blob_url + "-copy")
+        source_client.close.assert_called_once()
+        destination_client.close.assert_called_once()
+
     def test_reuses_transport(self, blob_url, mock_sdk_blob_client):
         factory = AzStorageTorchBlobClientFactory()
         factory.get_blob_client_from_url(blob_url)
@@ -640,6 +1410,26 @@ class TestAzStorageTorchBlobClientFactory:
             mock.call(blob_url_with_sas, **self.get_expected_from_url_kwargs()),
         ]
 
+    def test_yield_blob_clients_from_container_url_keeps_quoted_etags(
+        self,
+        container_url,
+        listed_blobs,
+        mock_sdk_blob_client,
+        mock_sdk_blob_clients_from_blob_names,
+        azstoragetorch_blob_client_cls_patch,
+    ):
+        mock_sdk_blob_client.from_blob_url.side_effect = (
+            mock_sdk_blob_clients_from_blob_names
+        )
+        for listed_blob in listed_blobs:
+            listed_blob.etag = f'"{listed_blob.etag}"'
+        factory = AzStorageTorchBlobClientFactory()
+        list(factory.yield_blob_clients_from_container_url(container_url))
+        assert [
+            client_call.kwargs["blob_properties"].etag
+            for client_call in azstoragetorch_blob_client_cls_patch.call_args_list
+        ] == [listed_blob.etag for listed_blob in listed_blobs]
+
     def test_does_not_reuse_pipeline_for_container_clients(
         self,
         container_url,
@@ -663,13 +1453,23 @@ class TestAzStorageTorchBlobClientFactory:
         # None of the container clients created should use a shared pipeline
         # nor a shared transport.
         expected_from_container_url_kwargs = self.get_expected_from_url_kwargs(
-            expected_transport=None,
+            expected_transport=mock.ANY,
             expected_pipeline=None,
         )
         assert mock_sdk_container_client.from_container_url.call_args_list == [
             mock.call(container_url, **expected_from_container_url_kwargs),
             mock.call(container_url, **expected_from_container_url_kwargs),
         ]
+        container_transports = [
+            from_url_call.kwargs["transport"]
+            for from_url_call in mock_sdk_container_client.from_container_url.call_args_list
+        ]
+        assert all(
+            isinstance(transport, RequestsTransport)
+            for transport in container_transports
+        )
+        assert factory._transport not in container_transports
+        assert container_transports[0] is not container_transports[1]
 
         # For the blob clients, we still want to share pipelines so we will cache the
         # pipeline of the first client and reuse for the rest of them including the clients
@@ -690,9 +1490,17 @@ class TestAzStorageTorchBlobClientFactory:
         additional_policies = self.get_additional_pipeline_policies_used(
             mock_sdk_blob_client
         )
-        assert len(additional_policies) == 1
+        assert len(additional_policies) == 2
         assert isinstance(additional_policies[0], EchoClientRequestIdPolicy)
 
+    def test_injects_adaptive_concurrency_policy(self, blob_url, mock_sdk_blob_client):
+        factory = AzStorageTorchBlobClientFactory()
+        factory.get_blob_client_from_url(blob_url)
+        additional_policies = self.get_additional_pipeline_policies_used(
+            mock_sdk_blob_client
+        )
+        assert isinstance(additional_policies[1], AdaptiveConcurrencyPolicy)
+
     def test_yield_blob_clients_from_container_url(
         self,
         container_url,
@@ -725,6 +1533,16 @@ class TestAzStorageTorchBlobClientFactory:
         self.assert_expected_underlying_sdk_blob_clients(
             azstoragetorch_blob_client_cls_patch,
             expected_blob_sdk_clients=mock_sdk_blob_clients_from_blob_names,
+            expected_blob_properties=[
+                BlobProperties(
+                    **{
+                        "Content-Length": i + 1,
+                        "ETag": f'"0x8D{i}"',
+                        "Last-Modified": LAST_MODIFIED,
+                    }
+                )
+                for i in range(len(blob_names))
+            ],
         )
 
     def test_yield_blob_clients_from_container_url_with_prefix(
@@ -736,16 +1554,14 @@ class TestAzStorageTorchBlobClientFactory:
     ):
         factory = AzStorageTorchBlobClientFactory()
         list(
-            factory.yield_blob_clients_from_container_url(
-                container_url, prefix="prefix"
-            )
+            factory.yield_blob_clients_from_container_url(container_url, prefix="blob")
         )
         self.assert_expected_sdk_blob_clients_from_container_url(
             mock_sdk_container_client,
             mock_sdk_blob_client,
             expected_url=container_url,
             expected_blob_names_used=blob_names,
-            expected_prefix="prefix",
+            expected_prefix="blob",
         )
 
     def test_yield_blob_clients_from_container_url_with_credential(
@@ -808,17 +1624,405 @@ class TestAzStorageTorchBlobClientFactory:
             expected_sdk_blob_client_pipeline=None,
         )
 
+    def test_list_blobs(
+        self, container_url, mock_sdk_container_client, listed_blobs, blob_names
+    ):
+        factory = AzStorageTorchBlobClientFactory()
+        assert list(factory.list_blobs(container_url, prefix="blob")) == listed_blobs
+        self.assert_expected_from_container_url_call(
+            mock_sdk_container_client,
+            expected_url=container_url,
+            expected_credential=mock.ANY,
+        )
+        mock_sdk_container_client.walk_blobs.assert_called_once_with(
+            name_starts_with="blob", delimiter="/"
+        )
+        mock_sdk_container_client.get_blob_client.assert_not_called()
+        mock_sdk_container_client.close.assert_called_once_with()
 
-class TestAzStorageTorchBlobClient:
-    def assert_expected_download_calls(
+    def test_list_blobs_closes_container_client_when_stopped_early(
+        self, container_url, mock_sdk_container_client, listed_blobs
+    ):
+        factory = AzStorageTorchBlobClientFactory()
+        listing = factory.list_blobs(container_url)
+        assert next(listing) == listed_blobs[0]
+        mock_sdk_container_client.close.assert_not_called()
+        listing.close()
+        mock_sdk_container_client.close.assert_called_once_with()
+
+    def test_yield_blob_clients_from_listing(
         self,
-        mock_generated_sdk_storage_client,
-        expected_ranges,
-        expected_etag,
-        known_blob_size=False,
+        container_url,
+        mock_sdk_container_client,
+        mock_sdk_blob_client,
+        azstoragetorch_blob_client_cls_patch,
+        listed_blobs,
+        blob_names,
+        mock_sdk_blob_clients_from_blob_names,
     ):
-        expected_download_calls = []
-        for i, expected_range in enumerate(expected_ranges):
+        factory = AzStorageTorchBlobClientFactory()
+        mock_sdk_blob_client.from_blob_url.side_effect = (
+            mock_sdk_blob_clients_from_blob_names
+        )
+        mock_azstorage_blob_clients = self.get_mock_azstoragetorch_blob_clients(
+            blob_names
+        )
+        azstoragetorch_blob_client_cls_patch.side_effect = mock_azstorage_blob_clients
+        blob_clients = list(
+            factory.yield_blob_clients_from_listing(container_url, listed_blobs)
+        )
+        assert blob_clients == mock_azstorage_blob_clients
+        mock_sdk_container_client.walk_blobs.assert_not_called()
+        mock_sdk_container_client.list_blobs.assert_not_called()
+        assert mock_sdk_container_client.get_blob_client.call_args_list == [
+            mock.call(blob_name) for blob_name in blob_names
+        ]
+        self.assert_expected_underlying_sdk_blob_clients(
+            azstoragetorch_blob_client_cls_patch,
+            expected_blob_sdk_clients=mock_sdk_blob_clients_from_blob_names,
+            expected_blob_properties=[
+                BlobProperties(
+                    **{
+                        "Content-Length": i + 1,
+                        "ETag": f'"0x8D{i}"',
+                        "Last-Modified": LAST_MODIFIED,
+                    }
+                )
+                for i in range(len(blob_names))
+            ],
+        )
+
+
+class TestParallelBlobLister:
+    @pytest.fixture
+    def executor(self):
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        yield executor
+        executor.shutdown()
+
+    def get_lister(self, blob_names, executor, page_size=2):
+        fake_listing = FakeBlobListing(
+            [get_listed_blob(name) for name in blob_names], page_size=page_size
+        )
+        mock_container_client = mock.Mock(ContainerClient)
+        mock_container_client.walk_blobs.side_effect = fake_listing.walk_blobs
+        mock_container_client.list_blobs.side_effect = fake_listing.list_blobs
+        return _client._ParallelBlobLister(mock_container_client, executor), (
+            mock_container_client
+        )
+
+    def get_listed_names(self, lister, prefix=None):
+        return [blob.name for blob in lister.list_blobs(prefix)]
+
+    @pytest.mark.parametrize("page_size", [1, 2, 5000])
+    def test_lists_in_sorted_order(self, executor, page_size):
+        blob_names = [
+            "b/2",
+            "a0",
+            "a/1",
+            "c/x/1",
+            "a.txt",
+            "c/y/2",
+            "b/1",
+            "a/0",
+            "d",
+        ]
+        lister, mock_container_client = self.get_lister(
+            blob_names, executor, page_size=page_size
+        )
+        assert self.get_listed_names(lister) == sorted(blob_names)
+        assert sorted(
+            list_call.kwargs["name_starts_with"]
+            for list_call in mock_container_client.list_blobs.call_args_list
+        ) == ["a/", "b/", "c/"]
+
+    def test_flat_namespace_lists_from_hierarchy_listing(self, executor):
+        blob_names = [f"blob{i}" for i in range(5)]
+        lister, mock_container_client = self.get_lister(blob_names, executor)
+        assert self.get_listed_names(lister) == blob_names
+        mock_container_client.walk_blobs.assert_called_once_with(
+            name_starts_with=None, delimiter="/"
+        )
+        mock_container_client.list_blobs.assert_not_called()
+
+    def test_descends_through_single_prefix_levels(self, executor):
+        blob_names = ["data/train/0/a", "data/train/0/b", "data/train/1/a"]
+        lister, mock_container_client = self.get_lister(blob_names, executor)
+        assert self.get_listed_names(lister) == blob_names
+        assert mock_container_client.walk_blobs.call_args_list == [
+            mock.call(name_starts_with=None, delimiter="/"),
+            mock.call(name_starts_with="data/", delimiter="/"),
+            mock.call(name_starts_with="data/train/", delimiter="/"),
+        ]
+        assert [
+            list_call.kwargs["name_starts_with"]
+            for list_call in mock_container_client.list_blobs.call_args_list
+        ] == ["data/train/0/", "data/train/1/"]
+
+    def test_lists_with_prefix(self, executor):
+        blob_names = ["other/0/a", "train/0/a", "train/1/a", "train/1/b", "train/2"]
+        lister, _ = self.get_lister(blob_names, executor)
+        assert self.get_listed_names(lister, "train/") == [
+            "train/0/a",
+            "train/1/a",
+            "train/1/b",
+            "train/2",
+        ]
+
+    def test_empty_listing(self, executor):
+        lister, _ = self.get_lister([], executor)
+        assert self.get_listed_names(lister) == []
+
+    def test_lists_prefixes_concurrently(self, executor):
+        lister, mock_container_client = self.get_lister(
+            ["0/a", "1/a", "2/a"], executor, page_size=5000
+        )
+        tracker = RunningTracker()
+        fake_list_blobs = mock_container_client.list_blobs.side_effect
+
+        def list_blobs(name_starts_with=None):
+            pages = fake_list_blobs(name_starts_with=name_starts_with).by_page()
+
+            def tracked_pages():
+                for page in pages:
+                    tracker.run()
+                    yield page
+
+            item_paged = mock.Mock()
+            item_paged.by_page.return_value = tracked_pages()
+            return item_paged
+
+        mock_container_client.list_blobs.side_effect = list_blobs
+        listed_names = []
+        listing_thread = threading.Thread(
+            target=lambda: listed_names.extend(self.get_listed_names(lister))
+        )
+        listing_thread.start()
+        tracker.wait_for_running(3)
+        assert tracker.running == 3
+        tracker.release_all()
+        listing_thread.join()
+        assert listed_names == ["0/a", "1/a", "2/a"]
+
+    def test_limits_concurrent_prefix_listings(self, executor):
+        blob_names = [f"{i}/a" for i in range(5)]
+        lister, mock_container_client = self.get_lister(
+            blob_names, executor, page_size=5000
+        )
+        with mock.patch.object(
+            _client._ParallelBlobLister, "_MAX_CONCURRENT_PREFIX_LISTINGS", 2
+        ):
+            blob_listing = lister.list_blobs()
+            assert next(blob_listing).name == "0/a"
+            assert [
+                list_call.kwargs["name_starts_with"]
+                for list_call in mock_container_client.list_blobs.call_args_list
+            ] == ["0/", "1/"]
+            assert ["0/a"] + [blob.name for blob in blob_listing] == blob_names
+        assert [
+            list_call.kwargs["name_starts_with"]
+            for list_call in mock_container_client.list_blobs.call_args_list
+        ] == ["0/", "1/", "2/", "3/", "4/"]
+
+    def test_limits_pages_queued_ahead_of_consumer(self):
+        # Runs each fetch as soon as it is submitted so that the listing fetches as
+        # far ahead as it is allowed to.
+        executor = mock.Mock(concurrent.futures.Executor)
+        executor.submit.side_effect = lambda fn: fn()
+        pages = [[get_listed_blob(f"a/{i}")] for i in range(5)]
+        fetched_pages = []
+
+        def get_pages():
+            for page in pages:
+                fetched_pages.append(page)
+                yield page
+
+        prefix_listing = _client._PrefixListing(
+            get_pages(), executor, threading.Event()
+        )
+        assert len(fetched_pages) == 2
+        blob_listing = iter(prefix_listing)
+        assert next(blob_listing).name == "a/0"
+        assert len(fetched_pages) == 3
+        assert [blob.name for blob in blob_listing] == [f"a/{i}" for i in range(1, 5)]
+        assert fetched_pages == pages
+
+    def test_propagates_listing_errors(self, executor):
+        lister, mock_container_client = self.get_lister(["a/1", "b/1"], executor)
+        mock_container_client.list_blobs.side_effect = azure.core.exceptions.AzureError(
+            "listing failed"
+        )
+        with pytest.raises(azure.core.exceptions.AzureError, match="listing failed"):
+            self.get_listed_names(lister)
+
+    def test_shuts_down_executor_when_listing_stops_early(self):
+        executor = mock.Mock(concurrent.futures.ThreadPoolExecutor)
+        lister, _ = self.get_lister(["a", "b"], executor)
+        blob_listing = lister.list_blobs()
+        assert next(blob_listing).name == "a"
+        blob_listing.close()
+        executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+
+class TestIOScheduler:
+    @pytest.fixture
+    def io_scheduler(self):
+        scheduler = _client._IOScheduler(max_workers=2)
+        with mock.patch.object(_client, "_IO_SCHEDULER", scheduler):
+            yield scheduler
+
+    @pytest.fixture
+    def running_tracker(self):
+        return RunningTracker()
+
+    def test_get_io_scheduler_is_shared(self):
+        assert _client._get_io_scheduler() is _client._get_io_scheduler()
+
+    def test_get_io_scheduler_uses_default_max_in_flight_requests(self, monkeypatch):
+        monkeypatch.setattr(os, "process_cpu_count", lambda: 4, raising=False)
+        monkeypatch.setattr(_client, "_IO_SCHEDULER", None)
+        assert _client._get_io_scheduler().max_workers == 8
+
+    def test_submit(self, io_scheduler):
+        executor = _client._ScheduledExecutor(max_in_flight=2)
+        futures = [executor.submit(lambda x: x * 2, i) for i in range(10)]
+        assert [f.result() for f in futures] == [i * 2 for i in range(10)]
+
+    def test_submit_propagates_exception(self, io_scheduler):
+        executor = _client._ScheduledExecutor(max_in_flight=2)
+        future = executor.submit(int, "not-an-int")
+        with pytest.raises(ValueError):
+            future.result()
+
+    def test_bounds_total_concurrency_across_executors(
+        self, io_scheduler, running_tracker
+    ):
+        executors = [_client._ScheduledExecutor(max_in_flight=2) for _ in range(3)]
+        futures = [
+            executor.submit(running_tracker.run)
+            for executor in executors
+            for _ in range(2)
+        ]
+        running_tracker.wait_for_running(2)
+        assert running_tracker.max_running == 2
+        running_tracker.release_all()
+        concurrent.futures.wait(futures)
+        assert running_tracker.max_running == 2
+
+    def test_bounds_concurrency_per_executor(self, running_tracker):
+        scheduler = _client._IOScheduler(max_workers=4)
+        with mock.patch.object(_client, "_IO_SCHEDULER", scheduler):
+            executor = _client._ScheduledExecutor(max_in_flight=1)
+            futures = [executor.submit(running_tracker.run) for _ in range(3)]
+            running_tracker.wait_for_running(1)
+            running_tracker.release_all()
+            concurrent.futures.wait(futures)
+        assert running_tracker.max_running == 1
+
+    def test_round_robins_across_executors(self):
+        scheduler = _client._IOScheduler(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+        order = []
+        with mock.patch.object(_client, "_IO_SCHEDULER", scheduler):
+            blocker = _client._ScheduledExecutor(max_in_flight=1)
+            first = _client._ScheduledExecutor(max_in_flight=4)
+            second = _client._ScheduledExecutor(max_in_flight=4)
+            blocking_future = blocker.submit(
+                lambda: (started.set(), release.wait(timeout=10))
+            )
+            started.wait(timeout=10)
+            futures = [first.submit(order.append, f"first-{i}") for i in range(3)]
+            futures += [second.submit(order.append, f"second-{i}") for i in range(3)]
+            release.set()
+            concurrent.futures.wait(futures + [blocking_future])
+        assert order == [
+            "first-0",
+            "second-0",
+            "first-1",
+            "second-1",
+            "first-2",
+            "second-2",
+        ]
+
+    def test_does_not_block_workers_on_concurrency_limit(self):
+        scheduler = _client._IOScheduler(max_workers=1)
+        concurrency_limit = _client._AdaptiveConcurrencyLimit(1)
+        # Simulates a request to a throttled account that is already in flight.
+        concurrency_limit.acquire()
+        with mock.patch.object(_client, "_IO_SCHEDULER", scheduler):
+            throttled = _client._ScheduledExecutor(
+                max_in_flight=4, concurrency_limit=concurrency_limit
+            )
+            other = _client._ScheduledExecutor(max_in_flight=4)
+            throttled_future = throttled.submit(int, "1")
+            assert other.submit(int, "2").result(timeout=10) == 2
+            assert not throttled_future.done()
+            concurrency_limit.release()
+            assert throttled_future.result(timeout=10) == 1
+            # The work's permit is released once it completes.
+            assert throttled.submit(int, "3").result(timeout=10) == 3
+
+    def test_shutdown_waits_for_submitted_work(self, io_scheduler):
+        executor = _client._ScheduledExecutor(max_in_flight=2)
+        release = threading.Event()
+        future = executor.submit(release.wait, 10)
+        threading.Timer(0.01, release.set).start()
+        executor.shutdown()
+        assert future.done()
+
+    def test_shutdown_cancel_futures(self, running_tracker):
+        scheduler = _client._IOScheduler(max_workers=1)
+        with mock.patch.object(_client, "_IO_SCHEDULER", scheduler):
+            executor = _client._ScheduledExecutor(max_in_flight=1)
+            running = executor.submit(running_tracker.run)
+            pending = executor.submit(running_tracker.run)
+            running_tracker.wait_for_running(1)
+            executor.shutdown(wait=False, cancel_futures=True)
+            assert pending.cancelled()
+            running_tracker.release_all()
+            executor.shutdown()
+            assert running.done()
+
+    def test_submit_after_shutdown_raises(self, io_scheduler):
+        executor = _client._ScheduledExecutor(max_in_flight=2)
+        executor.shutdown()
+        with pytest.raises(RuntimeError):
+            executor.submit(int)
+
+    def test_reset_after_fork(self, io_scheduler):
+        executor = _client._ScheduledExecutor(max_in_flight=2)
+        assert executor.submit(int, "1").result() == 1
+        _client._reset_io_scheduler_after_fork()
+        assert _client._get_io_scheduler() is not io_scheduler
+        # Executors created before the fork use the new scheduler.
+        assert executor.submit(int, "2").result() == 2
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork()")
+    def test_usable_in_forked_child(self, io_scheduler):
+        executor = _client._ScheduledExecutor(max_in_flight=2)
+        assert executor.submit(int, "1").result() == 1
+        pid = os.fork()
+        if pid == 0:
+            try:
+                result = executor.submit(int, "2").result(timeout=10)
+                os._exit(0 if result == 2 else 1)
+            except BaseException:
+                os._exit(1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+
+class TestAzStorageTorchBlobClient:
+    def assert_expected_download_calls(
+        self,
+        mock_generated_sdk_storage_client,
+        expected_ranges,
+        expected_etag,
+        known_blob_size=False,
+    ):
+        expected_download_calls = []
+        for i, expected_range in enumerate(expected_ranges):
             download_kwargs = {
                 "range": f"bytes={expected_range}",
             }
@@ -871,12 +2075,14 @@ class TestAzStorageTorchBlobClient:
                 os, "process_cpu_count", lambda: process_cpu_count, raising=False
             )
         monkeypatch.setattr(os, "cpu_count", lambda: cpu_count)
-        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
+        with mock.patch("azstoragetorch._client._ScheduledExecutor") as mock_executor:
             client = AzStorageTorchBlobClient(mock_sdk_blob_client)
             # Executor instantiation is lazy. Stage some content to instantiate it
-            # and determine what the max_workers value is.
+            # and determine what the max in-flight value is.
             client.stage_blocks(b"content")
-            mock_executor.assert_called_once_with(expected_max_workers)
+            mock_executor.assert_called_once_with(
+                expected_max_workers, client._concurrency_limit
+            )
 
     @pytest.mark.parametrize(
         "sdk_blob_client_url, expected_url",
@@ -933,14 +2139,89 @@ class TestAzStorageTorchBlobClient:
         assert azstoragetorch_blob_client.get_blob_size() == blob_properties.size
         mock_sdk_blob_client.get_blob_properties.assert_called_once_with()
 
+    def test_get_blob_size_from_provided_blob_properties(
+        self, mock_sdk_blob_client, blob_properties
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client, blob_properties=blob_properties
+        )
+        assert client.get_blob_size() == blob_properties.size
+        mock_sdk_blob_client.get_blob_properties.assert_not_called()
+
+    def test_download_with_provided_blob_properties(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        single_threaded_executor,
+        blob_properties,
+    ):
+        blob_size = 2 * DEFAULT_PARTITION_DOWNLOAD_THRESHOLD
+        blob_properties.size = blob_size
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=single_threaded_executor,
+            blob_properties=blob_properties,
+        )
+        content = random_bytes(blob_size)
+
+        def download(**kwargs):
+            expected_range = kwargs["range"].split("=", 1)[1]
+            return mock_download_response(
+                expected_range, blob_size, content, etag=blob_properties.etag
+            )
+
+        mock_generated_sdk_storage_client.blob.download.side_effect = download
+        assert client.download() == content
+        mock_sdk_blob_client.get_blob_properties.assert_not_called()
+        download_calls = mock_generated_sdk_storage_client.blob.download.call_args_list
+        assert len(download_calls) > 1
+        for download_call in download_calls:
+            assert download_call.kwargs["modified_access_conditions"].if_match == (
+                blob_properties.etag
+            )
+
     def test_close(self, mock_sdk_blob_client):
         mock_executor = mock.Mock(concurrent.futures.Executor)
         client = AzStorageTorchBlobClient(mock_sdk_blob_client, mock_executor)
         client.close()
         mock_executor.shutdown.assert_called_once_with()
 
+    def test_can_be_used_after_close(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client, blob_properties
+    ):
+        content = random_bytes(1024)
+        blob_properties.size = len(content)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            lambda range, **kwargs: to_bytes_iterator(
+                slice_bytes(content, range.split("=", 1)[1])
+            )
+        )
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client, blob_properties=blob_properties
+        )
+        assert client.submit_download(0, 100).result() == content[:100]
+        client.close()
+        assert client.submit_download(100, 100).result() == content[100:200]
+        client.close()
+
+    def test_recreates_process_state_after_fork(self, mock_sdk_blob_client):
+        client = AzStorageTorchBlobClient(mock_sdk_blob_client)
+        executor = client._get_executor()
+        semaphore = client._max_in_flight_semaphore
+        with mock.patch("os.getpid", return_value=os.getpid() + 1):
+            client.get_blob_size()
+            assert client._get_executor() is not executor
+            assert client._max_in_flight_semaphore is not semaphore
+
+    def test_keeps_provided_executor_after_fork(self, mock_sdk_blob_client):
+        mock_executor = mock.Mock(concurrent.futures.Executor)
+        client = AzStorageTorchBlobClient(mock_sdk_blob_client, mock_executor)
+        with mock.patch("os.getpid", return_value=os.getpid() + 1):
+            client.get_blob_size()
+            assert client._get_executor() is mock_executor
+
     def test_no_executor_used_when_no_transfers(self, mock_sdk_blob_client):
-        with mock.patch("concurrent.futures.ThreadPoolExecutor") as mock_executor:
+        with mock.patch("azstoragetorch._client._ScheduledExecutor") as mock_executor:
             client = AzStorageTorchBlobClient(mock_sdk_blob_client)
             client.close()
             mock_executor.assert_not_called()
@@ -1237,115 +2518,1671 @@ class TestAzStorageTorchBlobClient:
             azstoragetorch_blob_client.download()
         assert exc_info.value.error_code == expected_storage_error_code
 
-    def test_invalid_range_exception_size_zero(
+    @pytest.mark.parametrize(
+        "buffer_type",
+        [
+            bytearray,
+            lambda size: memoryview(bytearray(size)),
+            lambda size: torch.zeros(size, dtype=torch.uint8),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "blob_size, download_offset, buffer_size, expected_ranges, known_blob_size",
+        [
+            # Small download
+            (10, 0, 10, ["0-9"], True),
+            (10, 0, 10, ["0-9"], False),
+            # Small download with offset
+            (10, 3, 4, ["3-6"], True),
+            (10, 3, 4, ["3-6"], False),
+            # Buffer larger than remaining content
+            (10, 5, 10, ["5-9"], True),
+            (10, 5, 10, ["5-14"], False),
+            # Partitioned download
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                0,
+                4 * DEFAULT_PARTITION_SIZE,
+                [
+                    f"0-{DEFAULT_PARTITION_SIZE - 1}",
+                    f"{DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{2 * DEFAULT_PARTITION_SIZE}-{3 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{3 * DEFAULT_PARTITION_SIZE}-{4 * DEFAULT_PARTITION_SIZE - 1}",
+                ],
+                True,
+            ),
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                0,
+                4 * DEFAULT_PARTITION_SIZE,
+                [
+                    f"0-{DEFAULT_PARTITION_SIZE - 1}",
+                    f"{DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{2 * DEFAULT_PARTITION_SIZE}-{3 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{3 * DEFAULT_PARTITION_SIZE}-{4 * DEFAULT_PARTITION_SIZE - 1}",
+                ],
+                False,
+            ),
+            # Partitioned download with offset
+            (
+                2 * DEFAULT_PARTITION_SIZE + 10,
+                10,
+                2 * DEFAULT_PARTITION_SIZE,
+                [
+                    f"10-{10 + DEFAULT_PARTITION_SIZE - 1}",
+                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + 2 * DEFAULT_PARTITION_SIZE - 1}",
+                ],
+                True,
+            ),
+        ],
+    )
+    def test_download_into(
         self,
+        buffer_type,
+        blob_size,
+        download_offset,
+        buffer_size,
+        expected_ranges,
+        known_blob_size,
         azstoragetorch_blob_client,
         mock_sdk_blob_client,
         mock_generated_sdk_storage_client,
         blob_properties,
-        http_response_error,
     ):
-        http_response_error.response.text.return_value = (
-            '<?xml version="1.0" encoding="utf-8"?>'
-            " <Error><Code>InvalidRange</Code>"
-            " <Message>message</Message>"
-            "</Error>"
-        )
-        blob_properties.size = 0
+        blob_properties.size = blob_size
         mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
-        http_response_error.status_code = 416
-        http_response_error.response.headers = {"Content-Range": "bytes */0"}
-        mock_generated_sdk_storage_client.blob.download.side_effect = (
-            http_response_error
+        if known_blob_size:
+            azstoragetorch_blob_client.get_blob_size()
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response(
+                expected_range, blob_size, content, etag=blob_properties.etag
+            )
+            for expected_range in expected_ranges
+        ]
+        buffer = buffer_type(buffer_size)
+        expected_content = content[download_offset : download_offset + buffer_size]
+        assert azstoragetorch_blob_client.download_into(
+            buffer, offset=download_offset
+        ) == len(expected_content)
+        assert_buffer_content(buffer[: len(expected_content)], expected_content)
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            expected_ranges=expected_ranges,
+            expected_etag=blob_properties.etag,
+            known_blob_size=known_blob_size,
         )
-        assert azstoragetorch_blob_client.download() == b""
-        assert azstoragetorch_blob_client.get_blob_size() == 0
 
-    @pytest.mark.parametrize(
-        "retryable_exception_cls", EXPECTED_RETRYABLE_READ_EXCEPTIONS
-    )
-    def test_retries_reads(
+    @pytest.mark.parametrize("hedge_downloads", [False, True])
+    def test_download_into_waits_for_partitions_on_failure(
+        self, mock_sdk_blob_client, blob_properties, hedge_downloads
+    ):
+        blob_properties.size = 4 * DEFAULT_PARTITION_SIZE
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=concurrent.futures.ThreadPoolExecutor(4),
+            max_in_flight_requests=4,
+            hedge_downloads=hedge_downloads,
+            blob_properties=blob_properties,
+        )
+        first_partition_failed = threading.Event()
+
+        def retry_download(pos, length, read_stream):
+            if pos == 0:
+                first_partition_failed.set()
+                raise NonRetryableException()
+            first_partition_failed.wait()
+            time.sleep(0.05)
+            return read_stream(iter([b"x" * length]), 0)
+
+        buffer = bytearray(blob_properties.size)
+        with mock.patch.object(client, "_retry_download", retry_download):
+            with pytest.raises(NonRetryableException):
+                client.download_into(buffer)
+        # No partition writes into the buffer after the error is raised, and the buffer
+        # is no longer exported so it can be resized.
+        written = bytes(buffer)
+        time.sleep(0.1)
+        assert bytes(buffer) == written
+        buffer.extend(b"x")
+
+    def test_download_into_with_length(
         self,
-        retryable_exception_cls,
         azstoragetorch_blob_client,
         mock_sdk_blob_client,
         mock_generated_sdk_storage_client,
         blob_properties,
-        sleep_patch,
     ):
         content = random_bytes(10)
         blob_properties.size = len(content)
-        download_kwargs = {}
-        download_kwargs["length"] = len(content)
         preset_blob_size_on_clients(
             azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
         )
         mock_generated_sdk_storage_client.blob.download.side_effect = [
-            to_bytes_iterator(content, exception_to_raise=retryable_exception_cls()),
-            to_bytes_iterator(content),
+            mock_download_response("2-5", len(content), content)
         ]
-        assert azstoragetorch_blob_client.download(**download_kwargs) == content
-        self.assert_expected_download_calls(
-            mock_generated_sdk_storage_client,
-            ["0-9", "0-9"],
-            blob_properties.etag,
-            True,
-        )
-        assert sleep_patch.call_count == 1
+        buffer = bytearray(8)
+        assert azstoragetorch_blob_client.download_into(buffer, 2, 4) == 4
+        assert buffer == content[2:6] + bytearray(4)
+
+    def test_download_into_empty_buffer_makes_no_requests(
+        self, azstoragetorch_blob_client, mock_generated_sdk_storage_client
+    ):
+        assert azstoragetorch_blob_client.download_into(bytearray()) == 0
+        mock_generated_sdk_storage_client.blob.download.assert_not_called()
+
+    def test_download_into_raises_for_length_larger_than_buffer(
+        self, azstoragetorch_blob_client
+    ):
+        with pytest.raises(ValueError, match="must not be greater than size of buffer"):
+            azstoragetorch_blob_client.download_into(bytearray(2), length=3)
 
     @pytest.mark.parametrize(
-        "retryable_exception_cls", EXPECTED_RETRYABLE_READ_EXCEPTIONS
+        "buffer,expected_exception",
+        [
+            (b"readonly", TypeError),
+            (memoryview(b"readonly"), TypeError),
+            ("string", TypeError),
+            (torch.zeros(4, dtype=torch.float32), TypeError),
+            (torch.zeros((4, 4), dtype=torch.uint8).t(), ValueError),
+            (memoryview(bytearray(8))[::2], ValueError),
+        ],
     )
-    def test_raises_after_retries_exhausted(
+    def test_download_into_raises_for_unsupported_buffers(
+        self, azstoragetorch_blob_client, buffer, expected_exception
+    ):
+        with pytest.raises(expected_exception):
+            azstoragetorch_blob_client.download_into(buffer)
+
+    @pytest.mark.parametrize(
+        "latency,throughput,length,expected_partition_size",
+        [
+            # Fast link favors fewer, larger ranges to amortize request latency
+            (0.01, 1000 * MB, 40 * MB, 40 * MB),
+            # Latency is negligible compared to transfer time so ranges are spread
+            # across all in-flight request slots
+            (0.001, 10 * MB, 40 * MB, 10 * MB),
+            # Partition sizes are aligned to 1 MiB
+            (0.001, 10 * MB, 41 * MB, 11 * MB),
+            # Partition size does not go below minimum size
+            (0.001, 10 * MB, 12 * MB, 4 * MB),
+            # Partition size does not go above maximum size
+            (0.001, 10 * MB, 20 * 1024 * MB, 128 * MB),
+            (1, 1000 * MB, 40 * MB, 128 * MB),
+        ],
+    )
+    def test_get_download_partition_size(
+        self,
+        mock_sdk_blob_client,
+        blob_url,
+        latency,
+        throughput,
+        length,
+        expected_partition_size,
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client, max_in_flight_requests=4
+        )
+        seed_download_stats(blob_url, latency, throughput)
+        assert client._get_download_partition_size(length) == expected_partition_size
+
+    def test_get_download_partition_size_uses_default_without_enough_samples(
+        self, mock_sdk_blob_client, blob_url
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client, max_in_flight_requests=4
+        )
+        seed_download_stats(blob_url, 0.01, 1000 * MB, num_samples=7)
+        assert client._get_download_partition_size(40 * MB) == DEFAULT_PARTITION_SIZE
+
+    def test_download_returns_partitioned_content_without_copying(
         self,
-        retryable_exception_cls,
         azstoragetorch_blob_client,
         mock_sdk_blob_client,
         mock_generated_sdk_storage_client,
         blob_properties,
-        sleep_patch,
     ):
-        content = random_bytes(10)
+        content = random_bytes(2 * DEFAULT_PARTITION_SIZE)
         blob_properties.size = len(content)
-        download_kwargs = {}
-        download_kwargs["length"] = len(content)
         preset_blob_size_on_clients(
             azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
         )
-        mock_generated_sdk_storage_client.blob.download.side_effect = [
-            to_bytes_iterator(content, exception_to_raise=retryable_exception_cls()),
-            to_bytes_iterator(content, exception_to_raise=retryable_exception_cls()),
-            to_bytes_iterator(content, exception_to_raise=retryable_exception_cls()),
-        ]
-        with pytest.raises(retryable_exception_cls):
-            azstoragetorch_blob_client.download(**download_kwargs)
-        self.assert_expected_download_calls(
-            mock_generated_sdk_storage_client,
-            ["0-9", "0-9", "0-9"],
-            blob_properties.etag,
-            True,
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            lambda range, **kwargs: to_bytes_iterator(
+                slice_bytes(content, range.split("=", 1)[1])
+            )
         )
-        assert sleep_patch.call_count == 2
+        downloaded = azstoragetorch_blob_client.download()
+        # Partitions are downloaded into a single bytearray, which is returned as is.
+        assert isinstance(downloaded, bytearray)
+        assert downloaded == content
 
-    def test_does_not_retry_on_non_retryable_exceptions(
+    def test_download_uses_adaptive_partition_size(
         self,
-        azstoragetorch_blob_client,
         mock_sdk_blob_client,
         mock_generated_sdk_storage_client,
+        single_threaded_executor,
         blob_properties,
+        blob_url,
     ):
-        content = random_bytes(10)
-        blob_properties.size = len(content)
-        download_kwargs = {}
-        download_kwargs["length"] = len(content)
-        preset_blob_size_on_clients(
-            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=single_threaded_executor,
+            max_in_flight_requests=4,
         )
+        seed_download_stats(blob_url, 0.001, 10 * MB)
+        blob_size = 40 * MB
+        blob_properties.size = blob_size
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        expected_ranges = [f"{i * 10 * MB}-{(i + 1) * 10 * MB - 1}" for i in range(4)]
+        content = random_bytes(blob_size)
         mock_generated_sdk_storage_client.blob.download.side_effect = [
-            to_bytes_iterator(content, exception_to_raise=NonRetryableException()),
+            mock_download_response(expected_range, blob_size, content)
+            for expected_range in expected_ranges
         ]
-        with pytest.raises(NonRetryableException):
-            azstoragetorch_blob_client.download(**download_kwargs)
+        assert client.download() == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            expected_ranges=expected_ranges,
+            expected_etag=blob_properties.etag,
+            known_blob_size=True,
+        )
+
+    def test_download_records_download_stats(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        blob_url,
+    ):
+        blob_size = 4 * DEFAULT_PARTITION_SIZE
+        blob_properties.size = blob_size
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response(
+                f"{i * DEFAULT_PARTITION_SIZE}-{(i + 1) * DEFAULT_PARTITION_SIZE - 1}",
+                blob_size,
+                content,
+            )
+            for i in range(4)
+        ]
+        azstoragetorch_blob_client.download()
+        download_stats = _client._get_download_stats(
+            urllib.parse.urlparse(blob_url).netloc
+        )
+        assert download_stats._num_throughput_samples == 4
+
+    @pytest.mark.parametrize(
+        "blob_size, download_offset, download_length, expected_ranges, known_blob_size",
+        [
+            # Small blob is returned as single chunk
+            (10, 0, None, ["0-9"], True),
+            (10, 0, None, [f"0-{DEFAULT_PARTITION_SIZE - 1}"], False),
+            # Small range of blob
+            (10, 3, 4, ["3-6"], True),
+            (10, 3, 4, ["3-6"], False),
+            # Large blob is returned as ordered partitions
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                0,
+                None,
+                [
+                    f"0-{DEFAULT_PARTITION_SIZE - 1}",
+                    f"{DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{2 * DEFAULT_PARTITION_SIZE}-{3 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{3 * DEFAULT_PARTITION_SIZE}-{4 * DEFAULT_PARTITION_SIZE - 1}",
+                ],
+                True,
+            ),
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                0,
+                None,
+                [
+                    f"0-{DEFAULT_PARTITION_SIZE - 1}",
+                    f"{DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{2 * DEFAULT_PARTITION_SIZE}-{3 * DEFAULT_PARTITION_SIZE - 1}",
+                    f"{3 * DEFAULT_PARTITION_SIZE}-{4 * DEFAULT_PARTITION_SIZE - 1}",
+                ],
+                False,
+            ),
+            # Large blob with offset and length
+            (
+                4 * DEFAULT_PARTITION_SIZE,
+                10,
+                DEFAULT_PARTITION_SIZE + 5,
+                [
+                    f"10-{10 + DEFAULT_PARTITION_SIZE - 1}",
+                    f"{10 + DEFAULT_PARTITION_SIZE}-{10 + DEFAULT_PARTITION_SIZE + 4}",
+                ],
+                True,
+            ),
+        ],
+    )
+    def test_iter_chunks(
+        self,
+        blob_size,
+        download_offset,
+        download_length,
+        expected_ranges,
+        known_blob_size,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        blob_properties.size = blob_size
+        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
+        if known_blob_size:
+            azstoragetorch_blob_client.get_blob_size()
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response(
+                expected_range, blob_size, content, etag=blob_properties.etag
+            )
+            for expected_range in expected_ranges
+        ]
+        chunks = list(
+            azstoragetorch_blob_client.iter_chunks(
+                offset=download_offset, length=download_length
+            )
+        )
+        expected_end = blob_size
+        if download_length is not None:
+            expected_end = download_offset + download_length
+        assert b"".join(chunks) == content[download_offset:expected_end]
+        assert len(chunks) == len(expected_ranges)
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            expected_ranges=expected_ranges,
+            expected_etag=blob_properties.etag,
+            known_blob_size=known_blob_size,
+        )
+
+    def test_iter_chunks_bounds_in_flight_partitions_to_window(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        spy_submit_executor = SpySubmitExcecutor(1)
+        client = AzStorageTorchBlobClient(mock_sdk_blob_client, spy_submit_executor)
+        blob_size = 8 * DEFAULT_PARTITION_SIZE
+        blob_properties.size = blob_size
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response(
+                f"{i * DEFAULT_PARTITION_SIZE}-{(i + 1) * DEFAULT_PARTITION_SIZE - 1}",
+                blob_size,
+                content,
+            )
+            for i in range(8)
+        ]
+        chunks = client.iter_chunks(window=2)
+        assert next(chunks) == content[:DEFAULT_PARTITION_SIZE]
+        # The first two partitions are submitted up front and one more partition is
+        # submitted to replace the partition that was consumed.
+        assert spy_submit_executor.counter.value == 3
+        assert (
+            next(chunks) == content[DEFAULT_PARTITION_SIZE : 2 * DEFAULT_PARTITION_SIZE]
+        )
+        assert spy_submit_executor.counter.value == 4
+        chunks.close()
+        client.close()
+        assert mock_generated_sdk_storage_client.blob.download.call_count <= 4
+
+    def test_iter_chunks_empty_blob(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        blob_properties.size = 0
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        assert list(azstoragetorch_blob_client.iter_chunks()) == []
+        mock_generated_sdk_storage_client.blob.download.assert_not_called()
+
+    def test_submit_download(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(1024)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            lambda range, **kwargs: to_bytes_iterator(
+                slice_bytes(content, range.split("=", 1)[1])
+            )
+        )
+        future = azstoragetorch_blob_client.submit_download(100, 200)
+        assert future.result() == content[100:300]
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["100-299"],
+            blob_properties.etag,
+            known_blob_size=True,
+        )
+
+    @pytest.mark.parametrize("offset,length", [(-1, 1), (0, 0)])
+    def test_submit_download_raises_for_invalid_args(
+        self, azstoragetorch_blob_client, offset, length
+    ):
+        with pytest.raises(ValueError):
+            azstoragetorch_blob_client.submit_download(offset, length)
+
+    def get_disk_cache_client(self, mock_sdk_blob_client, disk_cache, **kwargs):
+        return AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=concurrent.futures.ThreadPoolExecutor(1),
+            disk_cache=disk_cache,
+            **kwargs,
+        )
+
+    def set_conditional_download_content(
+        self, mock_generated_sdk_storage_client, content, etag
+    ):
+        def download(range, modified_access_conditions=None, **kwargs):
+            if modified_access_conditions is not None:
+                if modified_access_conditions.if_none_match == etag:
+                    raise azure.core.exceptions.ResourceNotModifiedError()
+                if modified_access_conditions.if_match not in (None, etag):
+                    raise azure.core.exceptions.ResourceModifiedError()
+            return mock_download_response(
+                range.split("=", 1)[1], len(content), content, etag=etag
+            )
+
+        mock_generated_sdk_storage_client.blob.download.side_effect = download
+
+    def get_download_conditions(self, mock_generated_sdk_storage_client):
+        return [
+            (
+                download_call.kwargs["range"],
+                download_call.kwargs.get("modified_access_conditions"),
+            )
+            for download_call in mock_generated_sdk_storage_client.blob.download.call_args_list
+        ]
+
+    def test_download_with_disk_cache(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        blob_etag,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB, block_size=1024)
+        content = random_bytes(4 * 1024 + 100)
+        blob_properties.size = len(content)
+        self.set_conditional_download_content(
+            mock_generated_sdk_storage_client, content, blob_etag
+        )
+        client = self.get_disk_cache_client(
+            mock_sdk_blob_client, disk_cache, blob_properties=blob_properties
+        )
+        assert client.download(1000, 2000) == content[1000:3000]
+        # Nothing is cached for the blob yet, so its blocks are downloaded without first
+        # revalidating the cache.
+        assert self.get_download_conditions(mock_generated_sdk_storage_client) == [
+            ("bytes=0-3071", ModifiedAccessConditions(if_match=blob_etag)),
+        ]
+        assert client.download() == content
+        assert self.get_download_conditions(mock_generated_sdk_storage_client)[1:] == [
+            ("bytes=3072-4195", ModifiedAccessConditions(if_match=blob_etag)),
+        ]
+        assert client.metrics == {
+            "disk_cache_hits": 3,
+            "disk_cache_misses": 5,
+        }
+        assert disk_cache.get_blob_info(client.url) == (
+            blob_etag,
+            len(content),
+        )
+
+    def test_download_from_disk_cache_of_other_client(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        blob_etag,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB, block_size=1024)
+        content = random_bytes(4 * 1024 + 100)
+        self.set_conditional_download_content(
+            mock_generated_sdk_storage_client, content, blob_etag
+        )
+        self.get_disk_cache_client(mock_sdk_blob_client, disk_cache).download()
+        mock_generated_sdk_storage_client.blob.download.reset_mock()
+        # Without any known properties, the blob's ETag and size are taken from the cache
+        # once a conditional request confirms the blob is unchanged.
+        client = self.get_disk_cache_client(mock_sdk_blob_client, disk_cache)
+        assert client.download() == content
+        assert self.get_download_conditions(mock_generated_sdk_storage_client) == [
+            ("bytes=0-1023", ModifiedAccessConditions(if_none_match=blob_etag)),
+        ]
+        assert client.get_blob_size() == len(content)
+        mock_sdk_blob_client.get_blob_properties.assert_not_called()
+        assert client.metrics == {
+            "disk_cache_revalidations": 1,
+            "disk_cache_hits": 5,
+            "disk_cache_misses": 0,
+        }
+
+    def test_download_with_disk_cache_replaces_stale_blocks(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_etag,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB, block_size=1024)
+        stale_content = random_bytes(2048)
+        self.set_conditional_download_content(
+            mock_generated_sdk_storage_client, stale_content, "stale-etag"
+        )
+        self.get_disk_cache_client(mock_sdk_blob_client, disk_cache).download()
+        assert disk_cache.get_size() == 2048
+        mock_generated_sdk_storage_client.blob.download.reset_mock()
+
+        content = random_bytes(3000)
+        self.set_conditional_download_content(
+            mock_generated_sdk_storage_client, content, blob_etag
+        )
+        client = self.get_disk_cache_client(mock_sdk_blob_client, disk_cache)
+        assert client.download() == content
+        # The conditional request returns the first block of the modified blob, so only
+        # the remaining blocks need to be requested.
+        assert self.get_download_conditions(mock_generated_sdk_storage_client) == [
+            ("bytes=0-1023", ModifiedAccessConditions(if_none_match="stale-etag")),
+            ("bytes=1024-2999", ModifiedAccessConditions(if_match=blob_etag)),
+        ]
+        assert client.metrics == {
+            "disk_cache_stale_blobs": 1,
+            "disk_cache_hits": 1,
+            "disk_cache_misses": 2,
+        }
+        assert disk_cache.get_size() == len(content)
+        assert disk_cache.get_blob_info(client.url) == (
+            blob_etag,
+            len(content),
+        )
+
+    def test_download_with_disk_cache_raises_for_modified_blob_with_known_properties(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB, block_size=1024)
+        content = random_bytes(2048)
+        blob_properties.size = len(content)
+        self.set_conditional_download_content(
+            mock_generated_sdk_storage_client, content, "new-etag"
+        )
+        client = self.get_disk_cache_client(
+            mock_sdk_blob_client, disk_cache, blob_properties=blob_properties
+        )
+        with pytest.raises(azure.core.exceptions.ResourceModifiedError):
+            client.download()
+
+    def test_download_with_disk_cache_of_empty_blob(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        http_response_error,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB, block_size=1024)
+        http_response_error.status_code = 416
+        http_response_error.response.headers["Content-Range"] = "bytes */0"
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            http_response_error
+        )
+        client = self.get_disk_cache_client(mock_sdk_blob_client, disk_cache)
+        assert client.download() == b""
+        assert disk_cache.get_size() == 0
+
+    def test_download_with_disk_cache_of_blob_that_became_empty(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        http_response_error,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB, block_size=1024)
+        disk_cache.record_blob_info(mock_sdk_blob_client.url, "old-etag", 2048)
+        http_response_error.status_code = 416
+        http_response_error.response.headers = {
+            "Content-Range": "bytes */0",
+            "ETag": "new-etag",
+        }
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            http_response_error
+        )
+        client = self.get_disk_cache_client(mock_sdk_blob_client, disk_cache)
+        assert client.download() == b""
+        assert self.get_download_conditions(mock_generated_sdk_storage_client) == [
+            ("bytes=0-1023", ModifiedAccessConditions(if_none_match="old-etag")),
+        ]
+        assert disk_cache.get_blob_info(client.url) == ("new-etag", 0)
+        assert disk_cache.get_size() == 0
+
+    def test_download_with_disk_cache_ignores_cache_write_failures(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_etag,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB, block_size=1024)
+        content = random_bytes(2048)
+        self.set_conditional_download_content(
+            mock_generated_sdk_storage_client, content, blob_etag
+        )
+        client = self.get_disk_cache_client(mock_sdk_blob_client, disk_cache)
+        with mock.patch.object(
+            disk_cache, "put_block", side_effect=OSError("No space left on device")
+        ):
+            assert client.download() == content
+
+    def test_submit_download_with_disk_cache(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        blob_etag,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=MB, block_size=1024)
+        content = random_bytes(4096)
+        blob_properties.size = len(content)
+        self.set_conditional_download_content(
+            mock_generated_sdk_storage_client, content, blob_etag
+        )
+        client = self.get_disk_cache_client(
+            mock_sdk_blob_client, disk_cache, blob_properties=blob_properties
+        )
+        assert client.submit_download(100, 2000).result() == content[100:2100]
+        assert client.submit_download(1024, 1024).result() == content[1024:2048]
+        assert self.get_download_conditions(mock_generated_sdk_storage_client) == [
+            ("bytes=0-3071", ModifiedAccessConditions(if_match=blob_etag)),
+        ]
+
+    @pytest.mark.parametrize("use_submit_download", [False, True])
+    def test_disk_cache_with_crc64_limits_range_sizes(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        tmp_path,
+        use_submit_download,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=32 * MB, block_size=8 * MB)
+        content = random_bytes(10 * MB)
+        blob_properties.size = len(content)
+        # The first client downloads the blob in ranges no larger than 4 MiB, even
+        # though each cached block is larger.
+        self.set_crc64_download_side_effect(
+            mock_generated_sdk_storage_client, content, blob_properties.etag
+        )
+        client = self.get_disk_cache_client(
+            mock_sdk_blob_client,
+            disk_cache,
+            validate_crc64=True,
+            blob_properties=blob_properties,
+        )
+        if use_submit_download:
+            assert client.submit_download(0, len(content)).result() == content
+        else:
+            assert client.download() == content
+        assert disk_cache.get_size() == len(content)
+        # A modified blob returns only the start of its first block in response to the
+        # conditional request, so the rest of the block is downloaded separately.
+        content = random_bytes(10 * MB)
+        self.set_crc64_download_side_effect(
+            mock_generated_sdk_storage_client, content, "new-etag"
+        )
+        mock_generated_sdk_storage_client.blob.download.reset_mock()
+        client = self.get_disk_cache_client(
+            mock_sdk_blob_client, disk_cache, validate_crc64=True
+        )
+        assert client.download() == content
+        assert self.get_download_conditions(mock_generated_sdk_storage_client) == [
+            (
+                "bytes=0-4194303",
+                ModifiedAccessConditions(if_none_match=blob_properties.etag),
+            ),
+            ("bytes=4194304-8388607", ModifiedAccessConditions(if_match="new-etag")),
+            ("bytes=8388608-10485759", ModifiedAccessConditions(if_match="new-etag")),
+        ]
+        assert disk_cache.get_size() == len(content)
+        for (
+            download_call
+        ) in mock_generated_sdk_storage_client.blob.download.call_args_list:
+            assert download_call.kwargs["range_get_content_crc64"] is True
+
+    @pytest.mark.parametrize(
+        "query,expected_query",
+        [
+            ("", ""),
+            (f"?{SAS_TOKEN}", ""),
+            (
+                f"?snapshot={SNAPSHOT}&{SAS_TOKEN}",
+                "?" + urllib.parse.urlencode({"snapshot": SNAPSHOT}),
+            ),
+            (
+                f"?{SAS_TOKEN}&versionid={VERSION_ID}",
+                "?" + urllib.parse.urlencode({"versionid": VERSION_ID}),
+            ),
+        ],
+    )
+    def test_disk_cache_url_includes_snapshot_and_version(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        blob_url,
+        query,
+        expected_query,
+    ):
+        mock_sdk_blob_client.url = blob_url + query
+        assert azstoragetorch_blob_client._disk_cache_url == blob_url + expected_query
+
+    def test_iter_chunks_raises_for_invalid_window(self, azstoragetorch_blob_client):
+        with pytest.raises(ValueError, match="window"):
+            azstoragetorch_blob_client.iter_chunks(window=0)
+
+    def seed_partition_durations(self, blob_url, seconds_per_partition):
+        download_stats = _client._get_download_stats(
+            urllib.parse.urlparse(blob_url).netloc
+        )
+        for _ in range(8):
+            download_stats.record_partition_duration(
+                seconds_per_partition, DEFAULT_PARTITION_SIZE
+            )
+
+    def get_hedged_client(self, mock_sdk_blob_client, max_in_flight_requests=4):
+        return AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=concurrent.futures.ThreadPoolExecutor(max_in_flight_requests),
+            max_in_flight_requests=max_in_flight_requests,
+            hedge_downloads=True,
+        )
+
+    def set_straggling_first_request(
+        self, mock_generated_sdk_storage_client, content, release_straggler
+    ):
+        first_range = f"bytes=0-{DEFAULT_PARTITION_SIZE - 1}"
+        requested_ranges = []
+        lock = threading.Lock()
+
+        def straggling_stream():
+            release_straggler.wait()
+            # Purposely return different content to ensure the straggler does not
+            # write to the buffer after the hedged request wins.
+            yield b"x" * DEFAULT_PARTITION_SIZE
+
+        def download_side_effect(range, **kwargs):
+            with lock:
+                is_first_request_for_range = range not in requested_ranges
+                requested_ranges.append(range)
+            if range == first_range and is_first_request_for_range:
+                return straggling_stream()
+            return to_bytes_iterator(slice_bytes(content, range.split("=", 1)[1]))
+
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect
+        )
+        return requested_ranges
+
+    def test_hedged_download_without_partition_stats_does_not_hedge(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        client = self.get_hedged_client(mock_sdk_blob_client)
+        blob_size = 4 * DEFAULT_PARTITION_SIZE
+        blob_properties.size = blob_size
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        content = random_bytes(blob_size)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            lambda range, **kwargs: to_bytes_iterator(
+                slice_bytes(content, range.split("=", 1)[1])
+            )
+        )
+        assert client.download() == content
+        assert mock_generated_sdk_storage_client.blob.download.call_count == 4
+        assert client.metrics.get("hedged_requests", 0) == 0
+        client.close()
+
+    def test_hedged_download_hedges_straggling_range(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        blob_url,
+    ):
+        client = self.get_hedged_client(mock_sdk_blob_client)
+        self.seed_partition_durations(blob_url, 0.001)
+        blob_size = 2 * DEFAULT_PARTITION_SIZE
+        blob_properties.size = blob_size
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        content = random_bytes(blob_size)
+        release_straggler = threading.Event()
+        requested_ranges = self.set_straggling_first_request(
+            mock_generated_sdk_storage_client, content, release_straggler
+        )
+        buffer = bytearray(blob_size)
+        try:
+            assert client.download_into(buffer) == blob_size
+        finally:
+            release_straggler.set()
+            client.close()
+        assert buffer == content
+        assert requested_ranges.count(f"bytes=0-{DEFAULT_PARTITION_SIZE - 1}") == 2
+        assert client.metrics["hedged_requests_won"] >= 1
+
+    def test_hedged_download_does_not_wait_on_straggler_after_hedge_wins(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        blob_url,
+    ):
+        class InlineAfterFirstExecutor(concurrent.futures.ThreadPoolExecutor):
+            # Only the first (straggling) request runs on a thread. All other requests,
+            # including the hedge, complete before submit() returns so that the hedge has
+            # always won by the time the download next checks for pending requests.
+            def __init__(self):
+                super().__init__(max_workers=1)
+                self.num_submitted = 0
+
+            def submit(self, fn, /, *args, **kwargs):
+                self.num_submitted += 1
+                if self.num_submitted == 1:
+                    return super().submit(fn, *args, **kwargs)
+                future = concurrent.futures.Future()
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+                return future
+
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=InlineAfterFirstExecutor(),
+            max_in_flight_requests=4,
+            hedge_downloads=True,
+        )
+        self.seed_partition_durations(blob_url, 0.001)
+        blob_size = 2 * DEFAULT_PARTITION_SIZE
+        blob_properties.size = blob_size
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        content = random_bytes(blob_size)
+        release_straggler = threading.Event()
+        self.set_straggling_first_request(
+            mock_generated_sdk_storage_client, content, release_straggler
+        )
+        # Only a safety net so that a regression fails instead of hanging the test run.
+        timer = threading.Timer(10, release_straggler.set)
+        timer.start()
+        try:
+            result = client.download()
+            assert not release_straggler.is_set()
+        finally:
+            timer.cancel()
+            release_straggler.set()
+            client.close()
+        assert result == content
+        assert client.metrics["hedged_requests_won"] == 1
+
+    def test_hedged_requests_count_against_in_flight_limit(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        blob_url,
+    ):
+        client = self.get_hedged_client(mock_sdk_blob_client, max_in_flight_requests=1)
+        self.seed_partition_durations(blob_url, 0.001)
+        blob_size = 2 * DEFAULT_PARTITION_SIZE
+        blob_properties.size = blob_size
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        content = random_bytes(blob_size)
+        release_straggler = threading.Event()
+        self.set_straggling_first_request(
+            mock_generated_sdk_storage_client, content, release_straggler
+        )
+        timer = threading.Timer(0.2, release_straggler.set)
+        timer.start()
+        try:
+            result = client.download()
+        finally:
+            timer.join()
+            client.close()
+        # With only a single in-flight request allowed, no hedged requests can be
+        # made so the straggling request's content is returned.
+        assert (
+            result == b"x" * DEFAULT_PARTITION_SIZE + content[DEFAULT_PARTITION_SIZE:]
+        )
+        assert client.metrics.get("hedged_requests", 0) == 0
+
+    def test_hedged_download_raises_when_all_attempts_fail(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        client = self.get_hedged_client(mock_sdk_blob_client)
+        blob_size = 2 * DEFAULT_PARTITION_SIZE
+        blob_properties.size = blob_size
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            NonRetryableException()
+        )
+        with pytest.raises(NonRetryableException):
+            client.download()
+        client.close()
+
+    def get_speculative_client(
+        self, mock_sdk_blob_client, speculative_download_partitions=4
+    ):
+        return AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=concurrent.futures.ThreadPoolExecutor(4),
+            speculative_download_partitions=speculative_download_partitions,
+        )
+
+    def set_range_download_side_effect(
+        self, mock_generated_sdk_storage_client, content, etags=None
+    ):
+        requested_ranges = []
+        lock = threading.Lock()
+
+        def download_side_effect(range, **kwargs):
+            with lock:
+                request_number = len(requested_ranges)
+                requested_ranges.append(range)
+            start, end = range.split("=", 1)[1].split("-", 1)
+            if int(start) >= len(content):
+                mock_http_response = mock.Mock(HttpResponse)
+                mock_http_response.reason = "message"
+                mock_http_response.status_code = 416
+                mock_http_response.headers = {
+                    "Content-Range": f"bytes */{len(content)}"
+                }
+                mock_http_response.content_type = "application/xml"
+                mock_http_response.text.return_value = ""
+                raise azure.core.exceptions.HttpResponseError(
+                    response=mock_http_response
+                )
+            etag = etags[request_number] if etags else "etag"
+            access_conditions = kwargs.get("modified_access_conditions")
+            if access_conditions is not None and access_conditions.if_match != etag:
+                raise azure.core.exceptions.ResourceModifiedError()
+            return mock_download_response(
+                f"{start}-{end}", len(content), content, etag=etag
+            )
+
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect
+        )
+        return requested_ranges
+
+    def test_speculative_download_requests_initial_partitions_concurrently(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = self.get_speculative_client(mock_sdk_blob_client)
+        content = random_bytes(3 * DEFAULT_PARTITION_SIZE + 10)
+        requested_ranges = self.set_range_download_side_effect(
+            mock_generated_sdk_storage_client, content
+        )
+        assert client.download() == content
+        assert sorted(requested_ranges) == sorted(
+            [
+                f"bytes=0-{DEFAULT_PARTITION_SIZE - 1}",
+                f"bytes={DEFAULT_PARTITION_SIZE}-{2 * DEFAULT_PARTITION_SIZE - 1}",
+                f"bytes={2 * DEFAULT_PARTITION_SIZE}-{3 * DEFAULT_PARTITION_SIZE - 1}",
+                f"bytes={3 * DEFAULT_PARTITION_SIZE}-{4 * DEFAULT_PARTITION_SIZE - 1}",
+            ]
+        )
+        assert client.get_blob_size() == len(content)
+        assert client.metrics == {"speculative_requests": 3}
+        client.close()
+
+    def test_speculative_download_continues_past_initial_partitions(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = self.get_speculative_client(
+            mock_sdk_blob_client, speculative_download_partitions=2
+        )
+        content = random_bytes(3 * DEFAULT_PARTITION_SIZE)
+        requested_ranges = self.set_range_download_side_effect(
+            mock_generated_sdk_storage_client, content
+        )
+        assert client.download() == content
+        assert len(requested_ranges) == 3
+        client.close()
+
+    def test_speculative_download_ignores_partitions_past_end_of_blob(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = self.get_speculative_client(mock_sdk_blob_client)
+        content = random_bytes(DEFAULT_PARTITION_SIZE + 10)
+        requested_ranges = self.set_range_download_side_effect(
+            mock_generated_sdk_storage_client, content
+        )
+        assert client.download() == content
+        # Requests past the end of the blob are cancelled if they have not started yet.
+        assert 2 <= len(requested_ranges) <= 4
+        client.close()
+
+    def test_speculative_download_small_length_uses_single_request(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = self.get_speculative_client(mock_sdk_blob_client)
+        content = random_bytes(DEFAULT_PARTITION_SIZE * 2)
+        requested_ranges = self.set_range_download_side_effect(
+            mock_generated_sdk_storage_client, content
+        )
+        assert client.download(length=10) == content[:10]
+        assert requested_ranges == ["bytes=0-9"]
+        client.close()
+
+    def test_speculative_download_offset_past_end_of_blob_raises(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = self.get_speculative_client(mock_sdk_blob_client)
+        content = random_bytes(10)
+        self.set_range_download_side_effect(mock_generated_sdk_storage_client, content)
+        with pytest.raises(azure.core.exceptions.HttpResponseError):
+            client.download(offset=20)
+        client.close()
+
+    def test_speculative_download_raises_on_etag_mismatch(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = self.get_speculative_client(mock_sdk_blob_client)
+        content = random_bytes(4 * DEFAULT_PARTITION_SIZE)
+        self.set_range_download_side_effect(
+            mock_generated_sdk_storage_client,
+            content,
+            etags=["etag1", "etag2", "etag1", "etag1"],
+        )
+        with pytest.raises(azure.core.exceptions.ResourceModifiedError):
+            client.download()
+        client.close()
+
+    def test_speculative_download_into(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = self.get_speculative_client(mock_sdk_blob_client)
+        content = random_bytes(2 * DEFAULT_PARTITION_SIZE + 10)
+        requested_ranges = self.set_range_download_side_effect(
+            mock_generated_sdk_storage_client, content
+        )
+        buffer = bytearray(len(content) + 5)
+        assert client.download_into(buffer) == len(content)
+        assert buffer[: len(content)] == content
+        assert len(requested_ranges) == 3
+        client.close()
+
+    def test_speculative_iter_chunks_limited_by_window(
+        self, mock_sdk_blob_client, mock_generated_sdk_storage_client
+    ):
+        client = self.get_speculative_client(mock_sdk_blob_client)
+        content = random_bytes(3 * DEFAULT_PARTITION_SIZE)
+        requested_ranges = self.set_range_download_side_effect(
+            mock_generated_sdk_storage_client, content
+        )
+        chunks = client.iter_chunks(window=2)
+        assert next(chunks) == content[:DEFAULT_PARTITION_SIZE]
+        assert len(requested_ranges) == 2
+        assert b"".join(chunks) == content[DEFAULT_PARTITION_SIZE:]
+        client.close()
+
+    def test_speculative_download_partitions_must_be_positive(
+        self, mock_sdk_blob_client
+    ):
+        with pytest.raises(ValueError, match="speculative_download_partitions"):
+            AzStorageTorchBlobClient(
+                mock_sdk_blob_client, speculative_download_partitions=0
+            )
+
+    def test_download_ranges(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(10 * 1024 * 1024)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            lambda range, **kwargs: to_bytes_iterator(
+                slice_bytes(content, range.split("=", 1)[1])
+            )
+        )
+        ranges = [(5 * 1024 * 1024, 10), (0, 100), (50, 100), (200, 10), (10, 0)]
+        views = azstoragetorch_blob_client.download_ranges(ranges)
+        assert [bytes(view) for view in views] == [
+            content[offset : offset + length] for offset, length in ranges
+        ]
+        assert all(view.readonly for view in views)
+        # Ranges separated by at most the default gap are downloaded with a single request.
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["0-209", f"{5 * 1024 * 1024}-{5 * 1024 * 1024 + 9}"],
+            blob_properties.etag,
+            known_blob_size=True,
+        )
+
+    @pytest.mark.parametrize(
+        "max_gap,expected_ranges",
+        [
+            (0, ["0-9", "20-29", "35-39"]),
+            (5, ["0-9", "20-39"]),
+            (10, ["0-39"]),
+        ],
+    )
+    def test_download_ranges_with_max_gap(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        max_gap,
+        expected_ranges,
+    ):
+        content = random_bytes(100)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            lambda range, **kwargs: to_bytes_iterator(
+                slice_bytes(content, range.split("=", 1)[1])
+            )
+        )
+        ranges = [(35, 5), (0, 10), (20, 10)]
+        views = azstoragetorch_blob_client.download_ranges(ranges, max_gap=max_gap)
+        assert [bytes(view) for view in views] == [
+            content[offset : offset + length] for offset, length in ranges
+        ]
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            expected_ranges,
+            blob_properties.etag,
+            known_blob_size=True,
+        )
+
+    def test_download_ranges_partitions_large_merged_ranges(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(DEFAULT_PARTITION_SIZE + 10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            lambda range, **kwargs: to_bytes_iterator(
+                slice_bytes(content, range.split("=", 1)[1])
+            )
+        )
+        (view,) = azstoragetorch_blob_client.download_ranges([(0, len(content))])
+        assert view == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            [
+                f"0-{DEFAULT_PARTITION_SIZE - 1}",
+                f"{DEFAULT_PARTITION_SIZE}-{len(content) - 1}",
+            ],
+            blob_properties.etag,
+            known_blob_size=True,
+        )
+
+    def test_download_ranges_limits_in_flight_partitions(
+        self, mock_sdk_blob_client, blob_properties
+    ):
+        blob_properties.size = 1000
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=concurrent.futures.ThreadPoolExecutor(8),
+            max_in_flight_requests=2,
+            blob_properties=blob_properties,
+        )
+        lock = threading.Lock()
+        running = []
+        max_running = 0
+
+        def retry_download(pos, length, read_stream):
+            nonlocal max_running
+            with lock:
+                running.append(pos)
+                max_running = max(max_running, len(running))
+            threading.Event().wait(0.01)
+            with lock:
+                running.remove(pos)
+            return read_stream(iter([b"x" * length]), 0)
+
+        ranges = [(i * 100, 10) for i in range(8)]
+        with mock.patch.object(client, "_retry_download", retry_download):
+            views = client.download_ranges(ranges, max_gap=0)
+        assert [bytes(view) for view in views] == [b"x" * 10] * len(ranges)
+        assert max_running == 2
+
+    def test_download_ranges_waits_for_partitions_on_failure(
+        self, mock_sdk_blob_client, blob_properties
+    ):
+        blob_properties.size = 1000
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=concurrent.futures.ThreadPoolExecutor(4),
+            max_in_flight_requests=4,
+            blob_properties=blob_properties,
+        )
+        first_range_failed = threading.Event()
+        finished = []
+
+        def retry_download(pos, length, read_stream):
+            if pos == 0:
+                first_range_failed.set()
+                raise NonRetryableException()
+            first_range_failed.wait()
+            threading.Event().wait(0.05)
+            finished.append(pos)
+            return read_stream(iter([b"x" * length]), 0)
+
+        ranges = [(i * 100, 10) for i in range(4)]
+        with mock.patch.object(client, "_retry_download", retry_download):
+            with pytest.raises(NonRetryableException):
+                client.download_ranges(ranges, max_gap=0)
+            # Partitions that already started writing into the buffer finished before the
+            # error was raised.
+            assert sorted(finished) == [100, 200, 300]
+
+    def test_download_ranges_truncates_ranges_past_end_of_blob(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(20)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            lambda range, **kwargs: to_bytes_iterator(
+                slice_bytes(content, range.split("=", 1)[1])
+            )
+        )
+        views = azstoragetorch_blob_client.download_ranges([(15, 10), (30, 10)])
+        assert [bytes(view) for view in views] == [content[15:], b""]
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["15-19"],
+            blob_properties.etag,
+            known_blob_size=True,
+        )
+
+    def test_download_ranges_without_content_to_download(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        blob_properties.size = 10
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        assert azstoragetorch_blob_client.download_ranges([]) == []
+        assert azstoragetorch_blob_client.download_ranges([(0, 0)]) == [b""]
+        mock_generated_sdk_storage_client.blob.download.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "ranges,kwargs",
+        [
+            ([(-1, 1)], {}),
+            ([(0, -1)], {}),
+            ([(0, 1)], {"max_gap": -1}),
+        ],
+    )
+    def test_download_ranges_raises_for_invalid_args(
+        self, azstoragetorch_blob_client, ranges, kwargs
+    ):
+        with pytest.raises(ValueError):
+            azstoragetorch_blob_client.download_ranges(ranges, **kwargs)
+
+    def test_invalid_range_exception_size_zero(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        http_response_error,
+    ):
+        http_response_error.response.text.return_value = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            " <Error><Code>InvalidRange</Code>"
+            " <Message>message</Message>"
+            "</Error>"
+        )
+        blob_properties.size = 0
+        mock_sdk_blob_client.get_blob_properties.return_value = blob_properties
+        http_response_error.status_code = 416
+        http_response_error.response.headers = {"Content-Range": "bytes */0"}
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            http_response_error
+        )
+        assert azstoragetorch_blob_client.download() == b""
+        assert azstoragetorch_blob_client.get_blob_size() == 0
+
+    @pytest.mark.parametrize(
+        "retryable_exception_cls", EXPECTED_RETRYABLE_READ_EXCEPTIONS
+    )
+    def test_retries_reads(
+        self,
+        retryable_exception_cls,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        download_kwargs = {}
+        download_kwargs["length"] = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            to_bytes_iterator(
+                content, chunk_size=4, exception_to_raise=retryable_exception_cls()
+            ),
+            to_bytes_iterator(content[4:]),
+        ]
+        assert azstoragetorch_blob_client.download(**download_kwargs) == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["0-9", "4-9"],
+            blob_properties.etag,
+            True,
+        )
+        assert sleep_patch.call_count == 1
+
+    def test_releases_held_concurrency_permit_while_backing_off(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            to_bytes_iterator(
+                content,
+                chunk_size=4,
+                exception_to_raise=azure.core.exceptions.IncompleteReadError(),
+            ),
+            to_bytes_iterator(content[4:]),
+        ]
+        concurrency_limit = azstoragetorch_blob_client._concurrency_limit
+        in_flight_during_backoff = []
+        sleep_patch.side_effect = lambda _: in_flight_during_backoff.append(
+            concurrency_limit._in_flight
+        )
+        # Download as a scheduler worker would, holding a permit acquired on its behalf.
+        assert concurrency_limit.try_acquire(mock.Mock())
+        with concurrency_limit.hold():
+            assert azstoragetorch_blob_client.download(length=len(content)) == content
+            assert concurrency_limit._in_flight == 1
+        assert in_flight_during_backoff == [0]
+        assert concurrency_limit._in_flight == 0
+
+    @pytest.mark.parametrize(
+        "retryable_exception_cls", EXPECTED_RETRYABLE_READ_EXCEPTIONS
+    )
+    def test_retries_reads_from_start_if_nothing_received(
+        self,
+        retryable_exception_cls,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            raise_on_iteration(retryable_exception_cls()),
+            to_bytes_iterator(content),
+        ]
+        assert azstoragetorch_blob_client.download() == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["0-9", "0-9"],
+            blob_properties.etag,
+            True,
+        )
+        assert "resumed_requests" not in azstoragetorch_blob_client.metrics
+
+    def test_resumed_reads_update_metrics(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            to_bytes_iterator(
+                content,
+                chunk_size=3,
+                exception_to_raise=azure.core.exceptions.IncompleteReadError(),
+            ),
+            to_bytes_iterator(
+                content[3:],
+                chunk_size=4,
+                exception_to_raise=azure.core.exceptions.IncompleteReadError(),
+            ),
+            to_bytes_iterator(content[7:]),
+        ]
+        assert azstoragetorch_blob_client.download() == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["0-9", "3-9", "7-9"],
+            blob_properties.etag,
+            True,
+        )
+        assert azstoragetorch_blob_client.metrics == {
+            "resumed_requests": 2,
+            "resumed_bytes_saved": 3 + 7,
+        }
+
+    def test_resumes_download_into(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            to_bytes_iterator(
+                content,
+                chunk_size=4,
+                exception_to_raise=azure.core.exceptions.DecodeError(),
+            ),
+            to_bytes_iterator(content[4:]),
+        ]
+        buffer = bytearray(len(content))
+        assert azstoragetorch_blob_client.download_into(buffer) == len(content)
+        assert bytes(buffer) == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["0-9", "4-9"],
+            blob_properties.etag,
+            True,
+        )
+
+    def test_resumes_download_of_unknown_blob_size_with_etag(
+        self,
+        azstoragetorch_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(10)
+        first_response = mock_download_response(
+            "0-9", len(content), content, etag=blob_properties.etag
+        )
+        first_response.__iter__.return_value = to_bytes_iterator(
+            content,
+            chunk_size=4,
+            exception_to_raise=azure.core.exceptions.IncompleteReadError(),
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            first_response,
+            mock_download_response(
+                "4-9", len(content), content, etag=blob_properties.etag
+            ),
+        ]
+        assert azstoragetorch_blob_client.download() == content
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            [f"0-{16 * 1024 * 1024 - 1}", "4-9"],
+            blob_properties.etag,
+        )
+
+    def test_max_download_attempts(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+    ):
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            executor=single_threaded_executor,
+            max_download_attempts=5,
+        )
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            raise_on_iteration(azure.core.exceptions.IncompleteReadError())
+            for _ in range(4)
+        ] + [to_bytes_iterator(content)]
+        assert client.download() == content
+        assert mock_generated_sdk_storage_client.blob.download.call_count == 5
+
+    @pytest.mark.parametrize("max_download_attempts", [0, -1])
+    def test_max_download_attempts_must_be_positive(
+        self, mock_sdk_blob_client, max_download_attempts
+    ):
+        with pytest.raises(ValueError, match="max_download_attempts"):
+            AzStorageTorchBlobClient(
+                mock_sdk_blob_client, max_download_attempts=max_download_attempts
+            )
+
+    @pytest.mark.parametrize(
+        "retryable_exception_cls", EXPECTED_RETRYABLE_READ_EXCEPTIONS
+    )
+    def test_raises_after_retries_exhausted(
+        self,
+        retryable_exception_cls,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        sleep_patch,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        download_kwargs = {}
+        download_kwargs["length"] = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            to_bytes_iterator(
+                content, chunk_size=4, exception_to_raise=retryable_exception_cls()
+            ),
+            to_bytes_iterator(
+                content[4:], chunk_size=4, exception_to_raise=retryable_exception_cls()
+            ),
+            to_bytes_iterator(
+                content[8:], chunk_size=4, exception_to_raise=retryable_exception_cls()
+            ),
+        ]
+        with pytest.raises(retryable_exception_cls):
+            azstoragetorch_blob_client.download(**download_kwargs)
+        self.assert_expected_download_calls(
+            mock_generated_sdk_storage_client,
+            ["0-9", "4-9", "8-9"],
+            blob_properties.etag,
+            True,
+        )
+        assert sleep_patch.call_count == 2
+
+    def test_does_not_retry_on_non_retryable_exceptions(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        download_kwargs = {}
+        download_kwargs["length"] = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            to_bytes_iterator(content, exception_to_raise=NonRetryableException()),
+        ]
+        with pytest.raises(NonRetryableException):
+            azstoragetorch_blob_client.download(**download_kwargs)
         self.assert_expected_download_calls(
             mock_generated_sdk_storage_client,
             ["0-9"],
@@ -1418,6 +4255,89 @@ class TestAzStorageTorchBlobClient:
         )
         assert mock_uuid4.call_count == len(expected_block_start_ends)
 
+    @pytest.mark.parametrize(
+        "source_size,expected_partitions",
+        [
+            (0, []),
+            (1, [(0, 1)]),
+            (DEFAULT_BLOCK_SIZE, [(0, DEFAULT_BLOCK_SIZE)]),
+            (
+                DEFAULT_BLOCK_SIZE + 1,
+                [(0, DEFAULT_BLOCK_SIZE), (DEFAULT_BLOCK_SIZE, 1)],
+            ),
+        ],
+    )
+    def test_copy_from_url(
+        self,
+        source_size,
+        expected_partitions,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_uuid4,
+        blob_url,
+    ):
+        source_url = blob_url + "-source"
+        expected_block_ids = [str(i) for i in range(len(expected_partitions))]
+        mock_uuid4.side_effect = expected_block_ids
+        azstoragetorch_blob_client.copy_from_url(
+            source_url,
+            source_size,
+            source_etag="source-etag",
+            source_authorization="Bearer token",
+        )
+        assert mock_sdk_blob_client.stage_block_from_url.call_args_list == [
+            mock.call(
+                block_id,
+                source_url,
+                source_offset=pos,
+                source_length=length,
+                source_modified_access_conditions=SourceModifiedAccessConditions(
+                    source_if_match="source-etag"
+                ),
+                source_authorization="Bearer token",
+            )
+            for block_id, (pos, length) in zip(expected_block_ids, expected_partitions)
+        ]
+        mock_sdk_blob_client.commit_block_list.assert_called_once_with(
+            [BlobBlock(block_id) for block_id in expected_block_ids]
+        )
+
+    def test_copy_from_url_without_etag_or_authorization(
+        self, azstoragetorch_blob_client, mock_sdk_blob_client, blob_url
+    ):
+        azstoragetorch_blob_client.copy_from_url(blob_url + "-source", 1)
+        mock_sdk_blob_client.stage_block_from_url.assert_called_once_with(
+            mock.ANY, blob_url + "-source", source_offset=0, source_length=1
+        )
+
+    def test_copy_from_url_limits_number_of_blocks(
+        self, azstoragetorch_blob_client, mock_sdk_blob_client, blob_url
+    ):
+        azstoragetorch_blob_client._MAX_BLOCKS_PER_BLOB = 2
+        source_size = 4 * DEFAULT_BLOCK_SIZE
+        azstoragetorch_blob_client.copy_from_url(blob_url + "-source", source_size)
+        assert mock_sdk_blob_client.stage_block_from_url.call_count == 2
+        source_lengths = {
+            stage_call.kwargs["source_length"]
+            for stage_call in mock_sdk_blob_client.stage_block_from_url.call_args_list
+        }
+        assert source_lengths == {2 * DEFAULT_BLOCK_SIZE}
+
+    def test_copy_from_url_raises_without_committing_on_error(
+        self, azstoragetorch_blob_client, mock_sdk_blob_client, blob_url
+    ):
+        mock_sdk_blob_client.stage_block_from_url.side_effect = [
+            None,
+            azure.core.exceptions.ResourceModifiedError("source changed"),
+        ]
+        with pytest.raises(
+            azure.core.exceptions.ResourceModifiedError, match="source changed"
+        ):
+            azstoragetorch_blob_client.copy_from_url(
+                blob_url + "-source", 2 * DEFAULT_BLOCK_SIZE
+            )
+        mock_sdk_blob_client.commit_block_list.assert_not_called()
+
     def test_stage_blocks_returns_error_in_future(
         self, azstoragetorch_blob_client, mock_sdk_blob_client
     ):
@@ -1470,6 +4390,193 @@ class TestAzStorageTorchBlobClient:
         assert spy_submit_executor.counter.value == 0
         assert max(in_flight_counts) <= max_in_flight_requests
 
+    def get_crc64_client(self, mock_sdk_blob_client, executor):
+        return AzStorageTorchBlobClient(
+            mock_sdk_blob_client, executor=executor, validate_crc64=True
+        )
+
+    def set_crc64_download_side_effect(
+        self, mock_generated_sdk_storage_client, content, etag, corrupt_ranges=None
+    ):
+        corrupt_ranges = list(corrupt_ranges or [])
+
+        def download_side_effect(range, **kwargs):
+            expected_range = range.split("=", 1)[1]
+            start, end = expected_range.split("-", 1)
+            end = min(int(end), len(content) - 1)
+            expected_range = f"{start}-{end}"
+            response = mock_download_response(
+                expected_range, len(content), content, etag=etag
+            )
+            crc64 = _crc64.compute(slice_bytes(content, expected_range))
+            if expected_range in corrupt_ranges:
+                corrupt_ranges.remove(expected_range)
+                crc64 ^= 1
+            response.response.headers["x-ms-content-crc64"] = base64.b64encode(
+                _crc64.to_bytes(crc64)
+            ).decode()
+            return response
+
+        mock_generated_sdk_storage_client.blob.download.side_effect = (
+            download_side_effect
+        )
+
+    def get_requested_ranges(self, mock_generated_sdk_storage_client):
+        return [
+            download_call.kwargs["range"]
+            for download_call in mock_generated_sdk_storage_client.blob.download.call_args_list
+        ]
+
+    def test_crc64_validates_downloads_in_4mib_ranges(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+    ):
+        client = self.get_crc64_client(mock_sdk_blob_client, single_threaded_executor)
+        content = random_bytes(10 * 1024 * 1024)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        self.set_crc64_download_side_effect(
+            mock_generated_sdk_storage_client, content, blob_properties.etag
+        )
+        assert client.download() == content
+        assert self.get_requested_ranges(mock_generated_sdk_storage_client) == [
+            "bytes=0-4194303",
+            "bytes=4194304-8388607",
+            "bytes=8388608-10485759",
+        ]
+        for (
+            download_call
+        ) in mock_generated_sdk_storage_client.blob.download.call_args_list:
+            assert download_call.kwargs["range_get_content_crc64"] is True
+
+    def test_crc64_limits_first_download_of_unknown_blob_size(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+    ):
+        client = self.get_crc64_client(mock_sdk_blob_client, single_threaded_executor)
+        content = random_bytes(10)
+        self.set_crc64_download_side_effect(
+            mock_generated_sdk_storage_client, content, blob_properties.etag
+        )
+        assert client.download() == content
+        assert self.get_requested_ranges(mock_generated_sdk_storage_client) == [
+            "bytes=0-4194303"
+        ]
+
+    def test_crc64_retries_full_range_on_mismatch(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+    ):
+        client = self.get_crc64_client(mock_sdk_blob_client, single_threaded_executor)
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        self.set_crc64_download_side_effect(
+            mock_generated_sdk_storage_client,
+            content,
+            blob_properties.etag,
+            corrupt_ranges=["0-9"],
+        )
+        assert client.download() == content
+        assert self.get_requested_ranges(mock_generated_sdk_storage_client) == [
+            "bytes=0-9",
+            "bytes=0-9",
+        ]
+        assert "resumed_requests" not in client.metrics
+
+    def test_crc64_raises_after_retries_exhausted(
+        self,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+        single_threaded_executor,
+    ):
+        client = self.get_crc64_client(mock_sdk_blob_client, single_threaded_executor)
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(client, mock_sdk_blob_client, blob_properties)
+        self.set_crc64_download_side_effect(
+            mock_generated_sdk_storage_client,
+            content,
+            blob_properties.etag,
+            corrupt_ranges=["0-9"] * 3,
+        )
+        with pytest.raises(ChecksumMismatchError):
+            client.download()
+        assert mock_generated_sdk_storage_client.blob.download.call_count == 3
+
+    def test_crc64_stage_blocks(
+        self, mock_sdk_blob_client, single_threaded_executor, mock_uuid4
+    ):
+        client = self.get_crc64_client(mock_sdk_blob_client, single_threaded_executor)
+        mock_uuid4.return_value = "block-id"
+        content = random_bytes(10)
+        futures = client.stage_blocks(memoryview(content))
+        assert [f.result() for f in futures] == ["block-id"]
+        mock_sdk_blob_client.stage_block.assert_called_once_with(
+            "block-id",
+            memoryview(content),
+            transactional_content_crc64=_crc64.to_bytes(_crc64.compute(content)),
+        )
+
+    def test_no_crc64_by_default(
+        self,
+        azstoragetorch_blob_client,
+        mock_sdk_blob_client,
+        mock_generated_sdk_storage_client,
+        blob_properties,
+    ):
+        content = random_bytes(10)
+        blob_properties.size = len(content)
+        preset_blob_size_on_clients(
+            azstoragetorch_blob_client, mock_sdk_blob_client, blob_properties
+        )
+        mock_generated_sdk_storage_client.blob.download.side_effect = [
+            mock_download_response("0-9", len(content), content)
+        ]
+        azstoragetorch_blob_client.download()
+        download_kwargs = (
+            mock_generated_sdk_storage_client.blob.download.call_args.kwargs
+        )
+        assert "range_get_content_crc64" not in download_kwargs
+
+    def test_stage_blocks_bounded_by_account_concurrency_limit(
+        self, mock_sdk_blob_client, blob_url
+    ):
+        mock_sdk_blob_client.url = blob_url
+        concurrency_limit = _client._get_concurrency_limit(
+            urllib.parse.urlparse(blob_url).netloc
+        )
+        concurrency_limit.record_throttled(concurrency_limit.epoch)
+        concurrency_limit.record_throttled(concurrency_limit.epoch)
+        expected_limit = concurrency_limit.limit
+        running_tracker = RunningTracker()
+        mock_sdk_blob_client.stage_block.side_effect = lambda *args: (
+            running_tracker.run()
+        )
+        client = AzStorageTorchBlobClient(
+            mock_sdk_blob_client,
+            concurrent.futures.ThreadPoolExecutor(32),
+            max_in_flight_requests=32,
+        )
+        futures = []
+        for _ in range(16):
+            futures.extend(client.stage_blocks(b"content"))
+        running_tracker.wait_for_running(expected_limit)
+        running_tracker.release_all()
+        concurrent.futures.wait(futures)
+        client.close()
+        assert running_tracker.max_running == expected_limit
+
     @pytest.mark.parametrize(
         "block_list",
         [
@@ -1486,3 +4593,29 @@ class TestAzStorageTorchBlobClient:
         mock_sdk_blob_client.commit_block_list.assert_called_once_with(
             expected_blob_blocks
         )
+
+    @pytest.mark.parametrize("data_type", [bytes, bytearray, memoryview])
+    def test_upload_blob(
+        self, data_type, azstoragetorch_blob_client, mock_sdk_blob_client
+    ):
+        azstoragetorch_blob_client.upload_blob(data_type(b"content"))
+        mock_sdk_blob_client.upload_blob.assert_called_once_with(
+            b"content", length=7, overwrite=True
+        )
+        assert isinstance(mock_sdk_blob_client.upload_blob.call_args.args[0], bytes)
+
+    def test_upload_blob_empty(self, azstoragetorch_blob_client, mock_sdk_blob_client):
+        azstoragetorch_blob_client.upload_blob(b"")
+        mock_sdk_blob_client.upload_blob.assert_called_once_with(
+            b"", length=0, overwrite=True
+        )
+
+    def test_upload_blob_crc64(self, mock_sdk_blob_client):
+        client = AzStorageTorchBlobClient(mock_sdk_blob_client, validate_crc64=True)
+        client.upload_blob(b"content")
+        mock_sdk_blob_client.upload_blob.assert_called_once_with(
+            b"content",
+            length=7,
+            overwrite=True,
+            transactional_content_crc64=_crc64.to_bytes(_crc64.compute(b"content")),
+        )
@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import base64
+from unittest import mock
+
+import pytest
+
+from azstoragetorch import _crc64
+from tests.unit.utils import random_bytes
+
+# CRC64 of b"123456789" using the Azure Storage polynomial.
+CHECK_VALUE = 0xAE8B14860A799888
+
+
+@pytest.fixture(params=["native", "slice-by-8"])
+def compute(request):
+    if request.param == "native":
+        if not _crc64.is_native():
+            pytest.skip("azure-storage-extensions is not installed")
+        yield _crc64.compute
+        return
+    with mock.patch.object(_crc64, "_NATIVE_COMPUTE", None):
+        yield _crc64.compute
+
+
+def test_check_value(compute):
+    assert compute(b"123456789") == CHECK_VALUE
+
+
+def test_empty_data(compute):
+    assert compute(b"") == 0
+
+
+@pytest.mark.parametrize("size", [1, 7, 8, 9, 63, 64, 65, 1000])
+def test_incremental_matches_full(compute, size):
+    data = random_bytes(size)
+    split = size // 3
+    assert compute(data[split:], compute(data[:split])) == compute(data)
+
+
+@pytest.mark.parametrize("data_type", [bytearray, memoryview])
+def test_bytes_like_data(compute, data_type):
+    data = random_bytes(100)
+    assert compute(data_type(data)) == compute(data)
+
+
+@pytest.mark.skipif(not _crc64.is_native(), reason="Requires native implementation")
+@pytest.mark.parametrize("size", [0, 1, 31, 32, 33, 4096 + 5])
+def test_slice_by_8_matches_native(size):
+    data = random_bytes(size)
+    assert _crc64._compute_slice_by_8(data, 0) == _crc64.compute(data)
+
+
+def test_header_round_trip():
+    header = base64.b64encode(_crc64.to_bytes(CHECK_VALUE)).decode()
+    assert _crc64.from_header(header) == CHECK_VALUE
+    assert _crc64.to_bytes(CHECK_VALUE) == CHECK_VALUE.to_bytes(8, "little")
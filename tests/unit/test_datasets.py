@@ -3,18 +3,35 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import datetime
+import pickle
 from unittest import mock
 import pytest
 
+import azure.core.exceptions
 from azure.core.credentials import AzureSasCredential
+from azure.storage.blob import BlobClient, BlobProperties
 
+from azstoragetorch.cache import DiskCache
 from azstoragetorch.datasets import BlobDataset, IterableBlobDataset, Blob
+from azstoragetorch.io import DownloadOptions
 from azstoragetorch._client import (
     AzStorageTorchBlobClient,
     AzStorageTorchBlobClientFactory,
 )
 
 
+LAST_MODIFIED = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+LAST_MODIFIED_TIMESTAMP = int(LAST_MODIFIED.timestamp())
+
+
+def get_listed_blob(name, size, etag="0x8D"):
+    return BlobProperties(
+        name=name,
+        **{"Content-Length": size, "ETag": etag, "Last-Modified": LAST_MODIFIED},
+    )
+
+
 @pytest.fixture
 def create_mock_azstoragetorch_blob_client(blob_url, blob_content):
     def _create_mock_azstoragetorch_blob_client(url=None, data=None):
@@ -58,6 +75,14 @@ def azstoragetorch_blob_factory_patch(mock_azstoragetorch_blob_client_factory):
         yield mock_azstoragetorch_blob_client_factory
 
 
+@pytest.fixture
+def mock_load_or_create_manifest():
+    with mock.patch(
+        "azstoragetorch._manifest.load_or_create_manifest", spec=True
+    ) as mock_load_or_create_manifest:
+        yield mock_load_or_create_manifest
+
+
 @pytest.fixture
 def data_samples(container_url):
     return [
@@ -106,6 +131,31 @@ class TestBlob:
                 _azstoragetorch_blob_client=mock_azstoragetorch_blob_client,
             )
 
+    def test_reader_can_be_opened_again(self, blob_url):
+        content = b"0123456789" * 100
+        mock_sdk_blob_client = mock.Mock(BlobClient)
+        mock_sdk_blob_client._client = mock.Mock()
+        mock_sdk_blob_client.url = blob_url
+
+        def download(range, **kwargs):
+            start, end = range.split("=", 1)[1].split("-")
+            return iter([content[int(start) : int(end) + 1]])
+
+        mock_sdk_blob_client._client.blob.download.side_effect = download
+        blob = Blob(
+            AzStorageTorchBlobClient(
+                mock_sdk_blob_client,
+                blob_properties=get_listed_blob("blob", len(content)),
+            )
+        )
+        for _ in range(2):
+            # Consecutive small reads are read ahead in the background with the client's
+            # executor, which must still be usable after the first reader is closed.
+            with blob.reader() as f:
+                assert f.read(10) == content[:10]
+                assert f.read(10) == content[10:20]
+                assert f.read() == content[20:]
+
 
 class TestBlobDataset:
     def assert_expected_dataset(self, dataset, expected_data_samples):
@@ -120,22 +170,56 @@ class TestBlobDataset:
         expected_container_url,
         expected_prefix=None,
         expected_credential=None,
+        expected_disk_cache=None,
+        expected_validate_crc64=False,
+        expected_hedge_downloads=False,
+        expected_speculative_download_partitions=1,
+        expected_max_download_attempts=3,
     ):
         mock_azstoragetorch_blob_client_factory.assert_called_once_with(
-            credential=expected_credential
+            credential=expected_credential,
+            disk_cache=expected_disk_cache,
+            validate_crc64=expected_validate_crc64,
+            hedge_downloads=expected_hedge_downloads,
+            speculative_download_partitions=expected_speculative_download_partitions,
+            max_download_attempts=expected_max_download_attempts,
         )
-        mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.assert_called_once_with(
+        mock_azstoragetorch_blob_client_factory.list_blobs.assert_called_once_with(
             expected_container_url, prefix=expected_prefix
         )
+        for get_client_call in mock_azstoragetorch_blob_client_factory.get_blob_client_from_container_url.call_args_list:
+            assert get_client_call.args[0] == expected_container_url
+        assert not mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.called
+
+    def set_container_listing(
+        self, mock_azstoragetorch_blob_client_factory, blob_clients
+    ):
+        mock_azstoragetorch_blob_client_factory.list_blobs.return_value = [
+            get_listed_blob(
+                client.url.rsplit("/", 1)[1], client.get_blob_size.return_value
+            )
+            for client in blob_clients
+        ]
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_container_url.side_effect = blob_clients
 
     def assert_factory_calls_from_blob_urls(
         self,
         mock_azstoragetorch_blob_client_factory,
         expected_blob_urls,
         expected_credential=None,
+        expected_disk_cache=None,
+        expected_validate_crc64=False,
+        expected_hedge_downloads=False,
+        expected_speculative_download_partitions=1,
+        expected_max_download_attempts=3,
     ):
         mock_azstoragetorch_blob_client_factory.assert_called_once_with(
-            credential=expected_credential
+            credential=expected_credential,
+            disk_cache=expected_disk_cache,
+            validate_crc64=expected_validate_crc64,
+            hedge_downloads=expected_hedge_downloads,
+            speculative_download_partitions=expected_speculative_download_partitions,
+            max_download_attempts=expected_max_download_attempts,
         )
         assert (
             mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.call_args_list
@@ -149,7 +233,9 @@ class TestBlobDataset:
         data_samples,
         data_sample_blob_clients,
     ):
-        mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.return_value = data_sample_blob_clients
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
         dataset = BlobDataset.from_container_url(container_url)
         self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
         self.assert_factory_calls_from_container_url(
@@ -164,7 +250,9 @@ class TestBlobDataset:
         data_samples,
         data_sample_blob_clients,
     ):
-        mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.return_value = data_sample_blob_clients
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
         dataset = BlobDataset.from_container_url(container_url, prefix="prefix/")
         self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
         self.assert_factory_calls_from_container_url(
@@ -181,7 +269,9 @@ class TestBlobDataset:
         data_sample_blob_clients,
     ):
         credential = AzureSasCredential("sas_token")
-        mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.return_value = data_sample_blob_clients
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
         dataset = BlobDataset.from_container_url(container_url, credential=credential)
         self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
         self.assert_factory_calls_from_container_url(
@@ -190,6 +280,71 @@ class TestBlobDataset:
             expected_credential=credential,
         )
 
+    def test_from_container_url_with_disk_cache(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=1024)
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
+        dataset = BlobDataset.from_container_url(container_url, disk_cache=disk_cache)
+        self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
+        self.assert_factory_calls_from_container_url(
+            mock_azstoragetorch_blob_client_factory,
+            expected_container_url=container_url,
+            expected_disk_cache=disk_cache,
+        )
+
+    def test_from_container_url_with_validate_crc64(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
+        dataset = BlobDataset.from_container_url(container_url, validate_crc64=True)
+        self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
+        self.assert_factory_calls_from_container_url(
+            mock_azstoragetorch_blob_client_factory,
+            expected_container_url=container_url,
+            expected_validate_crc64=True,
+        )
+
+    def test_from_container_url_with_download_options(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
+        download_options = DownloadOptions(
+            hedge_downloads=True,
+            speculative_download_partitions=4,
+            max_download_attempts=5,
+        )
+        dataset = BlobDataset.from_container_url(
+            container_url, download_options=download_options
+        )
+        self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
+        self.assert_factory_calls_from_container_url(
+            mock_azstoragetorch_blob_client_factory,
+            expected_container_url=container_url,
+            expected_hedge_downloads=True,
+            expected_speculative_download_partitions=4,
+            expected_max_download_attempts=5,
+        )
+
     def test_from_container_url_with_transform(
         self,
         container_url,
@@ -197,7 +352,9 @@ class TestBlobDataset:
         data_sample_blob_urls,
         data_sample_blob_clients,
     ):
-        mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.return_value = data_sample_blob_clients
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
         dataset = BlobDataset.from_container_url(
             container_url, transform=lambda x: x.url
         )
@@ -209,6 +366,125 @@ class TestBlobDataset:
             expected_container_url=container_url,
         )
 
+    def test_from_container_url_with_manifest(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        mock_load_or_create_manifest,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        mock_load_or_create_manifest.return_value.iter_entries.return_value = [
+            (f"blob{i}", len(sample["data"]), f"0x8D{i}", LAST_MODIFIED_TIMESTAMP)
+            for i, sample in enumerate(data_samples)
+        ]
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_container_url.side_effect = data_sample_blob_clients
+        dataset = BlobDataset.from_container_url(
+            container_url,
+            prefix="prefix/",
+            manifest="manifest.json.gz",
+            refresh_manifest=True,
+        )
+        self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
+        mock_load_or_create_manifest.assert_called_once_with(
+            "manifest.json.gz",
+            mock_azstoragetorch_blob_client_factory,
+            container_url,
+            prefix="prefix/",
+            refresh=True,
+        )
+        assert not mock_azstoragetorch_blob_client_factory.list_blobs.called
+        assert [
+            get_client_call.args[:2]
+            for get_client_call in mock_azstoragetorch_blob_client_factory.get_blob_client_from_container_url.call_args_list
+        ] == [(container_url, f"blob{i}") for i in range(len(data_samples))]
+
+    def test_from_container_url_creates_blob_clients_on_access(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
+        mock_get_blob_client = (
+            mock_azstoragetorch_blob_client_factory.get_blob_client_from_container_url
+        )
+        mock_get_blob_client.side_effect = None
+        mock_get_blob_client.return_value = data_sample_blob_clients[3]
+        dataset = BlobDataset.from_container_url(container_url)
+        assert len(dataset) == len(data_samples)
+        mock_get_blob_client.assert_not_called()
+
+        assert dataset[3] == data_samples[3]
+        mock_get_blob_client.assert_called_once_with(container_url, "blob3", mock.ANY)
+        listed_blob_properties = mock_get_blob_client.call_args.args[2]
+        assert listed_blob_properties.name == "blob3"
+        assert listed_blob_properties.size == len(data_samples[3]["data"])
+        assert listed_blob_properties.etag == "0x8D"
+        assert listed_blob_properties.last_modified == LAST_MODIFIED
+
+        mock_get_blob_client.reset_mock()
+        dataset[-1]
+        assert mock_get_blob_client.call_args.args[1] == f"blob{len(data_samples) - 1}"
+
+    @pytest.mark.parametrize("index", [10, -11])
+    def test_from_container_url_index_out_of_range(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        data_sample_blob_clients,
+        index,
+    ):
+        self.set_container_listing(
+            mock_azstoragetorch_blob_client_factory, data_sample_blob_clients
+        )
+        dataset = BlobDataset.from_container_url(container_url)
+        with pytest.raises(IndexError):
+            dataset[index]
+
+    def test_from_container_url_with_non_ascii_blob_names(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        blob_content,
+    ):
+        blob_names = ["caf\u00e9/\u6570\u636e", "\U0001f600.bin", "plain"]
+        mock_azstoragetorch_blob_client_factory.list_blobs.return_value = [
+            get_listed_blob(name, 1) for name in blob_names
+        ]
+        dataset = BlobDataset.from_container_url(
+            container_url, transform=lambda blob: blob
+        )
+        for i, blob_name in enumerate(blob_names):
+            dataset[i]
+            assert (
+                mock_azstoragetorch_blob_client_factory.get_blob_client_from_container_url.call_args.args[
+                    1
+                ]
+                == blob_name
+            )
+
+    def test_from_blob_urls_creates_blob_clients_on_access(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.return_value = data_sample_blob_clients[
+            5
+        ]
+        dataset = BlobDataset.from_blob_urls(data_sample_blob_urls)
+        assert len(dataset) == len(data_samples)
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.assert_not_called()
+        assert dataset[5] == data_samples[5]
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.assert_called_once_with(
+            data_sample_blob_urls[5]
+        )
+
     def test_from_blob_urls(
         self,
         mock_azstoragetorch_blob_client_factory,
@@ -264,6 +540,28 @@ class TestBlobDataset:
             expected_credential=credential,
         )
 
+    def test_from_blob_urls_with_disk_cache(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=1024)
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = BlobDataset.from_blob_urls(
+            data_sample_blob_urls, disk_cache=disk_cache
+        )
+        self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
+        self.assert_factory_calls_from_blob_urls(
+            mock_azstoragetorch_blob_client_factory,
+            expected_blob_urls=data_sample_blob_urls,
+            expected_disk_cache=disk_cache,
+        )
+
     def test_from_blob_urls_with_transform(
         self,
         mock_azstoragetorch_blob_client_factory,
@@ -285,16 +583,149 @@ class TestBlobDataset:
         )
 
 
+def get_blob_url(blob: Blob) -> str:
+    return blob.url
+
+
+class TestBlobDatasetPickling:
+    @pytest.fixture(autouse=True)
+    def azstoragetorch_blob_factory_patch(self):
+        # Pickling requires the real factory class, so do not patch it for these tests.
+        yield None
+
+    def from_container_url(self, container_url, blob_names, **kwargs):
+        with mock.patch.object(
+            AzStorageTorchBlobClientFactory, "list_blobs"
+        ) as mock_list_blobs:
+            mock_list_blobs.return_value = [
+                get_listed_blob(blob_name, 1) for blob_name in blob_names
+            ]
+            return BlobDataset.from_container_url(
+                container_url, credential=False, **kwargs
+            )
+
+    def test_pickles_index_instead_of_blob_clients(self, container_url):
+        blob_names = ["blob0", "dir/blob1", "blob2"]
+        dataset = self.from_container_url(
+            container_url, blob_names, transform=get_blob_url
+        )
+        # Use the factory's transport before pickling to make sure it is not included in the
+        # pickled dataset.
+        assert dataset[0] == f"{container_url}/{blob_names[0]}"
+        blob_client_factory = dataset._blobs._blob_client_factory
+        assert blob_client_factory._transport is not None
+        unpickled = pickle.loads(pickle.dumps(dataset))
+        assert [unpickled[i] for i in range(len(unpickled))] == [
+            f"{container_url}/{blob_name}" for blob_name in blob_names
+        ]
+        unpickled_factory = unpickled._blobs._blob_client_factory
+        assert "_transport" not in vars(pickle.loads(pickle.dumps(blob_client_factory)))
+        assert unpickled_factory._transport is not blob_client_factory._transport
+
+    def test_pickled_size_is_proportional_to_blob_names(self, container_url):
+        blob_names = [f"train/sample-{i:08}.jpg" for i in range(10000)]
+        dataset = self.from_container_url(container_url, blob_names)
+        assert len(pickle.dumps(dataset)) < len(blob_names) * 100
+
+    def test_pickles_blob_urls(self, data_sample_blob_urls):
+        dataset = BlobDataset.from_blob_urls(
+            data_sample_blob_urls, credential=False, transform=get_blob_url
+        )
+        unpickled = pickle.loads(pickle.dumps(dataset))
+        assert [unpickled[i] for i in range(len(unpickled))] == data_sample_blob_urls
+
+
+class TestBlobDatasetWithDiskCache:
+    @pytest.fixture(autouse=True)
+    def azstoragetorch_blob_factory_patch(self):
+        # Use the real factory so that blob clients read through the disk cache.
+        yield None
+
+    @pytest.fixture
+    def downloaded_byte_counts(self):
+        return []
+
+    @pytest.fixture(autouse=True)
+    def sdk_blob_client_patch(self, data_samples, downloaded_byte_counts):
+        contents = {sample["url"]: sample["data"] for sample in data_samples}
+
+        def get_sdk_blob_client_from_url(blob_url):
+            content = contents[blob_url]
+            etag = f'"{blob_url}"'
+
+            def download(range, modified_access_conditions=None, **kwargs):
+                if (
+                    modified_access_conditions is not None
+                    and modified_access_conditions.if_none_match == etag
+                ):
+                    downloaded_byte_counts.append(0)
+                    raise azure.core.exceptions.ResourceNotModifiedError()
+                start, end = (int(pos) for pos in range.split("=", 1)[1].split("-"))
+                end = min(end, len(content) - 1)
+                downloaded_byte_counts.append(end - start + 1)
+                response = mock.MagicMock()
+                response.response.headers = {
+                    "Content-Range": f"bytes {start}-{end}/{len(content)}",
+                    "ETag": etag,
+                }
+                response.__iter__.return_value = iter([content[start : end + 1]])
+                return response
+
+            mock_sdk_blob_client = mock.Mock(BlobClient)
+            mock_sdk_blob_client.url = blob_url
+            mock_sdk_blob_client._client = mock.Mock()
+            mock_sdk_blob_client._client.blob.download.side_effect = download
+            return mock_sdk_blob_client
+
+        with mock.patch.object(
+            AzStorageTorchBlobClientFactory,
+            "_get_sdk_blob_client_from_url",
+            side_effect=get_sdk_blob_client_from_url,
+        ):
+            yield
+
+    def test_second_epoch_reads_from_disk_cache(
+        self, tmp_path, data_samples, data_sample_blob_urls, downloaded_byte_counts
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=1024 * 1024)
+        dataset = BlobDataset.from_blob_urls(
+            data_sample_blob_urls, credential=False, disk_cache=disk_cache
+        )
+        assert [dataset[i] for i in range(len(dataset))] == data_samples
+        assert sum(downloaded_byte_counts) == sum(
+            len(sample["data"]) for sample in data_samples
+        )
+        assert disk_cache.get_size() == sum(downloaded_byte_counts)
+
+        del downloaded_byte_counts[:]
+        assert [dataset[i] for i in range(len(dataset))] == data_samples
+        # Each blob is only revalidated with a conditional request that returns no content.
+        assert downloaded_byte_counts == [0] * len(data_samples)
+
+
 class TestIterableBlobDataset:
     def assert_expected_dataset_instantiation(
-        self, dataset, mock_azstoragetorch_blob_client_factory, expected_credential=None
+        self,
+        dataset,
+        mock_azstoragetorch_blob_client_factory,
+        expected_credential=None,
+        expected_disk_cache=None,
+        expected_validate_crc64=False,
+        expected_hedge_downloads=False,
+        expected_speculative_download_partitions=1,
+        expected_max_download_attempts=3,
     ):
         assert isinstance(dataset, IterableBlobDataset)
         # An iterable dataset can instaniate a blob client factory but should not immediately be
         # attempting to create blob clients. Those should be created in downstream calls to the
         # instantiated dataset
         mock_azstoragetorch_blob_client_factory.assert_called_once_with(
-            credential=expected_credential
+            credential=expected_credential,
+            disk_cache=expected_disk_cache,
+            validate_crc64=expected_validate_crc64,
+            hedge_downloads=expected_hedge_downloads,
+            speculative_download_partitions=expected_speculative_download_partitions,
+            max_download_attempts=expected_max_download_attempts,
         )
         assert not mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_container_url.called
         assert (
@@ -409,6 +840,38 @@ class TestIterableBlobDataset:
             container_url, prefix=None
         )
 
+    def test_from_container_url_with_manifest_loads_manifest_once(
+        self,
+        container_url,
+        mock_azstoragetorch_blob_client_factory,
+        mock_load_or_create_manifest,
+        data_samples,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_listing.side_effect = (
+            lambda *args: iter(data_sample_blob_clients)
+        )
+        dataset = IterableBlobDataset.from_container_url(
+            container_url, manifest="manifest.json.gz"
+        )
+        self.assert_expected_dataset_instantiation(
+            dataset, mock_azstoragetorch_blob_client_factory
+        )
+        mock_load_or_create_manifest.assert_not_called()
+        self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
+        self.assert_expected_dataset(dataset, expected_data_samples=data_samples)
+        mock_load_or_create_manifest.assert_called_once_with(
+            "manifest.json.gz",
+            mock_azstoragetorch_blob_client_factory,
+            container_url,
+            prefix=None,
+            refresh=False,
+        )
+        assert (
+            mock_azstoragetorch_blob_client_factory.yield_blob_clients_from_listing.call_count
+            == 2
+        )
+
     def test_from_blob_urls(
         self,
         mock_azstoragetorch_blob_client_factory,
@@ -477,6 +940,90 @@ class TestIterableBlobDataset:
             expected_blob_urls=data_sample_blob_urls,
         )
 
+    def test_from_blob_urls_with_disk_cache(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+        tmp_path,
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=1024)
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, disk_cache=disk_cache
+        )
+        self.assert_expected_dataset_instantiation(
+            dataset,
+            mock_azstoragetorch_blob_client_factory,
+            expected_disk_cache=disk_cache,
+        )
+        self.assert_expected_dataset_from_blob_url(
+            dataset,
+            mock_azstoragetorch_blob_client_factory,
+            expected_data_samples=data_samples,
+            expected_blob_urls=data_sample_blob_urls,
+        )
+
+    def test_from_blob_urls_with_validate_crc64(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, validate_crc64=True
+        )
+        self.assert_expected_dataset_instantiation(
+            dataset,
+            mock_azstoragetorch_blob_client_factory,
+            expected_validate_crc64=True,
+        )
+        self.assert_expected_dataset_from_blob_url(
+            dataset,
+            mock_azstoragetorch_blob_client_factory,
+            expected_data_samples=data_samples,
+            expected_blob_urls=data_sample_blob_urls,
+        )
+
+    def test_from_blob_urls_with_download_options(
+        self,
+        mock_azstoragetorch_blob_client_factory,
+        data_samples,
+        data_sample_blob_urls,
+        data_sample_blob_clients,
+    ):
+        mock_azstoragetorch_blob_client_factory.get_blob_client_from_url.side_effect = (
+            data_sample_blob_clients
+        )
+        download_options = DownloadOptions(
+            hedge_downloads=True,
+            speculative_download_partitions=4,
+            max_download_attempts=5,
+        )
+        dataset = IterableBlobDataset.from_blob_urls(
+            data_sample_blob_urls, download_options=download_options
+        )
+        self.assert_expected_dataset_instantiation(
+            dataset,
+            mock_azstoragetorch_blob_client_factory,
+            expected_hedge_downloads=True,
+            expected_speculative_download_partitions=4,
+            expected_max_download_attempts=5,
+        )
+        self.assert_expected_dataset_from_blob_url(
+            dataset,
+            mock_azstoragetorch_blob_client_factory,
+            expected_data_samples=data_samples,
+            expected_blob_urls=data_sample_blob_urls,
+        )
+
     def test_from_blob_urls_with_transform(
         self,
         mock_azstoragetorch_blob_client_factory,
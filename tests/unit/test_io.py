@@ -9,21 +9,28 @@ import io
 import os
 import random
 import string
+import threading
 from unittest import mock
 import pytest
+import torch
 
 from azure.core.credentials import AzureSasCredential
 from azure.core.exceptions import AzureError
 from azure.identity import DefaultAzureCredential
 
+from azstoragetorch.cache import DiskCache
 from azstoragetorch.exceptions import FatalBlobIOWriteError
-from azstoragetorch.io import BlobIO
+from azstoragetorch.io import BlobIO, DownloadOptions, _BlockCache
 from azstoragetorch._client import AzStorageTorchBlobClient
 from tests.unit.utils import random_bytes
 
 
 EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE = 4 * 1024 * 1024
 EXPECTED_FLUSH_THRESHOLD = 32 * 1024 * 1024
+EXPECTED_READ_AHEAD_MIN_WINDOW_SIZE = 256 * 1024
+EXPECTED_READ_AHEAD_MAX_RANGE_SIZE = 4 * 1024 * 1024
+EXPECTED_DEFAULT_CACHE_BLOCK_SIZE = 1024 * 1024
+CACHE_SIZE = 32 * 1024 * 1024
 
 
 @pytest.fixture
@@ -37,11 +44,12 @@ def mock_azstoragetorch_blob_client(blob_content, blob_length):
 
 @pytest.fixture
 def create_blob_io(blob_url, mock_azstoragetorch_blob_client):
-    def _create_blob_io(url=blob_url, mode="rb"):
+    def _create_blob_io(url=blob_url, mode="rb", **kwargs):
         return BlobIO(
             url,
             mode=mode,
             _azstoragetorch_blob_client=mock_azstoragetorch_blob_client,
+            **kwargs,
         )
 
     return _create_blob_io
@@ -72,6 +80,26 @@ def random_ascii_letter_bytes(size):
     return "".join(random.choices(string.ascii_letters, k=size)).encode("utf-8")
 
 
+def completed_future(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def set_download_content(mock_azstoragetorch_blob_client, content):
+    mock_azstoragetorch_blob_client.get_blob_size.return_value = len(content)
+    mock_azstoragetorch_blob_client.download.side_effect = lambda offset, length: (
+        content[offset:] if length is None else content[offset : offset + length]
+    )
+    set_submit_download_content(mock_azstoragetorch_blob_client, content)
+
+
+def set_submit_download_content(mock_azstoragetorch_blob_client, content):
+    mock_azstoragetorch_blob_client.submit_download.side_effect = (
+        lambda offset, length: completed_future(content[offset : offset + length])
+    )
+
+
 def add_stage_blocks_results(mock_azstoragetorch_blob_client, *stage_blocks_results):
     side_effects = []
     for stage_blocks_result in stage_blocks_results:
@@ -87,7 +115,42 @@ def add_stage_blocks_results(mock_azstoragetorch_blob_client, *stage_blocks_resu
     mock_azstoragetorch_blob_client.stage_blocks.side_effect = side_effects
 
 
+class TestDownloadOptions:
+    def test_defaults(self):
+        download_options = DownloadOptions()
+        assert download_options.hedge_downloads is False
+        assert download_options.speculative_download_partitions == 1
+        assert download_options.max_download_attempts == 3
+
+    def test_raises_for_invalid_speculative_download_partitions(self):
+        with pytest.raises(ValueError, match="speculative_download_partitions"):
+            DownloadOptions(speculative_download_partitions=0)
+
+    def test_raises_for_invalid_max_download_attempts(self):
+        with pytest.raises(ValueError, match="max_download_attempts"):
+            DownloadOptions(max_download_attempts=0)
+
+
 class TestBlobIO:
+    @pytest.fixture
+    def mock_factory(self):
+        with mock.patch(
+            "azstoragetorch._client.AzStorageTorchBlobClientFactory", spec=True
+        ) as mock_factory:
+            yield mock_factory
+
+    def assert_factory_called_with(self, mock_factory, **expected_kwargs):
+        expected_factory_kwargs = {
+            "credential": None,
+            "disk_cache": None,
+            "validate_crc64": False,
+            "hedge_downloads": False,
+            "speculative_download_partitions": 1,
+            "max_download_attempts": 3,
+        }
+        expected_factory_kwargs.update(expected_kwargs)
+        mock_factory.assert_called_with(**expected_factory_kwargs)
+
     @pytest.mark.parametrize(
         "credential",
         [
@@ -97,15 +160,43 @@ class TestBlobIO:
             False,
         ],
     )
-    def test_proxies_credential_to_blob_client_factory(self, blob_url, credential):
-        with mock.patch(
-            "azstoragetorch._client.AzStorageTorchBlobClientFactory", spec=True
-        ) as mock_factory:
-            BlobIO(blob_url, "rb", credential=credential)
-            mock_factory.assert_called_with(credential=credential)
-            mock_factory.return_value.get_blob_client_from_url.assert_called_once_with(
-                blob_url
-            )
+    def test_proxies_credential_to_blob_client_factory(
+        self, blob_url, credential, mock_factory
+    ):
+        BlobIO(blob_url, "rb", credential=credential)
+        self.assert_factory_called_with(mock_factory, credential=credential)
+        mock_factory.return_value.get_blob_client_from_url.assert_called_once_with(
+            blob_url
+        )
+
+    def test_proxies_disk_cache_to_blob_client_factory(
+        self, blob_url, tmp_path, mock_factory
+    ):
+        disk_cache = DiskCache(str(tmp_path), max_size=1024)
+        BlobIO(blob_url, "rb", disk_cache=disk_cache)
+        self.assert_factory_called_with(mock_factory, disk_cache=disk_cache)
+
+    def test_proxies_validate_crc64_to_blob_client_factory(
+        self, blob_url, mock_factory
+    ):
+        BlobIO(blob_url, "rb", validate_crc64=True)
+        self.assert_factory_called_with(mock_factory, validate_crc64=True)
+
+    def test_proxies_download_options_to_blob_client_factory(
+        self, blob_url, mock_factory
+    ):
+        download_options = DownloadOptions(
+            hedge_downloads=True,
+            speculative_download_partitions=4,
+            max_download_attempts=5,
+        )
+        BlobIO(blob_url, "rb", download_options=download_options)
+        self.assert_factory_called_with(
+            mock_factory,
+            hedge_downloads=True,
+            speculative_download_partitions=4,
+            max_download_attempts=5,
+        )
 
     @pytest.mark.parametrize(
         "unsupported_mode",
@@ -131,12 +222,33 @@ class TestBlobIO:
         with pytest.raises(ValueError, match="Unsupported mode"):
             BlobIO(blob_url, mode=unsupported_mode)
 
+    @pytest.mark.parametrize(
+        "kwargs,expected_error",
+        [
+            ({"cache_size": -1}, ValueError),
+            ({"cache_size": "1"}, TypeError),
+            ({"cache_block_size": 0}, ValueError),
+            ({"cache_block_size": 1.5}, TypeError),
+        ],
+    )
+    def test_raises_for_invalid_cache_args(
+        self, create_blob_io, kwargs, expected_error
+    ):
+        with pytest.raises(expected_error, match="cache"):
+            create_blob_io(**kwargs)
+
     @pytest.mark.parametrize(
         "mode,unsupported_method,args",
         [
             ("rb", "write", [b""]),
             ("wb", "read", []),
+            ("wb", "readinto", [bytearray(1)]),
+            ("wb", "readinto1", [bytearray(1)]),
+            ("wb", "iter_chunks", []),
+            ("wb", "read_ranges", [[(0, 1)]]),
             ("wb", "readline", []),
+            ("wb", "readlines", []),
+            ("wb", "iter_lines", []),
             ("wb", "seek", [0]),
         ],
     )
@@ -225,7 +337,13 @@ class TestBlobIO:
             ("flush", [], "wb"),
             ("read", [], "rb"),
             ("readable", [], "rb"),
+            ("readinto", [bytearray(1)], "rb"),
+            ("readinto1", [bytearray(1)], "rb"),
+            ("iter_chunks", [], "rb"),
+            ("read_ranges", [[(0, 1)]], "rb"),
             ("readline", [], "rb"),
+            ("readlines", [], "rb"),
+            ("iter_lines", [], "rb"),
             ("seek", [1], "rb"),
             ("seekable", [], "rb"),
             ("write", [b""], "wb"),
@@ -306,17 +424,20 @@ class TestBlobIO:
     ):
         mock_azstoragetorch_blob_client.download.side_effect = [
             blob_content[:1],
-            blob_content[1:2],
             blob_content[2:],
         ]
+        set_submit_download_content(mock_azstoragetorch_blob_client, blob_content)
         assert blob_io.read(1) == blob_content[:1]
         assert blob_io.read(1) == blob_content[1:2]
         assert blob_io.read() == blob_content[2:]
         assert mock_azstoragetorch_blob_client.download.call_args_list == [
             mock.call(offset=0, length=1),
-            mock.call(offset=1, length=1),
             mock.call(offset=2, length=None),
         ]
+        # The second, sequential read starts reading ahead through the end of the blob.
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once_with(
+            1, len(blob_content) - 1
+        )
         assert blob_io.tell() == len(blob_content)
 
     def test_read_after_seek(
@@ -368,6 +489,436 @@ class TestBlobIO:
         with pytest.raises(ValueError, match="must be greater than or equal to -1"):
             blob_io.read(-2)
 
+    def test_read_ahead_for_sequential_small_reads(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(1024 * 1024)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        read_size = 100
+        reads = []
+        while True:
+            read = blob_io.read(read_size)
+            if not read:
+                break
+            reads.append(read)
+        assert b"".join(reads) == content
+        assert blob_io.tell() == len(content)
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=read_size
+        )
+        # The window starts at the second read and doubles each time a range is consumed.
+        first_range_end = read_size + EXPECTED_READ_AHEAD_MIN_WINDOW_SIZE
+        second_range_end = first_range_end + 2 * EXPECTED_READ_AHEAD_MIN_WINDOW_SIZE
+        assert mock_azstoragetorch_blob_client.submit_download.call_args_list == [
+            mock.call(read_size, EXPECTED_READ_AHEAD_MIN_WINDOW_SIZE),
+            mock.call(first_range_end, 2 * EXPECTED_READ_AHEAD_MIN_WINDOW_SIZE),
+            mock.call(second_range_end, len(content) - second_range_end),
+        ]
+
+    def test_read_ahead_limits_range_size(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(3 * EXPECTED_READ_AHEAD_MAX_RANGE_SIZE)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        blob_io.read(1)
+        read_size = EXPECTED_READ_AHEAD_MAX_RANGE_SIZE
+        assert blob_io.read(read_size) == content[1 : read_size + 1]
+        assert blob_io.read(read_size) == content[read_size + 1 : 2 * read_size + 1]
+        assert all(
+            length <= EXPECTED_READ_AHEAD_MAX_RANGE_SIZE
+            for _, length in (
+                call.args
+                for call in (
+                    mock_azstoragetorch_blob_client.submit_download.call_args_list
+                )
+            )
+        )
+
+    def test_read_ahead_serves_seeks_within_window(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(1024 * 1024)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        blob_io.read(10)
+        blob_io.read(10)
+        blob_io.seek(15)
+        assert blob_io.read(10) == content[15:25]
+        blob_io.seek(1000)
+        assert blob_io.read(10) == content[1000:1010]
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=10
+        )
+        mock_azstoragetorch_blob_client.submit_download.assert_any_call(
+            10, EXPECTED_READ_AHEAD_MIN_WINDOW_SIZE
+        )
+
+    def test_read_ahead_resets_on_seek_outside_window(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(1024 * 1024)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        blob_io.read(10)
+        blob_io.read(10)
+        offset = len(content) - 100
+        blob_io.seek(offset)
+        assert blob_io.read(10) == content[offset : offset + 10]
+        assert blob_io.read(10) == content[offset + 10 : offset + 20]
+        assert mock_azstoragetorch_blob_client.download.call_args_list == [
+            mock.call(offset=0, length=10),
+            mock.call(offset=offset, length=10),
+        ]
+        # After the reset, the window starts again from its minimum size.
+        assert mock_azstoragetorch_blob_client.submit_download.call_args_list[-1] == (
+            mock.call(offset + 10, 90)
+        )
+
+    @pytest.mark.parametrize("size", [-1, EXPECTED_READ_AHEAD_MAX_RANGE_SIZE + 1])
+    def test_read_ahead_not_used_for_large_reads(
+        self, blob_io, mock_azstoragetorch_blob_client, size
+    ):
+        content = random_bytes(2 * EXPECTED_READ_AHEAD_MAX_RANGE_SIZE + 2)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        mock_azstoragetorch_blob_client.download.side_effect = None
+        mock_azstoragetorch_blob_client.download.return_value = content[:1]
+        blob_io.read(size)
+        blob_io.read(size)
+        assert mock_azstoragetorch_blob_client.download.call_count == 2
+        mock_azstoragetorch_blob_client.submit_download.assert_not_called()
+
+    def test_close_cancels_read_ahead(self, blob_io, mock_azstoragetorch_blob_client):
+        content = random_bytes(1024 * 1024)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        pending = Future()
+        mock_azstoragetorch_blob_client.submit_download.side_effect = [
+            completed_future(content[10 : 10 + EXPECTED_READ_AHEAD_MIN_WINDOW_SIZE]),
+            pending,
+        ]
+        blob_io.read(10)
+        blob_io.read(10)
+        blob_io.close()
+        assert pending.cancelled()
+
+    def test_read_ahead_resets_after_error(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(1024 * 1024)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        failed = Future()
+        failed.set_exception(AzureError("read ahead failed"))
+        mock_azstoragetorch_blob_client.submit_download.side_effect = [failed]
+        blob_io.read(10)
+        with pytest.raises(AzureError, match="read ahead failed"):
+            blob_io.read(10)
+        assert blob_io.read(10) == content[10:20]
+        assert mock_azstoragetorch_blob_client.download.call_args_list == [
+            mock.call(offset=0, length=10),
+            mock.call(offset=10, length=10),
+        ]
+
+    def test_cache_serves_repeated_random_reads(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        blob_io = create_blob_io(cache_size=CACHE_SIZE)
+        block_size = EXPECTED_DEFAULT_CACHE_BLOCK_SIZE
+        content = random_bytes(3 * block_size)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        footer_offset = len(content) - 8
+        data_offset = block_size + 100
+        assert blob_io.read(10) == content[:10]
+        for _ in range(2):
+            blob_io.seek(footer_offset)
+            assert blob_io.read(8) == content[footer_offset:]
+            blob_io.seek(data_offset)
+            assert blob_io.read(10) == content[data_offset : data_offset + 10]
+        # Only the first read, made before the blob size is known, is not cached.
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=10
+        )
+        assert mock_azstoragetorch_blob_client.submit_download.call_args_list == [
+            mock.call(2 * block_size, block_size),
+            mock.call(block_size, block_size),
+        ]
+        assert blob_io.get_cache_stats() == {
+            "hits": 2,
+            "misses": 2,
+            "cached_bytes": 2 * block_size,
+        }
+
+    def test_cache_read_across_blocks(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        blob_io = create_blob_io(cache_size=CACHE_SIZE, cache_block_size=10)
+        content = random_bytes(100)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        blob_io.read(1)
+        blob_io.seek(15)
+        assert blob_io.read(20) == content[15:35]
+        assert mock_azstoragetorch_blob_client.submit_download.call_args_list == [
+            mock.call(10, 10),
+            mock.call(20, 10),
+            mock.call(30, 10),
+        ]
+
+    def test_cache_evicts_least_recently_used_blocks(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        blob_io = create_blob_io(cache_size=20, cache_block_size=10)
+        content = random_bytes(100)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        blob_io.read(1)
+        for offset in [10, 30, 10, 50, 30]:
+            blob_io.seek(offset)
+            assert blob_io.read(5) == content[offset : offset + 5]
+        assert mock_azstoragetorch_blob_client.submit_download.call_args_list == [
+            mock.call(10, 10),
+            mock.call(30, 10),
+            mock.call(50, 10),
+            # Block at offset 30 was the least recently used when block at offset 50
+            # was cached.
+            mock.call(30, 10),
+        ]
+        assert blob_io.get_cache_stats() == {
+            "hits": 1,
+            "misses": 4,
+            "cached_bytes": 20,
+        }
+
+    def test_cache_disabled_by_default(self, blob_io, mock_azstoragetorch_blob_client):
+        content = random_bytes(100)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        for offset in [0, 50, 0, 50]:
+            blob_io.seek(offset)
+            assert blob_io.read(5) == content[offset : offset + 5]
+        assert mock_azstoragetorch_blob_client.download.call_count == 4
+        mock_azstoragetorch_blob_client.submit_download.assert_not_called()
+        assert blob_io.get_cache_stats() == {
+            "hits": 0,
+            "misses": 0,
+            "cached_bytes": 0,
+        }
+
+    def test_cache_does_not_keep_failed_blocks(
+        self, create_blob_io, mock_azstoragetorch_blob_client
+    ):
+        blob_io = create_blob_io(cache_size=CACHE_SIZE)
+        content = random_bytes(100)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        failed = Future()
+        failed.set_exception(AzureError("block download failed"))
+        mock_azstoragetorch_blob_client.submit_download.side_effect = [
+            failed,
+            completed_future(content),
+        ]
+        blob_io.read(1)
+        blob_io.seek(50)
+        with pytest.raises(AzureError, match="block download failed"):
+            blob_io.read(5)
+        assert blob_io.read(5) == content[50:55]
+        assert blob_io.get_cache_stats() == {
+            "hits": 0,
+            "misses": 2,
+            "cached_bytes": 100,
+        }
+
+    def test_close_clears_cache(self, create_blob_io, mock_azstoragetorch_blob_client):
+        blob_io = create_blob_io(cache_size=CACHE_SIZE)
+        content = random_bytes(100)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        blob_io.read(1)
+        blob_io.seek(50)
+        blob_io.read(5)
+        blob_io.close()
+        assert blob_io.get_cache_stats()["cached_bytes"] == 0
+
+    def test_iter_chunks(self, blob_io, blob_content, mock_azstoragetorch_blob_client):
+        mock_azstoragetorch_blob_client.iter_chunks.return_value = iter(
+            [blob_content[:4], blob_content[4:]]
+        )
+        chunks = blob_io.iter_chunks()
+        assert next(chunks) == blob_content[:4]
+        assert blob_io.tell() == 4
+        assert list(chunks) == [blob_content[4:]]
+        assert blob_io.tell() == len(blob_content)
+        mock_azstoragetorch_blob_client.iter_chunks.assert_called_once_with(
+            offset=0, length=None, window=None
+        )
+
+    def test_iter_chunks_with_size_and_window(
+        self, blob_io, blob_content, mock_azstoragetorch_blob_client
+    ):
+        mock_azstoragetorch_blob_client.iter_chunks.return_value = iter(
+            [blob_content[2:6]]
+        )
+        blob_io.seek(2)
+        assert list(blob_io.iter_chunks(4, window=3)) == [blob_content[2:6]]
+        assert blob_io.tell() == 6
+        mock_azstoragetorch_blob_client.iter_chunks.assert_called_once_with(
+            offset=2, length=4, window=3
+        )
+
+    def test_iter_chunks_beyond_end(
+        self, blob_io, blob_length, mock_azstoragetorch_blob_client
+    ):
+        blob_io.seek(blob_length)
+        assert list(blob_io.iter_chunks()) == []
+        mock_azstoragetorch_blob_client.iter_chunks.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "kwargs,expected_exception",
+        [
+            ({"window": 0}, ValueError),
+            ({"window": "1"}, TypeError),
+            ({"size": -2}, ValueError),
+            ({"size": 0.5}, TypeError),
+        ],
+    )
+    def test_iter_chunks_raises_for_invalid_args(
+        self, blob_io, kwargs, expected_exception
+    ):
+        args = []
+        if "size" in kwargs:
+            args.append(kwargs.pop("size"))
+        with pytest.raises(expected_exception):
+            blob_io.iter_chunks(*args, **kwargs)
+
+    def test_read_ranges(self, blob_io, blob_content, mock_azstoragetorch_blob_client):
+        mock_azstoragetorch_blob_client.download_ranges.return_value = [
+            memoryview(blob_content[1:3]),
+            memoryview(blob_content[5:6]),
+        ]
+        blob_io.seek(2)
+        views = blob_io.read_ranges([(1, 2), (5, 1)])
+        assert [bytes(view) for view in views] == [blob_content[1:3], blob_content[5:6]]
+        assert blob_io.tell() == 2
+        mock_azstoragetorch_blob_client.download_ranges.assert_called_once_with(
+            [(1, 2), (5, 1)], max_gap=None
+        )
+
+    def test_read_ranges_with_max_gap(self, blob_io, mock_azstoragetorch_blob_client):
+        mock_azstoragetorch_blob_client.download_ranges.return_value = []
+        assert blob_io.read_ranges([], max_gap=0) == []
+        mock_azstoragetorch_blob_client.download_ranges.assert_called_once_with(
+            [], max_gap=0
+        )
+
+    @pytest.mark.parametrize(
+        "ranges,kwargs,expected_exception",
+        [
+            ([(-1, 1)], {}, ValueError),
+            ([(0, -1)], {}, ValueError),
+            ([(0.5, 1)], {}, TypeError),
+            ([(0, "1")], {}, TypeError),
+            ([(0, 1)], {"max_gap": -1}, ValueError),
+            ([(0, 1)], {"max_gap": 0.5}, TypeError),
+        ],
+    )
+    def test_read_ranges_raises_for_invalid_args(
+        self, blob_io, ranges, kwargs, expected_exception
+    ):
+        with pytest.raises(expected_exception):
+            blob_io.read_ranges(ranges, **kwargs)
+
+    def test_readinto(self, blob_io, blob_content, mock_azstoragetorch_blob_client):
+        buffer = bytearray(len(blob_content))
+        assert blob_io.readinto(buffer) == len(blob_content)
+        assert buffer == blob_content
+        assert blob_io.tell() == len(blob_content)
+        # Small buffers are filled from the same read path as read()
+        assert mock_azstoragetorch_blob_client.mock_calls == [
+            mock.call.download(offset=0, length=len(blob_content)),
+            mock.call.get_blob_size(),
+        ]
+
+    def test_readinto_large_buffer_downloads_directly(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        size = EXPECTED_READ_AHEAD_MAX_RANGE_SIZE + 1
+        mock_azstoragetorch_blob_client.get_blob_size.return_value = size
+        mock_azstoragetorch_blob_client.download_into.return_value = size
+        buffer = bytearray(size)
+        assert blob_io.readinto(buffer) == size
+        assert blob_io.tell() == size
+        assert mock_azstoragetorch_blob_client.mock_calls == [
+            mock.call.download_into(buffer, offset=0),
+            mock.call.get_blob_size(),
+        ]
+
+    @pytest.mark.parametrize(
+        "buffer_factory",
+        [
+            bytearray,
+            lambda size: memoryview(bytearray(size)),
+            lambda size: torch.zeros(size, dtype=torch.uint8),
+        ],
+    )
+    def test_readinto_supported_buffer_types(
+        self, blob_io, blob_content, mock_azstoragetorch_blob_client, buffer_factory
+    ):
+        buffer = buffer_factory(len(blob_content))
+        assert blob_io.readinto(buffer) == len(blob_content)
+        assert bytes(buffer) == blob_content
+
+    def test_readinto_multiple_times(
+        self, blob_io, blob_content, mock_azstoragetorch_blob_client
+    ):
+        set_download_content(mock_azstoragetorch_blob_client, blob_content)
+        buffer = bytearray(4)
+        assert blob_io.readinto(buffer) == 4
+        assert buffer == blob_content[:4]
+        assert blob_io.readinto(buffer) == 4
+        assert buffer == blob_content[4:8]
+        assert blob_io.tell() == 8
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=4
+        )
+        # The second, sequential read is served from the read-ahead window.
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once_with(
+            4, len(blob_content) - 4
+        )
+
+    def test_readinto_raises_for_unsupported_buffer_type(self, blob_io):
+        with pytest.raises(TypeError, match="Unsupported type for buffer"):
+            blob_io.readinto("not a buffer")
+
+    def test_readinto1(self, blob_io, blob_content, mock_azstoragetorch_blob_client):
+        buffer = bytearray(4)
+        mock_azstoragetorch_blob_client.download.return_value = blob_content[:4]
+        assert blob_io.readinto1(buffer) == 4
+        assert buffer == blob_content[:4]
+        assert blob_io.tell() == 4
+
+    def test_buffered_reader(self, create_blob_io, mock_azstoragetorch_blob_client):
+        blob_io = create_blob_io(cache_size=CACHE_SIZE)
+        content = random_bytes(1024 * 1024)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        reader = io.BufferedReader(blob_io, buffer_size=8192)
+        assert reader.read(10) == content[:10]
+        assert reader.read(100) == content[10:110]
+        reader.seek(-8, os.SEEK_END)
+        assert reader.read() == content[-8:]
+        reader.seek(500_000)
+        chunks = []
+        while chunk := reader.read1(5000):
+            chunks.append(chunk)
+        assert b"".join(chunks) == content[500_000:]
+        reader.close()
+        assert blob_io.closed
+        # Other than the first read and reading to the end of the blob, reads are served
+        # from the read-ahead window and block cache.
+        assert mock_azstoragetorch_blob_client.download.call_args_list == [
+            mock.call(offset=0, length=8192),
+            mock.call(offset=len(content) - 8, length=None),
+        ]
+        mock_azstoragetorch_blob_client.download_into.assert_not_called()
+
+    def test_readinto_beyond_end(
+        self, blob_io, blob_length, mock_azstoragetorch_blob_client
+    ):
+        blob_io.seek(blob_length)
+        assert blob_io.readinto(bytearray(4)) == 0
+        assert blob_io.tell() == blob_length
+        mock_azstoragetorch_blob_client.download_into.assert_not_called()
+
     @pytest.mark.parametrize(
         "lines",
         [
@@ -396,6 +947,16 @@ class TestBlobIO:
             offset=0, length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE
         )
 
+    def test_readline_returns_bytes_for_downloaded_bytearray(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = b"line1\nline2\n"
+        mock_azstoragetorch_blob_client.download.return_value = bytearray(content)
+        mock_azstoragetorch_blob_client.get_blob_size.return_value = len(content)
+        lines = [blob_io.readline(), blob_io.readline()]
+        assert lines == [b"line1\n", b"line2\n"]
+        assert all(type(line) is bytes for line in lines)
+
     @pytest.mark.parametrize(
         "size,content,expected_readline_return_val",
         [
@@ -461,42 +1022,37 @@ class TestBlobIO:
             EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE - 1
         )
         final_download_prefetch = random_ascii_letter_bytes(100)
-        download_batches = [
-            first_download_prefetch,
-            second_download_prefetch,
-            final_download_prefetch,
-        ]
-        blob_size = sum([len(batch) for batch in download_batches])
-        mock_azstoragetorch_blob_client.download.side_effect = download_batches
-        mock_azstoragetorch_blob_client.get_blob_size.return_value = blob_size
+        content = first_download_prefetch + second_download_prefetch
+        content += final_download_prefetch
+        set_download_content(mock_azstoragetorch_blob_client, content)
 
         assert blob_io.readline() == first_download_prefetch + b"\n"
         assert blob_io.tell() == len(first_download_prefetch) + 1
-        # First readline() should have resulted in two prefetches because the first newline is in the second prefetch
-        assert mock_azstoragetorch_blob_client.download.call_args_list == [
-            mock.call(offset=0, length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE),
+        # First readline() should have resulted in two prefetches because the first newline is in the second
+        # prefetch. Prefetches after the first are downloaded in the background.
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE
+        )
+        assert mock_azstoragetorch_blob_client.submit_download.call_args_list == [
             mock.call(
-                offset=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
-                length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
+                EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
+                EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
             ),
         ]
         assert (
             blob_io.readline() == second_download_prefetch[1:] + final_download_prefetch
         )
-        assert blob_io.tell() == blob_size
+        assert blob_io.tell() == len(content)
         # Second readline should result in triggering the final prefetch because there are no newlines for the rest
         # of the blob content.
-        assert mock_azstoragetorch_blob_client.download.call_args_list == [
-            mock.call(offset=0, length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE),
+        assert mock_azstoragetorch_blob_client.submit_download.call_args_list == [
             mock.call(
-                offset=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
-                length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
-            ),
-            mock.call(
-                offset=2 * EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
-                length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
+                EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
+                EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
             ),
+            mock.call(2 * EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE, 100),
         ]
+        mock_azstoragetorch_blob_client.download.assert_called_once()
 
     def test_readline_size_across_multiple_prefetches(
         self, blob_io, mock_azstoragetorch_blob_client
@@ -507,23 +1063,19 @@ class TestBlobIO:
             + b"\n"
             + random_ascii_letter_bytes(100)
         )
-        mock_azstoragetorch_blob_client.download.side_effect = [
-            content[:EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE],
-            content[EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE:],
-        ]
-        mock_azstoragetorch_blob_client.get_blob_size.return_value = len(content)
+        set_download_content(mock_azstoragetorch_blob_client, content)
         readline_size = EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE + 2
         # First readline should have triggered two prefetches but stopped short of returning the newline in second
         # prefetch
         assert blob_io.readline(readline_size) == content[:readline_size]
         assert blob_io.tell() == readline_size
-        assert mock_azstoragetorch_blob_client.download.call_args_list == [
-            mock.call(offset=0, length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE),
-            mock.call(
-                offset=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
-                length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
-            ),
-        ]
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE
+        )
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once_with(
+            EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
+            len(content) - EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
+        )
         # Second readline should now reach newline from second prefetch
         assert (
             blob_io.readline(readline_size)
@@ -534,6 +1086,62 @@ class TestBlobIO:
         # made since the first readline
         assert blob_io.readline(readline_size) == content[newline_position + 1 :]
         assert blob_io.tell() == len(content)
+        assert mock_azstoragetorch_blob_client.download.call_count == 1
+        assert mock_azstoragetorch_blob_client.submit_download.call_count == 1
+
+    def test_readline_prefetches_next_buffer_after_half_consumed(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        line = b"x" * 1023 + b"\n"
+        num_lines_per_prefetch = EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE // len(line)
+        content = line * (2 * num_lines_per_prefetch)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        for _ in range(num_lines_per_prefetch // 2 - 1):
+            assert blob_io.readline() == line
+        mock_azstoragetorch_blob_client.submit_download.assert_not_called()
+        assert blob_io.readline() == line
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once_with(
+            EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
+            EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE,
+        )
+        assert list(blob_io) == [line] * (
+            2 * num_lines_per_prefetch - num_lines_per_prefetch // 2
+        )
+        mock_azstoragetorch_blob_client.download.assert_called_once()
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once()
+
+    def test_seek_cancels_readline_prefetch(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        line = b"x" * 1023 + b"\n"
+        num_lines_per_prefetch = EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE // len(line)
+        content = line * (2 * num_lines_per_prefetch)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        pending = Future()
+        mock_azstoragetorch_blob_client.submit_download.side_effect = [pending]
+        for _ in range(num_lines_per_prefetch // 2):
+            blob_io.readline()
+        assert not pending.cancelled()
+        blob_io.seek(0)
+        assert pending.cancelled()
+
+    def test_readline_does_not_reuse_failed_prefetch(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        line = b"x" * 1023 + b"\n"
+        num_lines_per_prefetch = EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE // len(line)
+        content = line * (2 * num_lines_per_prefetch)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        failed = Future()
+        failed.set_exception(RuntimeError("prefetch failed"))
+        mock_azstoragetorch_blob_client.submit_download.side_effect = [failed]
+        for _ in range(num_lines_per_prefetch):
+            assert blob_io.readline() == line
+        with pytest.raises(RuntimeError, match="prefetch failed"):
+            blob_io.readline()
+        # The next read downloads the buffer again instead of raising the same failure.
+        assert blob_io.readline() == line
+        assert blob_io.tell() == (num_lines_per_prefetch + 1) * len(line)
         assert mock_azstoragetorch_blob_client.download.call_count == 2
 
     def test_readline_mixed_with_read(self, blob_io, mock_azstoragetorch_blob_client):
@@ -610,6 +1218,79 @@ class TestBlobIO:
             offset=0, length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE
         )
 
+    @pytest.mark.parametrize(
+        "hint,expected_num_lines",
+        [
+            (None, 3),
+            (-1, 3),
+            (0, 3),
+            (1, 1),
+            (6, 1),
+            (7, 2),
+            (100, 3),
+        ],
+    )
+    def test_readlines_with_hint(
+        self, blob_io, mock_azstoragetorch_blob_client, hint, expected_num_lines
+    ):
+        lines = [b"line1\n", b"line2\n", b"line3\n"]
+        content = b"".join(lines)
+        mock_azstoragetorch_blob_client.download.return_value = content
+        mock_azstoragetorch_blob_client.get_blob_size.return_value = len(content)
+        assert blob_io.readlines(hint) == lines[:expected_num_lines]
+        assert blob_io.tell() == sum(len(line) for line in lines[:expected_num_lines])
+
+    @pytest.mark.parametrize(
+        "batch_size,expected_batches",
+        [
+            (1, [[b"line1\n"], [b"line2\n"], [b"line3"]]),
+            (2, [[b"line1\n", b"line2\n"], [b"line3"]]),
+            (3, [[b"line1\n", b"line2\n", b"line3"]]),
+            (100, [[b"line1\n", b"line2\n", b"line3"]]),
+        ],
+    )
+    def test_iter_lines(
+        self, blob_io, mock_azstoragetorch_blob_client, batch_size, expected_batches
+    ):
+        content = b"line1\nline2\nline3"
+        mock_azstoragetorch_blob_client.download.return_value = content
+        mock_azstoragetorch_blob_client.get_blob_size.return_value = len(content)
+        assert list(blob_io.iter_lines(batch_size)) == expected_batches
+        assert blob_io.tell() == len(content)
+        mock_azstoragetorch_blob_client.download.assert_called_once_with(
+            offset=0, length=EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE
+        )
+
+    def test_iter_lines_from_current_position(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        content = b"line1\nline2\nline3\n"
+        mock_azstoragetorch_blob_client.download.return_value = content
+        mock_azstoragetorch_blob_client.get_blob_size.return_value = len(content)
+        assert blob_io.readline() == b"line1\n"
+        assert list(blob_io.iter_lines()) == [[b"line2\n", b"line3\n"]]
+
+    def test_iter_lines_across_prefetches(
+        self, blob_io, mock_azstoragetorch_blob_client
+    ):
+        line = b"x" * 99 + b"\n"
+        content = line * (3 * EXPECTED_DEFAULT_READLINE_PREFETCH_SIZE // len(line) + 1)
+        set_download_content(mock_azstoragetorch_blob_client, content)
+        lines = [line for batch in blob_io.iter_lines(1000) for line in batch]
+        assert b"".join(lines) == content
+        assert all(line == lines[0] for line in lines)
+        mock_azstoragetorch_blob_client.download.assert_called_once()
+        assert mock_azstoragetorch_blob_client.submit_download.call_count == 3
+
+    @pytest.mark.parametrize(
+        "batch_size,expected_error", [(0, ValueError), ("1", TypeError)]
+    )
+    def test_iter_lines_raises_for_invalid_batch_size(
+        self, blob_io, batch_size, expected_error
+    ):
+        with pytest.raises(expected_error, match="batch_size"):
+            blob_io.iter_lines(batch_size)
+
     def test_next(self, blob_io, mock_azstoragetorch_blob_client):
         lines = [b"line1\n", b"line2\n", b"line3\n"]
         content = b"".join(lines)
@@ -806,20 +1487,58 @@ class TestBlobIO:
             ["00"]
         )
 
-    def test_small_writes_flushed_on_close(
+    def test_small_writes_uploaded_in_single_request_on_close(
         self, writable_blob_io, mock_azstoragetorch_blob_client
     ):
-        add_stage_blocks_results(mock_azstoragetorch_blob_client, ["00"])
         with writable_blob_io:
             assert writable_blob_io.write(b"a") == 1
             assert writable_blob_io.write(b"b") == 1
             assert writable_blob_io.tell() == 2
-            mock_azstoragetorch_blob_client.stage_blocks.assert_not_called()
+            mock_azstoragetorch_blob_client.upload_blob.assert_not_called()
+        mock_azstoragetorch_blob_client.upload_blob.assert_called_once_with(b"ab")
+        mock_azstoragetorch_blob_client.stage_blocks.assert_not_called()
+        mock_azstoragetorch_blob_client.commit_block_list.assert_not_called()
+
+    def test_small_writes_staged_on_close_after_flush(
+        self, writable_blob_io, mock_azstoragetorch_blob_client
+    ):
+        add_stage_blocks_results(mock_azstoragetorch_blob_client, ["00"], ["01"])
+        with writable_blob_io:
+            writable_blob_io.write(b"a")
+            writable_blob_io.flush()
+            writable_blob_io.write(b"b")
+        assert mock_azstoragetorch_blob_client.stage_blocks.call_args_list == [
+            mock.call(b"a"),
+            mock.call(b"b"),
+        ]
+        mock_azstoragetorch_blob_client.upload_blob.assert_not_called()
+        mock_azstoragetorch_blob_client.commit_block_list.assert_called_once_with(
+            ["00", "01"]
+        )
+
+    def test_staged_writes_when_over_single_put_size(
+        self, writable_blob_io, mock_azstoragetorch_blob_client
+    ):
+        add_stage_blocks_results(mock_azstoragetorch_blob_client, ["00"])
+        writable_blob_io._MAX_SINGLE_PUT_SIZE = 1
+        with writable_blob_io:
+            writable_blob_io.write(b"ab")
         mock_azstoragetorch_blob_client.stage_blocks.assert_called_once_with(b"ab")
+        mock_azstoragetorch_blob_client.upload_blob.assert_not_called()
         mock_azstoragetorch_blob_client.commit_block_list.assert_called_once_with(
             ["00"]
         )
 
+    def test_close_raises_fatal_error_for_failed_single_request_upload(
+        self, writable_blob_io, mock_azstoragetorch_blob_client
+    ):
+        mock_azstoragetorch_blob_client.upload_blob.side_effect = AzureError("error")
+        writable_blob_io.write(b"content")
+        with pytest.raises(FatalBlobIOWriteError):
+            writable_blob_io.close()
+        assert writable_blob_io.closed
+        mock_azstoragetorch_blob_client.commit_block_list.assert_not_called()
+
     def test_write_flushes_remaining_small_writes_on_close(
         self, writable_blob_io, mock_azstoragetorch_blob_client
     ):
@@ -852,7 +1571,7 @@ class TestBlobIO:
         with writable_blob_io:
             pass
         mock_azstoragetorch_blob_client.stage_blocks.assert_not_called()
-        mock_azstoragetorch_blob_client.commit_block_list.assert_called_once_with([])
+        mock_azstoragetorch_blob_client.upload_blob.assert_called_once_with(b"")
 
     def test_empty_writes_result_in_empty_blob(
         self, writable_blob_io, mock_azstoragetorch_blob_client
@@ -861,7 +1580,7 @@ class TestBlobIO:
             assert writable_blob_io.write(b"") == 0
             assert writable_blob_io.tell() == 0
         mock_azstoragetorch_blob_client.stage_blocks.assert_not_called()
-        mock_azstoragetorch_blob_client.commit_block_list.assert_called_once_with([])
+        mock_azstoragetorch_blob_client.upload_blob.assert_called_once_with(b"")
 
     @pytest.mark.parametrize(
         "unsupported_write_type",
@@ -879,16 +1598,12 @@ class TestBlobIO:
 
     def test_writelines(self, writable_blob_io, mock_azstoragetorch_blob_client):
         lines = [b"line1\n", b"line2\n", b"line3\n"]
-        expected_stage_blocks_content = b"".join(lines)
-        add_stage_blocks_results(mock_azstoragetorch_blob_client, ["00"])
+        expected_content = b"".join(lines)
         with writable_blob_io:
             writable_blob_io.writelines(lines)
-            assert writable_blob_io.tell() == len(expected_stage_blocks_content)
-        mock_azstoragetorch_blob_client.stage_blocks.assert_called_once_with(
-            expected_stage_blocks_content
-        )
-        mock_azstoragetorch_blob_client.commit_block_list.assert_called_once_with(
-            ["00"]
+            assert writable_blob_io.tell() == len(expected_content)
+        mock_azstoragetorch_blob_client.upload_blob.assert_called_once_with(
+            expected_content
         )
 
     def test_truncate_not_supported(self, writable_blob_io):
@@ -905,7 +1620,7 @@ class TestBlobIO:
             ("flush", [], EXPECTED_FLUSH_THRESHOLD + 1, [["00", AzureError("error")]]),
             # close() cases
             # Single stage block failure
-            ("close", [], 8, [[AzureError("error")]]),
+            ("close", [], EXPECTED_FLUSH_THRESHOLD, [[AzureError("error")]]),
             # One stage block failure out of multiple operations
             ("close", [], EXPECTED_FLUSH_THRESHOLD + 1, [["00", AzureError("error")]]),
             # write() cases
@@ -960,7 +1675,7 @@ class TestBlobIO:
         add_stage_blocks_results(mock_azstoragetorch_blob_client, [AzureError("error")])
         with pytest.raises(FatalBlobIOWriteError):
             with writable_blob_io:
-                writable_blob_io.write(b"content")
+                writable_blob_io.write(random_bytes(EXPECTED_FLUSH_THRESHOLD))
         mock_azstoragetorch_blob_client.commit_block_list.assert_not_called()
         assert writable_blob_io.closed
 
@@ -974,3 +1689,47 @@ class TestBlobIO:
         writable_blob_io.flush()
         with pytest.raises(RuntimeError, match="duplicate block IDs"):
             writable_blob_io.close()
+
+
+class TestBlockCache:
+    def test_deduplicates_concurrent_misses(self, mock_azstoragetorch_blob_client):
+        content = random_bytes(100)
+        pending = Future()
+        submitted = threading.Event()
+
+        def submit_download(offset, length):
+            submitted.set()
+            return pending
+
+        mock_azstoragetorch_blob_client.submit_download.side_effect = submit_download
+        cache = _BlockCache(
+            mock_azstoragetorch_blob_client, block_size=100, max_size=100
+        )
+        results = []
+        first_reader = threading.Thread(
+            target=lambda: results.append(cache.read(0, 10, len(content)))
+        )
+        first_reader.start()
+        assert submitted.wait(timeout=10)
+        second_reader = threading.Thread(
+            target=lambda: results.append(cache.read(50, 10, len(content)))
+        )
+        second_reader.start()
+        pending.set_result(content)
+        first_reader.join()
+        second_reader.join()
+        assert sorted(results) == sorted([content[:10], content[50:60]])
+        mock_azstoragetorch_blob_client.submit_download.assert_called_once_with(0, 100)
+        assert cache.get_stats() == {"hits": 1, "misses": 1, "cached_bytes": 100}
+
+    def test_does_not_cache_blocks_larger_than_max_size(
+        self, mock_azstoragetorch_blob_client
+    ):
+        content = random_bytes(100)
+        set_submit_download_content(mock_azstoragetorch_blob_client, content)
+        cache = _BlockCache(
+            mock_azstoragetorch_blob_client, block_size=100, max_size=50
+        )
+        assert cache.read(0, 10, len(content)) == content[:10]
+        assert cache.read(0, 10, len(content)) == content[:10]
+        assert cache.get_stats() == {"hits": 0, "misses": 2, "cached_bytes": 0}
@@ -0,0 +1,251 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import datetime
+import gzip
+import json
+from unittest import mock
+
+import azure.core.exceptions
+from azure.storage.blob import BlobProperties
+import pytest
+
+from azstoragetorch._client import AzStorageTorchBlobClientFactory
+from azstoragetorch._manifest import (
+    BlobManifest,
+    _BlobManifestStore,
+    _LocalManifestStore,
+    get_manifest_store,
+    load_or_create_manifest,
+)
+
+LAST_MODIFIED = datetime.datetime(2024, 12, 31, 12, 30, tzinfo=datetime.timezone.utc)
+
+
+def get_listed_blob(name, size, etag):
+    return BlobProperties(
+        name=name,
+        **{"Content-Length": size, "ETag": etag, "Last-Modified": LAST_MODIFIED},
+    )
+
+
+@pytest.fixture
+def listed_blobs():
+    return [get_listed_blob(f"blob{i}", i + 1, f"0x8D{i}") for i in range(3)]
+
+
+@pytest.fixture
+def manifest(container_url, listed_blobs):
+    return BlobManifest.from_listing(container_url, None, listed_blobs)
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    return tmp_path / "manifest.json.gz"
+
+
+@pytest.fixture
+def mock_blob_client_factory(listed_blobs):
+    factory = mock.Mock(AzStorageTorchBlobClientFactory)
+    factory.list_blobs.side_effect = lambda container_url, prefix=None: iter(
+        listed_blobs
+    )
+    return factory
+
+
+def assert_expected_blob_properties(manifest, expected_listed_blobs):
+    blob_properties = list(manifest.iter_blob_properties())
+    assert len(manifest) == len(expected_listed_blobs)
+    assert [
+        (props.name, props.size, props.etag, props.last_modified)
+        for props in blob_properties
+    ] == [
+        (listed.name, listed.size, listed.etag, listed.last_modified)
+        for listed in expected_listed_blobs
+    ]
+
+
+class TestBlobManifest:
+    def test_from_listing(self, manifest, container_url, listed_blobs):
+        assert manifest.container_url == container_url
+        assert manifest.prefix is None
+        assert_expected_blob_properties(manifest, listed_blobs)
+
+    def test_round_trips_through_bytes(self, container_url, listed_blobs):
+        manifest = BlobManifest.from_listing(container_url, "prefix/", listed_blobs)
+        loaded = BlobManifest.from_bytes(manifest.to_bytes())
+        assert loaded.container_url == container_url
+        assert loaded.prefix == "prefix/"
+        assert_expected_blob_properties(loaded, listed_blobs)
+
+    def test_does_not_record_sas_token(self, container_url, listed_blobs):
+        manifest = BlobManifest.from_listing(
+            f"{container_url}/?sv=2025-01-01&sig=secret", None, listed_blobs
+        )
+        assert manifest.container_url == container_url
+        assert b"secret" not in gzip.decompress(manifest.to_bytes())
+
+    def test_from_bytes_unsupported_version(self, manifest):
+        content = json.loads(gzip.decompress(manifest.to_bytes()))
+        content["version"] = 100
+        with pytest.raises(ValueError, match="Unsupported manifest version"):
+            BlobManifest.from_bytes(gzip.compress(json.dumps(content).encode("utf-8")))
+
+    @pytest.mark.parametrize(
+        "container_url_suffix,prefix,expected",
+        [
+            ("", None, True),
+            ("?sig=secret", None, True),
+            ("", "other/", False),
+            ("-other", None, False),
+        ],
+    )
+    def test_is_for_listing(
+        self, manifest, container_url, container_url_suffix, prefix, expected
+    ):
+        assert (
+            manifest.is_for_listing(container_url + container_url_suffix, prefix)
+            is expected
+        )
+
+    def test_has_same_blobs(self, manifest, container_url, listed_blobs):
+        same = BlobManifest.from_listing(container_url, None, listed_blobs)
+        assert manifest.has_same_blobs(same)
+
+    @pytest.mark.parametrize(
+        "changed_blobs",
+        [
+            [
+                get_listed_blob("blob0", 1, "0x8D0"),
+                get_listed_blob("blob1", 2, "0x8D1"),
+            ],
+            [
+                get_listed_blob("blob0", 1, "0x8D0"),
+                get_listed_blob("blob1", 2, "0x8D1"),
+                get_listed_blob("blob2", 100, "0x8DF"),
+            ],
+        ],
+    )
+    def test_has_same_blobs_detects_changes(
+        self, manifest, container_url, changed_blobs
+    ):
+        changed = BlobManifest.from_listing(container_url, None, changed_blobs)
+        assert not manifest.has_same_blobs(changed)
+
+
+class TestManifestStores:
+    def test_get_manifest_store(self, blob_url, manifest_path):
+        factory = mock.Mock(AzStorageTorchBlobClientFactory)
+        assert isinstance(get_manifest_store(blob_url, factory), _BlobManifestStore)
+        assert isinstance(
+            get_manifest_store(manifest_path, factory), _LocalManifestStore
+        )
+        assert isinstance(
+            get_manifest_store(str(manifest_path), factory), _LocalManifestStore
+        )
+
+    def test_local_store(self, manifest_path):
+        store = _LocalManifestStore(manifest_path)
+        assert store.load() is None
+        store.save(b"manifest")
+        assert store.load() == b"manifest"
+        assert list(manifest_path.parent.iterdir()) == [manifest_path]
+
+    def test_blob_store(self, blob_url):
+        factory = mock.Mock(AzStorageTorchBlobClientFactory)
+        store = _BlobManifestStore(blob_url, factory)
+        with mock.patch("azstoragetorch._manifest.BlobIO", spec=True) as mock_blob_io:
+            mock_blob_io.return_value.__enter__.return_value.read.return_value = (
+                b"manifest"
+            )
+            assert store.load() == b"manifest"
+            store.save(b"new manifest")
+        assert mock_blob_io.call_args_list == [
+            mock.call(
+                blob_url,
+                "rb",
+                _azstoragetorch_blob_client=factory.get_blob_client_from_url.return_value,
+            ),
+            mock.call(
+                blob_url,
+                "wb",
+                _azstoragetorch_blob_client=factory.get_blob_client_from_url.return_value,
+            ),
+        ]
+        mock_blob_io.return_value.__enter__.return_value.write.assert_called_once_with(
+            b"new manifest"
+        )
+
+    def test_blob_store_load_missing_blob(self, blob_url):
+        store = _BlobManifestStore(blob_url, mock.Mock(AzStorageTorchBlobClientFactory))
+        with mock.patch("azstoragetorch._manifest.BlobIO", spec=True) as mock_blob_io:
+            mock_blob_io.return_value.__enter__.return_value.read.side_effect = (
+                azure.core.exceptions.ResourceNotFoundError("not found")
+            )
+            assert store.load() is None
+
+
+class TestLoadOrCreateManifest:
+    def test_creates_missing_manifest(
+        self, manifest_path, mock_blob_client_factory, container_url, listed_blobs
+    ):
+        manifest = load_or_create_manifest(
+            manifest_path, mock_blob_client_factory, container_url, prefix="blob"
+        )
+        mock_blob_client_factory.list_blobs.assert_called_once_with(
+            container_url, prefix="blob"
+        )
+        assert_expected_blob_properties(manifest, listed_blobs)
+        saved = BlobManifest.from_bytes(manifest_path.read_bytes())
+        assert saved.prefix == "blob"
+        assert_expected_blob_properties(saved, listed_blobs)
+
+    def test_loads_existing_manifest_without_listing(
+        self, manifest_path, manifest, mock_blob_client_factory, container_url
+    ):
+        manifest_path.write_bytes(manifest.to_bytes())
+        loaded = load_or_create_manifest(
+            manifest_path, mock_blob_client_factory, container_url
+        )
+        mock_blob_client_factory.list_blobs.assert_not_called()
+        assert loaded.has_same_blobs(manifest)
+
+    def test_raises_for_manifest_of_different_listing(
+        self, manifest_path, manifest, mock_blob_client_factory, container_url
+    ):
+        manifest_path.write_bytes(manifest.to_bytes())
+        with pytest.raises(ValueError, match="cannot be used for container"):
+            load_or_create_manifest(
+                manifest_path, mock_blob_client_factory, container_url, prefix="other/"
+            )
+
+    def test_refresh_does_not_rewrite_unchanged_manifest(
+        self, manifest_path, manifest, mock_blob_client_factory, container_url
+    ):
+        manifest_path.write_bytes(manifest.to_bytes())
+        with mock.patch.object(_LocalManifestStore, "save") as mock_save:
+            load_or_create_manifest(
+                manifest_path, mock_blob_client_factory, container_url, refresh=True
+            )
+        mock_blob_client_factory.list_blobs.assert_called_once_with(
+            container_url, prefix=None
+        )
+        mock_save.assert_not_called()
+
+    def test_refresh_rewrites_changed_manifest(
+        self,
+        manifest_path,
+        mock_blob_client_factory,
+        container_url,
+        listed_blobs,
+    ):
+        manifest = BlobManifest.from_listing(container_url, None, listed_blobs[:1])
+        manifest_path.write_bytes(manifest.to_bytes())
+        refreshed = load_or_create_manifest(
+            manifest_path, mock_blob_client_factory, container_url, refresh=True
+        )
+        assert_expected_blob_properties(refreshed, listed_blobs)
+        saved = BlobManifest.from_bytes(manifest_path.read_bytes())
+        assert_expected_blob_properties(saved, listed_blobs)